@@ -8,4 +8,6 @@ from nidaqmx.scale import Scale
 from nidaqmx.task import Task
 from nidaqmx._task_modules.read_functions import CtrFreq, CtrTick, CtrTime
 
-__all__ = ['errors', 'scale', 'stream_readers', 'stream_writers', 'task']
+__all__ = ['digital_patterns', 'errors', 'polling', 'scale', 'scale_model',
+           'simulation', 'stream_readers', 'stream_writers', 'streaming',
+           'task', 'task_pool', 'task_templates', 'waveforms']
@@ -4,6 +4,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import ctypes
+import os
 import six
 import sys
 import platform
@@ -33,10 +34,10 @@ class c_bool32(ctypes.c_uint):
     """
 
     def _getter(self):
-        return bool(ctypes.c_uint.value.fget(self))
+        return bool(ctypes.c_uint.value.__get__(self))
 
     def _setter(self, val):
-        ctypes.c_uint.value.fset(self, int(val))
+        ctypes.c_uint.value.__set__(self, int(val))
 
     value = property(_getter, _setter)
 
@@ -148,6 +149,68 @@ class DaqFunctionImporter(object):
                 'version of NI-DAQmx.'.format(function))
 
 
+class DaqBackend(object):
+    """
+    Base class of the Python implementations of the NI-DAQmx C API that
+    can replace the NI-DAQmx driver.
+
+    Set a backend with :py:meth:`DaqLibImporter.set_backend` to route the
+    NI-DAQmx functions that the API calls to the methods of the backend
+    with the same names, such as "DAQmxCreateTask". The methods receive
+    the arguments that the API passes to ctypes, without conversion:
+    Python numbers and strings for inputs, the task handle object,
+    "ctypes.byref" references and string buffers for outputs, and NumPy
+    arrays for arrays. They return the NI-DAQmx status code.
+    """
+
+    def get_function(self, name):
+        """
+        Gets the implementation of an NI-DAQmx function.
+
+        Args:
+            name (str): Specifies the name of the NI-DAQmx function.
+        Returns:
+            function: Indicates the function to call.
+        Raises:
+            AttributeError: If the backend does not implement the
+                function.
+        """
+        if not name.startswith('DAQmx'):
+            raise AttributeError(name)
+        return getattr(self, name)
+
+
+class DaqBackendFunction(object):
+    """
+    Wraps a function of a :class:`DaqBackend` so that it accepts the
+    ctypes function attributes, such as "argtypes", that the API sets
+    before each call.
+    """
+    __slots__ = ['argtypes', 'restype', 'errcheck', '_function']
+
+    def __init__(self, function):
+        self.argtypes = None
+        self.restype = None
+        self.errcheck = None
+        self._function = function
+
+    def __call__(self, *args):
+        return self._function(*args)
+
+
+class _DaqBackendLibrary(object):
+    """
+    Exposes the functions of a :class:`DaqBackend` as the attributes of a
+    library.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def __getattr__(self, function):
+        return DaqBackendFunction(self._backend.get_function(function))
+
+
 class DaqLibImporter(object):
     """
     Encapsulates NI-DAQmx library importing and handle type parsing logic.
@@ -159,6 +222,51 @@ class DaqLibImporter(object):
         self._cal_handle = None
         self._task_handle = None
         self._is_mxbase = False
+        self._backend = None
+        self._backend_selected = False
+
+    @property
+    def backend(self):
+        """
+        :class:`DaqBackend`: Indicates the backend that implements the
+            NI-DAQmx functions, or None if the NI-DAQmx driver does.
+        """
+        # The NIDAQMX_BACKEND environment variable applies only until a
+        # backend, or the driver, is selected with set_backend.
+        if (self._backend is None and not self._backend_selected and
+                os.environ.get('NIDAQMX_BACKEND', '').lower() == 'simulated'):
+            from nidaqmx.simulation import SimulatedBackend
+            self._backend = SimulatedBackend()
+        return self._backend
+
+    def set_backend(self, backend):
+        """
+        Routes the NI-DAQmx functions that the API calls to a Python
+        backend instead of the NI-DAQmx driver.
+
+        Set the backend before you create tasks; handles obtained from
+        the previous backend are not valid with the new one. Set the
+        NIDAQMX_BACKEND environment variable to "simulated" to use a
+        :class:`nidaqmx.simulation.SimulatedBackend` without calling this
+        method; the backend this method selects takes precedence over
+        the environment variable.
+
+        Args:
+            backend (DaqBackend): Specifies the backend to use, or None to
+                use the NI-DAQmx driver.
+        Returns:
+            DaqBackend: Indicates the backend used before the call, or
+            None if it was the NI-DAQmx driver.
+        """
+        previous = self.backend
+        self._backend = backend
+        self._backend_selected = True
+        self._windll = None
+        self._cdll = None
+        self._cal_handle = None
+        self._task_handle = None
+        self._is_mxbase = False
+        return previous
 
     @property
     def windll(self):
@@ -186,11 +294,19 @@ class DaqLibImporter(object):
 
     def _import_lib(self):
         """
-        Determines the location of and loads the NI-DAQmx CAI DLL.
+        Determines the location of and loads the NI-DAQmx CAI DLL, or
+        wraps the backend that replaces it.
         """
         self._windll = None
         self._cdll = None
 
+        if self.backend is not None:
+            library = _DaqBackendLibrary(self._backend)
+            self._windll = DaqFunctionImporter(library, False)
+            self._cdll = self._windll
+            self._is_mxbase = False
+            return
+
         windll = None
         cdll = None
         is_mxbase = False
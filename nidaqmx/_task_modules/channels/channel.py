@@ -358,4 +358,6 @@ class Channel(object):
 
         error_code = cfunc(
             self._handle, self._name, save_as, author, options)
+        from nidaqmx.system._persisted_index import persisted_channel_index
+        persisted_channel_index.invalidate()
         check_for_error(error_code)
@@ -0,0 +1,529 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import ctypes
+import itertools
+import math
+import threading
+
+from six.moves import queue
+
+from nidaqmx._lib import lib_importer
+from nidaqmx.constants import EveryNSamplesEventType
+from nidaqmx.errors import check_for_error, DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import (
+    DoneEvent, EveryNSamplesEvent, SignalEvent, EventLatencyStatistics)
+from nidaqmx.utils import _clock
+
+__all__ = ['EventHub', 'EventSubscription']
+
+# Marks the end of the events in the dispatch queue.
+_STOP_WORKER = object()
+
+# Marks a point in the dispatch queue that a thread waits for.
+_DRAIN_MARKER = object()
+
+
+def _get_callback_ptr_types():
+    """
+    Gets the C function pointer types of the done, Every N Samples and
+    signal event callbacks. ctypes caches function pointer types, so the
+    same types are returned on every call.
+    """
+    DAQmxDoneEventCallbackPtr = ctypes.CFUNCTYPE(
+        ctypes.c_int32, lib_importer.task_handle, ctypes.c_int32,
+        ctypes.c_void_p)
+
+    DAQmxEveryNSamplesEventCallbackPtr = ctypes.CFUNCTYPE(
+        ctypes.c_int32, lib_importer.task_handle, ctypes.c_int32,
+        ctypes.c_uint32, ctypes.c_void_p)
+
+    DAQmxSignalEventCallbackPtr = ctypes.CFUNCTYPE(
+        ctypes.c_int32, lib_importer.task_handle, ctypes.c_int32,
+        ctypes.c_void_p)
+
+    return (DAQmxDoneEventCallbackPtr, DAQmxEveryNSamplesEventCallbackPtr,
+            DAQmxSignalEventCallbackPtr)
+
+
+class EventSubscription(object):
+    """
+    Represents a Python callback subscribed to an event of a task through
+    an :class:`EventHub`.
+    """
+    __slots__ = ['_hub', '_key', '_callback', '_priority', '_order',
+                 '_deliveries']
+
+    def __init__(self, hub, key, callback, priority, order):
+        self._hub = hub
+        self._key = key
+        self._callback = callback
+        self._priority = priority
+        self._order = order
+        self._deliveries = 0
+
+    def __repr__(self):
+        return 'EventSubscription(event={0}, priority={1})'.format(
+            self._key[0], self._priority)
+
+    @property
+    def callback(self):
+        """
+        function: Indicates the function called when the event occurs.
+        """
+        return self._callback
+
+    @property
+    def deliveries(self):
+        """
+        int: Indicates the number of events delivered to the callback.
+        """
+        return self._deliveries
+
+    @property
+    def priority(self):
+        """
+        int: Indicates the priority of the subscription. Callbacks with a
+            higher priority are called first.
+        """
+        return self._priority
+
+    def unsubscribe(self):
+        """
+        Unsubscribes the callback from the event.
+        """
+        self._hub.unsubscribe(self)
+
+
+class _EventRegistration(object):
+    """
+    Holds the C callback registered with NI-DAQmx for one event of a task
+    and the subscriptions it dispatches to.
+    """
+    __slots__ = ['key', 'c_callback', 'subscriptions', 'latencies']
+
+    def __init__(self, key, c_callback):
+        self.key = key
+        # ctypes does not keep C callback objects in memory. The program
+        # crashes if NI-DAQmx calls a callback that was garbage collected.
+        self.c_callback = c_callback
+        self.subscriptions = ()
+        # Count, mean, M2, minimum and maximum of the dispatch latency.
+        self.latencies = [0, 0.0, 0.0, float('inf'), 0.0]
+
+
+class EventHub(object):
+    """
+    Dispatches the events of an NI-DAQmx task to any number of Python
+    callbacks.
+
+    The hub registers a single C callback with NI-DAQmx for each event
+    and calls every callback subscribed to the event, in order of
+    descending priority. An exception raised by one callback does not
+    prevent the others from being called; it is passed to the
+    "error_handler" function, if set, and kept in the "errors" list.
+
+    By default, callbacks are called on the NI-DAQmx thread that reports
+    the event. Set the "dispatch_on_worker_thread" property to True to
+    queue events to a worker thread instead, which returns control to
+    NI-DAQmx immediately.
+
+    Events registered through the hub and through the register methods of
+    :class:`nidaqmx.task.Task` are mutually exclusive; NI-DAQmx reports an
+    error if the same event is registered by both.
+    """
+
+    def __init__(self, task):
+        self._task = task
+        self._handle = task._handle
+        self._lock = threading.RLock()
+        self._registrations = {}
+        self._order = itertools.count()
+        self._errors = collections.deque(maxlen=100)
+        self._error_handler = None
+        self._queue = None
+        self._worker = None
+
+    def __repr__(self):
+        return 'EventHub(task={0})'.format(self._task.name)
+
+    @property
+    def dispatch_on_worker_thread(self):
+        """
+        bool: Specifies if callbacks are called on a worker thread owned
+            by the hub instead of on the NI-DAQmx thread that reports the
+            event.
+        """
+        return self._worker is not None
+
+    @dispatch_on_worker_thread.setter
+    def dispatch_on_worker_thread(self, val):
+        with self._lock:
+            if val and self._worker is None:
+                self._queue = queue.Queue()
+                self._worker = threading.Thread(
+                    target=self._run_worker, args=(self._queue,),
+                    name='{0} events'.format(self._task.name))
+                self._worker.daemon = True
+                self._worker.start()
+            elif not val and self._worker is not None:
+                self._stop_worker()
+
+    @property
+    def error_handler(self):
+        """
+        function: Specifies a function to call when a callback raises an
+            exception. The function receives the subscription and the
+            exception.
+        """
+        return self._error_handler
+
+    @error_handler.setter
+    def error_handler(self, val):
+        self._error_handler = val
+
+    @property
+    def errors(self):
+        """
+        List[Tuple[nidaqmx._task_modules.events.EventSubscription,
+            Exception]]: Indicates the most recent exceptions raised by
+            callbacks, up to 100.
+        """
+        return list(self._errors)
+
+    @property
+    def subscriptions(self):
+        """
+        List[nidaqmx._task_modules.events.EventSubscription]: Indicates
+            the subscriptions to every event of the task.
+        """
+        with self._lock:
+            return [s for r in self._registrations.values()
+                    for s in r.subscriptions]
+
+    def latency_statistics(self):
+        """
+        Gets statistics of the time from NI-DAQmx reporting each event to
+        the hub calling a callback, per event.
+
+        Returns:
+            Dict[str, nidaqmx.types.EventLatencyStatistics]:
+
+            Indicates the latency statistics, in seconds, keyed by the
+            name of each event: "done", "every_n_samples_acquired_into_
+            buffer", "every_n_samples_transferred_from_buffer", or the
+            name of the member of the nidaqmx.constants.Signal enum for
+            signal events.
+        """
+        statistics = {}
+        with self._lock:
+            for registration in self._registrations.values():
+                count, mean, m2, minimum, maximum = registration.latencies
+                std = math.sqrt(m2 / count) if count else 0.0
+                statistics[self._event_name(registration.key)] = (
+                    EventLatencyStatistics(
+                        count=count, mean=mean, std=std,
+                        min=minimum if count else 0.0, max=maximum))
+        return statistics
+
+    def subscribe_done(self, callback, priority=0):
+        """
+        Subscribes a callback to the event that occurs when the task stops
+        due to an error or when a finite acquisition or generation
+        completes.
+
+        Args:
+            callback (function): Specifies the function to call when the
+                event occurs. The function receives a
+                :class:`nidaqmx.types.DoneEvent`.
+            priority (Optional[int]): Specifies the priority of the
+                callback. Callbacks with a higher priority are called
+                first.
+        Returns:
+            nidaqmx._task_modules.events.EventSubscription:
+
+            Indicates the subscription.
+        """
+        return self._subscribe(('done',), callback, priority)
+
+    def subscribe_every_n_samples_acquired_into_buffer(
+            self, sample_interval, callback, priority=0):
+        """
+        Subscribes a callback to the event that occurs when the specified
+        number of samples is written from the device to the buffer.
+
+        Args:
+            sample_interval (int): Specifies the number of samples after
+                which each event occurs. Every callback subscribed to this
+                event must use the same sample interval.
+            callback (function): Specifies the function to call when the
+                event occurs. The function receives a
+                :class:`nidaqmx.types.EveryNSamplesEvent`.
+            priority (Optional[int]): Specifies the priority of the
+                callback. Callbacks with a higher priority are called
+                first.
+        Returns:
+            nidaqmx._task_modules.events.EventSubscription:
+
+            Indicates the subscription.
+        """
+        return self._subscribe(
+            (EveryNSamplesEventType.ACQUIRED_INTO_BUFFER, sample_interval),
+            callback, priority)
+
+    def subscribe_every_n_samples_transferred_from_buffer(
+            self, sample_interval, callback, priority=0):
+        """
+        Subscribes a callback to the event that occurs when the specified
+        number of samples is written from the buffer to the device.
+
+        Args:
+            sample_interval (int): Specifies the number of samples after
+                which each event occurs. Every callback subscribed to this
+                event must use the same sample interval.
+            callback (function): Specifies the function to call when the
+                event occurs. The function receives a
+                :class:`nidaqmx.types.EveryNSamplesEvent`.
+            priority (Optional[int]): Specifies the priority of the
+                callback. Callbacks with a higher priority are called
+                first.
+        Returns:
+            nidaqmx._task_modules.events.EventSubscription:
+
+            Indicates the subscription.
+        """
+        return self._subscribe(
+            (EveryNSamplesEventType.TRANSFERRED_FROM_BUFFER,
+             sample_interval),
+            callback, priority)
+
+    def subscribe_signal(self, signal_type, callback, priority=0):
+        """
+        Subscribes a callback to the event that occurs when the specified
+        hardware signal occurs.
+
+        Args:
+            signal_type (nidaqmx.constants.Signal): Specifies the type of
+                signal.
+            callback (function): Specifies the function to call when the
+                event occurs. The function receives a
+                :class:`nidaqmx.types.SignalEvent`.
+            priority (Optional[int]): Specifies the priority of the
+                callback. Callbacks with a higher priority are called
+                first.
+        Returns:
+            nidaqmx._task_modules.events.EventSubscription:
+
+            Indicates the subscription.
+        """
+        return self._subscribe((signal_type,), callback, priority)
+
+    def unsubscribe(self, subscription):
+        """
+        Unsubscribes a callback from its event. NI-DAQmx stops reporting
+        the event once no callbacks are subscribed to it.
+
+        Args:
+            subscription (nidaqmx._task_modules.events.EventSubscription):
+                Specifies the subscription to remove.
+        """
+        with self._lock:
+            registration = self._registrations.get(subscription._key[:1])
+            if (registration is None or
+                    subscription not in registration.subscriptions):
+                return
+
+            remaining = tuple(
+                s for s in registration.subscriptions
+                if s is not subscription)
+            if not remaining:
+                self._register(registration.key, None)
+                del self._registrations[registration.key[:1]]
+            registration.subscriptions = remaining
+
+    def close(self):
+        """
+        Unsubscribes every callback and stops the worker thread, if any.
+        """
+        with self._lock:
+            if self._task._handle is not None:
+                for registration in list(self._registrations.values()):
+                    self._register(registration.key, None)
+            self._registrations.clear()
+            if self._worker is not None:
+                self._stop_worker()
+
+    def _subscribe(self, key, callback, priority):
+        with self._lock:
+            registration = self._registrations.get(key[:1])
+            if registration is None:
+                registration = _EventRegistration(
+                    key, self._create_c_callback(key))
+                self._register(key, registration.c_callback)
+                self._registrations[key[:1]] = registration
+            elif registration.key != key:
+                raise DaqError(
+                    'Every callback subscribed to an Every N Samples event '
+                    'must use the same sample interval.\n\n'
+                    'Sample interval of existing subscriptions: {0}\n'
+                    'Sample interval requested: {1}'.format(
+                        registration.key[1], key[1]),
+                    DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+
+            subscription = EventSubscription(
+                self, key, callback, priority, next(self._order))
+
+            # Replace rather than mutate the tuple so that dispatch never
+            # needs the lock to iterate over the subscriptions.
+            registration.subscriptions = tuple(sorted(
+                registration.subscriptions + (subscription,),
+                key=lambda s: (-s._priority, s._order)))
+            return subscription
+
+    def _create_c_callback(self, key):
+        registration_key = key[:1]
+        DAQmxDoneEventCallbackPtr, DAQmxEveryNSamplesEventCallbackPtr, \
+            DAQmxSignalEventCallbackPtr = _get_callback_ptr_types()
+
+        if key[0] == 'done':
+            def done_callback(task_handle, status, callback_data):
+                self._post(registration_key, DoneEvent(
+                    status=status, timestamp=_clock()))
+                return 0
+            return DAQmxDoneEventCallbackPtr(done_callback)
+
+        if isinstance(key[0], EveryNSamplesEventType):
+            event_type = key[0]
+
+            def every_n_samples_callback(
+                    task_handle, every_n_samples_event_type,
+                    number_of_samples, callback_data):
+                self._post(registration_key, EveryNSamplesEvent(
+                    event_type=event_type,
+                    number_of_samples=number_of_samples,
+                    timestamp=_clock()))
+                return 0
+            return DAQmxEveryNSamplesEventCallbackPtr(
+                every_n_samples_callback)
+
+        signal_type = key[0]
+
+        def signal_callback(task_handle, signal_id, callback_data):
+            self._post(registration_key, SignalEvent(
+                signal_type=signal_type, timestamp=_clock()))
+            return 0
+        return DAQmxSignalEventCallbackPtr(signal_callback)
+
+    def _register(self, key, c_callback):
+        DAQmxDoneEventCallbackPtr, DAQmxEveryNSamplesEventCallbackPtr, \
+            DAQmxSignalEventCallbackPtr = _get_callback_ptr_types()
+
+        if key[0] == 'done':
+            cfunc = lib_importer.windll.DAQmxRegisterDoneEvent
+            cfunc.argtypes = [
+                lib_importer.task_handle, ctypes.c_uint,
+                DAQmxDoneEventCallbackPtr, ctypes.c_void_p]
+
+            error_code = cfunc(self._handle, 0, c_callback, None)
+
+        elif isinstance(key[0], EveryNSamplesEventType):
+            cfunc = lib_importer.windll.DAQmxRegisterEveryNSamplesEvent
+            cfunc.argtypes = [
+                lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
+                ctypes.c_uint, DAQmxEveryNSamplesEventCallbackPtr,
+                ctypes.c_void_p]
+
+            error_code = cfunc(
+                self._handle, key[0].value, key[1], 0, c_callback, None)
+
+        else:
+            cfunc = lib_importer.windll.DAQmxRegisterSignalEvent
+            cfunc.argtypes = [
+                lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
+                DAQmxSignalEventCallbackPtr, ctypes.c_void_p]
+
+            error_code = cfunc(
+                self._handle, key[0].value, 0, c_callback, None)
+
+        check_for_error(error_code)
+
+    def _post(self, registration_key, event):
+        event_queue = self._queue
+        if event_queue is not None:
+            event_queue.put((registration_key, event))
+        else:
+            self._dispatch(registration_key, event)
+
+    def _dispatch(self, registration_key, event):
+        registration = self._registrations.get(registration_key)
+        if registration is None:
+            return
+
+        latencies = registration.latencies
+        for subscription in registration.subscriptions:
+            # Welford's method keeps the statistics without storing each
+            # latency.
+            latency = _clock() - event.timestamp
+            latencies[0] += 1
+            delta = latency - latencies[1]
+            latencies[1] += delta / latencies[0]
+            latencies[2] += delta * (latency - latencies[1])
+            latencies[3] = min(latencies[3], latency)
+            latencies[4] = max(latencies[4], latency)
+
+            subscription._deliveries += 1
+            try:
+                subscription._callback(event)
+            except Exception as e:
+                self._errors.append((subscription, e))
+                error_handler = self._error_handler
+                if error_handler is not None:
+                    try:
+                        error_handler(subscription, e)
+                    except Exception:
+                        pass
+
+    def _drain(self):
+        """
+        Waits until the worker thread, if any, has dispatched the events
+        queued before the call.
+        """
+        with self._lock:
+            event_queue, worker = self._queue, self._worker
+        if event_queue is None or worker is threading.current_thread():
+            return
+
+        drained = threading.Event()
+        event_queue.put((_DRAIN_MARKER, drained))
+        drained.wait()
+
+    def _run_worker(self, event_queue):
+        while True:
+            item = event_queue.get()
+            if item is _STOP_WORKER:
+                return
+            if item[0] is _DRAIN_MARKER:
+                item[1].set()
+                continue
+            self._dispatch(*item)
+
+    def _stop_worker(self):
+        self._queue.put(_STOP_WORKER)
+        if self._worker is not threading.current_thread():
+            self._worker.join()
+        self._queue = None
+        self._worker = None
+
+    @staticmethod
+    def _event_name(key):
+        if key[0] == 'done':
+            return 'done'
+        if key[0] == EveryNSamplesEventType.ACQUIRED_INTO_BUFFER:
+            return 'every_n_samples_acquired_into_buffer'
+        if key[0] == EveryNSamplesEventType.TRANSFERRED_FROM_BUFFER:
+            return 'every_n_samples_transferred_from_buffer'
+        return key[0].name
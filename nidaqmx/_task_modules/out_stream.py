@@ -27,6 +27,7 @@ class OutStream(object):
         self._handle = task._handle
         self._auto_start = False
         self._timeout = 10.0
+        self._raw_sample_size = None
 
         super(OutStream, self).__init__()
 
@@ -925,15 +926,29 @@ class OutStream(object):
             Specifies the actual number of samples per channel successfully 
             written to the buffer.
         """
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_samples_per_channel = (
+            numpy_array.nbytes * 8 // self._get_raw_sample_size())
 
-        channels_to_write.ao_resolution_units = ResolutionType.BITS
+        return _write_raw(
+            self._handle, number_of_samples_per_channel, numpy_array,
+            self.auto_start, self.timeout)
+
+    def _get_raw_sample_size(self):
+        """
+        Gets the size in bits of one raw sample of every channel in the
+        task. The size is cached and queried again only if the number of
+        channels in the task changed.
+        """
+        number_of_channels = self._task.number_of_channels
 
-        number_of_samples_per_channel, _ = divmod(
-            numpy_array.nbytes, (
-                number_of_channels * channels_to_write.ao_resolution / 8))
+        cached = self._raw_sample_size
+        if cached is not None and cached[0] == number_of_channels:
+            return cached[1]
 
-        return _write_raw(
-            self._handle, number_of_samples_per_channel, self.auto_start,
-            self.timeout, numpy_array)
+        channels_to_write = self._task.channels
+        channels_to_write.ao_resolution_units = ResolutionType.BITS
+        raw_sample_size = int(
+            number_of_channels * channels_to_write.ao_resolution)
+
+        self._raw_sample_size = (number_of_channels, raw_sample_size)
+        return raw_sample_size
@@ -0,0 +1,382 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import inspect
+import re
+import six
+import threading
+
+from nidaqmx import constants
+from nidaqmx.constants import UsageTypeAI, UsageTypeAO, UsageTypeCI, UsageTypeCO
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.scale import Scale
+from nidaqmx.system.physical_channel import PhysicalChannel
+from nidaqmx._task_modules.channels.channel import Channel
+
+__all__ = ['PropertyDescriptor', 'PropertyManifest', 'get_property_manifest',
+           'invalidate_property_manifests']
+
+# Matches the type at the start of a property docstring, such as "float:"
+# or ":class:`nidaqmx.constants.TerminalConfiguration`:".
+_DOCSTRING_TYPE = re.compile(r'\s*(?::class:`([^`]+)`|([^:\s]+))\s*:')
+
+# Properties that identify an object rather than configure it, and
+# properties that return other objects with properties of their own.
+# Private properties are excluded as well.
+_EXCLUDED_PROPERTIES = frozenset(['name', 'channel_names'])
+_EXCLUDED_TYPE_PREFIX = 'nidaqmx._task_modules.triggering.'
+
+# Errors NI-DAQmx reports for properties that do not apply to the type of
+# the channel or to the device. A property that fails with one of these
+# errors fails again for the same measurement type and devices, so the
+# manifest remembers it and skips it from then on.
+_INAPPLICABLE_ERROR_CODES = frozenset([
+    DAQmxErrors.ATTRIBUTE_NOT_SUPPORTED_IN_TASK_CONTEXT.value,
+    DAQmxErrors.ATTR_NOT_SUPPORTED.value,
+    DAQmxErrors.ATTR_NOT_SUPPORTED_ON_ACCESSORY.value,
+    DAQmxErrors.PROPERTY_NOT_SUPPORTED_FOR_BUS_TYPE.value])
+
+_ACCELERATION = frozenset([
+    UsageTypeAI.ACCELERATION_ACCELEROMETER_CURRENT_INPUT,
+    UsageTypeAI.ACCELERATION_CHARGE,
+    UsageTypeAI.ACCELERATION_4_WIRE_DC_VOLTAGE])
+_STRAIN = frozenset([
+    UsageTypeAI.STRAIN_STRAIN_GAGE, UsageTypeAI.ROSETTE_STRAIN_GAGE])
+
+# For each channel class, the property that indicates the measurement or
+# output type of the channel and the property name prefixes that apply
+# only to some types. The longest matching prefix wins.
+_APPLICABILITY_RULES = {
+    'AIChannel': ('ai_meas_type', {
+        'ai_accel_': _ACCELERATION,
+        'ai_acceld_': _ACCELERATION,
+        'ai_charge_': frozenset([UsageTypeAI.CHARGE]),
+        'ai_eddy_current_prox_': frozenset([
+            UsageTypeAI.POSITION_EDDY_CURRENT_PROX_PROBE]),
+        'ai_force_iepe_': frozenset([UsageTypeAI.FORCE_IEPE_SENSOR]),
+        'ai_freq_': frozenset([UsageTypeAI.FREQUENCY_VOLTAGE]),
+        'ai_lvdt_': frozenset([UsageTypeAI.POSITION_LINEAR_LVDT]),
+        'ai_microphone_': frozenset([
+            UsageTypeAI.SOUND_PRESSURE_MICROPHONE]),
+        'ai_pressure_': frozenset([UsageTypeAI.PRESSURE_BRIDGE]),
+        'ai_rosette_': frozenset([UsageTypeAI.ROSETTE_STRAIN_GAGE]),
+        'ai_rtd_': frozenset([UsageTypeAI.TEMPERATURE_RTD]),
+        'ai_rvdt_': frozenset([UsageTypeAI.POSITION_ANGULAR_RVDT]),
+        'ai_sound_pressure': frozenset([
+            UsageTypeAI.SOUND_PRESSURE_MICROPHONE]),
+        'ai_strain_gage_': _STRAIN,
+        'ai_strain_units': _STRAIN,
+        'ai_thrmcpl_': frozenset([UsageTypeAI.TEMPERATURE_THERMOCOUPLE]),
+        'ai_thrmstr_': frozenset([UsageTypeAI.TEMPERATURE_THERMISTOR]),
+        'ai_torque_': frozenset([UsageTypeAI.TORQUE_BRIDGE]),
+        'ai_velocity_': frozenset([UsageTypeAI.VELOCITY_IEPE_SENSOR]),
+    }),
+    'AOChannel': ('ao_output_type', {
+        'ao_current_units': frozenset([UsageTypeAO.CURRENT]),
+        'ao_func_gen_': frozenset([UsageTypeAO.FUNCTION_GENERATION]),
+        'ao_voltage_units': frozenset([UsageTypeAO.VOLTAGE]),
+    }),
+    'CIChannel': ('ci_meas_type', {
+        'ci_ang_encoder_': frozenset([UsageTypeCI.POSITION_ANGULAR_ENCODER]),
+        'ci_count_edges_': frozenset([UsageTypeCI.COUNT_EDGES]),
+        'ci_duty_cycle_': frozenset([UsageTypeCI.DUTY_CYCLE]),
+        'ci_encoder_': frozenset([
+            UsageTypeCI.POSITION_ANGULAR_ENCODER,
+            UsageTypeCI.POSITION_LINEAR_ENCODER]),
+        'ci_freq_': frozenset([UsageTypeCI.FREQUENCY]),
+        'ci_gps_': frozenset([UsageTypeCI.TIME_GPS]),
+        'ci_lin_encoder_': frozenset([UsageTypeCI.POSITION_LINEAR_ENCODER]),
+        'ci_period_': frozenset([UsageTypeCI.PERIOD]),
+        'ci_pulse_freq_': frozenset([UsageTypeCI.PULSE_FREQ]),
+        'ci_pulse_ticks_': frozenset([UsageTypeCI.PULSE_TICKS]),
+        'ci_pulse_time_': frozenset([UsageTypeCI.PULSE_TIME]),
+        'ci_pulse_width_': frozenset([UsageTypeCI.PULSE_WIDTH_DIGITAL]),
+        'ci_semi_period_': frozenset([
+            UsageTypeCI.PULSE_WIDTH_DIGITAL_SEMI_PERIOD]),
+        'ci_two_edge_sep_': frozenset([
+            UsageTypeCI.PULSE_WIDTH_DIGITAL_TWO_EDGE_SEPARATION]),
+        'ci_velocity_': frozenset([
+            UsageTypeCI.VELOCITY_ANGULAR_ENCODER,
+            UsageTypeCI.VELOCITY_LINEAR_ENCODER]),
+        'ci_velocity_ang_encoder_': frozenset([
+            UsageTypeCI.VELOCITY_ANGULAR_ENCODER]),
+        'ci_velocity_lin_encoder_': frozenset([
+            UsageTypeCI.VELOCITY_LINEAR_ENCODER]),
+    }),
+    'COChannel': ('co_output_type', {
+        'co_pulse_duty_cyc': frozenset([UsageTypeCO.PULSE_FREQUENCY]),
+        'co_pulse_freq': frozenset([UsageTypeCO.PULSE_FREQUENCY]),
+        'co_pulse_high_ticks': frozenset([UsageTypeCO.PULSE_TICKS]),
+        'co_pulse_high_time': frozenset([UsageTypeCO.PULSE_TIME]),
+        'co_pulse_low_ticks': frozenset([UsageTypeCO.PULSE_TICKS]),
+        'co_pulse_low_time': frozenset([UsageTypeCO.PULSE_TIME]),
+        'co_pulse_ticks_': frozenset([UsageTypeCO.PULSE_TICKS]),
+        'co_pulse_time_': frozenset([UsageTypeCO.PULSE_TIME]),
+    }),
+}
+
+# Classes of the object-valued properties, keyed by the name of the class
+# in the property docstrings. Such properties are set from an object and
+# represented by its name.
+_OBJECT_TYPES = {
+    'Channel': Channel,
+    'PhysicalChannel': PhysicalChannel,
+    'Scale': Scale,
+}
+
+# Properties that select the type, mode or units of an object change which
+# other properties apply and how NI-DAQmx interprets them, so they are
+# written first. Ranges are written last because they are expressed in the
+# units of the channel.
+_FIRST_WRITTEN_SUFFIXES = (
+    '_cfg', '_meth', '_mode', '_src', '_type', '_units')
+_LAST_WRITTEN_PROPERTIES = frozenset([
+    'ai_max', 'ai_min', 'ao_max', 'ao_min', 'ci_max', 'ci_min'])
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+class PropertyDescriptor(object):
+    """
+    Describes one property of an NI-DAQmx task, channel, timing or
+    trigger class.
+    """
+    __slots__ = ['name', 'value_type', 'settable', 'resettable',
+                 'applicable_types', 'write_rank']
+
+    def __init__(self, name, value_type, settable, resettable,
+                 applicable_types):
+        self.name = name
+        self.value_type = value_type
+        self.settable = settable
+        self.resettable = resettable
+        self.applicable_types = applicable_types
+
+        if name.endswith(_FIRST_WRITTEN_SUFFIXES):
+            self.write_rank = 0
+        elif name in _LAST_WRITTEN_PROPERTIES:
+            self.write_rank = 2
+        else:
+            self.write_rank = 1
+
+    def __repr__(self):
+        return 'PropertyDescriptor(name={0}, value_type={1})'.format(
+            self.name, self.value_type)
+
+    def to_plain_value(self, value):
+        """
+        Converts a value to the form a snapshot represents the property
+        with. Enum-valued properties accept the enum member, its name or
+        its value; object-valued properties accept the object or its name.
+        """
+        type_name = self.value_type.rpartition('.')[2]
+        if self.value_type.startswith('nidaqmx.constants.'):
+            enum_type = getattr(constants, type_name)
+            if isinstance(value, enum_type):
+                return value
+            if isinstance(value, six.string_types):
+                return enum_type[value]
+            return enum_type(value)
+        return _to_plain_value(value)
+
+    def to_setter_value(self, value, task_handle):
+        """
+        Converts a value in the form a snapshot represents the property
+        with to the value the setter of the property expects.
+        """
+        object_type = _OBJECT_TYPES.get(self.value_type.rpartition('.')[2])
+        if object_type is Channel:
+            return Channel(task_handle, value)
+        if object_type is not None:
+            return object_type(value)
+        return value
+
+
+class PropertyManifest(object):
+    """
+    Lists the properties of a class, their types and the measurement or
+    output types they apply to.
+
+    The manifest is built once per class from the property docstrings.
+    It also learns which properties NI-DAQmx reports as not applicable to
+    a measurement type and set of devices, so that later reads skip them
+    without calling the driver.
+    """
+
+    def __init__(self, cls):
+        self._cls = cls
+        context_property, rules = _APPLICABILITY_RULES.get(
+            cls.__name__, (None, {}))
+        self._context_property = context_property
+
+        prefixes = sorted(rules, key=len, reverse=True)
+        descriptors = []
+        for name, prop in inspect.getmembers(
+                cls, lambda o: isinstance(o, property)):
+            if (name.startswith('_') or name in _EXCLUDED_PROPERTIES or
+                    name == context_property):
+                continue
+            match = _DOCSTRING_TYPE.match(prop.__doc__ or '')
+            if match is None:
+                continue
+            value_type = match.group(1) or match.group(2)
+            if value_type.startswith(_EXCLUDED_TYPE_PREFIX):
+                continue
+
+            applicable_types = None
+            for prefix in prefixes:
+                if name.startswith(prefix):
+                    applicable_types = rules[prefix]
+                    break
+
+            descriptors.append(PropertyDescriptor(
+                name, value_type, prop.fset is not None,
+                prop.fdel is not None, applicable_types))
+
+        self._descriptors = tuple(descriptors)
+        self._by_name = dict((d.name, d) for d in descriptors)
+        self._inapplicable = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'PropertyManifest(cls={0})'.format(self._cls.__name__)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def __iter__(self):
+        return iter(self._descriptors)
+
+    def __len__(self):
+        return len(self._descriptors)
+
+    @property
+    def context_property(self):
+        """
+        str: Indicates the name of the property that indicates the
+            measurement or output type of the class, or None if every
+            property applies regardless of type.
+        """
+        return self._context_property
+
+    def applicable(self, context):
+        """
+        Lists the properties that may apply in the specified context.
+
+        Args:
+            context (tuple): Specifies the measurement or output type, or
+                None, followed by the product types of the devices.
+        Returns:
+            List[nidaqmx._task_modules.property_manifest.PropertyDescriptor]:
+
+            Indicates the properties not known to be inapplicable.
+        """
+        inapplicable = self._inapplicable.get(context, ())
+        usage_type = context[0]
+        return [
+            d for d in self._descriptors
+            if d.name not in inapplicable and (
+                usage_type is None or d.applicable_types is None or
+                usage_type in d.applicable_types)]
+
+    def mark_inapplicable(self, context, name):
+        """
+        Records that a property does not apply in the specified context.
+        """
+        with self._lock:
+            self._inapplicable.setdefault(context, set()).add(name)
+
+    def invalidate(self):
+        """
+        Forgets which properties were found not to apply, so that later
+        reads try every property again.
+        """
+        with self._lock:
+            self._inapplicable.clear()
+
+    def read(self, obj, devices=()):
+        """
+        Reads every property of an object that may apply to it.
+
+        Properties that NI-DAQmx reports as not applicable are skipped on
+        later reads in the same context. Properties that fail with any
+        other error are left out of the result.
+
+        Args:
+            obj: Specifies the channel, timing, trigger or stream object to
+                read.
+            devices (Optional[tuple]): Specifies the product types of the
+                devices in the task. Applicability of properties depends
+                on the devices.
+        Returns:
+            dict:
+
+            Indicates the value of each property, keyed by name. Objects
+            such as physical channels and scales are represented by name.
+        """
+        values = {}
+        usage_type = None
+        if self._context_property is not None:
+            try:
+                usage_type = getattr(obj, self._context_property)
+            except DaqError:
+                pass
+            else:
+                values[self._context_property] = usage_type
+        context = (usage_type,) + tuple(devices)
+
+        for descriptor in self.applicable(context):
+            try:
+                value = getattr(obj, descriptor.name)
+            except DaqError as e:
+                if e.error_code in _INAPPLICABLE_ERROR_CODES:
+                    self.mark_inapplicable(context, descriptor.name)
+                continue
+            values[descriptor.name] = _to_plain_value(value)
+        return values
+
+
+def get_property_manifest(cls):
+    """
+    Gets the property manifest of a class, building it the first time.
+
+    Args:
+        cls (type): Specifies the class.
+    Returns:
+        nidaqmx._task_modules.property_manifest.PropertyManifest:
+
+        Indicates the property manifest of the class.
+    """
+    manifest = _manifests.get(cls)
+    if manifest is None:
+        with _manifests_lock:
+            manifest = _manifests.get(cls)
+            if manifest is None:
+                manifest = PropertyManifest(cls)
+                _manifests[cls] = manifest
+    return manifest
+
+
+def invalidate_property_manifests():
+    """
+    Forgets which properties were found not to apply in every property
+    manifest, such as after the devices of the system change.
+    """
+    with _manifests_lock:
+        manifests = list(_manifests.values())
+    for manifest in manifests:
+        manifest.invalidate()
+
+
+def _to_plain_value(value):
+    # Physical channels, scales and channels are represented by name.
+    if hasattr(value, 'name') and not hasattr(value, 'value'):
+        return value.name
+    return value
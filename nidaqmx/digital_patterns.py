@@ -0,0 +1,494 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import hashlib
+import numpy
+import threading
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+
+__all__ = ['DigitalPattern', 'DigitalPatternCompiler']
+
+_PORT_DTYPES = {
+    8: numpy.uint8,
+    16: numpy.uint16,
+    32: numpy.uint32,
+}
+
+
+def _digest(array):
+    return hashlib.sha1(numpy.ascontiguousarray(array).tobytes()).hexdigest()
+
+
+class DigitalPattern(object):
+    """
+    Describes the waveform of each line of a digital port symbolically.
+
+    Each line is described by one of an explicit sequence of values,
+    which can repeat, a clock, a list of edges, or a timeline of value
+    changes. Lines that are not described are held low. Compile a pattern
+    with a :class:`DigitalPatternCompiler` to obtain the port-width
+    unsigned integer samples that
+    :class:`nidaqmx.stream_writers.DigitalSingleChannelWriter` and
+    :class:`nidaqmx.stream_writers.DigitalMultiChannelWriter` write.
+    """
+
+    def __init__(self, number_of_samples, port_width=32):
+        """
+        Args:
+            number_of_samples (int): Specifies the number of samples in
+                the pattern.
+            port_width (Optional[int]): Specifies the number of lines in
+                the port; 8, 16 or 32.
+        """
+        if port_width not in _PORT_DTYPES:
+            raise DaqError(
+                'Port width must be 8, 16 or 32.\n\n'
+                'Port width: {0}'.format(port_width),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._number_of_samples = int(number_of_samples)
+        self._port_width = port_width
+        # Maps each line to a tuple of the hashable key that identifies its
+        # description and the arguments needed to render it.
+        self._lines = {}
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.key == other.key
+        return False
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'DigitalPattern(number_of_samples={0}, port_width={1})'.format(
+            self._number_of_samples, self._port_width)
+
+    @classmethod
+    def from_timeline(cls, number_of_samples, events, port_width=32,
+                      initial_values=0):
+        """
+        Creates a pattern from a timeline of value changes, in the manner
+        of a value change dump.
+
+        Args:
+            number_of_samples (int): Specifies the number of samples in
+                the pattern.
+            events (List[Tuple[int, int, bool]]): Specifies the sample
+                index, line and new value of each value change. Events do
+                not need to be in order.
+            port_width (Optional[int]): Specifies the number of lines in
+                the port; 8, 16 or 32.
+            initial_values (Optional[int]): Specifies the value of every
+                line before its first event, as a bit mask in which bit
+                *n* corresponds to line *n*.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            The pattern.
+        """
+        pattern = cls(number_of_samples, port_width)
+
+        changes_by_line = collections.defaultdict(list)
+        for sample_index, line, value in events:
+            changes_by_line[line].append((sample_index, value))
+
+        for line in range(port_width):
+            initial_value = bool((initial_values >> line) & 1)
+            if line in changes_by_line:
+                pattern.set_timeline(
+                    line, changes_by_line.pop(line), initial_value)
+            elif initial_value:
+                pattern.set_values(line, [True], repeat=True)
+
+        if changes_by_line:
+            pattern._raise_invalid_line_error(min(changes_by_line))
+        return pattern
+
+    @property
+    def dtype(self):
+        """
+        numpy.dtype: Indicates the data type of the compiled samples.
+        """
+        return numpy.dtype(_PORT_DTYPES[self._port_width])
+
+    @property
+    def key(self):
+        """
+        tuple: Indicates a hashable value that uniquely identifies the
+            pattern.
+        """
+        return (self._number_of_samples, self._port_width,
+                tuple(sorted(
+                    (line, spec[0]) for line, spec in self._lines.items())))
+
+    @property
+    def lines(self):
+        """
+        List[int]: Indicates the lines that the pattern describes.
+        """
+        return sorted(self._lines)
+
+    @property
+    def number_of_samples(self):
+        """
+        int: Indicates the number of samples in the pattern.
+        """
+        return self._number_of_samples
+
+    @property
+    def port_width(self):
+        """
+        int: Indicates the number of lines in the port.
+        """
+        return self._port_width
+
+    def copy(self):
+        """
+        Returns a copy of the pattern that can be modified independently.
+
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            The copy of the pattern.
+        """
+        pattern = DigitalPattern(self._number_of_samples, self._port_width)
+        pattern._lines = dict(self._lines)
+        return pattern
+
+    def clear_line(self, line):
+        """
+        Removes the description of a line, holding it low.
+
+        Args:
+            line (int): Specifies the line.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            This pattern.
+        """
+        self._lines.pop(line, None)
+        return self
+
+    def set_values(self, line, values, repeat=False):
+        """
+        Describes a line with an explicit sequence of values.
+
+        Args:
+            line (int): Specifies the line.
+            values (numpy.ndarray): Specifies the value of the line at
+                each sample.
+            repeat (Optional[bool]): Specifies if the values repeat until
+                the end of the pattern. If False, the number of values
+                must equal the number of samples in the pattern.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            This pattern.
+        """
+        self._verify_line(line)
+        values = numpy.asarray(values).astype(numpy.bool_, copy=False)
+        if values.ndim != 1 or not values.size or (
+                not repeat and values.size != self._number_of_samples):
+            raise DaqError(
+                'Number of values does not match the number of samples in '
+                'the pattern.\n\n'
+                'Number of values: {0}\n'
+                'Number of samples: {1}'.format(
+                    values.size, self._number_of_samples),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._lines[line] = (
+            ('values', _digest(values), bool(repeat)), (values, repeat))
+        return self
+
+    def set_clock(self, line, period, high_samples=None, phase=0):
+        """
+        Describes a line with a periodic clock.
+
+        Args:
+            line (int): Specifies the line.
+            period (int): Specifies the period of the clock in samples.
+            high_samples (Optional[int]): Specifies the number of samples
+                in each period that the clock is high. If you do not
+                specify a value, the clock is high for half of each
+                period, rounded down.
+            phase (Optional[int]): Specifies the number of samples into
+                the period at which the pattern starts.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            This pattern.
+        """
+        self._verify_line(line)
+        period = int(period)
+        if period < 1:
+            raise DaqError(
+                'Clock period must be at least 1 sample.\n\n'
+                'Period: {0}'.format(period), DAQmxErrors.UNKNOWN.value)
+        if high_samples is None:
+            high_samples = period // 2
+
+        args = (period, int(high_samples), int(phase) % period)
+        self._lines[line] = (('clock',) + args, args)
+        return self
+
+    def set_edges(self, line, edges, initial_value=False):
+        """
+        Describes a line with the samples at which it toggles.
+
+        Args:
+            line (int): Specifies the line.
+            edges (List[int]): Specifies the index of each sample at which
+                the line changes value. A sample index that appears twice
+                toggles the line twice.
+            initial_value (Optional[bool]): Specifies the value of the
+                line before the first edge.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            This pattern.
+        """
+        self._verify_line(line)
+        edges = numpy.asarray(edges, dtype=numpy.int64).ravel()
+        self._verify_sample_indices(edges)
+
+        edges = numpy.sort(edges)
+        self._lines[line] = (
+            ('edges', _digest(edges), bool(initial_value)),
+            (edges, bool(initial_value)))
+        return self
+
+    def set_timeline(self, line, changes, initial_value=False):
+        """
+        Describes a line with the samples at which it changes value.
+
+        Args:
+            line (int): Specifies the line.
+            changes (List[Tuple[int, bool]]): Specifies the sample index
+                and new value of each change. If a sample index appears
+                more than once, the last change at that index wins.
+            initial_value (Optional[bool]): Specifies the value of the
+                line before the first change.
+        Returns:
+            nidaqmx.digital_patterns.DigitalPattern:
+
+            This pattern.
+        """
+        self._verify_line(line)
+        changes = numpy.asarray(changes, dtype=numpy.int64).reshape(-1, 2)
+        self._verify_sample_indices(changes[:, 0])
+
+        # A stable sort keeps the order of changes at the same sample.
+        order = numpy.argsort(changes[:, 0], kind='mergesort')
+        times = changes[order, 0]
+        values = changes[order, 1] != 0
+
+        self._lines[line] = (
+            ('timeline', _digest(times), _digest(values),
+             bool(initial_value)),
+            (times, values, bool(initial_value)))
+        return self
+
+    def _render_line(self, line):
+        kind = self._lines[line][0][0]
+        args = self._lines[line][1]
+        number_of_samples = self._number_of_samples
+
+        if kind == 'values':
+            values, repeat = args
+            if repeat and values.size != number_of_samples:
+                return numpy.resize(values, number_of_samples)
+            return values
+
+        if kind == 'clock':
+            period, high_samples, phase = args
+            positions = numpy.arange(
+                phase, phase + number_of_samples, dtype=numpy.int64)
+            positions %= period
+            return positions < high_samples
+
+        if kind == 'edges':
+            edges, initial_value = args
+            toggles = numpy.bincount(edges, minlength=number_of_samples)
+            levels = numpy.cumsum(toggles, out=toggles) & 1
+            if initial_value:
+                levels ^= 1
+            return levels.astype(numpy.bool_)
+
+        times, values, initial_value = args
+        # Find the last change at or before each sample.
+        indices = numpy.searchsorted(
+            times, numpy.arange(number_of_samples), side='right')
+        levels = numpy.concatenate(([initial_value], values))
+        return levels[indices]
+
+    def _verify_line(self, line):
+        if not 0 <= line < self._port_width:
+            self._raise_invalid_line_error(line)
+
+    def _verify_sample_indices(self, indices):
+        if indices.size and (
+                indices.min() < 0 or
+                indices.max() >= self._number_of_samples):
+            raise DaqError(
+                'Sample indices must be between 0 and the number of samples '
+                'in the pattern.\n\n'
+                'Sample index: {0}\n'
+                'Number of samples: {1}'.format(
+                    indices.min() if indices.min() < 0 else indices.max(),
+                    self._number_of_samples),
+                DAQmxErrors.UNKNOWN.value)
+
+    def _raise_invalid_line_error(self, line):
+        raise DaqError(
+            'Line must be between 0 and the port width.\n\n'
+            'Line: {0}\n'
+            'Port width: {1}'.format(line, self._port_width),
+            DAQmxErrors.UNKNOWN.value)
+
+
+class DigitalPatternCompiler(object):
+    """
+    Compiles digital patterns into the port-width unsigned integer samples
+    written by the digital stream writers.
+
+    Compiled samples are cached by pattern, and the compiler evicts the
+    least recently used samples once it holds more than **max_entries**.
+    When a pattern differs from the previously compiled pattern of the same
+    size in only some of its lines, the compiler reuses the previous
+    samples and recompiles only the lines that changed. Arrays returned by
+    the compiler are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries=64):
+        """
+        Args:
+            max_entries (Optional[int]): Specifies the maximum number of
+                compiled patterns to cache.
+        """
+        self._max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        # Maps the number of samples and data type of a pattern to the
+        # line descriptions and samples of the last pattern compiled.
+        self._bases = {}
+        self._hits = 0
+        self._misses = 0
+        self._lines_compiled = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hits(self):
+        """
+        int: Indicates the number of patterns served from the cache.
+        """
+        return self._hits
+
+    @property
+    def lines_compiled(self):
+        """
+        int: Indicates the total number of lines the compiler rendered.
+        """
+        return self._lines_compiled
+
+    @property
+    def misses(self):
+        """
+        int: Indicates the number of patterns the compiler compiled.
+        """
+        return self._misses
+
+    def clear(self):
+        """
+        Removes all compiled patterns from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bases.clear()
+
+    def compile(self, patterns):
+        """
+        Compiles one pattern, or one pattern per channel.
+
+        Args:
+            patterns (nidaqmx.digital_patterns.DigitalPattern or
+                List[nidaqmx.digital_patterns.DigitalPattern]): Specifies
+                the pattern to compile, or a list that contains the
+                pattern of each channel in the task. Every pattern in the
+                list must have the same number of samples and port width.
+        Returns:
+            numpy.ndarray:
+
+            The compiled samples. If you specify one pattern, a 1D array
+            for :class:`nidaqmx.stream_writers.DigitalSingleChannelWriter`.
+            If you specify a list of patterns, a 2D array in which each
+            row corresponds to a channel, for
+            :class:`nidaqmx.stream_writers.DigitalMultiChannelWriter`.
+        """
+        if isinstance(patterns, DigitalPattern):
+            return self._compile(patterns)
+
+        if len(set((p.number_of_samples, p.port_width)
+                   for p in patterns)) > 1:
+            raise DaqError(
+                'Every pattern must have the same number of samples and '
+                'port width.',
+                DAQmxErrors.UNKNOWN.value)
+        return numpy.vstack([self._compile(p) for p in patterns])
+
+    def _compile(self, pattern):
+        key = pattern.key
+        with self._lock:
+            samples = self._entries.get(key)
+            if samples is not None:
+                self._entries[key] = self._entries.pop(key)
+                self._hits += 1
+                return samples
+            self._misses += 1
+            base = self._bases.get(key[:2])
+
+        line_keys = dict(key[2])
+        dtype = pattern.dtype
+
+        if base is not None:
+            base_line_keys, base_samples = base
+            changed_lines = [
+                line for line in set(line_keys) | set(base_line_keys)
+                if line_keys.get(line) != base_line_keys.get(line)]
+        else:
+            changed_lines = None
+
+        if changed_lines is not None and (
+                len(changed_lines) < len(line_keys)):
+            # Clear the bits of the changed lines and render only those.
+            samples = base_samples & dtype.type(
+                ~sum(1 << line for line in changed_lines) &
+                ((1 << pattern.port_width) - 1))
+            lines_to_render = [
+                line for line in changed_lines if line in line_keys]
+        else:
+            samples = numpy.zeros(pattern.number_of_samples, dtype=dtype)
+            lines_to_render = list(line_keys)
+
+        for line in lines_to_render:
+            levels = pattern._render_line(line)
+            samples |= levels.astype(dtype) << dtype.type(line)
+
+        with self._lock:
+            self._lines_compiled += len(lines_to_render)
+            self._bases[key[:2]] = (line_keys, samples)
+            self._entries[key] = samples
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return samples
@@ -123,14 +123,27 @@ def check_for_error(error_code):
         raise DaqError(error_buffer.value.decode("utf-8"), error_code)
 
     elif error_code > 0:
-        error_buffer = ctypes.create_string_buffer(2048)
+        warnings.warn(DaqWarning(get_error_string(error_code), error_code))
+
+
+def get_error_string(error_code):
+    """
+    Gets the description of an NI-DAQmx error or warning code.
+
+    Args:
+        error_code (int): Specifies the NI-DAQmx error or warning code.
+    Returns:
+        str:
+
+        Indicates the description of the code.
+    """
+    error_buffer = ctypes.create_string_buffer(2048)
 
-        cfunc = lib_importer.windll.DAQmxGetErrorString
-        cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
-        cfunc(error_code, error_buffer, 2048)
+    cfunc = lib_importer.windll.DAQmxGetErrorString
+    cfunc.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    cfunc(error_code, error_buffer, 2048)
 
-        warnings.warn(DaqWarning(
-            error_buffer.value.decode("utf-8"), error_code))
+    return error_buffer.value.decode("utf-8")
 
 
 def is_string_buffer_too_small(error_code):
@@ -0,0 +1,493 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import ctypes
+import math
+import numpy
+import time
+
+from nidaqmx._lib import lib_importer, c_bool32
+from nidaqmx.errors import check_for_error, DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import PollingLoopStatistics
+from nidaqmx.utils import _clock
+
+__all__ = ['PollingLoop', 'ScalarReadOperation', 'ScalarWriteOperation']
+
+
+class ScalarReadOperation(object):
+    """
+    Represents a single-sample read that is pre-bound to an NI-DAQmx task
+    by a :class:`PollingLoop`.
+
+    The ctypes cell that receives the sample is allocated once, when the
+    operation is bound, and is reused on every iteration of the loop.
+    """
+    __slots__ = ['_task', '_cell', '_cfunc', '_args']
+
+    def __init__(self, task, cfunc, cell_type, timeout):
+        self._task = task
+        self._cell = cell_type()
+        self._cfunc = cfunc
+        self._args = (
+            task._handle, ctypes.c_double(timeout), ctypes.byref(self._cell),
+            None)
+
+    def __repr__(self):
+        return 'ScalarReadOperation(task={0})'.format(self._task.name)
+
+    @property
+    def task(self):
+        """
+        :class:`nidaqmx.task.Task`: Indicates the task this operation
+            reads from.
+        """
+        return self._task
+
+    @property
+    def value(self):
+        """
+        float or int: Indicates the sample acquired by the most recent
+            iteration of the loop.
+        """
+        return self._cell.value
+
+
+class ScalarWriteOperation(object):
+    """
+    Represents a single-sample write that is pre-bound to an NI-DAQmx task
+    by a :class:`PollingLoop`.
+
+    Set the **value** property from the step function of the loop; the
+    loop writes the most recent value to the task at the end of every
+    iteration.
+    """
+    __slots__ = ['_task', '_cell', '_cfunc', '_args']
+
+    def __init__(self, task, cfunc, cell_type, initial_value, auto_start,
+                 timeout):
+        self._task = task
+        self._cell = cell_type(initial_value)
+        self._cfunc = cfunc
+        self._args = (
+            task._handle, c_bool32(auto_start), ctypes.c_double(timeout),
+            self._cell, None)
+
+    def __repr__(self):
+        return 'ScalarWriteOperation(task={0})'.format(self._task.name)
+
+    @property
+    def task(self):
+        """
+        :class:`nidaqmx.task.Task`: Indicates the task this operation
+            writes to.
+        """
+        return self._task
+
+    @property
+    def value(self):
+        """
+        float or int: Specifies the sample to write to the task on the
+            next iteration of the loop.
+        """
+        return self._cell.value
+
+    @value.setter
+    def value(self, val):
+        self._cell.value = val
+
+
+class PollingLoop(object):
+    """
+    Runs a fixed set of single-sample reads and writes on one or more
+    NI-DAQmx tasks at a target period, for software-timed control loops.
+
+    Every read and write is bound once, when it is added to the loop: the
+    C function, its argument types and the ctypes cells that hold the
+    samples are resolved up front, so that an iteration of the loop only
+    performs the driver calls themselves. Each iteration reads all input
+    operations, calls the step function and then writes all output
+    operations.
+
+    The loop schedules iterations on a fixed time grid, so timing errors
+    do not accumulate. If an iteration overruns the period, the loop
+    skips the missed grid points instead of running a burst of late
+    iterations. Loop jitter, which is the delay between the scheduled and
+    the actual start of each iteration, and overruns are recorded and
+    available from the **statistics** property.
+
+    Example:
+        >>> loop = PollingLoop(period=0.001)
+        >>> feedback = loop.add_analog_input(ai_task)
+        >>> drive = loop.add_analog_output(ao_task)
+        >>> def step(loop):
+        >>>     drive.value = controller.update(feedback.value)
+        >>> loop.run(step, num_iterations=10000)
+    """
+
+    def __init__(self, period, spin_threshold=0.001, history_length=1000):
+        """
+        Args:
+            period (float): Specifies in seconds the target period of the
+                loop.
+            spin_threshold (Optional[float]): Specifies in seconds how
+                long before the start of each iteration the loop stops
+                sleeping and busy-waits instead. Busy-waiting keeps the
+                jitter below the resolution of the operating system
+                scheduler at the cost of CPU usage. Set this input to 0 to
+                only sleep.
+            history_length (Optional[int]): Specifies the number of most
+                recent jitter values to keep in **jitter_history**. Set
+                this input to 0 to not keep a history.
+        """
+        if period <= 0:
+            raise DaqError(
+                'The period of a polling loop must be greater than 0.\n\n'
+                'Requested period: {0}'.format(period),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._period = float(period)
+        self._spin_threshold = float(spin_threshold)
+
+        self._read_operations = []
+        self._write_operations = []
+        self._stop_requested = False
+
+        self._history = numpy.zeros(int(history_length), dtype=numpy.float64)
+        self.reset_statistics()
+
+    def __repr__(self):
+        return 'PollingLoop(period={0})'.format(self._period)
+
+    @property
+    def period(self):
+        """
+        float: Indicates in seconds the target period of the loop.
+        """
+        return self._period
+
+    @property
+    def read_operations(self):
+        """
+        List[:class:`nidaqmx.polling.ScalarReadOperation`]: Indicates
+            the read operations bound to this loop, in the order in which
+            they run.
+        """
+        return list(self._read_operations)
+
+    @property
+    def write_operations(self):
+        """
+        List[:class:`nidaqmx.polling.ScalarWriteOperation`]: Indicates
+            the write operations bound to this loop, in the order in
+            which they run.
+        """
+        return list(self._write_operations)
+
+    @property
+    def statistics(self):
+        """
+        :class:`nidaqmx.types.PollingLoopStatistics`: Indicates the
+            timing statistics of the iterations run since the loop was
+            created or since **reset_statistics** was last called. All
+            times are in seconds.
+        """
+        count = self._iterations
+        if count > 0:
+            mean_jitter = self._jitter_mean
+            std_jitter = math.sqrt(self._jitter_m2 / count)
+            min_jitter = self._jitter_min
+            max_jitter = self._jitter_max
+        else:
+            mean_jitter = std_jitter = min_jitter = max_jitter = 0.0
+
+        return PollingLoopStatistics(
+            iterations=count, overruns=self._overruns,
+            missed_periods=self._missed_periods, mean_jitter=mean_jitter,
+            std_jitter=std_jitter, min_jitter=min_jitter,
+            max_jitter=max_jitter,
+            max_execution_time=self._max_execution_time)
+
+    @property
+    def jitter_history(self):
+        """
+        numpy.ndarray: Indicates in seconds the jitter of the most recent
+            iterations of the loop, oldest first.
+        """
+        size = len(self._history)
+        if size == 0:
+            return self._history.copy()
+        if self._iterations < size:
+            return self._history[:self._iterations].copy()
+
+        start = self._iterations % size
+        return numpy.concatenate(
+            (self._history[start:], self._history[:start]))
+
+    def _bind_read(self, task, function_name, cell_type, timeout):
+        cfunc = getattr(lib_importer.windll, function_name)
+        cfunc.argtypes = [
+            lib_importer.task_handle, ctypes.c_double,
+            ctypes.POINTER(cell_type), ctypes.POINTER(c_bool32)]
+
+        operation = ScalarReadOperation(task, cfunc, cell_type, timeout)
+        self._read_operations.append(operation)
+        return operation
+
+    def _bind_write(self, task, function_name, cell_type, initial_value,
+                    auto_start, timeout):
+        cfunc = getattr(lib_importer.windll, function_name)
+        cfunc.argtypes = [
+            lib_importer.task_handle, c_bool32, ctypes.c_double,
+            cell_type, ctypes.POINTER(c_bool32)]
+
+        operation = ScalarWriteOperation(
+            task, cfunc, cell_type, initial_value, auto_start, timeout)
+        self._write_operations.append(operation)
+        return operation
+
+    def add_analog_input(self, task, timeout=10.0):
+        """
+        Binds a single-sample floating-point read from a single analog
+        input channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to read from.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the sample to become available.
+        Returns:
+            nidaqmx.polling.ScalarReadOperation:
+
+            Specifies the operation. Its **value** property holds the
+            sample read in the current iteration.
+        """
+        return self._bind_read(
+            task, 'DAQmxReadAnalogScalarF64', ctypes.c_double, timeout)
+
+    def add_counter_input(self, task, timeout=10.0):
+        """
+        Binds a single-sample floating-point read from a single counter
+        input channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to read from.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the sample to become available.
+        Returns:
+            nidaqmx.polling.ScalarReadOperation:
+
+            Specifies the operation. Its **value** property holds the
+            sample read in the current iteration.
+        """
+        return self._bind_read(
+            task, 'DAQmxReadCounterScalarF64', ctypes.c_double, timeout)
+
+    def add_counter_input_uint32(self, task, timeout=10.0):
+        """
+        Binds a single-sample 32-bit unsigned integer read from a single
+        counter input channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to read from.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the sample to become available.
+        Returns:
+            nidaqmx.polling.ScalarReadOperation:
+
+            Specifies the operation. Its **value** property holds the
+            sample read in the current iteration.
+        """
+        return self._bind_read(
+            task, 'DAQmxReadCounterScalarU32', ctypes.c_uint, timeout)
+
+    def add_digital_input(self, task, timeout=10.0):
+        """
+        Binds a single-sample 32-bit unsigned integer read from a single
+        digital input channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to read from.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the sample to become available.
+        Returns:
+            nidaqmx.polling.ScalarReadOperation:
+
+            Specifies the operation. Its **value** property holds the
+            sample read in the current iteration.
+        """
+        return self._bind_read(
+            task, 'DAQmxReadDigitalScalarU32', ctypes.c_uint, timeout)
+
+    def add_analog_output(self, task, initial_value=0.0, auto_start=True,
+                          timeout=10.0):
+        """
+        Binds a single-sample floating-point write to a single analog
+        output channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to write to.
+            initial_value (Optional[float]): Specifies the sample to write
+                until the step function sets a new value.
+            auto_start (Optional[bool]): Specifies if the write
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the write to complete.
+        Returns:
+            nidaqmx.polling.ScalarWriteOperation:
+
+            Specifies the operation. Set its **value** property to the
+            sample to write in the current iteration.
+        """
+        return self._bind_write(
+            task, 'DAQmxWriteAnalogScalarF64', ctypes.c_double,
+            initial_value, auto_start, timeout)
+
+    def add_digital_output(self, task, initial_value=0, auto_start=True,
+                           timeout=10.0):
+        """
+        Binds a single-sample 32-bit unsigned integer write to a single
+        digital output channel in a task to the loop.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to write to.
+            initial_value (Optional[int]): Specifies the sample to write
+                until the step function sets a new value.
+            auto_start (Optional[bool]): Specifies if the write
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the write to complete.
+        Returns:
+            nidaqmx.polling.ScalarWriteOperation:
+
+            Specifies the operation. Set its **value** property to the
+            sample to write in the current iteration.
+        """
+        return self._bind_write(
+            task, 'DAQmxWriteDigitalScalarU32', ctypes.c_uint,
+            initial_value, auto_start, timeout)
+
+    def reset_statistics(self):
+        """
+        Clears the timing statistics and the jitter history of the loop.
+        """
+        self._iterations = 0
+        self._overruns = 0
+        self._missed_periods = 0
+        self._jitter_mean = 0.0
+        self._jitter_m2 = 0.0
+        self._jitter_min = float('inf')
+        self._jitter_max = float('-inf')
+        self._max_execution_time = 0.0
+        self._history[:] = 0.0
+
+    def stop(self):
+        """
+        Requests the loop to stop after the current iteration. You can
+        call this method from the step function or from another thread.
+        """
+        self._stop_requested = True
+
+    def _wait_until(self, deadline):
+        remaining = deadline - _clock()
+        if remaining > self._spin_threshold:
+            time.sleep(remaining - self._spin_threshold)
+        while _clock() < deadline:
+            pass
+
+    def run(self, step=None, num_iterations=None, duration=None):
+        """
+        Runs the loop until it completes the requested number of
+        iterations, the requested duration elapses, or **stop** is
+        called.
+
+        If you specify neither **num_iterations** nor **duration**, the
+        loop runs until **stop** is called. If a read, a write or the
+        step function raises an exception, the loop stops and the
+        exception propagates to the caller.
+
+        Args:
+            step (Optional[function]): Specifies the function to call in
+                each iteration, after all reads and before all writes.
+                The function you pass in this parameter must have the
+                following prototype:
+
+                >>> def step(loop):
+                >>>     pass
+
+                Upon entry, the loop parameter contains this loop.
+            num_iterations (Optional[int]): Specifies the maximum number
+                of iterations to run.
+            duration (Optional[float]): Specifies in seconds the maximum
+                amount of time to run the loop.
+        Returns:
+            int:
+
+            Indicates the number of iterations that ran.
+        """
+        calls = [(o._cfunc, o._args) for o in self._read_operations]
+        write_calls = [(o._cfunc, o._args) for o in self._write_operations]
+        period = self._period
+        history = self._history
+        history_length = len(history)
+        wait_until = self._wait_until
+
+        self._stop_requested = False
+        iterations_run = 0
+
+        start = _clock()
+        deadline = start
+        while not self._stop_requested:
+            wait_until(deadline)
+            iteration_start = _clock()
+
+            for cfunc, args in calls:
+                error_code = cfunc(*args)
+                if error_code != 0:
+                    check_for_error(error_code)
+
+            if step is not None:
+                step(self)
+
+            for cfunc, args in write_calls:
+                error_code = cfunc(*args)
+                if error_code != 0:
+                    check_for_error(error_code)
+
+            iteration_end = _clock()
+
+            # Update the running jitter statistics with Welford's method
+            # so that no per-iteration storage is needed.
+            jitter = iteration_start - deadline
+            self._iterations += 1
+            delta = jitter - self._jitter_mean
+            self._jitter_mean += delta / self._iterations
+            self._jitter_m2 += delta * (jitter - self._jitter_mean)
+            if jitter < self._jitter_min:
+                self._jitter_min = jitter
+            if jitter > self._jitter_max:
+                self._jitter_max = jitter
+            if history_length:
+                history[(self._iterations - 1) % history_length] = jitter
+
+            execution_time = iteration_end - iteration_start
+            if execution_time > self._max_execution_time:
+                self._max_execution_time = execution_time
+
+            deadline += period
+            if iteration_end > deadline:
+                missed = int((iteration_end - deadline) // period) + 1
+                self._overruns += 1
+                self._missed_periods += missed
+                deadline += missed * period
+
+            iterations_run += 1
+            if num_iterations is not None and iterations_run >= num_iterations:
+                break
+            if duration is not None and iteration_end - start >= duration:
+                break
+
+        return iterations_run
@@ -793,6 +793,19 @@ class Scale(object):
 
         return scale
 
+    def to_model(self):
+        """
+        Reads the properties of this custom scale and returns a model of
+        the scale that applies the scale to data without NI-DAQmx.
+
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        from nidaqmx.scale_model import ScaleModel
+        return ScaleModel.from_scale(self)
+
     def save(self, save_as="", author="", overwrite_existing_scale=False,
              allow_interactive_editing=True, allow_interactive_deletion=True):
         """
@@ -837,4 +850,6 @@ class Scale(object):
 
         error_code = cfunc(
             self._name, save_as, author, options)
+        from nidaqmx.system._persisted_index import persisted_scale_index
+        persisted_scale_index.invalidate()
         check_for_error(error_code)
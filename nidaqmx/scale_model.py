@@ -0,0 +1,463 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+from numpy.polynomial import chebyshev
+
+from nidaqmx.constants import ScaleType
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import ReversePolyFit
+
+__all__ = ['ScaleModel', 'fit_reverse_poly_coeff']
+
+
+def _evaluate_polynomial(coeffs, values):
+    # Horner's method; coeffs[i] is the coefficient of x^i.
+    result = numpy.zeros_like(values)
+    for coeff in reversed(coeffs):
+        result *= values
+        result += coeff
+    return result
+
+
+def _interpolate(xp, fp, values):
+    # Piecewise linear interpolation that extends the first and last
+    # segments beyond the ends of the table.
+    index = numpy.clip(numpy.searchsorted(xp, values), 1, len(xp) - 1)
+    x0 = xp[index - 1]
+    x1 = xp[index]
+    y0 = fp[index - 1]
+    y1 = fp[index]
+    return y0 + (values - x0) * (y1 - y0) / (x1 - x0)
+
+
+def _power_basis_from_scaled(coeffs, center, half_range):
+    # Rewrites sum(a[k] * ((y - c) / h)^k) as sum(b[j] * y^j) for a batch
+    # of coefficient sets, using the binomial expansion.
+    order = coeffs.shape[-1]
+    k = numpy.arange(order)
+    binomial = numpy.zeros((order, order))
+    for n in range(order):
+        binomial[n, :n + 1] = [
+            numpy.prod(numpy.arange(n - j + 1, n + 1)) /
+            numpy.prod(numpy.arange(1, j + 1)) for j in range(n + 1)]
+
+    # term[s, n, j]: coefficient of y^j in ((y - c) / h)^n for set s.
+    exponent = numpy.clip(k[:, None] - k[None, :], 0, None)
+    term = (binomial[None, :, :] *
+            (-center[:, None, None]) ** exponent[None, :, :] /
+            half_range[:, None, None] ** k[None, :, None])
+    return numpy.einsum('sn,snj->sj', coeffs, term)
+
+
+def fit_reverse_poly_coeff(
+        forward_coeffs, min_val_x=-5.0, max_val_x=5.0,
+        num_points_to_compute=1000, reverse_poly_order=-1):
+    """
+    Computes the coefficients of a polynomial that approximates the
+    inverse of a polynomial, without NI-DAQmx. Like
+    :meth:`nidaqmx.scale.Scale.calculate_reverse_poly_coeff`, this
+    function evaluates the forward polynomial on evenly spaced values of x
+    and fits x as a polynomial of y with the least squares method.
+
+    To keep the fit well conditioned, the y values are mapped to [-1, 1]
+    and fitted in the Chebyshev basis before the coefficients are
+    converted to powers of y. The function fits many polynomials in one
+    call when **forward_coeffs** is two-dimensional.
+
+    Args:
+        forward_coeffs (numpy.ndarray): Specifies the coefficients of the
+            polynomial that computes y given a value of x, where element
+            i is the coefficient of x^i. Specify a two-dimensional array,
+            with one row per polynomial, to fit several polynomials.
+        min_val_x (Optional[float]): Is the minimum value of x for which
+            you use the polynomial. You can specify one value per
+            polynomial.
+        max_val_x (Optional[float]): Is the maximum value of x for which
+            you use the polynomial. You can specify one value per
+            polynomial.
+        num_points_to_compute (Optional[int]): Is the number of values of
+            x to fit.
+        reverse_poly_order (Optional[int]): Is the order of the reverse
+            polynomial to compute. A value of -1 indicates a reverse
+            polynomial of the same order as the forward polynomial.
+    Returns:
+        nidaqmx.types.ReversePolyFit:
+
+        Indicates the reverse coefficients and how well they fit.
+
+        - reverse_coeffs (numpy.ndarray): Indicates the coefficients of
+          the reverse polynomial, with one row per polynomial if
+          **forward_coeffs** is two-dimensional.
+        - max_error (float): Indicates the largest absolute difference
+          between x and the reverse polynomial evaluated at y.
+        - rms_error (float): Indicates the root mean square of the
+          differences.
+
+        If **forward_coeffs** is two-dimensional, the errors are arrays
+        with one element per polynomial.
+    """
+    forward = numpy.array(forward_coeffs, dtype=numpy.float64)
+    is_batch = forward.ndim == 2
+    forward = numpy.atleast_2d(forward)
+    sets = forward.shape[0]
+
+    if reverse_poly_order == -1:
+        order = forward.shape[1] - 1
+    else:
+        order = reverse_poly_order
+    if order < 0 or num_points_to_compute <= order:
+        raise DaqError(
+            'The number of points to compute must be greater than the '
+            'order of the reverse polynomial.\n\n'
+            'Number of points: {0}\nReverse polynomial order: {1}'.format(
+                num_points_to_compute, order), DAQmxErrors.UNKNOWN.value)
+
+    min_x = numpy.broadcast_to(
+        numpy.float64(min_val_x), (sets,)).astype(numpy.float64)
+    max_x = numpy.broadcast_to(
+        numpy.float64(max_val_x), (sets,)).astype(numpy.float64)
+    steps = numpy.linspace(0.0, 1.0, num_points_to_compute)
+    x = min_x[:, None] + (max_x - min_x)[:, None] * steps[None, :]
+    y = _evaluate_polynomial(forward.T[:, :, None], x)
+
+    y_min = y.min(axis=1)
+    y_max = y.max(axis=1)
+    center = (y_max + y_min) / 2.0
+    half_range = (y_max - y_min) / 2.0
+    if numpy.any(half_range == 0):
+        raise DaqError(
+            'The forward polynomial is constant over the range of x, so '
+            'it cannot be inverted.', DAQmxErrors.UNKNOWN.value)
+
+    # Least squares in the Chebyshev basis, with the columns scaled to
+    # unit norm.
+    vander = chebyshev.chebvander(
+        (y - center[:, None]) / half_range[:, None], order)
+    gram = numpy.einsum('spi,spj->sij', vander, vander)
+    norm = 1.0 / numpy.sqrt(numpy.einsum('sii->si', gram))
+    gram *= norm[:, :, None] * norm[:, None, :]
+    rhs = numpy.einsum('spi,sp->si', vander, x) * norm
+    cheb = numpy.linalg.solve(gram, rhs[:, :, None])[:, :, 0] * norm
+
+    scaled_power = numpy.array([chebyshev.cheb2poly(c) for c in cheb])
+    reverse = _power_basis_from_scaled(scaled_power, center, half_range)
+
+    error = _evaluate_polynomial(reverse.T[:, :, None], y) - x
+    max_error = numpy.abs(error).max(axis=1)
+    rms_error = numpy.sqrt((error ** 2).mean(axis=1))
+
+    if is_batch:
+        return ReversePolyFit(reverse, max_error, rms_error)
+    return ReversePolyFit(
+        reverse[0], float(max_error[0]), float(rms_error[0]))
+
+
+class ScaleModel(object):
+    """
+    Applies a custom scale to data without NI-DAQmx.
+
+    A scale model holds the parameters of a linear, map ranges,
+    polynomial or table scale and converts NumPy arrays of pre-scaled
+    values to scaled values (**forward**) and back (**reverse**). Build a
+    model from a scale saved in MAX with :meth:`nidaqmx.scale.Scale.to_model`
+    and use it where NI-DAQmx is not installed.
+
+    As with NI-DAQmx, **forward** coerces map ranges and table scaled
+    values to the scaled range, and **reverse** raises a DaqError for
+    values outside the scaled range.
+
+    Scale models cannot be changed. They compare equal if their
+    parameters are equal, can be used as dictionary keys, and can be
+    pickled to send them to other processes.
+    """
+    __slots__ = ['_scale_type', '_params', '_tables']
+
+    def __init__(self, scale_type, **params):
+        """
+        Use the **linear**, **map_ranges**, **polynomial**, **table** and
+        **from_scale** methods to create a scale model.
+        """
+        if scale_type == ScaleType.TABLE:
+            if len(params['pre_scaled_vals']) < 2 or (
+                    len(params['pre_scaled_vals']) !=
+                    len(params['scaled_vals'])):
+                raise DaqError(
+                    'A table scale requires at least two pre-scaled values '
+                    'and the same number of scaled values.',
+                    DAQmxErrors.UNKNOWN.value)
+        elif scale_type not in (ScaleType.LINEAR, ScaleType.MAP_RANGES,
+                                ScaleType.POLYNOMIAL, ScaleType.NONE):
+            raise DaqError(
+                'Scale type {0} cannot be evaluated.'.format(scale_type),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._scale_type = scale_type
+        self._params = tuple(sorted(
+            (k, tuple(float(x) for x in v) if isinstance(v, (list, tuple))
+             else float(v))
+            for k, v in params.items()))
+
+        # Tables sorted by pre-scaled values and by scaled values, for
+        # interpolation in either direction.
+        self._tables = {}
+        if scale_type == ScaleType.TABLE:
+            pre_scaled = numpy.float64(params['pre_scaled_vals'])
+            scaled = numpy.float64(params['scaled_vals'])
+            order = numpy.argsort(pre_scaled, kind='mergesort')
+            self._tables['forward'] = (pre_scaled[order], scaled[order])
+            order = numpy.argsort(scaled, kind='mergesort')
+            self._tables['reverse'] = (scaled[order], pre_scaled[order])
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return (self._scale_type == other._scale_type and
+                    self._params == other._params)
+        return False
+
+    def __hash__(self):
+        return hash((self._scale_type, self._params))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __reduce__(self):
+        return _create_scale_model, (self._scale_type, self._params)
+
+    def __repr__(self):
+        return 'ScaleModel(scale_type={0}, {1})'.format(
+            self._scale_type, ', '.join(
+                '{0}={1}'.format(k, v) for k, v in self._params))
+
+    @property
+    def scale_type(self):
+        """
+        :class:`nidaqmx.constants.ScaleType`: Indicates the type of the
+            scale.
+        """
+        return self._scale_type
+
+    @property
+    def parameters(self):
+        """
+        dict: Indicates the parameters of the scale, named after the
+            arguments of the method that created the model.
+        """
+        return dict(self._params)
+
+    @staticmethod
+    def linear(slope, y_intercept=0.0):
+        """
+        Creates a model of a scale that uses the equation y=mx+b.
+
+        Args:
+            slope (float): Is the slope, m, in the equation.
+            y_intercept (Optional[float]): Is the y-intercept, b, in the
+                equation.
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        if slope == 0:
+            raise DaqError(
+                'The slope of a linear scale cannot be 0.',
+                DAQmxErrors.UNKNOWN.value)
+        return ScaleModel(
+            ScaleType.LINEAR, slope=slope, y_intercept=y_intercept)
+
+    @staticmethod
+    def map_ranges(prescaled_min, prescaled_max, scaled_min, scaled_max):
+        """
+        Creates a model of a scale that scales values proportionally
+        from a range of pre-scaled values to a range of scaled values.
+
+        Args:
+            prescaled_min (float): Is the smallest pre-scaled value.
+            prescaled_max (float): Is the largest pre-scaled value.
+            scaled_min (float): Is the scaled value of **prescaled_min**.
+            scaled_max (float): Is the scaled value of **prescaled_max**.
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        if prescaled_min == prescaled_max or scaled_min == scaled_max:
+            raise DaqError(
+                'The pre-scaled and scaled ranges of a map ranges scale '
+                'cannot be empty.', DAQmxErrors.UNKNOWN.value)
+        return ScaleModel(
+            ScaleType.MAP_RANGES, prescaled_min=prescaled_min,
+            prescaled_max=prescaled_max, scaled_min=scaled_min,
+            scaled_max=scaled_max)
+
+    @staticmethod
+    def polynomial(forward_coeffs, reverse_coeffs):
+        """
+        Creates a model of a scale that uses an nth order polynomial
+        equation.
+
+        Args:
+            forward_coeffs (List[float]): Is the list of coefficients of
+                the polynomial that converts pre-scaled values to scaled
+                values. Element i is the coefficient of x^i.
+            reverse_coeffs (List[float]): Is the list of coefficients of
+                the polynomial that converts scaled values to pre-scaled
+                values.
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        return ScaleModel(
+            ScaleType.POLYNOMIAL, forward_coeffs=list(forward_coeffs),
+            reverse_coeffs=list(reverse_coeffs))
+
+    @staticmethod
+    def table(prescaled_vals, scaled_vals):
+        """
+        Creates a model of a scale that maps a list of pre-scaled values
+        to a list of scaled values, with linear interpolation between
+        them.
+
+        Args:
+            prescaled_vals (List[float]): Is the list of pre-scaled values.
+            scaled_vals (List[float]): Is the list of scaled values that
+                map to the values in **prescaled_vals**.
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        return ScaleModel(
+            ScaleType.TABLE, pre_scaled_vals=list(prescaled_vals),
+            scaled_vals=list(scaled_vals))
+
+    @staticmethod
+    def from_scale(scale):
+        """
+        Creates a model of a custom scale by reading the properties of
+        the scale from NI-DAQmx.
+
+        Args:
+            scale (nidaqmx.scale.Scale): Specifies the scale.
+        Returns:
+            nidaqmx.scale_model.ScaleModel:
+
+            Indicates the scale model.
+        """
+        scale_type = scale.scale_type
+        if scale_type == ScaleType.LINEAR:
+            return ScaleModel.linear(scale.lin_slope, scale.lin_y_intercept)
+        elif scale_type == ScaleType.MAP_RANGES:
+            return ScaleModel.map_ranges(
+                scale.map_pre_scaled_min, scale.map_pre_scaled_max,
+                scale.map_scaled_min, scale.map_scaled_max)
+        elif scale_type == ScaleType.POLYNOMIAL:
+            return ScaleModel.polynomial(
+                scale.poly_forward_coeff, scale.poly_reverse_coeff)
+        elif scale_type == ScaleType.TABLE:
+            return ScaleModel.table(
+                scale.table_pre_scaled_vals, scale.table_scaled_vals)
+        return ScaleModel(scale_type)
+
+    def forward(self, values):
+        """
+        Converts pre-scaled values to scaled values, as NI-DAQmx does when
+        it reads samples.
+
+        Args:
+            values (numpy.ndarray): Specifies the pre-scaled values. You
+                can also specify a float or a list of floats.
+        Returns:
+            numpy.ndarray:
+
+            Indicates the scaled values, as an array of the same shape as
+            **values**, or a float if **values** is a float.
+        """
+        x, is_scalar = self._to_array(values)
+        p = self.parameters
+
+        if self._scale_type == ScaleType.LINEAR:
+            y = x * p['slope'] + p['y_intercept']
+        elif self._scale_type == ScaleType.MAP_RANGES:
+            y = self._map(
+                x, p['prescaled_min'], p['prescaled_max'], p['scaled_min'],
+                p['scaled_max'])
+            y = numpy.clip(y, min(p['scaled_min'], p['scaled_max']),
+                           max(p['scaled_min'], p['scaled_max']))
+        elif self._scale_type == ScaleType.POLYNOMIAL:
+            y = _evaluate_polynomial(p['forward_coeffs'], x)
+        elif self._scale_type == ScaleType.TABLE:
+            xp, fp = self._tables['forward']
+            y = numpy.clip(_interpolate(xp, fp, x), fp.min(), fp.max())
+        else:
+            y = x
+
+        return float(y) if is_scalar else y
+
+    def reverse(self, values):
+        """
+        Converts scaled values to pre-scaled values, as NI-DAQmx does when
+        it writes samples.
+
+        Args:
+            values (numpy.ndarray): Specifies the scaled values. You can
+                also specify a float or a list of floats.
+        Returns:
+            numpy.ndarray:
+
+            Indicates the pre-scaled values, as an array of the same shape
+            as **values**, or a float if **values** is a float.
+        """
+        y, is_scalar = self._to_array(values)
+        p = self.parameters
+
+        if self._scale_type == ScaleType.LINEAR:
+            x = (y - p['y_intercept']) / p['slope']
+        elif self._scale_type == ScaleType.MAP_RANGES:
+            self._check_range(y, p['scaled_min'], p['scaled_max'])
+            x = self._map(
+                y, p['scaled_min'], p['scaled_max'], p['prescaled_min'],
+                p['prescaled_max'])
+        elif self._scale_type == ScaleType.POLYNOMIAL:
+            if not p['reverse_coeffs']:
+                raise DaqError(
+                    'The polynomial scale has no reverse coefficients.',
+                    DAQmxErrors.UNKNOWN.value)
+            x = _evaluate_polynomial(p['reverse_coeffs'], y)
+        elif self._scale_type == ScaleType.TABLE:
+            fp, xp = self._tables['reverse']
+            self._check_range(y, fp[0], fp[-1])
+            x = _interpolate(fp, xp, y)
+        else:
+            x = y
+
+        return float(x) if is_scalar else x
+
+    @staticmethod
+    def _to_array(values):
+        array = numpy.array(values, dtype=numpy.float64)
+        return array, array.ndim == 0
+
+    @staticmethod
+    def _map(values, from_min, from_max, to_min, to_max):
+        return (to_min + (values - from_min) *
+                ((to_max - to_min) / (from_max - from_min)))
+
+    @staticmethod
+    def _check_range(values, bound_a, bound_b):
+        if values.size and (values.min() < min(bound_a, bound_b) or
+                            values.max() > max(bound_a, bound_b)):
+            raise DaqError(
+                'Scaled values are outside the range of the scale.\n\n'
+                'Minimum: {0}\nMaximum: {1}'.format(
+                    min(bound_a, bound_b), max(bound_a, bound_b)),
+                DAQmxErrors.UNKNOWN.value)
+
+
+def _create_scale_model(scale_type, params):
+    return ScaleModel(scale_type, **dict(params))
@@ -0,0 +1,1680 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import contextlib
+import ctypes
+import math
+import re
+import threading
+import time
+import zlib
+
+import numpy
+import six
+
+from nidaqmx._lib import DaqBackend, lib_importer
+from nidaqmx.constants import (
+    AcquisitionType, BusType, ChannelType, CountDirection, FillMode,
+    LineGrouping, ProductCategory, RegenerationMode, SampleTimingType,
+    TaskMode, TriggerType, UsageTypeAI, UsageTypeAO, UsageTypeCI,
+    UsageTypeCO)
+from nidaqmx.error_codes import DAQmxErrors, DAQmxWarnings
+from nidaqmx.utils import _clock, unflatten_channel_string
+
+__all__ = ['DaqBackend', 'SimulatedBackend', 'SimulatedDevice', 'constant',
+           'sine_wave', 'use_backend']
+
+# Type of the objects that ctypes.byref returns, used to recognize the
+# output arguments of the NI-DAQmx functions.
+_CArgObject = type(ctypes.byref(ctypes.c_int()))
+
+_LINE_REGEX = re.compile(r'^(?P<port>.*/port\d+)/line(?P<line>\d+)$', re.I)
+
+_DIGITAL_TYPES = (ChannelType.DIGITAL_INPUT, ChannelType.DIGITAL_OUTPUT)
+
+# Values of the task properties that are not set.
+_TASK_DEFAULTS = {
+    'SampTimingType': SampleTimingType.ON_DEMAND.value,
+    'SampQuantSampMode': AcquisitionType.FINITE.value,
+    'SampQuantSampPerChan': 1000,
+    'SampClkRate': 1000.0,
+    'SampClkSrc': '',
+    'ReadAllAvailSamp': False,
+    'ReadAutoStart': True,
+    'WriteRegenMode': RegenerationMode.ALLOW_REGENERATION.value,
+    'StartTrigType': TriggerType.NONE.value,
+    'RefTrigType': TriggerType.NONE.value,
+    'ArmStartTrigType': TriggerType.NONE.value,
+    'PauseTrigType': TriggerType.NONE.value,
+    'HshkTrigType': TriggerType.NONE.value,
+}
+
+# Values of the system properties that are not set. The backend does not
+# save tasks, scales or global channels.
+_SYSTEM_DEFAULTS = {
+    'SysTasks': '',
+    'SysScales': '',
+    'SysGlobalChans': '',
+}
+
+# Device properties that physical channels of each kind report when they
+# are not set, keyed by physical channel property.
+_PHYSICAL_CHANNEL_DEFAULTS = {
+    'ai': {'PhysicalChanAISupportedMeasTypes': 'DevAISupportedMeasTypes'},
+    'ao': {'PhysicalChanAOSupportedOutputTypes':
+           'DevAOSupportedOutputTypes'},
+    'ctr': {'PhysicalChanCISupportedMeasTypes': 'DevCISupportedMeasTypes',
+            'PhysicalChanCOSupportedOutputTypes':
+            'DevCOSupportedOutputTypes'},
+}
+
+
+def sine_wave(amplitude=1.0, frequency=10.0, offset=0.0, noise=0.0,
+              seed=None):
+    """
+    Creates a sample generator that returns a sine wave.
+
+    Args:
+        amplitude (Optional[float]): Specifies the amplitude of the wave.
+        frequency (Optional[float]): Specifies the frequency of the wave
+            in hertz.
+        offset (Optional[float]): Specifies the DC offset of the wave.
+        noise (Optional[float]): Specifies the standard deviation of the
+            Gaussian noise added to the wave.
+        seed (Optional[int]): Specifies the seed of the noise generator.
+    Returns:
+        function: Indicates the generator, which returns the values of
+        a physical channel at an array of times in seconds.
+    """
+    random_state = numpy.random.RandomState(seed)
+
+    def generator(physical_channel, times):
+        values = offset + amplitude * numpy.sin(
+            2 * math.pi * frequency * times)
+        if noise:
+            values += random_state.normal(0.0, noise, len(times))
+        return values
+
+    return generator
+
+
+def constant(value):
+    """
+    Creates a sample generator that returns a constant value.
+
+    Args:
+        value (float): Specifies the value to return.
+    Returns:
+        function: Indicates the generator, which returns the values of
+        a physical channel at an array of times in seconds.
+    """
+    def generator(physical_channel, times):
+        return numpy.full(len(times), value, dtype=numpy.float64)
+
+    return generator
+
+
+@contextlib.contextmanager
+def use_backend(backend):
+    """
+    Routes the NI-DAQmx functions that the API calls to a backend within
+    a "with" block, and routes them back to the previous backend, or to
+    the NI-DAQmx driver, when the block exits.
+
+    The device capabilities, the properties found not to apply to them,
+    and the names of the saved tasks, scales and global channels that the
+    API caches are discarded on entry and exit.
+
+    Args:
+        backend (nidaqmx._lib.DaqBackend): Specifies the backend to use.
+    """
+    previous = lib_importer.set_backend(backend)
+    _invalidate_caches()
+    try:
+        yield backend
+    finally:
+        lib_importer.set_backend(previous)
+        _invalidate_caches()
+
+
+def _invalidate_caches():
+    from nidaqmx._task_modules.property_manifest import (
+        invalidate_property_manifests)
+    from nidaqmx.system._capability_cache import capability_cache
+    from nidaqmx.system._persisted_index import (
+        persisted_channel_index, persisted_scale_index, persisted_task_index)
+
+    capability_cache.invalidate()
+    invalidate_property_manifests()
+    for index in (persisted_task_index, persisted_scale_index,
+                  persisted_channel_index):
+        index.invalidate()
+
+
+class _SimulatedError(Exception):
+    """
+    Reports an NI-DAQmx error from a function of the simulated backend.
+    """
+
+    def __init__(self, error, message):
+        super(_SimulatedError, self).__init__(message)
+        self.error_code = error.value
+        self.message = message
+
+
+def _to_str(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+def _join(names):
+    return ', '.join(names)
+
+
+class _PropertyStore(object):
+    """
+    Holds the property values set on an object of the simulated backend.
+    """
+    __slots__ = ['properties']
+
+    def __init__(self):
+        self.properties = {}
+
+
+def _get_property_value(store, attribute):
+    value = store.properties.get(attribute)
+    if value is None and hasattr(store, '_compute'):
+        value = store._compute(attribute)
+    return value
+
+
+class SimulatedDevice(object):
+    """
+    Represents a DAQ device of a :class:`SimulatedBackend`.
+
+    Analog input channels return the values of sample generators. Analog
+    output channels and digital output lines keep the last sample written
+    to them, and digital input lines read the state of the line, so a
+    digital output task and a digital input task on the same lines are
+    connected as if by a loopback cable. Counters count the edges of a
+    source signal with a frequency of **counter_rate**.
+    """
+
+    def __init__(self, name, product_type='PCIe-6363',
+                 product_category=ProductCategory.X_SERIES_DAQ,
+                 serial_num=None, num_ai_chans=32, num_ao_chans=4,
+                 port_widths=(32, 8, 8), num_counters=4,
+                 voltage_range=(-10.0, 10.0), max_sample_rate=2.0e6,
+                 ai_generator=None, counter_rate=1000.0,
+                 is_simulated=False):
+        """
+        Args:
+            name (str): Specifies the name of the device.
+            product_type (Optional[str]): Specifies the product type that
+                the device reports.
+            product_category (Optional[nidaqmx.constants.ProductCategory]):
+                Specifies the product category that the device reports.
+            serial_num (Optional[int]): Specifies the serial number that
+                the device reports. By default, the serial number is
+                derived from the name of the device.
+            num_ai_chans (Optional[int]): Specifies the number of analog
+                input channels.
+            num_ao_chans (Optional[int]): Specifies the number of analog
+                output channels.
+            port_widths (Optional[List[int]]): Specifies the number of
+                lines of each digital port.
+            num_counters (Optional[int]): Specifies the number of
+                counters.
+            voltage_range (Optional[List[float]]): Specifies the minimum
+                and maximum voltage of the analog channels.
+            max_sample_rate (Optional[float]): Specifies the maximum
+                sample clock rate of the device.
+            ai_generator (Optional[function]): Specifies the generator
+                that returns the values of the analog input channels.
+                The generator is called with the name of the physical
+                channel and a NumPy array of sample times in seconds. By
+                default, the channels return a sine wave.
+            counter_rate (Optional[float]): Specifies the frequency in
+                hertz of the signal that the counters measure.
+            is_simulated (Optional[bool]): Specifies the value of the
+                "dev_is_simulated" property of the device.
+        """
+        if serial_num is None:
+            serial_num = zlib.crc32(name.encode('utf-8')) & 0xFFFFFFFF
+
+        self.name = name
+        self.ai_generator = ai_generator or sine_wave()
+        self.counter_rate = counter_rate
+
+        self._ai_generators = {}
+        self._ao_values = {}
+        self._line_states = {}
+        self._physical_channel_stores = {}
+
+        self._channels = {
+            'ai': ['{0}/ai{1}'.format(name, i) for i in range(num_ai_chans)],
+            'ao': ['{0}/ao{1}'.format(name, i) for i in range(num_ao_chans)],
+            'ctr': ['{0}/ctr{1}'.format(name, i)
+                    for i in range(num_counters)],
+            'port': ['{0}/port{1}'.format(name, i)
+                     for i in range(len(port_widths))],
+            'line': ['{0}/port{1}/line{2}'.format(name, i, j)
+                     for i, width in enumerate(port_widths)
+                     for j in range(width)],
+        }
+        self._lookup = dict(
+            (kind, dict((c.lower(), c) for c in channels))
+            for kind, channels in self._channels.items())
+
+        rate = float(max_sample_rate)
+        self.properties = {
+            'DevProductType': product_type,
+            'DevProductCategory': product_category.value,
+            'DevProductNum': 0,
+            'DevSerialNum': serial_num,
+            'DevIsSimulated': is_simulated,
+            'DevBusType': BusType.PCIE.value,
+            'DevAIPhysicalChans': _join(self._channels['ai']),
+            'DevAOPhysicalChans': _join(self._channels['ao']),
+            'DevCIPhysicalChans': _join(self._channels['ctr']),
+            'DevCOPhysicalChans': _join(self._channels['ctr']),
+            'DevDILines': _join(self._channels['line']),
+            'DevDOLines': _join(self._channels['line']),
+            'DevDIPorts': _join(self._channels['port']),
+            'DevDOPorts': _join(self._channels['port']),
+            'DevTerminals': _join('/{0}/PFI{1}'.format(name, i)
+                                  for i in range(16)),
+            'DevAIMaxSingleChanRate': rate,
+            'DevAIMaxMultiChanRate': rate,
+            'DevAIMinRate': 0.0,
+            'DevAOMaxRate': rate,
+            'DevAOMinRate': 0.0,
+            'DevDIMaxRate': rate,
+            'DevDOMaxRate': rate,
+            'DevAIVoltageRngs': list(voltage_range),
+            'DevAOVoltageRngs': list(voltage_range),
+            'DevAISupportedMeasTypes': [UsageTypeAI.VOLTAGE.value],
+            'DevAOSupportedOutputTypes': [UsageTypeAO.VOLTAGE.value],
+            'DevCISupportedMeasTypes': [UsageTypeCI.COUNT_EDGES.value,
+                                        UsageTypeCI.FREQUENCY.value],
+            'DevCOSupportedOutputTypes': [UsageTypeCO.PULSE_FREQUENCY.value],
+            'DevAnlgTrigSupported': True,
+            'DevDigTrigSupported': True,
+        }
+
+    def __repr__(self):
+        return 'SimulatedDevice(name={0})'.format(self.name)
+
+    def set_ai_generator(self, physical_channel, generator):
+        """
+        Sets the generator that returns the values of an analog input
+        channel.
+
+        Args:
+            physical_channel (str): Specifies the name of the analog input
+                physical channel.
+            generator (function): Specifies the generator, or None to use
+                the "ai_generator" of the device.
+        """
+        key = self._find('ai', physical_channel).lower()
+        if generator is None:
+            self._ai_generators.pop(key, None)
+        else:
+            self._ai_generators[key] = generator
+
+    def get_ao_value(self, physical_channel):
+        """
+        Gets the last value written to an analog output channel.
+
+        Args:
+            physical_channel (str): Specifies the name of the analog
+                output physical channel.
+        Returns:
+            float: Indicates the value, or 0.0 if no value was written.
+        """
+        key = self._find('ao', physical_channel).lower()
+        return self._ao_values.get(key, 0.0)
+
+    def get_line_state(self, line):
+        """
+        Gets the state of a digital line.
+
+        Args:
+            line (str): Specifies the name of the digital line.
+        Returns:
+            bool: Indicates the state of the line.
+        """
+        return self._line_states.get(self._find('line', line).lower(), False)
+
+    def set_line_state(self, line, state):
+        """
+        Sets the state of a digital line, as an external signal would.
+
+        Args:
+            line (str): Specifies the name of the digital line.
+            state (bool): Specifies the state of the line.
+        """
+        self._line_states[self._find('line', line).lower()] = bool(state)
+
+    def _find(self, kind, physical_channel):
+        channel = self._lookup[kind].get(
+            physical_channel.lstrip('/').lower())
+        if channel is None:
+            raise _SimulatedError(
+                DAQmxErrors.PHYSICAL_CHAN_DOES_NOT_EXIST,
+                'Physical channel specified does not exist on this device.'
+                '\n\nPhysical Channel Name: {0}\nDevice: {1}'.format(
+                    physical_channel, self.name))
+        return channel
+
+    def _expand_lines(self, physical_channel):
+        port = self._lookup['port'].get(physical_channel.lstrip('/').lower())
+        if port is None:
+            return [self._find('line', physical_channel)]
+        prefix = port.lower() + '/'
+        return [line for line in self._channels['line']
+                if line.lower().startswith(prefix)]
+
+    def _generate(self, physical_channel, times):
+        generator = self._ai_generators.get(
+            physical_channel.lower(), self.ai_generator)
+        return numpy.asarray(
+            generator(physical_channel, times), dtype=numpy.float64)
+
+    def _get_physical_channel_store(self, physical_channel):
+        key = physical_channel.lower()
+        store = self._physical_channel_stores.get(key)
+        if store is None:
+            kind = next((k for k, lookup in self._lookup.items()
+                         if key in lookup), None)
+            store = _PhysicalChannelStore(self, kind)
+            self._physical_channel_stores[key] = store
+        return store
+
+
+class _PhysicalChannelStore(_PropertyStore):
+    """
+    Holds the properties of a physical channel of a :class:`SimulatedDevice`.
+    """
+    __slots__ = ['_device', '_kind']
+
+    def __init__(self, device, kind):
+        super(_PhysicalChannelStore, self).__init__()
+        self._device = device
+        self._kind = kind
+
+    def _compute(self, attribute):
+        device_attribute = _PHYSICAL_CHANNEL_DEFAULTS.get(
+            self._kind, {}).get(attribute)
+        if device_attribute is None:
+            return None
+        return self._device.properties.get(device_attribute)
+
+
+class _SimulatedChannel(object):
+    """
+    Represents a virtual channel of a simulated task.
+    """
+    __slots__ = ['name', 'chan_type', 'device', 'physical_channels',
+                 'lines', 'properties']
+
+    def __init__(self, name, chan_type, device, physical_channels,
+                 properties):
+        self.name = name
+        self.chan_type = chan_type
+        self.device = device
+        self.physical_channels = physical_channels
+        self.properties = dict(properties)
+        self.properties['ChanType'] = chan_type.value
+        self.properties['PhysicalChanName'] = _join(physical_channels)
+
+        # Each line is stored with the bit that represents it in port
+        # data: the line number if the lines are on one port, and the
+        # position of the line in the channel otherwise.
+        self.lines = []
+        if chan_type in _DIGITAL_TYPES:
+            matches = [_LINE_REGEX.match(c) for c in physical_channels]
+            if len(set(m.group('port').lower() for m in matches)) == 1:
+                bits = [int(m.group('line')) for m in matches]
+            else:
+                bits = range(len(matches))
+            self.lines = [(c.lower(), b)
+                          for c, b in zip(physical_channels, bits)]
+
+
+class _SimulatedTask(object):
+    """
+    Represents a task of a :class:`SimulatedBackend`.
+    """
+
+    def __init__(self, handle, name):
+        self.handle = handle
+        self.name = name
+        self.channels = []
+        self.properties = {}
+        self.callbacks = {}
+
+        self.running = False
+        self.auto_started = False
+        self.start_time = None
+        self.stop_time = None
+        self.read_position = 0
+        self.written = 0
+        self.event_thread = None
+        self.stop_event = None
+        self._stores = {}
+
+    def get(self, attribute):
+        return _get_property_value(self, attribute)
+
+    def get_store(self, key):
+        return self._stores.setdefault(key, _PropertyStore())
+
+    def find_channels(self, channel_names):
+        if not channel_names:
+            return list(self.channels)
+
+        by_name = dict((c.name.lower(), c) for c in self.channels)
+        channel = by_name.get(channel_names.lower())
+        if channel is not None:
+            return [channel]
+
+        channels = []
+        for name in unflatten_channel_string(channel_names):
+            channel = by_name.get(name.lower())
+            if channel is None:
+                raise _SimulatedError(
+                    DAQmxErrors.CHAN_NOT_IN_TASK,
+                    'Specified channel is not in the task.\n\n'
+                    'Channel Name: {0}\nTask Name: {1}'.format(
+                        name, self.name))
+            channels.append(channel)
+        return channels
+
+    def channels_to_read(self):
+        return self.find_channels(self.properties.get('ReadChannelsToRead'))
+
+    def is_clocked(self):
+        return self.get('SampTimingType') in (
+            SampleTimingType.SAMPLE_CLOCK.value,
+            SampleTimingType.IMPLICIT.value)
+
+    def rate(self):
+        if (self.get('SampTimingType') == SampleTimingType.IMPLICIT.value and
+                self.channels):
+            return float(self.channels[0].device.counter_rate)
+        return float(self.get('SampClkRate'))
+
+    def total(self):
+        if self.get('SampQuantSampMode') == AcquisitionType.FINITE.value:
+            return int(self.get('SampQuantSampPerChan'))
+        return None
+
+    def acquired(self, now=None):
+        """
+        Returns the number of samples per channel acquired or generated
+        since the task started.
+        """
+        if self.start_time is None:
+            return 0
+        if not self.is_clocked():
+            return self.read_position
+
+        if self.running:
+            end = _clock() if now is None else now
+        else:
+            end = self.stop_time
+        acquired = int((end - self.start_time) * self.rate())
+        total = self.total()
+        return acquired if total is None else min(acquired, total)
+
+    def is_done(self, now=None):
+        if not self.running:
+            return True
+        total = self.total()
+        return (self.is_clocked() and total is not None and
+                self.acquired(now) >= total)
+
+    def input_buffer_size(self):
+        size = self.properties.get('BufInputBufSize')
+        if size is not None:
+            return size
+        if not self.is_clocked():
+            return 0
+        total = self.total()
+        if total is not None:
+            return total
+
+        # NI-DAQmx sizes the buffer of continuous acquisitions from the
+        # sample rate.
+        rate = self.rate()
+        if rate <= 100:
+            return 1000
+        if rate <= 10000:
+            return 10000
+        if rate <= 1000000:
+            return 100000
+        return 1000000
+
+    def output_buffer_size(self):
+        size = self.properties.get('BufOutputBufSize')
+        if size is not None:
+            return size
+        # NI-DAQmx sizes the buffer from the first write.
+        return self.written
+
+    def _compute(self, attribute):
+        if attribute in _TASK_DEFAULTS:
+            return _TASK_DEFAULTS[attribute]
+        if attribute in ('TaskChannels', 'ReadChannelsToRead'):
+            return _join(c.name for c in self.channels)
+        if attribute in ('TaskNumChans', 'ReadNumChans', 'WriteNumChans'):
+            return len(self.channels)
+
+        devices = collections.OrderedDict(
+            (c.device.name, c.device) for c in self.channels)
+        if attribute == 'TaskName':
+            return self.name
+        if attribute == 'TaskDevices':
+            return _join(devices)
+        if attribute == 'TaskNumDevices':
+            return len(devices)
+        if attribute == 'SampClkMaxRate':
+            return min([d.properties['DevAIMaxMultiChanRate']
+                        for d in devices.values()] or [0.0])
+        if attribute in ('ReadTotalSampPerChanAcquired',
+                         'WriteTotalSampPerChanGenerated'):
+            return self.acquired()
+        if attribute == 'ReadAvailSampPerChan':
+            return max(0, self.acquired() - self.read_position)
+        if attribute == 'ReadCurrReadPos':
+            return self.read_position
+        if attribute in ('ReadDigitalLinesBytesPerChan',
+                         'WriteDigitalLinesBytesPerChan'):
+            return max([len(c.lines) for c in self.channels] or [0])
+        if attribute == 'BufInputBufSize':
+            return self.input_buffer_size()
+        if attribute == 'BufOutputBufSize':
+            return self.output_buffer_size()
+        if attribute == 'WriteSpaceAvail':
+            return max(0, self.output_buffer_size() -
+                       (self.written - self.acquired()))
+        return None
+
+
+class _SystemStore(_PropertyStore):
+    """
+    Holds the system properties of a :class:`SimulatedBackend`.
+    """
+    __slots__ = ['_backend']
+
+    def __init__(self, backend):
+        super(_SystemStore, self).__init__()
+        self._backend = backend
+
+    def _compute(self, attribute):
+        if attribute in _SYSTEM_DEFAULTS:
+            return _SYSTEM_DEFAULTS[attribute]
+        if attribute == 'SysDevNames':
+            return _join(d.name for d in self._backend.devices)
+        if attribute == 'SysNIDAQMajorVersion':
+            return self._backend.driver_version[0]
+        if attribute == 'SysNIDAQMinorVersion':
+            return self._backend.driver_version[1]
+        if attribute == 'SysNIDAQUpdateVersion':
+            return self._backend.driver_version[2]
+        return None
+
+
+class SimulatedBackend(DaqBackend):
+    """
+    Implements a subset of the NI-DAQmx C API in Python, so that code that
+    uses the NI-DAQmx Python API can run, and be tested and benchmarked,
+    on machines without NI-DAQmx or DAQ hardware.
+
+    The backend simulates :class:`SimulatedDevice` devices and supports:
+
+    - Creating, starting, stopping and clearing tasks.
+    - Voltage analog input and output, digital input and output, count
+      edges and frequency counter input, and pulse frequency counter
+      output channels.
+    - On demand, sample clock and implicit timing. Sample clocked tasks
+      acquire samples at the sample clock rate in real time, so reads
+      wait for the samples they request and time out as NI-DAQmx does.
+    - Reading and writing analog, digital and counter samples.
+    - Every N samples and done events.
+    - Enumerating devices and physical channels.
+
+    The backend stores every property that the API sets and returns it
+    when the API gets the property. Properties that are not set return the
+    default value of NI-DAQmx if the backend knows it, and otherwise fail
+    with the error NI-DAQmx reports for properties that are not supported.
+    Functions that the backend does not implement raise
+    :class:`nidaqmx._lib.DaqFunctionNotSupportedError`.
+
+    Use :func:`use_backend` or set the NIDAQMX_BACKEND environment
+    variable to "simulated" to route the API to a backend.
+    """
+
+    driver_version = (18, 1, 0)
+
+    def __init__(self, devices=None):
+        """
+        Args:
+            devices (Optional[List[SimulatedDevice]]): Specifies the
+                devices to simulate. By default, the backend simulates an
+                X Series device named "Dev1".
+        """
+        if devices is None:
+            devices = [SimulatedDevice('Dev1')]
+
+        self._lock = threading.RLock()
+        self._devices = collections.OrderedDict()
+        self._tasks = {}
+        self._next_handle = 1
+        self._epoch = _clock()
+        self._error_info = threading.local()
+        self._system = _SystemStore(self)
+        self._stores = {}
+
+        for device in devices:
+            self.add_device(device)
+
+    @property
+    def devices(self):
+        """
+        List[SimulatedDevice]: Indicates the simulated devices.
+        """
+        with self._lock:
+            return list(self._devices.values())
+
+    @property
+    def task_names(self):
+        """
+        List[str]: Indicates the names of the tasks that are not cleared.
+        """
+        with self._lock:
+            return [t.name for t in self._tasks.values()]
+
+    def add_device(self, device):
+        """
+        Adds a device to the backend.
+
+        Args:
+            device (SimulatedDevice): Specifies the device to add.
+        """
+        with self._lock:
+            self._devices[device.name.lower()] = device
+
+    def get_device(self, name):
+        """
+        Gets a device of the backend.
+
+        Args:
+            name (str): Specifies the name of the device.
+        Returns:
+            SimulatedDevice: Indicates the device.
+        """
+        with self._lock:
+            try:
+                return self._devices[name.lower()]
+            except KeyError:
+                raise KeyError(
+                    'The simulated backend has no device named '
+                    '"{0}".'.format(name))
+
+    def remove_device(self, name):
+        """
+        Removes a device from the backend.
+
+        Args:
+            name (str): Specifies the name of the device.
+        """
+        with self._lock:
+            self._devices.pop(name.lower(), None)
+
+    def get_function(self, name):
+        function = None
+        if name.startswith('DAQmx'):
+            function = getattr(self, name, None)
+
+        if function is None:
+            for prefix, accessor in (('DAQmxGet', self._get_property),
+                                     ('DAQmxSet', self._set_property),
+                                     ('DAQmxReset', self._reset_property)):
+                if name.startswith(prefix) and len(name) > len(prefix):
+                    function = self._bind(accessor, name[len(prefix):])
+                    break
+            else:
+                raise AttributeError(name)
+
+        def call(*args):
+            try:
+                result = function(*args)
+            except _SimulatedError as e:
+                self._error_info.message = '{0}\n\nStatus Code: {1}'.format(
+                    e.message, e.error_code)
+                return e.error_code
+            return result or 0
+
+        return call
+
+    @staticmethod
+    def _bind(accessor, attribute):
+        def function(*args):
+            return accessor(attribute, *args)
+        return function
+
+    # region Error Functions
+
+    def DAQmxGetExtendedErrorInfo(self, buffer, buffer_size):
+        message = getattr(self._error_info, 'message', '')
+        buffer.value = message.encode('utf-8')[:max(buffer_size - 1, 0)]
+
+    def DAQmxGetErrorString(self, error_code, buffer, buffer_size):
+        name = None
+        for enum_type in (DAQmxErrors, DAQmxWarnings):
+            try:
+                name = enum_type(error_code).name
+                break
+            except ValueError:
+                pass
+        message = (name.replace('_', ' ').capitalize() if name else
+                   'Unknown status code {0}.'.format(error_code))
+        buffer.value = message.encode('utf-8')[:max(buffer_size - 1, 0)]
+
+    # endregion
+
+    # region Property Functions
+
+    def _get_property(self, attribute, *args):
+        if args and isinstance(args[-1], _CArgObject):
+            inputs, outputs = args[:-1], args[-1:]
+        elif len(args) >= 2 and isinstance(
+                args[-2], (ctypes.Array, numpy.ndarray)):
+            inputs, outputs = args[:-2], args[-2:]
+        else:
+            raise _SimulatedError(
+                DAQmxErrors.INVALID_ATTRIBUTE_NAME,
+                'The simulated backend cannot get the property.\n\n'
+                'Property: {0}'.format(attribute))
+
+        with self._lock:
+            stores = self._resolve(inputs)
+            value = _get_property_value(stores[0], attribute)
+        if value is None:
+            raise _SimulatedError(
+                DAQmxErrors.ATTR_NOT_SUPPORTED,
+                'Specified property is not supported by the device or is '
+                'not applicable to the task.\n\nProperty: {0}'.format(
+                    attribute))
+
+        if len(outputs) == 1:
+            outputs[0]._obj.value = value
+            return 0
+
+        buffer, buffer_size = outputs
+        if isinstance(buffer, numpy.ndarray):
+            values = list(value)
+            if buffer_size == 0:
+                return len(values)
+            if buffer_size < len(values):
+                raise _SimulatedError(
+                    DAQmxErrors.WRITE_BUFFER_TOO_SMALL,
+                    'Buffer is too small to fit the property value.')
+            buffer[:len(values)] = values
+            return 0
+
+        data = value.encode('utf-8')
+        if buffer_size == 0:
+            return len(data) + 1
+        if buffer_size <= len(data):
+            raise _SimulatedError(
+                DAQmxErrors.BUFFER_TOO_SMALL_FOR_STRING,
+                'Buffer is too small to fit the string.')
+        buffer.value = data
+        return 0
+
+    def _set_property(self, attribute, *args):
+        if len(args) >= 2 and isinstance(args[-2], numpy.ndarray):
+            inputs, value = args[:-2], args[-2][:args[-1]].tolist()
+        else:
+            inputs, value = args[:-1], _to_str(args[-1])
+
+        with self._lock:
+            for store in self._resolve(inputs):
+                store.properties[attribute] = value
+
+    def _reset_property(self, attribute, *args):
+        with self._lock:
+            for store in self._resolve(args):
+                store.properties.pop(attribute, None)
+
+    def _resolve(self, inputs):
+        """
+        Returns the objects that hold the property values of the objects
+        that the input arguments of a property function specify.
+        """
+        inputs = [_to_str(i) for i in inputs]
+        if not inputs:
+            return [self._system]
+
+        if not isinstance(inputs[0], six.string_types):
+            task = self._get_task(inputs[0])
+            if len(inputs) == 1:
+                return [task]
+            if len(inputs) == 2 and isinstance(inputs[1], six.string_types):
+                return task.find_channels(inputs[1]) or [task]
+            return [task.get_store(tuple(inputs[1:]))]
+
+        if len(inputs) == 1:
+            name = inputs[0].lstrip('/')
+            device_name, separator, _ = name.partition('/')
+            device = self._devices.get(device_name.lower())
+            if device is not None:
+                if not separator:
+                    return [device]
+                return [device._get_physical_channel_store(name)]
+        key = tuple(i.lower() if isinstance(i, six.string_types) else i
+                    for i in inputs)
+        return [self._stores.setdefault(key, _PropertyStore())]
+
+    # endregion
+
+    # region Task Functions
+
+    def DAQmxCreateTask(self, task_name, task_handle):
+        task_name = _to_str(task_name) or ''
+        with self._lock:
+            names = set(t.name.lower() for t in self._tasks.values())
+            if not task_name:
+                index = 0
+                while '_unnamedtask<{0}>'.format(index) in names:
+                    index += 1
+                task_name = '_unnamedTask<{0}>'.format(index)
+            elif task_name.lower() in names:
+                raise _SimulatedError(
+                    DAQmxErrors.DUPLICATE_TASK,
+                    'Task cannot be created because a task with this name '
+                    'already exists.\n\nTask Name: {0}'.format(task_name))
+
+            handle = self._next_handle
+            self._next_handle += 1
+            self._tasks[handle] = _SimulatedTask(handle, task_name)
+        task_handle._obj.value = handle
+
+    def DAQmxClearTask(self, task_handle):
+        with self._lock:
+            task = self._get_task(task_handle)
+            thread = self._stop(task)
+            del self._tasks[task.handle]
+        self._join(thread)
+
+    def DAQmxStartTask(self, task_handle):
+        with self._lock:
+            task = self._get_task(task_handle)
+            task.auto_started = False
+            self._start(task)
+
+    def DAQmxStopTask(self, task_handle):
+        with self._lock:
+            thread = self._stop(self._get_task(task_handle))
+        self._join(thread)
+
+    def DAQmxTaskControl(self, task_handle, action):
+        if action == TaskMode.TASK_START.value:
+            return self.DAQmxStartTask(task_handle)
+        if action in (TaskMode.TASK_STOP.value, TaskMode.TASK_ABORT.value):
+            return self.DAQmxStopTask(task_handle)
+        with self._lock:
+            self._get_task(task_handle)
+
+    def DAQmxIsTaskDone(self, task_handle, is_task_done):
+        with self._lock:
+            is_task_done._obj.value = self._get_task(task_handle).is_done()
+
+    def DAQmxWaitUntilTaskDone(self, task_handle, time_to_wait):
+        deadline = None if time_to_wait < 0 else _clock() + time_to_wait
+        while True:
+            with self._lock:
+                task = self._get_task(task_handle)
+                if task.is_done():
+                    return
+                total = task.total()
+                now = _clock()
+                # Tasks that do not end by themselves are polled, as
+                # another thread can stop them.
+                if task.is_clocked() and total is not None:
+                    wait = task.start_time + total / task.rate() - now
+                else:
+                    wait = 0.01
+
+            if deadline is not None:
+                if now >= deadline:
+                    raise _SimulatedError(
+                        DAQmxErrors.WAIT_UNTIL_DONE_DOES_NOT_INDICATE_DONE,
+                        'Wait Until Done did not indicate that the task was '
+                        'done within the specified timeout.\n\n'
+                        'Task Name: {0}'.format(task.name))
+                wait = min(wait, deadline - now)
+            time.sleep(max(wait, 0.0))
+
+    def DAQmxCfgSampClkTiming(self, task_handle, source, rate, active_edge,
+                              sample_mode, samps_per_chan):
+        if rate <= 0:
+            raise _SimulatedError(
+                DAQmxErrors.INVALID_ATTRIBUTE_VALUE,
+                'Requested sample clock rate is invalid.\n\n'
+                'Rate: {0}'.format(rate))
+        with self._lock:
+            self._get_task(task_handle).properties.update({
+                'SampTimingType': SampleTimingType.SAMPLE_CLOCK.value,
+                'SampClkSrc': _to_str(source) or '',
+                'SampClkRate': float(rate),
+                'SampClkActiveEdge': active_edge,
+                'SampQuantSampMode': sample_mode,
+                'SampQuantSampPerChan': samps_per_chan,
+            })
+
+    def DAQmxCfgImplicitTiming(self, task_handle, sample_mode,
+                               samps_per_chan):
+        with self._lock:
+            self._get_task(task_handle).properties.update({
+                'SampTimingType': SampleTimingType.IMPLICIT.value,
+                'SampQuantSampMode': sample_mode,
+                'SampQuantSampPerChan': samps_per_chan,
+            })
+
+    def DAQmxCfgDigEdgeStartTrig(self, task_handle, trigger_source,
+                                 trigger_edge):
+        with self._lock:
+            self._get_task(task_handle).properties.update({
+                'StartTrigType': TriggerType.DIGITAL_EDGE.value,
+                'DigEdgeStartTrigSrc': _to_str(trigger_source),
+                'DigEdgeStartTrigEdge': trigger_edge,
+            })
+
+    def DAQmxDisableStartTrig(self, task_handle):
+        with self._lock:
+            self._get_task(task_handle).properties[
+                'StartTrigType'] = TriggerType.NONE.value
+
+    def _get_task(self, task_handle):
+        handle = getattr(task_handle, 'value', task_handle)
+        task = self._tasks.get(handle)
+        if task is None:
+            raise _SimulatedError(
+                DAQmxErrors.INVALID_TASK,
+                'Task specified is invalid or does not exist.')
+        return task
+
+    def _start(self, task):
+        if task.running:
+            return
+        if not task.channels:
+            raise _SimulatedError(
+                DAQmxErrors.CAN_NOT_PERFORM_OP_WHEN_NO_CHANS_IN_TASK,
+                'Cannot perform this operation when there are no channels '
+                'in the task.\n\nTask Name: {0}'.format(task.name))
+
+        task.running = True
+        task.start_time = _clock()
+        task.stop_time = None
+        task.read_position = 0
+        self._start_events(task)
+
+    def _stop(self, task):
+        """
+        Stops a task and returns its event thread, which the caller joins
+        after releasing the lock.
+        """
+        if not task.running:
+            return None
+        task.running = False
+        task.auto_started = False
+        task.stop_time = _clock()
+
+        thread = task.event_thread
+        if thread is not None:
+            task.stop_event.set()
+            task.event_thread = None
+            task.stop_event = None
+        return thread
+
+    @staticmethod
+    def _join(thread):
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    # endregion
+
+    # region Channel Functions
+
+    def DAQmxCreateAIVoltageChan(
+            self, task_handle, physical_channel, name_to_assign_to_channel,
+            terminal_config, min_val, max_val, units, custom_scale_name):
+        self._add_channels(
+            task_handle, 'ai', physical_channel, name_to_assign_to_channel,
+            ChannelType.ANALOG_INPUT, {
+                'AIMeasType': UsageTypeAI.VOLTAGE.value,
+                'AITermCfg': terminal_config,
+                'AIMin': min_val,
+                'AIMax': max_val,
+                'AIVoltageUnits': units,
+                'AICustomScaleName': _to_str(custom_scale_name) or '',
+            })
+
+    def DAQmxCreateAOVoltageChan(
+            self, task_handle, physical_channel, name_to_assign_to_channel,
+            min_val, max_val, units, custom_scale_name):
+        self._add_channels(
+            task_handle, 'ao', physical_channel, name_to_assign_to_channel,
+            ChannelType.ANALOG_OUTPUT, {
+                'AOOutputType': UsageTypeAO.VOLTAGE.value,
+                'AOMin': min_val,
+                'AOMax': max_val,
+                'AOVoltageUnits': units,
+                'AOCustomScaleName': _to_str(custom_scale_name) or '',
+            })
+
+    def DAQmxCreateDIChan(self, task_handle, lines, name_to_assign_to_lines,
+                          line_grouping):
+        self._add_digital_channels(
+            task_handle, lines, name_to_assign_to_lines, line_grouping,
+            ChannelType.DIGITAL_INPUT, 'DINumLines')
+
+    def DAQmxCreateDOChan(self, task_handle, lines, name_to_assign_to_lines,
+                          line_grouping):
+        self._add_digital_channels(
+            task_handle, lines, name_to_assign_to_lines, line_grouping,
+            ChannelType.DIGITAL_OUTPUT, 'DONumLines')
+
+    def DAQmxCreateCICountEdgesChan(
+            self, task_handle, counter, name_to_assign_to_channel, edge,
+            initial_count, count_direction):
+        self._add_channels(
+            task_handle, 'ctr', counter, name_to_assign_to_channel,
+            ChannelType.COUNTER_INPUT, {
+                'CIMeasType': UsageTypeCI.COUNT_EDGES.value,
+                'CICountEdgesActiveEdge': edge,
+                'CICountEdgesInitialCnt': initial_count,
+                'CICountEdgesDir': count_direction,
+            })
+
+    def DAQmxCreateCIFreqChan(
+            self, task_handle, counter, name_to_assign_to_channel, min_val,
+            max_val, units, edge, meas_method, meas_time, divisor,
+            custom_scale_name):
+        self._add_channels(
+            task_handle, 'ctr', counter, name_to_assign_to_channel,
+            ChannelType.COUNTER_INPUT, {
+                'CIMeasType': UsageTypeCI.FREQUENCY.value,
+                'CIMin': min_val,
+                'CIMax': max_val,
+                'CIFreqUnits': units,
+                'CIFreqStartingEdge': edge,
+                'CIFreqMeasMeth': meas_method,
+                'CIFreqMeasTime': meas_time,
+                'CIFreqDiv': divisor,
+                'CIFreqCustomScaleName': _to_str(custom_scale_name) or '',
+            })
+
+    def DAQmxCreateCOPulseChanFreq(
+            self, task_handle, counter, name_to_assign_to_channel, units,
+            idle_state, initial_delay, freq, duty_cycle):
+        self._add_channels(
+            task_handle, 'ctr', counter, name_to_assign_to_channel,
+            ChannelType.COUNTER_OUTPUT, {
+                'COOutputType': UsageTypeCO.PULSE_FREQUENCY.value,
+                'COPulseFreqUnits': units,
+                'COPulseIdleState': idle_state,
+                'COPulseFreqInitialDelay': initial_delay,
+                'COPulseFreq': freq,
+                'COPulseDutyCyc': duty_cycle,
+            })
+
+    def _find_physical_channels(self, physical_channel, kind):
+        """
+        Returns the (device, physical channel) pairs that a list of
+        physical channels specifies. Digital ports expand to their lines.
+        """
+        channels = []
+        for name in unflatten_channel_string(_to_str(physical_channel)):
+            device_name = name.lstrip('/').partition('/')[0]
+            device = self._devices.get(device_name.lower())
+            if device is None:
+                raise _SimulatedError(
+                    DAQmxErrors.INVALID_DEVICE_ID,
+                    'Device identifier is invalid.\n\n'
+                    'Device Specified: {0}'.format(device_name))
+
+            if kind == 'line':
+                channels.extend((device, c) for c in
+                                device._expand_lines(name))
+            else:
+                channels.append((device, device._find(kind, name)))
+        return channels
+
+    def _add_channels(self, task_handle, kind, physical_channel,
+                      name_to_assign, chan_type, properties):
+        with self._lock:
+            task = self._get_task(task_handle)
+            physical = self._find_physical_channels(physical_channel, kind)
+            names = self._get_channel_names(
+                _to_str(name_to_assign), [c for _, c in physical])
+            self._add_to_task(task, [
+                _SimulatedChannel(name, chan_type, device, [channel],
+                                  properties)
+                for name, (device, channel) in zip(names, physical)])
+
+    def _add_digital_channels(self, task_handle, lines, name_to_assign,
+                              line_grouping, chan_type, num_lines_attribute):
+        with self._lock:
+            task = self._get_task(task_handle)
+            physical = self._find_physical_channels(lines, 'line')
+            if line_grouping == LineGrouping.CHAN_PER_LINE.value:
+                groups = [[c] for c in physical]
+                default_names = [c for _, c in physical]
+            else:
+                groups = [physical]
+                default_names = [_to_str(lines)]
+
+            names = self._get_channel_names(
+                _to_str(name_to_assign), default_names)
+            self._add_to_task(task, [
+                _SimulatedChannel(
+                    name, chan_type, group[0][0], [c for _, c in group],
+                    {num_lines_attribute: len(group)})
+                for name, group in zip(names, groups)])
+
+    @staticmethod
+    def _get_channel_names(name_to_assign, default_names):
+        if not name_to_assign:
+            return default_names
+        if len(default_names) == 1:
+            return [name_to_assign]
+        return ['{0}{1}'.format(name_to_assign, i)
+                for i in range(len(default_names))]
+
+    @staticmethod
+    def _add_to_task(task, channels):
+        names = set(c.name.lower() for c in task.channels)
+        for channel in channels:
+            if channel.name.lower() in names:
+                raise _SimulatedError(
+                    DAQmxErrors.CHAN_ALREADY_IN_TASK,
+                    'Channel with the specified name is already in the '
+                    'task.\n\nChannel Name: {0}\nTask Name: {1}'.format(
+                        channel.name, task.name))
+            names.add(channel.name.lower())
+        task.channels.extend(channels)
+
+    # endregion
+
+    # region Read Functions
+
+    def DAQmxReadAnalogF64(
+            self, task_handle, num_samps_per_chan, timeout, fill_mode,
+            read_array, array_size_in_samps, samps_per_chan_read, reserved):
+        self._read(task_handle, num_samps_per_chan, timeout, fill_mode,
+                   read_array, array_size_in_samps, samps_per_chan_read,
+                   (ChannelType.ANALOG_INPUT,), self._analog_samples)
+
+    def DAQmxReadAnalogScalarF64(self, task_handle, timeout, value,
+                                 reserved):
+        value._obj.value = self._read_scalar(
+            task_handle, timeout, (ChannelType.ANALOG_INPUT,),
+            self._analog_samples)
+
+    def DAQmxReadDigitalU8(
+            self, task_handle, num_samps_per_chan, timeout, fill_mode,
+            read_array, array_size_in_samps, samps_per_chan_read, reserved):
+        self._read(task_handle, num_samps_per_chan, timeout, fill_mode,
+                   read_array, array_size_in_samps, samps_per_chan_read,
+                   _DIGITAL_TYPES, self._port_samples)
+
+    DAQmxReadDigitalU16 = DAQmxReadDigitalU8
+    DAQmxReadDigitalU32 = DAQmxReadDigitalU8
+
+    def DAQmxReadDigitalScalarU32(self, task_handle, timeout, value,
+                                  reserved):
+        value._obj.value = int(self._read_scalar(
+            task_handle, timeout, _DIGITAL_TYPES, self._port_samples))
+
+    def DAQmxReadDigitalLines(
+            self, task_handle, num_samps_per_chan, timeout, fill_mode,
+            read_array, array_size_in_bytes, samps_per_chan_read,
+            num_bytes_per_samp, reserved):
+        try:
+            self._read(task_handle, num_samps_per_chan, timeout, fill_mode,
+                       read_array, array_size_in_bytes, samps_per_chan_read,
+                       _DIGITAL_TYPES, self._line_samples)
+        finally:
+            with self._lock:
+                task = self._tasks.get(
+                    getattr(task_handle, 'value', task_handle))
+                if task is not None:
+                    num_bytes_per_samp._obj.value = max(
+                        [len(c.lines) for c in task.channels_to_read()] or
+                        [0])
+
+    def DAQmxReadCounterF64Ex(
+            self, task_handle, num_samps_per_chan, timeout, fill_mode,
+            read_array, array_size_in_samps, samps_per_chan_read, reserved):
+        self._read(task_handle, num_samps_per_chan, timeout, fill_mode,
+                   read_array, array_size_in_samps, samps_per_chan_read,
+                   (ChannelType.COUNTER_INPUT,), self._counter_samples)
+
+    DAQmxReadCounterU32Ex = DAQmxReadCounterF64Ex
+
+    def DAQmxReadCounterF64(
+            self, task_handle, num_samps_per_chan, timeout, read_array,
+            array_size_in_samps, samps_per_chan_read, reserved):
+        self.DAQmxReadCounterF64Ex(
+            task_handle, num_samps_per_chan, timeout,
+            FillMode.GROUP_BY_CHANNEL.value, read_array, array_size_in_samps,
+            samps_per_chan_read, reserved)
+
+    DAQmxReadCounterU32 = DAQmxReadCounterF64
+
+    def DAQmxReadCounterScalarF64(self, task_handle, timeout, value,
+                                  reserved):
+        value._obj.value = self._read_scalar(
+            task_handle, timeout, (ChannelType.COUNTER_INPUT,),
+            self._counter_samples)
+
+    def DAQmxReadCounterScalarU32(self, task_handle, timeout, value,
+                                  reserved):
+        value._obj.value = int(self._read_scalar(
+            task_handle, timeout, (ChannelType.COUNTER_INPUT,),
+            self._counter_samples))
+
+    def _read(self, task_handle, num_samps_per_chan, timeout, fill_mode,
+              read_array, array_size, samps_per_chan_read, chan_types,
+              get_samples):
+        task, channels, times, error = self._acquire(
+            task_handle, num_samps_per_chan, timeout, chan_types)
+
+        data = get_samples(task, channels, times)
+        num_values = data.size
+        if num_values > array_size:
+            raise _SimulatedError(
+                DAQmxErrors.READ_BUFFER_TOO_SMALL,
+                'Buffer is too small to fit read data.\n\n'
+                'Buffer Size: {0}\nRequired Buffer Size: {1}'.format(
+                    array_size, num_values))
+
+        flat_array = read_array.reshape(-1)
+        if fill_mode == FillMode.GROUP_BY_SCAN_NUMBER.value:
+            flat_array[:num_values] = data.swapaxes(0, 1).reshape(-1)
+        elif len(channels):
+            stride = array_size // len(channels)
+            for i, samples in enumerate(data):
+                samples = samples.reshape(-1)
+                flat_array[i * stride:i * stride + len(samples)] = samples
+
+        samps_per_chan_read._obj.value = len(times)
+        if error is not None:
+            raise error
+
+    def _read_scalar(self, task_handle, timeout, chan_types, get_samples):
+        task, channels, times, error = self._acquire(
+            task_handle, 1, timeout, chan_types)
+        if error is not None:
+            raise error
+        return get_samples(task, channels, times)[0, 0]
+
+    def _acquire(self, task_handle, num_samps_per_chan, timeout, chan_types):
+        """
+        Waits for the samples that a read requests and returns the task,
+        the channels to read, the times of the samples relative to the
+        creation of the backend, and the error to report, if any.
+        """
+        with self._lock:
+            task = self._get_task(task_handle)
+            channels = task.channels_to_read()
+            if not channels or not all(
+                    c.chan_type in chan_types for c in channels):
+                raise _SimulatedError(
+                    DAQmxErrors.READ_NO_INPUT_CHANS_IN_TASK,
+                    'Read cannot be performed because the task has no '
+                    'channels of the type that this function reads.\n\n'
+                    'Task Name: {0}'.format(task.name))
+
+            if not task.running:
+                self._start(task)
+                task.auto_started = True
+
+            if not task.is_clocked():
+                count = 1 if num_samps_per_chan < 0 else num_samps_per_chan
+                times = numpy.full(count, _clock() - self._epoch)
+                task.read_position += count
+                if task.auto_started:
+                    self._stop(task)
+                return task, channels, times, None
+
+            rate = task.rate()
+            total = task.total()
+            start_time = task.start_time
+            position = task.read_position
+            now = _clock()
+            if num_samps_per_chan >= 0:
+                count = num_samps_per_chan
+            elif total is not None and not task.get('ReadAllAvailSamp'):
+                count = total - position
+            else:
+                count = task.acquired(now) - position
+
+        if total is not None and position + count > total:
+            raise _SimulatedError(
+                DAQmxErrors.SAMPLES_WILL_NEVER_BE_AVAILABLE,
+                'Requested samples will never be available, because the '
+                'read position is beyond the final sample of the finite '
+                'acquisition.\n\nTask Name: {0}'.format(task.name))
+
+        error = None
+        wait = start_time + (position + count) / rate - now
+        if wait > 0:
+            if 0 <= timeout < wait:
+                time.sleep(timeout)
+                count = max(0, task.acquired() - position)
+                error = _SimulatedError(
+                    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE,
+                    'Some or all of the samples requested have not yet '
+                    'been acquired.\n\nTask Name: {0}'.format(task.name))
+            else:
+                time.sleep(wait)
+
+        thread = None
+        with self._lock:
+            self._get_task(task_handle)
+            buffer_size = task.input_buffer_size()
+            if (total is None and
+                    task.acquired() - position > buffer_size):
+                raise _SimulatedError(
+                    DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE,
+                    'The application is not able to keep up with the '
+                    'hardware acquisition.\n\nTask Name: {0}'.format(
+                        task.name))
+
+            task.read_position = position + count
+            if (task.auto_started and total is not None and
+                    task.read_position >= total):
+                thread = self._stop(task)
+        self._join(thread)
+
+        times = ((start_time - self._epoch) +
+                 (position + numpy.arange(count)) / rate)
+        return task, channels, times, error
+
+    def _analog_samples(self, task, channels, times):
+        data = numpy.empty((len(channels), len(times)))
+        for row, channel in zip(data, channels):
+            values = channel.device._generate(
+                channel.physical_channels[0], times)
+            row[:] = numpy.clip(values, channel.properties['AIMin'],
+                                channel.properties['AIMax'])
+        return data
+
+    def _line_samples(self, task, channels, times):
+        width = max(len(c.lines) for c in channels)
+        data = numpy.zeros((len(channels), len(times), width),
+                           dtype=numpy.bool_)
+        with self._lock:
+            for samples, channel in zip(data, channels):
+                states = channel.device._line_states
+                samples[:, :len(channel.lines)] = [
+                    states.get(line, False) for line, _ in channel.lines]
+        return data
+
+    def _port_samples(self, task, channels, times):
+        data = numpy.zeros((len(channels), len(times)), dtype=numpy.uint32)
+        with self._lock:
+            for row, channel in zip(data, channels):
+                states = channel.device._line_states
+                row[:] = sum(1 << bit for line, bit in channel.lines
+                             if states.get(line, False))
+        return data
+
+    def _counter_samples(self, task, channels, times):
+        data = numpy.empty((len(channels), len(times)))
+        elapsed = times - (task.start_time - self._epoch)
+        for row, channel in zip(data, channels):
+            properties = channel.properties
+            rate = channel.device.counter_rate
+            if properties['CIMeasType'] == UsageTypeCI.FREQUENCY.value:
+                row[:] = rate
+                continue
+
+            counts = numpy.floor(numpy.maximum(elapsed, 0.0) * rate)
+            if (properties['CICountEdgesDir'] ==
+                    CountDirection.COUNT_DOWN.value):
+                counts = -counts
+            row[:] = numpy.mod(
+                properties['CICountEdgesInitialCnt'] + counts, 2 ** 32)
+        return data
+
+    # endregion
+
+    # region Write Functions
+
+    def DAQmxWriteAnalogF64(
+            self, task_handle, num_samps_per_chan, auto_start, timeout,
+            data_layout, write_array, samps_per_chan_written, reserved):
+        self._write(task_handle, num_samps_per_chan, auto_start, data_layout,
+                    write_array, samps_per_chan_written,
+                    ChannelType.ANALOG_OUTPUT, self._apply_analog)
+
+    def DAQmxWriteAnalogScalarF64(self, task_handle, auto_start, timeout,
+                                  value, reserved):
+        self.DAQmxWriteAnalogF64(
+            task_handle, 1, auto_start, timeout,
+            FillMode.GROUP_BY_CHANNEL.value, numpy.array([value]), None,
+            reserved)
+
+    def DAQmxWriteDigitalU8(
+            self, task_handle, num_samps_per_chan, auto_start, timeout,
+            data_layout, write_array, samps_per_chan_written, reserved):
+        self._write(task_handle, num_samps_per_chan, auto_start, data_layout,
+                    write_array, samps_per_chan_written,
+                    ChannelType.DIGITAL_OUTPUT, self._apply_port)
+
+    DAQmxWriteDigitalU16 = DAQmxWriteDigitalU8
+    DAQmxWriteDigitalU32 = DAQmxWriteDigitalU8
+
+    def DAQmxWriteDigitalScalarU32(self, task_handle, auto_start, timeout,
+                                   value, reserved):
+        self.DAQmxWriteDigitalU32(
+            task_handle, 1, auto_start, timeout,
+            FillMode.GROUP_BY_CHANNEL.value,
+            numpy.array([value], dtype=numpy.uint32), None, reserved)
+
+    def DAQmxWriteDigitalLines(
+            self, task_handle, num_samps_per_chan, auto_start, timeout,
+            data_layout, write_array, samps_per_chan_written, reserved):
+        self._write(task_handle, num_samps_per_chan, auto_start, data_layout,
+                    write_array, samps_per_chan_written,
+                    ChannelType.DIGITAL_OUTPUT, self._apply_lines)
+
+    def _write(self, task_handle, num_samps_per_chan, auto_start,
+               data_layout, write_array, samps_per_chan_written, chan_type,
+               apply_sample):
+        """
+        Applies the last sample written to each channel to its physical
+        channels. Sample clocked tasks also count the samples written,
+        and start if **auto_start** is True.
+        """
+        thread = None
+        with self._lock:
+            task = self._get_task(task_handle)
+            channels = task.channels
+            if not channels or any(c.chan_type != chan_type
+                                   for c in channels):
+                raise _SimulatedError(
+                    DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK,
+                    'Write cannot be performed because the task has no '
+                    'channels of the type that this function writes.\n\n'
+                    'Task Name: {0}'.format(task.name))
+
+            data = numpy.asarray(write_array).reshape(-1)
+            if data.size % (len(channels) * max(num_samps_per_chan, 1)):
+                raise _SimulatedError(
+                    DAQmxErrors.WRITE_NUM_CHANS_MISMATCH,
+                    'Write cannot be performed, because the number of '
+                    'channels in the data does not match the number of '
+                    'channels in the task.\n\nTask Name: {0}'.format(
+                        task.name))
+
+            if num_samps_per_chan > 0:
+                if data_layout == FillMode.GROUP_BY_SCAN_NUMBER.value:
+                    data = data.reshape(
+                        num_samps_per_chan, len(channels), -1).swapaxes(0, 1)
+                else:
+                    data = data.reshape(
+                        len(channels), num_samps_per_chan, -1)
+                for channel, samples in zip(channels, data):
+                    apply_sample(channel, samples[-1])
+
+            if task.is_clocked():
+                task.written += num_samps_per_chan
+                if auto_start and not task.running:
+                    self._start(task)
+            elif auto_start and not task.running:
+                self._start(task)
+                thread = self._stop(task)
+        self._join(thread)
+
+        if samps_per_chan_written is not None:
+            samps_per_chan_written._obj.value = num_samps_per_chan
+
+    @staticmethod
+    def _apply_analog(channel, sample):
+        key = channel.physical_channels[0].lower()
+        channel.device._ao_values[key] = float(sample[0])
+
+    @staticmethod
+    def _apply_lines(channel, sample):
+        states = channel.device._line_states
+        for (line, _), state in zip(channel.lines, sample):
+            states[line] = bool(state)
+
+    @staticmethod
+    def _apply_port(channel, sample):
+        states = channel.device._line_states
+        value = int(sample[0])
+        for line, bit in channel.lines:
+            states[line] = bool(value >> bit & 1)
+
+    # endregion
+
+    # region Event Functions
+
+    def DAQmxRegisterEveryNSamplesEvent(
+            self, task_handle, every_n_samples_event_type, n_samples,
+            options, callback_function, callback_data):
+        self._register(task_handle, ('every_n', every_n_samples_event_type),
+                       callback_function, n_samples, callback_data)
+
+    def DAQmxRegisterDoneEvent(self, task_handle, options, callback_function,
+                               callback_data):
+        self._register(task_handle, ('done',), callback_function, None,
+                       callback_data)
+
+    def DAQmxRegisterSignalEvent(self, task_handle, signal_id, options,
+                                 callback_function, callback_data):
+        # Signal events are accepted but never occur.
+        self._register(task_handle, ('signal', signal_id),
+                       callback_function, None, callback_data)
+
+    def _register(self, task_handle, key, callback_function, n_samples,
+                  callback_data):
+        with self._lock:
+            task = self._get_task(task_handle)
+            if callback_function is None:
+                task.callbacks.pop(key, None)
+            else:
+                task.callbacks[key] = (
+                    callback_function, n_samples, callback_data)
+                if task.running:
+                    self._start_events(task)
+
+    def _start_events(self, task):
+        if (task.event_thread is not None or not task.callbacks or
+                not task.is_clocked()):
+            return
+        task.stop_event = threading.Event()
+        task.event_thread = threading.Thread(
+            target=self._run_events, args=(task, task.stop_event))
+        task.event_thread.daemon = True
+        task.event_thread.start()
+
+    def _run_events(self, task, stop_event):
+        """
+        Calls the event callbacks of a running task when the sample clock
+        reaches the samples that trigger them.
+        """
+        counts = {}
+        while True:
+            due = []
+            next_time = None
+            with self._lock:
+                if stop_event.is_set():
+                    return
+                now = _clock()
+                rate = task.rate()
+                total = task.total()
+
+                for key, (callback, n_samples, data) in list(
+                        task.callbacks.items()):
+                    count = counts.get(key, 0)
+                    if key[0] == 'every_n' and n_samples:
+                        sample = (count + 1) * n_samples
+                        if total is not None and sample > total:
+                            continue
+                        args = (task.handle, key[1], n_samples, data)
+                    elif key[0] == 'done' and total is not None and not count:
+                        sample = total
+                        args = (task.handle, 0, data)
+                    else:
+                        continue
+
+                    event_time = task.start_time + sample / rate
+                    if event_time <= now:
+                        counts[key] = count + 1
+                        due.append((callback, args))
+                    elif next_time is None or event_time < next_time:
+                        next_time = event_time
+
+            for callback, args in due:
+                callback(*args)
+
+            if not due:
+                if next_time is None or stop_event.wait(next_time - now):
+                    return
+
+    # endregion
+
+    # region Device Functions
+
+    def DAQmxResetDevice(self, device_name):
+        with self._lock:
+            device = self._devices.get(_to_str(device_name).lower())
+            if device is None:
+                raise _SimulatedError(
+                    DAQmxErrors.INVALID_DEVICE_ID,
+                    'Device identifier is invalid.\n\n'
+                    'Device Specified: {0}'.format(device_name))
+
+            threads = [self._stop(task) for task in self._tasks.values()
+                       if any(c.device is device for c in task.channels)]
+            device._ao_values.clear()
+            device._line_states.clear()
+
+        for thread in threads:
+            self._join(thread)
+
+    # endregion
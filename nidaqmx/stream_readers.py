@@ -16,6 +16,7 @@ from nidaqmx._task_modules.read_functions import (
     _read_ctr_freq_scalar, _read_ctr_ticks_scalar, _read_ctr_time_scalar,
     _read_ctr_freq, _read_ctr_ticks, _read_ctr_time)
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import CtrFreq, CtrTick, CtrTime
 
 __all__ = ['AnalogSingleChannelReader', 'AnalogMultiChannelReader',
            'AnalogUnscaledReader', 'CounterReader',
@@ -714,6 +715,22 @@ class CounterReader(ChannelReaderBase):
     Reads samples from a counter input channel in an NI-DAQmx task.
     """
 
+    # The sample type, data type and read function of each kind of pulse
+    # sample, matched against the fields of structured NumPy arrays.
+    _PULSE_SAMPLE_TYPES = [
+        (CtrFreq, numpy.float64, _read_ctr_freq),
+        (CtrTime, numpy.float64, _read_ctr_time),
+        (CtrTick, numpy.uint32, _read_ctr_ticks)]
+
+    def __init__(self, task_in_stream):
+        """
+        Args:
+            task_in_stream: Specifies the input stream associated with
+                an NI-DAQmx task from which to read samples.
+        """
+        super(CounterReader, self).__init__(task_in_stream)
+        self._pulse_buffers = {}
+
     def read_many_sample_double(
             self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
             timeout=10.0):
@@ -784,6 +801,91 @@ class CounterReader(ChannelReaderBase):
             self._handle, data, number_of_samples_per_channel,
             timeout)
 
+    def read_many_sample_pulse(
+            self, data, number_of_samples_per_channel=READ_ALL_AVAILABLE,
+            timeout=10.0):
+        """
+        Reads one or more pulse samples from a single counter input
+        channel in a task into a structured NumPy array.
+
+        The fields of the array determine the type of pulse sample to
+        read. Use an array of the nidaqmx.types.CTR_FREQ_DTYPE data type
+        to read pulse samples in terms of frequency, of the
+        nidaqmx.types.CTR_TIME_DTYPE data type to read pulse samples in
+        terms of time, or of the nidaqmx.types.CTR_TICK_DTYPE data type to
+        read pulse samples in terms of ticks. Arrays with additional
+        fields, or with fields of other numeric types, are also accepted.
+
+        NI-DAQmx returns each part of a pulse sample in a separate
+        contiguous array, so this method reads into buffers that the
+        reader allocates once and reuses, and then copies each part into
+        its field of the array.
+
+        Args:
+            data (numpy.ndarray): Specifies a preallocated 1D structured
+                NumPy array to hold the samples requested.
+
+                Each element in the array corresponds to a sample from
+                the channel. The size of the array must be large enough
+                to hold all requested samples from the channel in the
+                task; otherwise, an error is thrown.
+            number_of_samples_per_channel (Optional[int]): Specifies the
+                number of samples to read.
+
+                If you set this input to nidaqmx.constants.
+                READ_ALL_AVAILABLE, NI-DAQmx determines how many samples
+                to read based on if the task acquires samples
+                continuously or acquires a finite number of samples.
+
+                If the task acquires samples continuously and you set
+                this input to nidaqmx.constants.READ_ALL_AVAILABLE, this
+                method reads all the samples currently available in the
+                buffer.
+
+                If the task acquires a finite number of samples and you
+                set this input to nidaqmx.constants.READ_ALL_AVAILABLE,
+                the method waits for the task to acquire all requested
+                samples, then reads those samples. If you set the
+                "read_all_avail_samp" property to True, the method reads
+                the samples currently available in the buffer and does
+                not wait for the task to acquire all requested samples.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for samples to become available. If the
+                time elapses, the method returns an error and any
+                samples read before the timeout elapsed. The default
+                timeout is 10 seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to read the requested samples and returns an error
+                if it is unable to.
+        Returns:
+            int:
+
+            Indicates the number of samples acquired by each channel.
+            NI-DAQmx returns a single value because this value is the
+            same for all channels.
+        """
+        number_of_samples_per_channel = (
+            self._task._calculate_num_samps_per_chan(
+                number_of_samples_per_channel))
+
+        self._verify_array(
+            data, number_of_samples_per_channel, False, True)
+
+        sample_type, dtype, read_function = self._get_pulse_sample_type(
+            data)
+        buffers = self._get_pulse_buffers(
+            dtype, number_of_samples_per_channel)
+
+        samples_read = read_function(
+            self._handle, buffers[0], buffers[1],
+            number_of_samples_per_channel, timeout)
+
+        for field, buffer in zip(sample_type._fields, buffers):
+            data[field][:samples_read] = buffer[:samples_read]
+
+        return samples_read
+
     def read_many_sample_pulse_frequency(
             self, frequencies, duty_cycles,
             number_of_samples_per_channel=READ_ALL_AVAILABLE, timeout=10.0):
@@ -1207,6 +1309,37 @@ class CounterReader(ChannelReaderBase):
         """
         return _read_counter_scalar_u_32(self._handle, timeout)
 
+    def _get_pulse_buffers(self, dtype, number_of_samples):
+        """
+        Gets the two reusable buffers that hold the parts of pulse samples
+        of the specified data type, growing them if they are too small.
+        """
+        buffers = self._pulse_buffers.get(dtype)
+        if buffers is None or buffers[0].shape[0] < number_of_samples:
+            buffers = (numpy.zeros(number_of_samples, dtype=dtype),
+                       numpy.zeros(number_of_samples, dtype=dtype))
+            self._pulse_buffers[dtype] = buffers
+        return buffers
+
+    def _get_pulse_sample_type(self, data):
+        """
+        Gets the sample type, data type and read function that correspond
+        to the fields of the specified structured NumPy array.
+        """
+        names = data.dtype.names or ()
+        for sample_type, dtype, read_function in self._PULSE_SAMPLE_TYPES:
+            if all(f in names for f in sample_type._fields):
+                return sample_type, dtype, read_function
+
+        raise DaqError(
+            'Read cannot be performed because the NumPy array passed into '
+            'this function does not have the fields of a counter pulse '
+            'sample. You must pass in a structured NumPy array with the '
+            'fields of CtrFreq, CtrTime or CtrTick samples.\n\n'
+            'Fields of NumPy Array provided: {0}'
+            .format(', '.join(names) if names else 'None'),
+            DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+
 
 class DigitalSingleChannelReader(ChannelReaderBase):
     """
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import numpy
 from nidaqmx import DaqError
+from nidaqmx.constants import ResolutionType
 from nidaqmx._task_modules.write_functions import (
     _write_analog_f_64, _write_analog_scalar_f_64, _write_binary_i_16,
     _write_binary_i_32, _write_binary_u_16, _write_binary_u_32,
@@ -13,9 +14,10 @@ from nidaqmx._task_modules.write_functions import (
     _write_digital_u_16, _write_digital_u_32, _write_digital_lines,
     _write_digital_scalar_u_32)
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import CtrFreq, CtrTick, CtrTime
 
 __all__ = ['AnalogSingleChannelWriter', 'AnalogMultiChannelWriter',
-           'AnalogUnscaledWriter', 'CounterWriter',
+           'AnalogRawConverter', 'AnalogUnscaledWriter', 'CounterWriter',
            'DigitalSingleChannelWriter', 'DigitalMultiChannelWriter']
 
 
@@ -110,8 +112,7 @@ class ChannelWriterBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_channels = self._task.number_of_channels
 
         expected_num_dimensions = None
         if is_many_chan:
@@ -149,8 +150,7 @@ class ChannelWriterBase(object):
         if not self._verify_array_shape:
             return
 
-        channels_to_write = self._task.channels
-        number_of_channels = len(channels_to_write.channel_names)
+        number_of_channels = self._task.number_of_channels
         number_of_lines = self._out_stream.do_num_booleans_per_chan
 
         expected_num_dimensions = None
@@ -356,12 +356,222 @@ class AnalogMultiChannelWriter(ChannelWriterBase):
             self._handle, data, 1, auto_start, timeout)
 
 
+class AnalogRawConverter(object):
+    """
+    Converts scaled samples to the raw codes of the digital-to-analog
+    converters of the analog output channels in an NI-DAQmx task.
+
+    The converter uses the device scaling coefficients and the resolution
+    of each channel. These are queried once and cached; they are queried
+    again only if the number of channels in the task changes or you call
+    the "refresh" method. Scaling coefficients do not account for any
+    custom scales that may be applied to the channels.
+    """
+
+    def __init__(self, task_out_stream):
+        """
+        Args:
+            task_out_stream: Specifies the output stream associated with
+                an NI-DAQmx task whose channels to convert samples for.
+        """
+        self._task = task_out_stream._task
+        self._layout = None
+
+    def __repr__(self):
+        return 'AnalogRawConverter(task={0})'.format(self._task.name)
+
+    @property
+    def coefficients(self):
+        """
+        numpy.ndarray: Indicates the device scaling coefficients of each
+            channel as a 2D array. Each row corresponds to a channel in
+            the task. The first column corresponds to the y-intercept,
+            and the second column corresponds to the slope.
+        """
+        return self._get_layout()[1][:, :, 0].T.copy()
+
+    @property
+    def dtype(self):
+        """
+        numpy.dtype: Indicates the integer data type that holds the raw
+            codes of every channel in the task; numpy.int16 if the
+            resolution of every channel is 16 bits or fewer, numpy.int32
+            otherwise.
+        """
+        return self._get_layout()[2]
+
+    def refresh(self):
+        """
+        Queries the scaling coefficients and resolution of the channels
+        in the task again.
+        """
+        self._layout = None
+
+    def convert(self, data, out=None):
+        """
+        Converts scaled samples to raw codes, rounding each sample to the
+        nearest code and clipping it to the range of the channel's
+        digital-to-analog converter.
+
+        Args:
+            data (numpy.ndarray): Specifies the scaled samples to convert.
+                For a task with a single channel, use a 1D NumPy array.
+                For a task with multiple channels, use a 2D NumPy array in
+                which each row corresponds to a channel in the task.
+            out (Optional[numpy.ndarray]): Specifies a preallocated NumPy
+                array of the same shape as **data** to store the raw
+                codes in. If you do not specify a value, this method
+                allocates an array of the data type indicated by the
+                "dtype" property.
+        Returns:
+            numpy.ndarray:
+
+            The raw codes.
+        """
+        number_of_channels, coefficients, dtype, low, high = (
+            self._get_layout())
+
+        data = numpy.asarray(data, dtype=numpy.float64)
+        channels_in_data = 1 if data.ndim == 1 else data.shape[0]
+        if data.ndim > 2 or channels_in_data != number_of_channels:
+            self._task._raise_invalid_write_num_chans_error(
+                number_of_channels, channels_in_data)
+
+        if data.ndim == 1:
+            coefficients = coefficients[:, 0]
+            low = low[0]
+            high = high[0]
+
+        # Evaluate the polynomial with Horner's method; for the usual
+        # linear coefficients this is one multiply and one add.
+        codes = numpy.multiply(data, coefficients[-1])
+        for coefficient in coefficients[-2:0:-1]:
+            codes += coefficient
+            codes *= data
+        codes += coefficients[0]
+        numpy.rint(codes, out=codes)
+        numpy.clip(codes, low, high, out=codes)
+
+        if out is None:
+            return codes.astype(dtype)
+        numpy.copyto(out, codes, casting='unsafe')
+        return out
+
+    def _get_layout(self):
+        number_of_channels = self._task.number_of_channels
+
+        layout = self._layout
+        if layout is not None and layout[0] == number_of_channels:
+            return layout
+
+        coefficients = []
+        resolutions = []
+        for channel in self._task.ao_channels:
+            coefficients.append(channel.ao_dev_scaling_coeff)
+            channel.ao_resolution_units = ResolutionType.BITS
+            resolutions.append(int(channel.ao_resolution))
+
+        number_of_terms = max([2] + [len(c) for c in coefficients])
+        terms = numpy.zeros(
+            (number_of_terms, len(coefficients), 1), dtype=numpy.float64)
+        for index, channel_coefficients in enumerate(coefficients):
+            terms[:len(channel_coefficients), index, 0] = channel_coefficients
+
+        resolutions = numpy.array(resolutions, dtype=numpy.float64)
+        high = (2 ** (resolutions - 1) - 1)[:, numpy.newaxis]
+        low = (-2 ** (resolutions - 1))[:, numpy.newaxis]
+        dtype = numpy.dtype(
+            numpy.int16 if resolutions.max() <= 16 else numpy.int32)
+
+        layout = (number_of_channels, terms, dtype, low, high)
+        self._layout = layout
+        return layout
+
+
 class AnalogUnscaledWriter(ChannelWriterBase):
     """
     Writes unscaled samples to one or more analog output channels in
     an NI-DAQmx task.
     """
 
+    def __init__(self, task_out_stream, auto_start=AUTO_START_UNSET):
+        """
+        Args:
+            task_out_stream: Specifies the output stream associated with
+                an NI-DAQmx task which to write samples.
+            auto_start (Optional[bool]): Specifies if the write method
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method.
+
+                If you do not specify a value for this parameter,
+                NI-DAQmx determines its value based on the type of write
+                method used. If you use a one sample write method, the
+                value is True; conversely, if you use a many sample
+                write method, the value is False.
+        """
+        super(AnalogUnscaledWriter, self).__init__(
+            task_out_stream, auto_start=auto_start)
+        self._converter = None
+
+    @property
+    def converter(self):
+        """
+        :class:`nidaqmx.stream_writers.AnalogRawConverter`: Indicates the
+            converter the "write_scaled" method uses to convert scaled
+            samples to raw codes.
+        """
+        if self._converter is None:
+            self._converter = AnalogRawConverter(self._out_stream)
+        return self._converter
+
+    def write_scaled(self, data, timeout=10.0):
+        """
+        Converts one or more scaled samples to raw codes and writes them
+        to one or more analog output channels in a task.
+
+        The samples are converted with the device scaling coefficients of
+        each channel, which do not account for any custom scales that may
+        be applied to the channels. The raw codes are written as 16-bit
+        integers, or as 32-bit integers if any channel has a resolution
+        greater than 16 bits, which halves or more the amount of data
+        transferred to the driver compared to writing scaled samples.
+
+        Args:
+            data (numpy.ndarray): Contains a 2D NumPy array of scaled
+                samples to write to the task.
+
+                Each row corresponds to a channel in the task. Each
+                column corresponds to a sample to write to each channel.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples.
+                NI-DAQmx performs a timeout check only if the method
+                must wait before it writes data. This method returns an
+                error if the time elapses. The default timeout is 10
+                seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to write the submitted samples. If the method could
+                not write all the submitted samples, it returns an error
+                and the number of samples successfully written.
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote to each channel in the task.
+        """
+        self._verify_array(data, True, True)
+
+        codes = self.converter.convert(data)
+
+        auto_start = (self._auto_start if self._auto_start is not
+                      AUTO_START_UNSET else False)
+
+        if codes.dtype == numpy.int16:
+            return _write_binary_i_16(
+                self._handle, codes, codes.shape[1], auto_start, timeout)
+        return _write_binary_i_32(
+            self._handle, codes, codes.shape[1], auto_start, timeout)
+
     def write_int16(self, data, timeout=10.0):
         """
         Writes one or more unscaled 16-bit integer samples to one or
@@ -548,6 +758,104 @@ class CounterWriter(ChannelWriterBase):
     Writes samples to a counter output channel in an NI-DAQmx task.
     """
 
+    # The sample type, data type and write function of each kind of pulse
+    # sample, matched against the fields of structured NumPy arrays.
+    _PULSE_SAMPLE_TYPES = [
+        (CtrFreq, numpy.float64, _write_ctr_freq),
+        (CtrTime, numpy.float64, _write_ctr_time),
+        (CtrTick, numpy.uint32, _write_ctr_ticks)]
+
+    def __init__(self, task_out_stream, auto_start=AUTO_START_UNSET):
+        """
+        Args:
+            task_out_stream: Specifies the output stream associated with
+                an NI-DAQmx task which to write samples.
+            auto_start (Optional[bool]): Specifies if the write method
+                automatically starts the task if you did not explicitly
+                start it with the DAQmx Start Task method.
+
+                If you do not specify a value for this parameter,
+                NI-DAQmx determines its value based on the type of write
+                method used. If you use a one sample write method, the
+                value is True; conversely, if you use a many sample
+                write method, the value is False.
+        """
+        super(CounterWriter, self).__init__(
+            task_out_stream, auto_start=auto_start)
+        self._pulse_buffers = {}
+
+    def write_many_sample_pulse(self, data, timeout=10.0):
+        """
+        Writes one or more pulse samples held in a structured NumPy array
+        to a single counter output channel in a task.
+
+        The fields of the array determine the type of pulse sample to
+        write. Use an array of the nidaqmx.types.CTR_FREQ_DTYPE data type
+        to write pulse samples in terms of frequency, of the
+        nidaqmx.types.CTR_TIME_DTYPE data type to write pulse samples in
+        terms of time, or of the nidaqmx.types.CTR_TICK_DTYPE data type to
+        write pulse samples in terms of ticks. Arrays with additional
+        fields, or with fields of other numeric types, are also accepted.
+
+        NI-DAQmx accepts each part of a pulse sample in a separate
+        contiguous array, so this method copies each field of the array
+        into buffers that the writer allocates once and reuses.
+
+        If the task uses on-demand timing, this method returns only
+        after the device generates all samples. On-demand is the default
+        timing type if you do not use the timing property on the task to
+        configure a sample timing type. If the task uses any timing type
+        other than on-demand, this method returns immediately and does
+        not wait for the device to generate all samples. Your
+        application must determine if the task is done to ensure that
+        the device generated all samples.
+
+        Args:
+            data (numpy.ndarray): Contains a 1D structured NumPy array of
+                pulse samples to write to the task. Each element of the
+                array corresponds to a sample to write.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for the method to write all samples.
+                NI-DAQmx performs a timeout check only if the method
+                must wait before it writes data. This method returns an
+                error if the time elapses. The default timeout is 10
+                seconds. If you set timeout to
+                nidaqmx.constants.WAIT_INFINITELY, the method waits
+                indefinitely. If you set timeout to 0, the method tries
+                once to write the submitted samples. If the method could
+                not write all the submitted samples, it returns an error
+                and the number of samples successfully written.
+        Returns:
+            int:
+
+            Specifies the actual number of samples this method
+            successfully wrote.
+        """
+        self._verify_array(data, False, True)
+
+        sample_type, dtype, write_function = self._get_pulse_sample_type(
+            data)
+
+        number_of_samples = data.shape[0]
+        buffers = self._pulse_buffers.get(dtype)
+        if buffers is None or buffers[0].shape[0] < number_of_samples:
+            buffers = (numpy.zeros(number_of_samples, dtype=dtype),
+                       numpy.zeros(number_of_samples, dtype=dtype))
+            self._pulse_buffers[dtype] = buffers
+
+        parts = []
+        for field, buffer in zip(sample_type._fields, buffers):
+            part = buffer[:number_of_samples]
+            numpy.copyto(part, data[field], casting='unsafe')
+            parts.append(part)
+
+        auto_start = (self._auto_start if self._auto_start is not
+                      AUTO_START_UNSET else False)
+
+        return write_function(
+            self._handle, parts[0], parts[1], number_of_samples,
+            auto_start, timeout)
+
     def write_many_sample_pulse_frequency(
             self, frequencies, duty_cycles, timeout=10.0):
         """
@@ -793,6 +1101,25 @@ class CounterWriter(ChannelWriterBase):
         return _write_ctr_time_scalar(
             self._handle, high_time, low_time, auto_start, timeout)
 
+    def _get_pulse_sample_type(self, data):
+        """
+        Gets the sample type, data type and write function that correspond
+        to the fields of the specified structured NumPy array.
+        """
+        names = data.dtype.names or ()
+        for sample_type, dtype, write_function in self._PULSE_SAMPLE_TYPES:
+            if all(f in names for f in sample_type._fields):
+                return sample_type, dtype, write_function
+
+        raise DaqError(
+            'Write cannot be performed because the NumPy array passed into '
+            'this function does not have the fields of a counter pulse '
+            'sample. You must pass in a structured NumPy array with the '
+            'fields of CtrFreq, CtrTime or CtrTick samples.\n\n'
+            'Fields of NumPy Array provided: {0}'
+            .format(', '.join(names) if names else 'None'),
+            DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+
 
 class DigitalSingleChannelWriter(ChannelWriterBase):
     """
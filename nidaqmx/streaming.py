@@ -0,0 +1,401 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import numpy
+import threading
+import time
+
+from six.moves import queue
+
+from nidaqmx.constants import RegenerationMode
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.stream_writers import (
+    AnalogSingleChannelWriter, AnalogMultiChannelWriter)
+from nidaqmx.types import OutStreamEngineMetrics
+from nidaqmx.utils import _clock
+
+__all__ = ['OutStreamEngine']
+
+# Marks the end of the block source in the prefetch queue.
+_END_OF_SOURCE = object()
+
+
+class OutStreamEngine(object):
+    """
+    Streams a long, non-repeating waveform to an output task from a Python
+    iterable of NumPy blocks.
+
+    The engine disallows regeneration on the task, primes the output
+    buffer, starts the task and then keeps the buffer topped up from a
+    background thread. A second background thread pulls blocks from the
+    source ahead of time so that block synthesis overlaps with writing.
+
+    Each block must contain the same number of channels. One-dimensional
+    blocks are written to single-channel tasks and two-dimensional blocks,
+    laid out as (channels, samples), to multi-channel tasks. To stream any
+    other type of data, specify a **write_function**, such as the
+    **write_int16** method of an
+    :class:`nidaqmx.stream_writers.AnalogUnscaledWriter`.
+
+    The engine is a context manager; leaving the context stops the engine.
+    """
+
+    def __init__(self, task, source, write_function=None,
+                 low_water_mark=0.25, prefetch_blocks=4, timeout=10.0,
+                 low_water_callback=None):
+        """
+        Args:
+            task (nidaqmx.task.Task): Specifies the output task to stream
+                to. Configure the timing of the task before you start the
+                engine. The engine starts the task.
+            source: Specifies an iterable, such as a generator, that
+                yields the blocks of samples to write.
+            write_function (Optional[Callable]): Specifies the function
+                the engine calls to write each block. The function must
+                accept the block and a timeout, in that order, and return
+                the number of samples per channel written. If you do not
+                specify a value, the engine writes double-precision
+                floating-point samples using an analog stream writer.
+            low_water_mark (Optional[float]): Specifies the fraction of
+                the output buffer, between 0 and 1, below which the amount
+                of data not yet generated is considered at risk of
+                underflow. Each time the buffer drains below this mark,
+                the engine counts a low-water event and calls
+                **low_water_callback**.
+            prefetch_blocks (Optional[int]): Specifies the maximum number
+                of blocks the engine pulls from the source ahead of the
+                block being written.
+            timeout (Optional[float]): Specifies the amount of time in
+                seconds to wait for each write to complete.
+            low_water_callback (Optional[Callable]): Specifies a function
+                to call, from the background thread, each time the buffer
+                drains below **low_water_mark**. The function receives the
+                engine as its only argument.
+        """
+        if not 0 <= low_water_mark <= 1:
+            raise DaqError(
+                'Low-water mark must be between 0 and 1.\n\n'
+                'Low-water mark: {0}'.format(low_water_mark),
+                DAQmxErrors.UNKNOWN.value, task_name=task.name)
+
+        if prefetch_blocks < 1:
+            raise DaqError(
+                'Number of prefetch blocks must be greater than 0.\n\n'
+                'Number of prefetch blocks: {0}'.format(prefetch_blocks),
+                DAQmxErrors.UNKNOWN.value, task_name=task.name)
+
+        self._task = task
+        self._source = source
+        self._write_function = write_function
+        self._low_water_mark = low_water_mark
+        self._timeout = timeout
+        self._low_water_callback = low_water_callback
+
+        self._queue = queue.Queue(maxsize=prefetch_blocks)
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._producer = None
+        self._writer = None
+        self._error = None
+        self._started = False
+
+        self._buffer_size = 0
+        self._number_of_channels = None
+        self._sample_interval = 0.0
+        self._pending_block = None
+
+        self._samples_written = 0
+        self._samples_generated = 0
+        self._blocks_written = 0
+        self._min_headroom = None
+        self._low_water_events = 0
+        self._below_low_water = False
+        self._source_exhausted = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop(raise_error=type is None)
+
+    def __repr__(self):
+        return 'OutStreamEngine(task={0})'.format(self._task.name)
+
+    @property
+    def error(self):
+        """
+        Exception: Indicates the exception that terminated the background
+            threads, or None if no error occurred.
+        """
+        return self._error
+
+    @property
+    def is_running(self):
+        """
+        bool: Indicates if the background thread that writes to the task
+            is running.
+        """
+        return self._writer is not None and self._writer.is_alive()
+
+    @property
+    def metrics(self):
+        """
+        :class:`nidaqmx.types.OutStreamEngineMetrics`: Indicates the
+            progress of the stream and its risk of underflow.
+
+            **buffer_fill** is the fraction of the output buffer holding
+            samples not yet generated, measured the last time the engine
+            polled the task. **min_headroom** is the smallest number of
+            samples per channel not yet generated that the engine has
+            observed since it started the task.
+        """
+        with self._lock:
+            headroom = self._samples_written - self._samples_generated
+            buffer_fill = (
+                headroom / self._buffer_size if self._buffer_size else 0.0)
+            return OutStreamEngineMetrics(
+                samples_written=self._samples_written,
+                samples_generated=self._samples_generated,
+                blocks_written=self._blocks_written,
+                buffer_size=self._buffer_size,
+                buffer_fill=buffer_fill,
+                min_headroom=(
+                    self._min_headroom if self._min_headroom is not None
+                    else headroom),
+                low_water_events=self._low_water_events)
+
+    def start(self):
+        """
+        Disallows regeneration, primes the output buffer, starts the task
+        and starts the background threads that keep the buffer topped up.
+        """
+        if self._started:
+            raise DaqError(
+                'The output stream engine has already been started.',
+                DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+        self._started = True
+
+        out_stream = self._task.out_stream
+        out_stream.regen_mode = RegenerationMode.DONT_ALLOW_REGENERATION
+
+        self._producer = threading.Thread(
+            target=self._produce, name='{0} prefetch'.format(self._task.name))
+        self._producer.daemon = True
+        self._producer.start()
+
+        try:
+            self._buffer_size = out_stream.output_buf_size
+            try:
+                self._sample_interval = 1.0 / self._task.timing.samp_clk_rate
+            except DaqError:
+                self._sample_interval = 0.0
+
+            # Prime the buffer: the task does not start until there is
+            # data to generate, so block until the first block arrives.
+            while not self._source_exhausted:
+                block = self._next_block(wait=True)
+                if block is None:
+                    break
+                length = self._block_length(block)
+                if (self._samples_written and
+                        length > out_stream.space_avail):
+                    self._pending_block = block
+                    break
+                self._write_block(block)
+
+            if not self._samples_written:
+                raise DaqError(
+                    'The source did not yield any samples to prime the '
+                    'output buffer with.',
+                    DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+
+            self._task.start()
+        except BaseException:
+            self._stop_event.set()
+            raise
+
+        self._writer = threading.Thread(
+            target=self._run, name='{0} writer'.format(self._task.name))
+        self._writer.daemon = True
+        self._writer.start()
+
+    def wait_until_done(self, timeout=None):
+        """
+        Waits until the source is exhausted and the task has generated
+        every sample written to it.
+
+        Args:
+            timeout (Optional[float]): Specifies the maximum amount of
+                time in seconds to wait. If you do not specify a value,
+                this method waits indefinitely.
+        Returns:
+            bool:
+
+            Indicates if all samples were generated before the timeout
+            elapsed.
+        """
+        deadline = None if timeout is None else _clock() + timeout
+        if self._writer is not None:
+            self._writer.join(timeout)
+        self._raise_error()
+        if self.is_running:
+            return False
+
+        out_stream = self._task.out_stream
+        while True:
+            generated = out_stream.total_samp_per_chan_generated
+            self._update_headroom(generated)
+            if generated >= self._samples_written:
+                return True
+            if deadline is not None and _clock() >= deadline:
+                return False
+            time.sleep(max(
+                (self._samples_written - generated) *
+                self._sample_interval / 2, 0.001))
+
+    def stop(self, raise_error=True):
+        """
+        Stops the background threads and the task.
+
+        Args:
+            raise_error (Optional[bool]): Specifies if this method
+                re-raises the exception, if any, that terminated the
+                background threads.
+        """
+        self._stop_event.set()
+        for thread in (self._writer, self._producer):
+            if thread is not None:
+                thread.join()
+        if self._started:
+            self._task.stop()
+        if raise_error:
+            self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self):
+        try:
+            for block in self._source:
+                if not self._put(numpy.asarray(block)):
+                    return
+        except Exception as e:
+            self._error = e
+            self._stop_event.set()
+            return
+        self._put(_END_OF_SOURCE)
+
+    def _next_block(self, wait):
+        if self._pending_block is not None:
+            block, self._pending_block = self._pending_block, None
+            return block
+        if self._source_exhausted:
+            # The end of the source was already taken from the queue,
+            # such as while priming the buffer; nothing else will arrive.
+            return None
+
+        while not self._stop_event.is_set():
+            try:
+                block = self._queue.get(timeout=0.05 if wait else 0)
+            except queue.Empty:
+                if not wait:
+                    return None
+                continue
+            if block is _END_OF_SOURCE:
+                self._source_exhausted = True
+                return None
+            return block
+        self._raise_error()
+        return None
+
+    def _block_length(self, block):
+        if self._number_of_channels is None:
+            self._number_of_channels = self._task.number_of_channels
+            if self._write_function is None:
+                if block.ndim == 1:
+                    writer = AnalogSingleChannelWriter(self._task.out_stream)
+                    write = writer.write_many_sample
+                else:
+                    writer = AnalogMultiChannelWriter(self._task.out_stream)
+                    write = writer.write_many_sample
+                writer.auto_start = False
+                self._write_function = write
+
+        channels = 1 if block.ndim == 1 else block.shape[0]
+        if block.ndim > 2 or channels != self._number_of_channels:
+            raise DaqError(
+                'Block shape does not match the number of channels in the '
+                'task. Blocks must be one-dimensional for single-channel '
+                'tasks or laid out as (channels, samples) for multi-channel '
+                'tasks.\n\n'
+                'Number of channels in task: {0}\n'
+                'Block shape: {1}'.format(
+                    self._number_of_channels, block.shape),
+                DAQmxErrors.UNKNOWN.value, task_name=self._task.name)
+        return block.shape[-1]
+
+    def _write_block(self, block):
+        written = self._write_function(block, timeout=self._timeout)
+        with self._lock:
+            self._samples_written += written
+            self._blocks_written += 1
+
+    def _update_headroom(self, generated):
+        with self._lock:
+            self._samples_generated = generated
+            if self._source_exhausted:
+                # The buffer is expected to drain once the source ends.
+                return
+            headroom = self._samples_written - generated
+            if self._min_headroom is None or headroom < self._min_headroom:
+                self._min_headroom = headroom
+
+        below = headroom < self._low_water_mark * self._buffer_size
+        crossed = below and not self._below_low_water
+        self._below_low_water = below
+        if crossed:
+            with self._lock:
+                self._low_water_events += 1
+            if self._low_water_callback is not None:
+                self._low_water_callback(self)
+
+    def _run(self):
+        out_stream = self._task.out_stream
+        try:
+            while not self._stop_event.is_set():
+                block = self._next_block(wait=True)
+                if block is None:
+                    break
+                length = self._block_length(block)
+
+                # Poll the buffer until the block fits, sleeping for about
+                # half the time the device takes to free the missing space.
+                while not self._stop_event.is_set():
+                    self._update_headroom(
+                        out_stream.total_samp_per_chan_generated)
+                    space = out_stream.space_avail
+                    if space >= length or length > self._buffer_size:
+                        break
+                    time.sleep(max(
+                        (length - space) * self._sample_interval / 2,
+                        0.0005))
+
+                if self._stop_event.is_set():
+                    break
+                self._write_block(block)
+        except Exception as e:
+            self._error = e
+            self._stop_event.set()
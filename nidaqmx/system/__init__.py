@@ -7,8 +7,12 @@ from nidaqmx.system.system import (
     System, AOPowerUpState, CDAQSyncConnection, DOPowerUpState,
     DOResistorPowerUpState)
 from nidaqmx.system.device import Device
+from nidaqmx.system.cdaq_sync_topology import CDAQSyncTopology
 from nidaqmx.system.physical_channel import PhysicalChannel
+from nidaqmx.system.system_snapshot import SystemSnapshot
+from nidaqmx.system.teds import TEDSCache
 from nidaqmx.system.watchdog import (
     WatchdogTask, AOExpirationState, COExpirationState, DOExpirationState)
 
-__all__ = ['system', 'device', 'physical_channel', 'storage', 'watchdog']
+__all__ = ['system', 'cdaq_sync_topology', 'device', 'physical_channel',
+           'storage', 'system_snapshot', 'teds', 'watchdog']
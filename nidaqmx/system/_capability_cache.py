@@ -0,0 +1,186 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import functools
+import threading
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.utils import _clock
+
+STATIC = 'static'
+DYNAMIC = 'dynamic'
+VOLATILE = 'volatile'
+
+# Device properties that describe how the device is connected to the
+# host. They can change while the process runs, for example when a module
+# is moved to another slot, so they are cached only for a short time.
+_DYNAMIC_PROPERTIES = frozenset([
+    'carrier_serial_num', 'chassis_module_devices',
+    'compact_daq_chassis_device', 'compact_daq_slot_num', 'pci_bus_num',
+    'pci_dev_num', 'pxi_chassis_num', 'pxi_slot_num'])
+
+# Device properties that can change at any time without NI-DAQmx
+# reporting it, such as connected accessories and network addresses.
+_VOLATILE_PROPERTIES = frozenset([
+    'accessory_product_nums', 'accessory_product_types',
+    'accessory_serial_nums', 'tcpip_ethernet_ip', 'tcpip_hostname',
+    'tcpip_wireless_ip'])
+
+
+# Errors that mean the device does not support a property. Other errors,
+# such as the device not being found, are never cached.
+_UNSUPPORTED_ERROR_CODES = frozenset([
+    DAQmxErrors.ATTR_NOT_SUPPORTED.value,
+    DAQmxErrors.ATTRIBUTE_NOT_SUPPORTED_IN_TASK_CONTEXT.value,
+    DAQmxErrors.ATTR_NOT_SUPPORTED_ON_ACCESSORY.value,
+    DAQmxErrors.PROPERTY_NOT_SUPPORTED_FOR_BUS_TYPE.value])
+
+
+def get_volatility(property_name):
+    """
+    Returns how long the value of a device property can be cached.
+
+    Args:
+        property_name (str): Specifies the name of the property.
+    Returns:
+        str:
+
+        Indicates **static** if the value changes only when the device is
+        reset, tested, added or deleted, **dynamic** if the value can
+        change when the system topology changes, and **volatile** if the
+        value is never cached.
+    """
+    if property_name in _VOLATILE_PROPERTIES:
+        return VOLATILE
+    if property_name in _DYNAMIC_PROPERTIES:
+        return DYNAMIC
+    return STATIC
+
+
+class CapabilityCache(object):
+    """
+    Caches the capabilities of DAQmx devices by device name, so that
+    repeated accesses of static device properties do not query the
+    driver.
+
+    Device objects are created freely and compare equal by name, so the
+    cache is shared by every Device object that refers to the same device.
+    Errors that indicate a static property is not supported by the device
+    are cached as well.
+    """
+
+    def __init__(self, dynamic_ttl=5.0):
+        """
+        Args:
+            dynamic_ttl (Optional[float]): Specifies the time in seconds
+                the value of a dynamic property is cached.
+        """
+        self.enabled = True
+        self.dynamic_ttl = dynamic_ttl
+
+        self._lock = threading.Lock()
+        # Entries keyed by device name and then by property key, as
+        # (value, error, time fetched) triples.
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        """
+        int: Indicates the number of property accesses served by the
+            cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        int: Indicates the number of property accesses that queried the
+            driver.
+        """
+        return self._misses
+
+    def get(self, device_name, key, volatility, fetch):
+        """
+        Returns the cached value of a device property, calling **fetch**
+        to query the driver if the value is not cached or has expired.
+        """
+        if not self.enabled or volatility == VOLATILE:
+            return fetch()
+
+        with self._lock:
+            entry = self._entries.get(device_name, {}).get(key)
+            if entry is not None and (
+                    volatility == STATIC or
+                    _clock() - entry[2] < self.dynamic_ttl):
+                self._hits += 1
+                return self._unpack(entry)
+            self._misses += 1
+
+        try:
+            entry = (fetch(), None, _clock())
+        except DaqError as e:
+            if (volatility != STATIC or
+                    e.error_code not in _UNSUPPORTED_ERROR_CODES):
+                raise
+            entry = (None, e, _clock())
+
+        with self._lock:
+            self._entries.setdefault(device_name, {})[key] = entry
+        return self._unpack(entry)
+
+    def invalidate(self, device_name=None):
+        """
+        Removes the cached properties of a device.
+
+        Args:
+            device_name (Optional[str]): Specifies the name of the device.
+                If you do not specify a value, this method removes the
+                cached properties of every device.
+        """
+        with self._lock:
+            if device_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(device_name, None)
+
+    def cached_property(self, prop, key, volatility=STATIC):
+        """
+        Returns a copy of a property, of an object whose **_name**
+        attribute holds a device name, that reads its value through the
+        cache.
+
+        Args:
+            prop (property): Specifies the property to copy.
+            key (str): Specifies the key of the property in the cache.
+            volatility (Optional[str]): Specifies how long the value of
+                the property is cached.
+        """
+        if volatility == VOLATILE:
+            return prop
+
+        fget = prop.fget
+
+        @functools.wraps(fget)
+        def getter(obj):
+            return self.get(
+                obj._name, key, volatility, functools.partial(fget, obj))
+
+        return property(getter, prop.fset, prop.fdel, prop.__doc__)
+
+    @staticmethod
+    def _unpack(entry):
+        value, error, _ = entry
+        if error is not None:
+            raise error
+        # Callers may modify lists they receive, so hand out copies.
+        if isinstance(value, list):
+            return list(value)
+        return value
+
+
+capability_cache = CapabilityCache()
@@ -3,14 +3,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import ctypes
 import six
 from collections import Sequence
 
-from nidaqmx._lib import lib_importer, ctypes_byte_str
-from nidaqmx.errors import (
-    check_for_error, is_string_buffer_too_small, DaqError)
+from nidaqmx.errors import DaqError
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system._persisted_index import persisted_channel_index
 from nidaqmx.system.storage.persisted_channel import PersistedChannel
 from nidaqmx.utils import unflatten_channel_string
 
@@ -20,15 +18,18 @@ class PersistedChannelCollection(Sequence):
     Contains the collection of global channels for a DAQmx system.
     
     This class defines methods that implements a container object.
+
+    The names of the global channels are cached and indexed by lowercase
+    name for **cache_ttl** seconds, shared by every collection of global
+    channels.
     """
     def __contains__(self, item):
-        channel_names = self.global_channel_names
-
         if isinstance(item, six.string_types):
             items = unflatten_channel_string(item)
-            return all([i in channel_names for i in items])
+            return all([persisted_channel_index.find(i) is not None
+                        for i in items])
         elif isinstance(item, PersistedChannel):
-            return item._name in channel_names
+            return persisted_channel_index.find(item._name) is not None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -58,10 +59,10 @@ class PersistedChannelCollection(Sequence):
             Indicates the of global channels indexed.
         """
         if isinstance(index, six.integer_types):
-            return PersistedChannel(self.global_channel_names[index])
+            return PersistedChannel(persisted_channel_index.names()[index])
         elif isinstance(index, slice):
             return [PersistedChannel(name) for name in
-                    self.global_channel_names[index]]
+                    persisted_channel_index.names()[index]]
         elif isinstance(index, six.string_types):
             names = unflatten_channel_string(index)
             if len(names) == 1:
@@ -73,48 +74,89 @@ class PersistedChannelCollection(Sequence):
                 .format(type(index)), DAQmxErrors.UNKNOWN.value)
 
     def __iter__(self):
-        for channel_name in self.global_channel_names:
+        for channel_name in persisted_channel_index.names():
             yield PersistedChannel(channel_name)
 
     def __len__(self):
-        return len(self.global_channel_names)
+        return len(persisted_channel_index.names())
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        channel_names = self.global_channel_names
-        channel_names.reverse()
-
-        for channel_name in channel_names:
+        for channel_name in reversed(persisted_channel_index.names()):
             yield PersistedChannel(channel_name)
 
+    @property
+    def cache_ttl(self):
+        """
+        float: Specifies the time in seconds the names of the global
+            channels are cached. None caches the names until **refresh**
+            is called.
+        """
+        return persisted_channel_index.ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, val):
+        persisted_channel_index.ttl = val
+
     @property
     def global_channel_names(self):
         """
         List[str]: The names of all the global channels on this
             collection.
         """
-        cfunc = lib_importer.windll.DAQmxGetSysGlobalChans
-        cfunc.argtypes = [
-            ctypes.c_char_p, ctypes.c_uint]
+        return list(persisted_channel_index.names())
 
-        temp_size = 0
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
+    def find(self, name):
+        """
+        Looks up a global channel by name, ignoring case.
 
-            size_or_code = cfunc(
-                val, temp_size)
+        Args:
+            name (str): Specifies the name of the global channel.
+        Returns:
+            nidaqmx.system.storage.persisted_channel.PersistedChannel:
 
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
+            Indicates the global channel, or None if no global channel
+            with that name is saved.
+        """
+        channel_name = persisted_channel_index.find(name)
+        if channel_name is None:
+            return None
+        return PersistedChannel(channel_name)
 
-        check_for_error(size_or_code)
+    def get_info(self):
+        """
+        Reads the author and interactive flags of every global channel.
+        The properties of each global channel are read from the driver
+        only once.
 
-        return unflatten_channel_string(val.value.decode('ascii'))
+        Returns:
+            List[nidaqmx.types.PersistedInfo]:
+
+            Indicates the metadata of each global channel, in collection
+            order.
+        """
+        return persisted_channel_index.get_info(PersistedChannel)
+
+    def refresh(self):
+        """
+        Removes the cached names and metadata of the global channels, so
+        that the next access queries the driver.
+        """
+        persisted_channel_index.invalidate()
+
+    def starting_with(self, prefix):
+        """
+        Looks up the global channels whose names start with a prefix,
+        ignoring case.
+
+        Args:
+            prefix (str): Specifies the prefix.
+        Returns:
+            List[nidaqmx.system.storage.persisted_channel.PersistedChannel]:
+
+            Indicates the global channels, sorted by name.
+        """
+        return [PersistedChannel(name) for name in
+                persisted_channel_index.starting_with(prefix)]
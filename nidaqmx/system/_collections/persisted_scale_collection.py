@@ -3,14 +3,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import ctypes
 import six
 from collections import Sequence
 
-from nidaqmx._lib import lib_importer, ctypes_byte_str
-from nidaqmx.errors import (
-    check_for_error, is_string_buffer_too_small, DaqError)
+from nidaqmx.errors import DaqError
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system._persisted_index import persisted_scale_index
 from nidaqmx.system.storage.persisted_scale import PersistedScale
 from nidaqmx.utils import unflatten_channel_string
 
@@ -20,15 +18,18 @@ class PersistedScaleCollection(Sequence):
     Contains the collection of custom scales on a DAQmx system.
     
     This class defines methods that implements a container object.
+
+    The names of the custom scales are cached and indexed by lowercase
+    name for **cache_ttl** seconds, shared by every collection of custom
+    scales.
     """
     def __contains__(self, item):
-        scale_names = self.scale_names
-
         if isinstance(item, six.string_types):
             items = unflatten_channel_string(item)
-            return all([i in scale_names for i in items])
+            return all([persisted_scale_index.find(i) is not None
+                        for i in items])
         elif isinstance(item, PersistedScale):
-            return item._name in scale_names
+            return persisted_scale_index.find(item._name) is not None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -57,10 +58,10 @@ class PersistedScaleCollection(Sequence):
             Indicates the subset of custom scales indexed.
         """
         if isinstance(index, six.integer_types):
-            return PersistedScale(self.scale_names[index])
+            return PersistedScale(persisted_scale_index.names()[index])
         elif isinstance(index, slice):
             return [PersistedScale(name) for name in
-                    self.scale_names[index]]
+                    persisted_scale_index.names()[index]]
         elif isinstance(index, six.string_types):
             names = unflatten_channel_string(index)
             if len(names) == 1:
@@ -72,48 +73,89 @@ class PersistedScaleCollection(Sequence):
                 .format(type(index)), DAQmxErrors.UNKNOWN.value)
 
     def __iter__(self):
-        for scale_name in self.scale_names:
+        for scale_name in persisted_scale_index.names():
             yield PersistedScale(scale_name)
 
     def __len__(self):
-        return len(self.scale_names)
+        return len(persisted_scale_index.names())
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        scale_names = self.scale_names
-        scale_names.reverse()
-
-        for scale_name in scale_names:
+        for scale_name in reversed(persisted_scale_index.names()):
             yield PersistedScale(scale_name)
 
+    @property
+    def cache_ttl(self):
+        """
+        float: Specifies the time in seconds the names of the custom
+            scales are cached. None caches the names until **refresh** is
+            called.
+        """
+        return persisted_scale_index.ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, val):
+        persisted_scale_index.ttl = val
+
     @property
     def scale_names(self):
         """
         List[str]: Indicates the names of all the custom scales on this
             collection.
         """
-        cfunc = lib_importer.windll.DAQmxGetSysScales
-        cfunc.argtypes = [
-            ctypes.c_char_p, ctypes.c_uint]
+        return list(persisted_scale_index.names())
 
-        temp_size = 0
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
+    def find(self, name):
+        """
+        Looks up a custom scale by name, ignoring case.
 
-            size_or_code = cfunc(
-                val, temp_size)
+        Args:
+            name (str): Specifies the name of the custom scale.
+        Returns:
+            nidaqmx.system.storage.persisted_scale.PersistedScale:
 
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
+            Indicates the custom scale, or None if no custom scale with
+            that name is saved.
+        """
+        scale_name = persisted_scale_index.find(name)
+        if scale_name is None:
+            return None
+        return PersistedScale(scale_name)
 
-        check_for_error(size_or_code)
+    def get_info(self):
+        """
+        Reads the author and interactive flags of every custom scale.
+        The properties of each custom scale are read from the driver only
+        once.
 
-        return unflatten_channel_string(val.value.decode('ascii'))
+        Returns:
+            List[nidaqmx.types.PersistedInfo]:
+
+            Indicates the metadata of each custom scale, in collection
+            order.
+        """
+        return persisted_scale_index.get_info(PersistedScale)
+
+    def refresh(self):
+        """
+        Removes the cached names and metadata of the custom scales, so that
+        the next access queries the driver.
+        """
+        persisted_scale_index.invalidate()
+
+    def starting_with(self, prefix):
+        """
+        Looks up the custom scales whose names start with a prefix, ignoring
+        case.
+
+        Args:
+            prefix (str): Specifies the prefix.
+        Returns:
+            List[nidaqmx.system.storage.persisted_scale.PersistedScale]:
+
+            Indicates the custom scales, sorted by name.
+        """
+        return [PersistedScale(name) for name in
+                persisted_scale_index.starting_with(prefix)]
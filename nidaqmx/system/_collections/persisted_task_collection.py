@@ -3,14 +3,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import ctypes
 import six
 from collections import Sequence
 
-from nidaqmx._lib import lib_importer, ctypes_byte_str
-from nidaqmx.errors import (
-    check_for_error, is_string_buffer_too_small, DaqError)
+from nidaqmx.errors import DaqError
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system._persisted_index import persisted_task_index
 from nidaqmx.system.storage.persisted_task import PersistedTask
 from nidaqmx.utils import unflatten_channel_string
 
@@ -20,15 +18,17 @@ class PersistedTaskCollection(Sequence):
     Contains the collection of task saved on a DAQmx system.
     
     This class defines methods that implements a container object.
+
+    The names of the saved tasks are cached and indexed by lowercase name
+    for **cache_ttl** seconds, shared by every collection of saved tasks.
     """
     def __contains__(self, item):
-        task_names = self.task_names
-
         if isinstance(item, six.string_types):
             items = unflatten_channel_string(item)
-            return all([i in task_names for i in items])
+            return all([persisted_task_index.find(i) is not None
+                        for i in items])
         elif isinstance(item, PersistedTask):
-            return item._name in task_names
+            return persisted_task_index.find(item._name) is not None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -57,10 +57,10 @@ class PersistedTaskCollection(Sequence):
             Indicates the subset of saved tasks indexed.
         """
         if isinstance(index, six.integer_types):
-            return PersistedTask(self.task_names[index])
+            return PersistedTask(persisted_task_index.names()[index])
         elif isinstance(index, slice):
             return [PersistedTask(name) for name in
-                    self.task_names[index]]
+                    persisted_task_index.names()[index]]
         elif isinstance(index, six.string_types):
             names = unflatten_channel_string(index)
             if len(names) == 1:
@@ -72,47 +72,86 @@ class PersistedTaskCollection(Sequence):
                 .format(type(index)), DAQmxErrors.UNKNOWN.value)
 
     def __iter__(self):
-        for task_name in self.task_names:
+        for task_name in persisted_task_index.names():
             yield PersistedTask(task_name)
 
     def __len__(self):
-        return len(self.task_names)
+        return len(persisted_task_index.names())
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        task_names = self.task_names
-        task_names.reverse()
-
-        for task_name in task_names:
+        for task_name in reversed(persisted_task_index.names()):
             yield PersistedTask(task_name)
 
+    @property
+    def cache_ttl(self):
+        """
+        float: Specifies the time in seconds the names of the saved tasks
+            are cached. None caches the names until **refresh** is called.
+        """
+        return persisted_task_index.ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, val):
+        persisted_task_index.ttl = val
+
     @property
     def task_names(self):
         """
         List[str]: Indicates the names of all the tasks on this collection.
         """
-        cfunc = lib_importer.windll.DAQmxGetSysTasks
-        cfunc.argtypes = [
-            ctypes.c_char_p, ctypes.c_uint]
+        return list(persisted_task_index.names())
 
-        temp_size = 0
-        while True:
-            val = ctypes.create_string_buffer(temp_size)
+    def find(self, name):
+        """
+        Looks up a saved task by name, ignoring case.
 
-            size_or_code = cfunc(
-                val, temp_size)
+        Args:
+            name (str): Specifies the name of the saved task.
+        Returns:
+            nidaqmx.system.storage.persisted_task.PersistedTask:
 
-            if is_string_buffer_too_small(size_or_code):
-                # Buffer size must have changed between calls; check again.
-                temp_size = 0
-            elif size_or_code > 0 and temp_size == 0:
-                # Buffer size obtained, use to retrieve data.
-                temp_size = size_or_code
-            else:
-                break
+            Indicates the saved task, or None if no task with that name is
+            saved.
+        """
+        task_name = persisted_task_index.find(name)
+        if task_name is None:
+            return None
+        return PersistedTask(task_name)
 
-        check_for_error(size_or_code)
+    def get_info(self):
+        """
+        Reads the author and interactive flags of every saved task. The
+        properties of each task are read from the driver only once.
 
-        return unflatten_channel_string(val.value.decode('ascii'))
+        Returns:
+            List[nidaqmx.types.PersistedInfo]:
+
+            Indicates the metadata of each saved task, in collection
+            order.
+        """
+        return persisted_task_index.get_info(PersistedTask)
+
+    def refresh(self):
+        """
+        Removes the cached names and metadata of the saved tasks, so that
+        the next access queries the driver.
+        """
+        persisted_task_index.invalidate()
+
+    def starting_with(self, prefix):
+        """
+        Looks up the saved tasks whose names start with a prefix, ignoring
+        case.
+
+        Args:
+            prefix (str): Specifies the prefix.
+        Returns:
+            List[nidaqmx.system.storage.persisted_task.PersistedTask]:
+
+            Indicates the saved tasks, sorted by name.
+        """
+        return [PersistedTask(name) for name in
+                persisted_task_index.starting_with(prefix)]
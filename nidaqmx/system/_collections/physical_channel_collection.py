@@ -3,7 +3,9 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bisect
 import ctypes
+import re
 import six
 from collections import Sequence
 
@@ -11,8 +13,141 @@ from nidaqmx._lib import lib_importer, ctypes_byte_str
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small, DaqError)
 from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system._capability_cache import capability_cache, STATIC
 from nidaqmx.system.physical_channel import PhysicalChannel
-from nidaqmx.utils import unflatten_channel_string, flatten_channel_string
+from nidaqmx.utils import unflatten_channel_string
+
+_NAME_REGEX = re.compile('(.*?)([0-9]+)$')
+
+
+class _ChannelNameRanges(object):
+    """
+    Represents a list of physical channel names as runs of consecutive
+    indexes that share a base name, such as Dev1/ai0:31, so that names
+    can be indexed, looked up and flattened without building and
+    searching the full list.
+    """
+    __slots__ = ['_runs', '_offsets', '_length', '_by_base_name',
+                 '_by_name']
+
+    def __init__(self, channel_names):
+        # Runs as [base name, first index, step, count] lists. Names that
+        # do not end in a canonical number form runs of one with a first
+        # index of None.
+        runs = []
+        for name in channel_names:
+            m = _NAME_REGEX.match(name)
+            if not m or (len(m.group(2)) > 1 and m.group(2)[0] == '0'):
+                runs.append([name, None, 0, 1])
+                continue
+
+            base_name, index = m.group(1), int(m.group(2))
+            if runs and runs[-1][0] == base_name and runs[-1][1] is not None:
+                run = runs[-1]
+                last = run[1] + run[2] * (run[3] - 1)
+                if run[3] == 1 and abs(index - last) == 1:
+                    run[2] = index - last
+                    run[3] = 2
+                    continue
+                if run[3] > 1 and index == last + run[2]:
+                    run[3] += 1
+                    continue
+            runs.append([base_name, index, 1, 1])
+
+        self._runs = [tuple(r) for r in runs]
+        self._offsets = []
+        self._by_base_name = {}
+        self._by_name = {}
+        offset = 0
+        for run_index, (base_name, first, _, count) in enumerate(self._runs):
+            self._offsets.append(offset)
+            if first is None:
+                self._by_name.setdefault(base_name.lower(), offset)
+            else:
+                self._by_base_name.setdefault(
+                    base_name.lower(), []).append(run_index)
+            offset += count
+        self._length = offset
+
+    def __iter__(self):
+        for base_name, first, step, count in self._runs:
+            if first is None:
+                yield base_name
+            else:
+                for i in six.moves.range(count):
+                    yield '{0}{1}'.format(base_name, first + step * i)
+
+    def __len__(self):
+        return self._length
+
+    def name(self, position):
+        """
+        Returns the name at a position of the list.
+        """
+        run_index, i = self._locate(position)
+        base_name, first, step, _ = self._runs[run_index]
+        if first is None:
+            return base_name
+        return '{0}{1}'.format(base_name, first + step * i)
+
+    def position(self, name):
+        """
+        Returns the first position of a name in the list, ignoring case,
+        or None.
+        """
+        key = name.lower()
+        if key in self._by_name:
+            return self._by_name[key]
+
+        m = _NAME_REGEX.match(key)
+        if not m:
+            return None
+        index = int(m.group(2))
+        for run_index in self._by_base_name.get(m.group(1), []):
+            _, first, step, count = self._runs[run_index]
+            i = (index - first) * step
+            if 0 <= i < count:
+                return self._offsets[run_index] + i
+        return None
+
+    def flatten(self, positions):
+        """
+        Returns the names at the specified positions as a flattened
+        string, using ranges for consecutive positions of a run.
+        """
+        # Segments as [run index, first position, last position] lists,
+        # relative to the run, in ascending or descending order.
+        segments = []
+        for position in positions:
+            run_index, i = self._locate(position)
+            if segments and self._runs[run_index][1] is not None:
+                segment = segments[-1]
+                direction = i - segment[2]
+                if (segment[0] == run_index and abs(direction) == 1 and
+                        (segment[2] - segment[1]) * direction >= 0):
+                    segment[2] = i
+                    continue
+            segments.append([run_index, i, i])
+
+        names = []
+        for run_index, start, end in segments:
+            base_name, first, step, _ = self._runs[run_index]
+            if first is None:
+                names.append(base_name)
+            elif start == end:
+                names.append('{0}{1}'.format(base_name, first + step * start))
+            else:
+                names.append('{0}{1}:{2}'.format(
+                    base_name, first + step * start, first + step * end))
+        return ','.join(names)
+
+    def _locate(self, position):
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError('list index out of range')
+        run_index = bisect.bisect_right(self._offsets, position) - 1
+        return run_index, position - self._offsets[run_index]
 
 
 class PhysicalChannelCollection(Sequence):
@@ -20,18 +155,24 @@ class PhysicalChannelCollection(Sequence):
     Contains the collection of physical channels for a DAQmx device.
     
     This class defines methods that implements a container object.
+
+    The physical channels of each device are cached as ranges of
+    channel indexes, so indexing the collection, checking membership and
+    flattening subsets of the collection neither query the driver again
+    nor build the list of channel names.
     """
     def __init__(self, device_name):
         self._name = device_name
 
     def __contains__(self, item):
-        channel_names = self.channel_names
+        ranges = self._ranges
 
         if isinstance(item, six.string_types):
             items = unflatten_channel_string(item)
-            return all([i in channel_names for i in items])
+            return all([ranges.position(i) is not None for i in items])
         elif isinstance(item, PhysicalChannel):
-            return item._name in channel_names
+            return all([ranges.position(i) is not None
+                        for i in unflatten_channel_string(item._name)])
         return False
 
     def __eq__(self, other):
@@ -63,9 +204,11 @@ class PhysicalChannelCollection(Sequence):
             Indicates the subset of physical channels indexed.
         """
         if isinstance(index, six.integer_types):
-            return PhysicalChannel(self.channel_names[index])
+            return PhysicalChannel(self._ranges.name(index))
         elif isinstance(index, slice):
-            return PhysicalChannel(self.channel_names[index])
+            ranges = self._ranges
+            return PhysicalChannel(ranges.flatten(
+                six.moves.range(*index.indices(len(ranges)))))
         elif isinstance(index, six.string_types):
             return PhysicalChannel('{0}/{1}'.format(self._name, index))
         else:
@@ -74,21 +217,26 @@ class PhysicalChannelCollection(Sequence):
                 .format(type(index)), DAQmxErrors.UNKNOWN.value)
 
     def __iter__(self):
-        for channel_name in self.channel_names:
+        for channel_name in self._ranges:
             yield PhysicalChannel(channel_name)
 
     def __len__(self):
-        return len(self.channel_names)
+        return len(self._ranges)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        channel_names = self.channel_names
-        channel_names.reverse()
+        ranges = self._ranges
 
-        for channel_name in channel_names:
-            yield PhysicalChannel(channel_name)
+        for position in six.moves.range(len(ranges) - 1, -1, -1):
+            yield PhysicalChannel(ranges.name(position))
+
+    @property
+    def _ranges(self):
+        return capability_cache.get(
+            self._name, '{0}.ranges'.format(type(self).__name__), STATIC,
+            lambda: _ChannelNameRanges(self.channel_names))
 
     @property
     def all(self):
@@ -97,7 +245,8 @@ class PhysicalChannelCollection(Sequence):
             physical channel object that represents the entire list of
             physical channels on this channel collection.
         """
-        return PhysicalChannel(flatten_channel_string(self.channel_names))
+        ranges = self._ranges
+        return PhysicalChannel(ranges.flatten(six.moves.range(len(ranges))))
 
     @property
     def channel_names(self):
@@ -107,6 +256,25 @@ class PhysicalChannelCollection(Sequence):
         """
         raise NotImplementedError()
 
+    def names_for(self, indices):
+        """
+        Gets the names of the physical channels at the specified
+        positions of this collection as a flattened string, such as
+        the **physical_channel** input of the DAQmx Create Channel
+        methods. Consecutive positions are flattened to ranges, such as
+        Dev1/ai0:3.
+
+        Args:
+            indices (List[int]): Specifies the indexes/positions of the
+                physical channels in the collection, in the order of the
+                physical channels in the flattened string.
+        Returns:
+            str:
+
+            Indicates the flattened names of the physical channels.
+        """
+        return self._ranges.flatten(indices)
+
 
 class AIPhysicalChannelCollection(PhysicalChannelCollection):
     """
@@ -382,3 +550,13 @@ class DOPortsCollection(PhysicalChannelCollection):
         check_for_error(size_or_code)
 
         return unflatten_channel_string(val.value.decode('ascii'))
+
+
+def _cache_channel_names():
+    # The physical channels of a device are static capabilities.
+    for cls in PhysicalChannelCollection.__subclasses__():
+        cls.channel_names = capability_cache.cached_property(
+            cls.channel_names, cls.__name__)
+
+
+_cache_channel_names()
@@ -0,0 +1,159 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+import ctypes
+import threading
+
+from nidaqmx._lib import lib_importer
+from nidaqmx.errors import check_for_error, is_string_buffer_too_small
+from nidaqmx.types import PersistedInfo
+from nidaqmx.utils import _clock, unflatten_channel_string
+
+
+class PersistedNameIndex(object):
+    """
+    Caches the names of the tasks, scales or global channels saved on a
+    DAQmx system, indexed by lowercase name, so that lookups in the
+    persisted collections do not query the driver.
+
+    Collection objects are created freely, so the index is shared by
+    every collection of the same kind. The names are queried again when
+    they are older than **ttl** seconds, or after **invalidate** is
+    called. Saving or deleting a task, scale or global channel through
+    this API invalidates the index of its kind.
+    """
+
+    def __init__(self, function_name, ttl=5.0):
+        """
+        Args:
+            function_name (str): Specifies the name of the DAQmx function
+                that returns the flattened list of names.
+            ttl (Optional[float]): Specifies the time in seconds the names
+                are cached. None caches the names until **invalidate** is
+                called.
+        """
+        self.ttl = ttl
+
+        self._function_name = function_name
+        self._lock = threading.Lock()
+        self._names = None
+        self._fetch_time = None
+        self._positions = {}
+        self._sorted_keys = []
+        self._info = {}
+
+    def invalidate(self):
+        """
+        Removes the cached names and metadata.
+        """
+        with self._lock:
+            self._names = None
+            self._info = {}
+
+    def names(self):
+        """
+        Returns the tuple of cached names, querying the driver if they
+        are not cached or have expired.
+        """
+        return self._get_index()[0]
+
+    def find(self, name):
+        """
+        Returns the saved name that matches **name** case-insensitively,
+        or None.
+        """
+        names, positions, _ = self._get_index()
+        position = positions.get(name.lower())
+        return names[position] if position is not None else None
+
+    def starting_with(self, prefix):
+        """
+        Returns the saved names that start with **prefix**,
+        case-insensitively, in sorted order.
+        """
+        names, positions, sorted_keys = self._get_index()
+        prefix = prefix.lower()
+        matches = []
+        for key in sorted_keys[bisect.bisect_left(sorted_keys, prefix):]:
+            if not key.startswith(prefix):
+                break
+            matches.append(names[positions[key]])
+        return matches
+
+    def get_info(self, item_class, names=None):
+        """
+        Returns the metadata of the specified names, or of every saved
+        name, reading the properties of each name from the driver only
+        the first time.
+        """
+        if names is None:
+            names = self.names()
+
+        with self._lock:
+            missing = [n for n in names if n not in self._info]
+        loaded = {}
+        for name in missing:
+            item = item_class(name)
+            loaded[name] = PersistedInfo(
+                name=name, author=item.author,
+                allow_interactive_editing=item.allow_interactive_editing,
+                allow_interactive_deletion=item.allow_interactive_deletion)
+
+        with self._lock:
+            self._info.update(loaded)
+            return [self._info.get(n) or loaded[n] for n in names]
+
+    def _get_index(self):
+        with self._lock:
+            if self._names is None or (
+                    self.ttl is not None and
+                    _clock() - self._fetch_time >= self.ttl):
+                self._refresh()
+            return self._names, self._positions, self._sorted_keys
+
+    def _refresh(self):
+        names = tuple(self._fetch_names())
+        keys = [n.lower() for n in names]
+
+        self._names = names
+        self._fetch_time = _clock()
+        self._positions = dict(
+            (k, i) for i, k in reversed(list(enumerate(keys))))
+        self._sorted_keys = sorted(set(keys))
+        # Metadata is kept for the names that still exist.
+        existing = set(names)
+        self._info = dict(
+            (n, i) for n, i in self._info.items() if n in existing)
+
+    def _fetch_names(self):
+        cfunc = getattr(lib_importer.windll, self._function_name)
+        cfunc.argtypes = [
+            ctypes.c_char_p, ctypes.c_uint]
+
+        temp_size = 0
+        while True:
+            val = ctypes.create_string_buffer(temp_size)
+
+            size_or_code = cfunc(
+                val, temp_size)
+
+            if is_string_buffer_too_small(size_or_code):
+                # Buffer size must have changed between calls; check again.
+                temp_size = 0
+            elif size_or_code > 0 and temp_size == 0:
+                # Buffer size obtained, use to retrieve data.
+                temp_size = size_or_code
+            else:
+                break
+
+        check_for_error(size_or_code)
+
+        return unflatten_channel_string(val.value.decode('ascii'))
+
+
+persisted_task_index = PersistedNameIndex('DAQmxGetSysTasks')
+persisted_scale_index = PersistedNameIndex('DAQmxGetSysScales')
+persisted_channel_index = PersistedNameIndex('DAQmxGetSysGlobalChans')
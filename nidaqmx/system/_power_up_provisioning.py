@@ -0,0 +1,208 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import concurrent.futures
+import six
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.utils import _clock, unflatten_channel_string
+from nidaqmx.types import (
+    AOPowerUpState, DOPowerUpState, DOResistorPowerUpState,
+    PowerUpProvisioningReport, PowerUpStateChange)
+
+DIGITAL = 'digital'
+PULL_UP_PULL_DOWN = 'pull_up_pull_down'
+ANALOG = 'analog'
+LOGIC_FAMILY = 'logic_family'
+
+STATE_TYPES = (DIGITAL, PULL_UP_PULL_DOWN, ANALOG, LOGIC_FAMILY)
+
+
+def _check_power_up_map(power_up_map):
+    for device_name, states in six.iteritems(power_up_map):
+        for state_type in states:
+            if state_type not in STATE_TYPES:
+                raise DaqError(
+                    'Invalid power up state type "{0}" specified for '
+                    'device "{1}".\n\nValid types: {2}'.format(
+                        state_type, device_name, ', '.join(STATE_TYPES)),
+                    DAQmxErrors.UNKNOWN.value)
+
+
+def _full_name(device_name, physical_channel):
+    if physical_channel.startswith('{0}/'.format(device_name)):
+        return physical_channel
+    return '{0}/{1}'.format(device_name, physical_channel.lstrip('/'))
+
+
+def _expand_analog(device_name, requested):
+    # Analog power up states are read and set per channel, so split lists
+    # and ranges of channels into one state per channel.
+    return [
+        AOPowerUpState(physical_channel=channel,
+                       power_up_state=p.power_up_state,
+                       channel_type=p.channel_type)
+        for p in requested
+        for channel in unflatten_channel_string(
+            _full_name(device_name, p.physical_channel))]
+
+
+def _read_device(system, device_name, states):
+    start = _clock()
+    current = {}
+
+    if DIGITAL in states:
+        current[DIGITAL] = dict(
+            (p.physical_channel, p.power_up_state)
+            for p in system.get_digital_power_up_states(device_name))
+    if PULL_UP_PULL_DOWN in states:
+        current[PULL_UP_PULL_DOWN] = dict(
+            (p.physical_channel, p.power_up_state) for p in
+            system.get_digital_pull_up_pull_down_states(device_name))
+    if states.get(ANALOG):
+        channels = [p.physical_channel
+                    for p in _expand_analog(device_name, states[ANALOG])]
+        current[ANALOG] = dict(
+            (p.physical_channel, (p.power_up_state, p.channel_type)) for p in
+            system.get_analog_power_up_states_with_output_type(channels))
+    if states.get(LOGIC_FAMILY) is not None:
+        current[LOGIC_FAMILY] = (
+            system.get_digital_logic_family_power_up_state(device_name))
+
+    return current, _clock() - start
+
+
+def _diff_lines(device_name, state_type, requested, current):
+    # Digital power up states are read per line but can be set per line,
+    # range of lines or port.
+    changes = []
+    for p in requested:
+        physical_channel = _full_name(device_name, p.physical_channel)
+        lines = []
+        for channel in unflatten_channel_string(physical_channel):
+            prefix = '{0}/'.format(channel)
+            lines.extend(line for line in current
+                         if line == channel or line.startswith(prefix))
+        old_states = set(current[line] for line in lines)
+
+        if old_states != set([p.power_up_state]):
+            old_state = old_states.pop() if len(old_states) == 1 else None
+            changes.append(PowerUpStateChange(
+                device_name=device_name, state_type=state_type,
+                physical_channel=physical_channel, old_state=old_state,
+                new_state=p.power_up_state))
+    return changes
+
+
+def _diff_analog(device_name, requested, current):
+    changes = []
+    for p in _expand_analog(device_name, requested):
+        physical_channel = p.physical_channel
+        new_state = (float(p.power_up_state), p.channel_type)
+        old_state = current.get(physical_channel)
+
+        if (old_state is None or old_state[1] != new_state[1] or
+                abs(old_state[0] - new_state[0]) >
+                1e-9 * max(1.0, abs(new_state[0]))):
+            changes.append(PowerUpStateChange(
+                device_name=device_name, state_type=ANALOG,
+                physical_channel=physical_channel, old_state=old_state,
+                new_state=new_state))
+    return changes
+
+
+def _diff_device(device_name, states, current):
+    changes = []
+    if DIGITAL in states:
+        changes.extend(_diff_lines(
+            device_name, DIGITAL, states[DIGITAL], current[DIGITAL]))
+    if PULL_UP_PULL_DOWN in states:
+        changes.extend(_diff_lines(
+            device_name, PULL_UP_PULL_DOWN, states[PULL_UP_PULL_DOWN],
+            current[PULL_UP_PULL_DOWN]))
+    if states.get(ANALOG):
+        changes.extend(_diff_analog(
+            device_name, states[ANALOG], current[ANALOG]))
+    if (states.get(LOGIC_FAMILY) is not None and
+            states[LOGIC_FAMILY] != current[LOGIC_FAMILY]):
+        changes.append(PowerUpStateChange(
+            device_name=device_name, state_type=LOGIC_FAMILY,
+            physical_channel=None, old_state=current[LOGIC_FAMILY],
+            new_state=states[LOGIC_FAMILY]))
+    return changes
+
+
+def _apply_device(system, device_name, changes):
+    by_type = dict((t, []) for t in STATE_TYPES)
+    for change in changes:
+        by_type[change.state_type].append(change)
+
+    if by_type[DIGITAL]:
+        system.set_digital_power_up_states(device_name, [
+            DOPowerUpState(physical_channel=c.physical_channel,
+                           power_up_state=c.new_state)
+            for c in by_type[DIGITAL]])
+    if by_type[PULL_UP_PULL_DOWN]:
+        system.set_digital_pull_up_pull_down_states(device_name, [
+            DOResistorPowerUpState(physical_channel=c.physical_channel,
+                                   power_up_state=c.new_state)
+            for c in by_type[PULL_UP_PULL_DOWN]])
+    if by_type[ANALOG]:
+        system.set_analog_power_up_states_with_output_type([
+            AOPowerUpState(physical_channel=c.physical_channel,
+                           power_up_state=c.new_state[0],
+                           channel_type=c.new_state[1])
+            for c in by_type[ANALOG]])
+    for change in by_type[LOGIC_FAMILY]:
+        system.set_digital_logic_family_power_up_state(
+            device_name, change.new_state)
+
+
+def provision_power_up_states(
+        system, power_up_map, dry_run=False, max_workers=None):
+    """
+    Reads the current power up states of the devices in **power_up_map**
+    in parallel, compares them with the requested states and sets only
+    the states that differ.
+    """
+    _check_power_up_map(power_up_map)
+    device_names = list(power_up_map)
+    if not device_names:
+        return PowerUpProvisioningReport(
+            changes=[], dry_run=dry_run, read_time=0.0, apply_time=0.0,
+            device_read_times={})
+    if max_workers is None:
+        max_workers = min(8, len(device_names))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        start = _clock()
+        results = list(executor.map(
+            lambda n: _read_device(system, n, power_up_map[n]),
+            device_names))
+        read_time = _clock() - start
+
+        changes_by_device = []
+        for device_name, (current, _) in zip(device_names, results):
+            changes = _diff_device(
+                device_name, power_up_map[device_name], current)
+            if changes:
+                changes_by_device.append((device_name, changes))
+
+        start = _clock()
+        if not dry_run:
+            # Propagate the first error after every device has been
+            # attempted.
+            futures = [executor.submit(_apply_device, system, n, c)
+                       for n, c in changes_by_device]
+            for future in futures:
+                future.result()
+        apply_time = _clock() - start
+
+    return PowerUpProvisioningReport(
+        changes=[c for _, changes in changes_by_device for c in changes],
+        dry_run=dry_run, read_time=read_time, apply_time=apply_time,
+        device_read_times=dict(
+            (n, t) for n, (_, t) in zip(device_names, results)))
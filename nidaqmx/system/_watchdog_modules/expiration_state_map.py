@@ -0,0 +1,141 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import fnmatch
+import six
+
+from nidaqmx.constants import Level, WatchdogAOExpirState, WatchdogCOExpirState
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system.device import Device
+from nidaqmx.system._watchdog_modules.expiration_state import ExpirationState
+from nidaqmx.types import (
+    AOExpirationState, COExpirationState, DOExpirationState)
+from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
+
+_WILDCARDS = ('*', '?', '[')
+
+
+def _get_kind(state):
+    if isinstance(state, Level):
+        return DOExpirationState
+    if isinstance(state, WatchdogCOExpirState):
+        return COExpirationState
+    if (isinstance(state, (tuple, list)) and len(state) == 2 and
+            isinstance(state[1], WatchdogAOExpirState)):
+        return AOExpirationState
+    raise DaqError(
+        'Invalid expiration state "{0}" specified. Specify a '
+        'nidaqmx.constants.Level value for digital lines and ports, a '
+        'nidaqmx.constants.WatchdogCOExpirState value for counters, or an '
+        '(expiration_state, nidaqmx.constants.WatchdogAOExpirState) pair '
+        'for analog output channels.'.format(state),
+        DAQmxErrors.UNKNOWN.value)
+
+
+def _get_candidates(device_name, kind):
+    device = Device(device_name)
+    if kind is DOExpirationState:
+        return (device.do_lines.channel_names +
+                device.do_ports.channel_names)
+    if kind is COExpirationState:
+        return device.co_physical_chans.channel_names
+    return device.ao_physical_chans.channel_names
+
+
+def _matches(name, pattern):
+    # Match each "/"-separated segment on its own so that a wildcard does
+    # not match "/": "Dev1/port*" matches ports but not their lines.
+    segments = name.split('/')
+    pattern_segments = pattern.split('/')
+    return (len(segments) == len(pattern_segments) and
+            all(fnmatch.fnmatch(s, p)
+                for s, p in zip(segments, pattern_segments)))
+
+
+def _expand_pattern(pattern, kind):
+    channels = []
+    for name in unflatten_channel_string(pattern):
+        if not any(w in name for w in _WILDCARDS):
+            channels.append(name)
+            continue
+
+        device_name = name.split('/', 1)[0]
+        if any(w in device_name for w in _WILDCARDS):
+            raise DaqError(
+                'Physical channel patterns must start with a device name '
+                'without wildcards.\n\nPattern: {0}'.format(name),
+                DAQmxErrors.UNKNOWN.value)
+        matches = [c for c in _get_candidates(device_name, kind)
+                   if _matches(c, name)]
+        if not matches:
+            raise DaqError(
+                'The physical channel pattern does not match any physical '
+                'channel of the device.\n\nPattern: {0}'.format(name),
+                DAQmxErrors.UNKNOWN.value)
+        channels.extend(matches)
+    return channels
+
+
+def expand_expiration_map(expiration_map):
+    """
+    Expands a map of physical channel patterns to expiration states into
+    one expiration state per physical channel, grouped by channel type.
+    Later entries of the map take precedence over earlier ones.
+    """
+    if isinstance(expiration_map, dict):
+        expiration_map = six.iteritems(expiration_map)
+
+    states = collections.OrderedDict(
+        (kind, collections.OrderedDict()) for kind in
+        (AOExpirationState, COExpirationState, DOExpirationState))
+    for pattern, state in expiration_map:
+        kind = _get_kind(state)
+        for channel in _expand_pattern(pattern, kind):
+            states[kind][channel] = state
+
+    expanded = {}
+    for kind, channels in states.items():
+        if kind is AOExpirationState:
+            expanded[kind] = [
+                AOExpirationState(physical_channel=c, expiration_state=s[0],
+                                  output_type=s[1])
+                for c, s in channels.items()]
+        else:
+            expanded[kind] = [
+                kind(physical_channel=c, expiration_state=s)
+                for c, s in channels.items()]
+    return expanded
+
+
+def _read_back(task_handle, kind, channels):
+    state = ExpirationState(task_handle, flatten_channel_string(channels))
+    if kind is DOExpirationState:
+        return (state.expir_states_do_state,)
+    if kind is COExpirationState:
+        return (state.expir_states_co_state,)
+    return (state.expir_states_ao_state, state.expir_states_ao_type)
+
+
+def verify_expiration_states(task_handle, kind, expiration_states):
+    """
+    Reads back the expiration states, one read per group of physical
+    channels with the same state, and returns the states that differ.
+    """
+    groups = collections.OrderedDict()
+    for e in expiration_states:
+        groups.setdefault(tuple(e[1:]), []).append(e.physical_channel)
+
+    mismatches = []
+    for expected, channels in groups.items():
+        try:
+            actual = [_read_back(task_handle, kind, channels)] * len(channels)
+        except DaqError:
+            # The channels of the group do not all have the same state.
+            actual = [_read_back(task_handle, kind, [c]) for c in channels]
+        mismatches.extend(
+            kind(c, *a) for c, a in zip(channels, actual) if a != expected)
+    return mismatches
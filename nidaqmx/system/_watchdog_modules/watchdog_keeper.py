@@ -0,0 +1,205 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import ctypes
+import sys
+import threading
+import time
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import WatchdogAlert, WatchdogReset
+from nidaqmx.utils import _clock
+
+_THREAD_PRIORITY_HIGHEST = 2
+
+
+def _raise_thread_priority():
+    # Only Windows lets a thread raise its own priority without
+    # privileges.
+    if sys.platform.startswith('win'):
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(
+            kernel32.GetCurrentThread(), _THREAD_PRIORITY_HIGHEST)
+
+
+class WatchdogKeeper(object):
+    """
+    Resets the timer of a watchdog task from a dedicated thread, as long
+    as every health check of the application passes.
+
+    The keeper resets the timer every time a fraction of the watchdog
+    timeout elapses and records the latency and the remaining margin of
+    each reset. If the application stops making progress, a health check
+    fails, the keeper stops resetting the timer, and the watchdog timer
+    expires as intended.
+
+    Create a keeper with
+    :meth:`nidaqmx.system.watchdog.WatchdogTask.start_keeper`. Stopping or
+    closing the watchdog task stops the keeper first.
+    """
+
+    def __init__(self, task, timeout, reset_fraction=0.25, health_checks=None,
+                 alert_callback=None, alert_margin=0.5, history_length=64):
+        """
+        Args:
+            task (nidaqmx.system.watchdog.WatchdogTask): Specifies the
+                watchdog task whose timer to reset.
+            timeout (float): Specifies the watchdog timeout in seconds.
+            reset_fraction (Optional[float]): Specifies the fraction of
+                the timeout that elapses between resets.
+            health_checks (Optional[List[function]]): Specifies the
+                functions the keeper calls before each reset. Each function
+                takes no arguments and returns True if the application is
+                healthy. The keeper skips the reset if any function returns
+                False or raises an exception.
+            alert_callback (Optional[function]): Specifies the function the
+                keeper calls, from the keeper thread, with a
+                :class:`nidaqmx.types.WatchdogAlert` when a reset is
+                skipped, fails, or leaves less than **alert_margin** of the
+                timeout. Exceptions raised by the function are ignored.
+            alert_margin (Optional[float]): Specifies the fraction of the
+                timeout below which a remaining margin raises an alert.
+            history_length (Optional[int]): Specifies the number of recent
+                resets the keeper records.
+        """
+        if timeout <= 0:
+            raise DaqError(
+                'A watchdog keeper requires a watchdog timeout greater '
+                'than 0.\n\nTimeout: {0}'.format(timeout),
+                DAQmxErrors.UNKNOWN.value)
+        if not 0 < reset_fraction < 1:
+            raise DaqError(
+                'Reset fraction must be greater than 0 and less than 1.\n\n'
+                'Reset fraction: {0}'.format(reset_fraction),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._task = task
+        self._timeout = timeout
+        self._period = timeout * reset_fraction
+        self._health_checks = list(health_checks or [])
+        self._alert_callback = alert_callback
+        self._alert_margin = alert_margin * timeout
+
+        self._history = collections.deque(maxlen=history_length)
+        self._error = None
+        self._stop_event = threading.Event()
+        self._last_reset = _clock()
+        self._thread = threading.Thread(
+            target=self._run, name='WatchdogKeeper')
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def error(self):
+        """
+        nidaqmx.errors.DaqError: Indicates the error that stopped the
+            keeper, or None.
+        """
+        return self._error
+
+    @property
+    def history(self):
+        """
+        List[nidaqmx.types.WatchdogReset]: Indicates the most recent
+            resets, oldest first.
+
+            **latency** is the time in seconds by which a reset finished
+            later than scheduled, and **margin** the time in seconds that
+            was left before the watchdog timer would have expired.
+        """
+        return list(self._history)
+
+    @property
+    def is_running(self):
+        """
+        bool: Indicates if the keeper is resetting the timer.
+        """
+        return self._thread.is_alive()
+
+    @property
+    def minimum_margin(self):
+        """
+        float: Indicates the smallest margin, in seconds, of the recent
+            resets, or None if the keeper has not reset the timer yet.
+        """
+        history = self.history
+        return min(r.margin for r in history) if history else None
+
+    def add_health_check(self, health_check):
+        """
+        Adds a function the keeper calls before each reset.
+
+        Args:
+            health_check (function): Specifies the function. The function
+                takes no arguments and returns True if the application is
+                healthy.
+        """
+        self._health_checks = self._health_checks + [health_check]
+
+    def stop(self, final_reset=True):
+        """
+        Stops the keeper thread. Call this method before the application
+        resets the timer itself.
+
+        Args:
+            final_reset (Optional[bool]): Specifies if the keeper resets
+                the timer once more after the thread stops, so that the
+                application has a full timeout to take over.
+        """
+        self._stop_event.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        if final_reset and self._error is None and self._is_healthy():
+            self._task.reset_timer()
+
+    def _is_healthy(self):
+        for health_check in self._health_checks:
+            try:
+                if not health_check():
+                    return False
+            except Exception:
+                return False
+        return True
+
+    def _alert(self, reason, margin):
+        if self._alert_callback is None:
+            return
+        try:
+            self._alert_callback(WatchdogAlert(
+                reason=reason, margin=margin, timestamp=time.time()))
+        except Exception:
+            pass
+
+    def _run(self):
+        _raise_thread_priority()
+
+        next_reset = self._last_reset + self._period
+        while not self._stop_event.wait(max(0.0, next_reset - _clock())):
+            if not self._is_healthy():
+                self._alert(
+                    'unhealthy', self._timeout - (_clock() - self._last_reset))
+                next_reset += self._period
+                continue
+
+            try:
+                self._task.reset_timer()
+            except DaqError as e:
+                self._error = e
+                self._alert(
+                    'error', self._timeout - (_clock() - self._last_reset))
+                return
+
+            now = _clock()
+            margin = self._timeout - (now - self._last_reset)
+            self._history.append(WatchdogReset(
+                timestamp=time.time(), latency=now - next_reset,
+                margin=margin))
+            self._last_reset = now
+            next_reset = now + self._period
+
+            if margin < self._alert_margin:
+                self._alert('low_margin', margin)
@@ -0,0 +1,294 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import json
+import os
+import six
+import threading
+
+from nidaqmx.constants import ProductCategory
+from nidaqmx.errors import DaqError
+from nidaqmx.system.device import Device
+from nidaqmx.system.system import System
+from nidaqmx.types import CDAQSyncConnection
+from nidaqmx.utils import _write_text_file, flatten_channel_string
+
+__all__ = ['CDAQSyncTopology']
+
+
+def _get_chassis_name(port):
+    return port.split('/', 1)[0]
+
+
+def _read(device, name, default=None):
+    try:
+        return getattr(device, name)
+    except DaqError:
+        return default
+
+
+class CDAQSyncTopology(object):
+    """
+    Keeps the last known cDAQ Sync connections between CompactDAQ chassis
+    together with a fingerprint of the chassis and modules they were
+    detected on, so that the connections do not have to be detected again
+    every time the application starts.
+
+    Use the **prepare** method before running tasks. If the fingerprint of
+    the system matches, this method verifies only the ports of the chassis
+    the tasks use, and detects connections again only for the chassis
+    whose ports failed verification. If the chassis or modules have
+    changed, it detects every connection.
+
+    If you specify a cache file, the connections and fingerprint are
+    loaded from and saved to the file.
+    """
+
+    def __init__(self, cache_path=None, system=None):
+        """
+        Args:
+            cache_path (Optional[str]): Specifies the path of the JSON file
+                in which the connections and fingerprint are kept across
+                runs of the application.
+            system (Optional[nidaqmx.system.system.System]): Specifies the
+                DAQmx system. If you do not specify a value, the local
+                system is used.
+        """
+        self._cache_path = cache_path
+        self._system = system if system is not None else System.local()
+        self._lock = threading.RLock()
+
+        self._fingerprint = None
+        self._connections = []
+        if cache_path is not None and os.path.isfile(cache_path):
+            self._load()
+
+    @property
+    def connections(self):
+        """
+        List[nidaqmx.types.CDAQSyncConnection]: Indicates the last known
+            cDAQ Sync connections.
+        """
+        with self._lock:
+            return list(self._connections)
+
+    @property
+    def fingerprint(self):
+        """
+        str: Indicates the fingerprint of the chassis and modules the
+            last known connections were detected on, or None if no
+            connections have been detected.
+        """
+        return self._fingerprint
+
+    def compute_fingerprint(self):
+        """
+        Computes the fingerprint of the CompactDAQ chassis of the system
+        and the modules installed in them.
+
+        Returns:
+            str:
+
+            Indicates the fingerprint.
+        """
+        return self._get_fingerprint(self._read_chassis())
+
+    def prepare(self, devices=None, timeout=10.0):
+        """
+        Makes sure the cDAQ Sync connections the specified devices need
+        are configured, verifying and detecting as few ports as possible.
+
+        Stop all NI-DAQmx tasks running on the chassis before you call
+        this method.
+
+        Args:
+            devices (Optional[List]): Specifies the devices about to run,
+                as :class:`nidaqmx.system.device.Device` objects or
+                device names, such as the **devices** property of the
+                tasks. If you do not specify a value, every known
+                connection is verified.
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for each verification or detection to finish.
+        Returns:
+            List[nidaqmx.types.CDAQSyncConnection]:
+
+            Indicates the configured cDAQ Sync connections.
+        """
+        with self._lock:
+            # Read the chassis once for both the fingerprint and the
+            # chassis of the devices.
+            chassis = self._read_chassis()
+            fingerprint = self._get_fingerprint(chassis)
+            if fingerprint != self._fingerprint:
+                return self._rescan(timeout, fingerprint)
+
+            ports = self._get_ports(
+                self._get_chassis_names(devices, chassis))
+            if not ports:
+                return self.connections
+
+            disconnected = (
+                self._system.are_configured_cdaq_sync_ports_disconnected(
+                    flatten_channel_string(ports), timeout=timeout))
+            if not disconnected:
+                return self.connections
+
+            chassis_names = sorted(set(
+                _get_chassis_name(port) for c in disconnected for port in c))
+            detected = self._system.auto_configure_cdaq_sync_connections(
+                ', '.join(chassis_names), timeout=timeout)
+
+            # Remove the connections of the rescanned chassis that were
+            # not detected again.
+            stale = [c for c in self._connections
+                     if self._touches(c, chassis_names) and
+                     c not in detected]
+            for connection in stale:
+                self._system.remove_cdaq_sync_connection(connection)
+
+            kept = [c for c in self._connections
+                    if not self._touches(c, chassis_names)]
+            self._connections = kept + [c for c in detected if c not in kept]
+            self._save()
+            return self.connections
+
+    def rescan(self, timeout=10.0):
+        """
+        Detects and configures every cDAQ Sync connection of the system
+        and updates the last known connections.
+
+        Args:
+            timeout (Optional[float]): Specifies the time in seconds to
+                wait for the detection to finish.
+        Returns:
+            List[nidaqmx.types.CDAQSyncConnection]:
+
+            Indicates the configured cDAQ Sync connections.
+        """
+        with self._lock:
+            return self._rescan(timeout, self.compute_fingerprint())
+
+    def apply(self, connections):
+        """
+        Configures the specified cDAQ Sync connections, removing and
+        adding only the connections that differ from the last known
+        connections. The connections are not verified.
+
+        Args:
+            connections (List[nidaqmx.types.CDAQSyncConnection]): Specifies
+                the cDAQ Sync connections to configure.
+        Returns:
+            Tuple[List[nidaqmx.types.CDAQSyncConnection],
+            List[nidaqmx.types.CDAQSyncConnection]]:
+
+            Indicates the connections that were removed and the
+            connections that were added.
+        """
+        connections = [CDAQSyncConnection(*c) for c in connections]
+        with self._lock:
+            removed = [c for c in self._connections if c not in connections]
+            added = [c for c in connections if c not in self._connections]
+
+            try:
+                for connection in removed:
+                    self._system.remove_cdaq_sync_connection(connection)
+                    self._connections.remove(connection)
+                for connection in added:
+                    self._system.add_cdaq_sync_connection(connection)
+                    self._connections.append(connection)
+                if self._fingerprint is None:
+                    self._fingerprint = self.compute_fingerprint()
+            finally:
+                self._save()
+            return removed, added
+
+    def clear(self):
+        """
+        Forgets the last known connections, so that the next call to
+        **prepare** detects every connection. The configured connections
+        are not changed.
+        """
+        with self._lock:
+            self._fingerprint = None
+            self._connections = []
+            if self._cache_path is not None and os.path.isfile(
+                    self._cache_path):
+                os.remove(self._cache_path)
+
+    def _rescan(self, timeout, fingerprint):
+        with self._lock:
+            self._connections = (
+                self._system.auto_configure_cdaq_sync_connections(
+                    timeout=timeout))
+            self._fingerprint = fingerprint
+            self._save()
+            return self.connections
+
+    def _read_chassis(self):
+        # Reads only the fields the fingerprint and the chassis lookup
+        # need, rather than a full snapshot of every device.
+        chassis = []
+        for name in self._system.devices.device_names:
+            device = Device(name)
+            if (_read(device, 'product_category') !=
+                    ProductCategory.COMPACT_DAQ_CHASSIS or
+                    _read(device, 'dev_is_simulated')):
+                continue
+            chassis.append([
+                name, _read(device, 'product_type'),
+                _read(device, 'dev_serial_num'),
+                sorted(d.name for d in
+                       _read(device, 'chassis_module_devices', []))])
+        chassis.sort()
+        return chassis
+
+    @staticmethod
+    def _get_fingerprint(chassis):
+        return hashlib.sha1(
+            json.dumps(chassis, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _get_chassis_names(devices, chassis):
+        if devices is None:
+            return None
+
+        chassis_of_modules = dict(
+            (module, c[0]) for c in chassis for module in c[3])
+        chassis_names = set()
+        for device in devices:
+            name = device.name if isinstance(device, Device) else device
+            chassis_names.add(chassis_of_modules.get(name, name))
+        return chassis_names
+
+    def _get_ports(self, chassis_names):
+        ports = []
+        for connection in self._connections:
+            if chassis_names is None or self._touches(
+                    connection, chassis_names):
+                ports.extend(p for p in connection if p not in ports)
+        return ports
+
+    @staticmethod
+    def _touches(connection, chassis_names):
+        return any(_get_chassis_name(p) in chassis_names for p in connection)
+
+    def _load(self):
+        with io.open(self._cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._fingerprint = data['fingerprint']
+        self._connections = [
+            CDAQSyncConnection(*c) for c in data['connections']]
+
+    def _save(self):
+        if self._cache_path is None:
+            return
+
+        data = six.text_type(json.dumps({
+            'fingerprint': self._fingerprint,
+            'connections': [list(c) for c in self._connections]},
+            indent=4, sort_keys=True))
+        _write_text_file(self._cache_path, data)
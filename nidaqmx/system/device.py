@@ -12,6 +12,7 @@ from nidaqmx._lib import (
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small, is_array_buffer_too_small)
 from nidaqmx.utils import unflatten_channel_string
+from nidaqmx.system._capability_cache import capability_cache, get_volatility
 from nidaqmx.system._collections.physical_channel_collection import (
     AIPhysicalChannelCollection, AOPhysicalChannelCollection,
     CIPhysicalChannelCollection, COPhysicalChannelCollection,
@@ -27,6 +28,11 @@ __all__ = ['Device']
 class Device(object):
     """
     Represents a DAQmx device.
+
+    The values of device properties that describe the capabilities of
+    the device are cached for every Device object with the same name.
+    The cache is cleared when you reset, self-test, add or delete the
+    device, or when you call **clear_capability_cache**.
     """
     __slots__ = ['_name', '__weakref__']
 
@@ -1978,6 +1984,7 @@ class Device(object):
 
         error_code = cfunc(
             self._name)
+        capability_cache.invalidate(self._name)
         check_for_error(error_code)
 
     def self_test_device(self):
@@ -1991,8 +1998,25 @@ class Device(object):
 
         error_code = cfunc(
             self._name)
+        capability_cache.invalidate(self._name)
         check_for_error(error_code)
 
+    def clear_capability_cache(self):
+        """
+        Clears the cached property values of this device, so that the next
+        access of each property queries the driver. Call this method
+        after you change the device outside of this process, such as in
+        NI MAX.
+        """
+        capability_cache.invalidate(self._name)
+
+    @staticmethod
+    def clear_all_capability_caches():
+        """
+        Clears the cached property values of every device.
+        """
+        capability_cache.invalidate()
+
     # region Network Device Functions
 
     @staticmethod
@@ -2044,6 +2068,8 @@ class Device(object):
             else:
                 break
 
+        # Adding a chassis also adds its modules.
+        capability_cache.invalidate()
         check_for_error(size_or_code)
 
         return Device(device_name_out.value.decode('ascii'))
@@ -2059,6 +2085,7 @@ class Device(object):
 
         error_code = cfunc(
             self._name)
+        capability_cache.invalidate()
         check_for_error(error_code)
 
     def reserve_network_device(self, override_reservation=None):
@@ -2095,3 +2122,13 @@ class Device(object):
         check_for_error(error_code)
 
     # endregion
+
+
+def _cache_device_properties():
+    for name, prop in list(vars(Device).items()):
+        if isinstance(prop, property) and name != 'name':
+            setattr(Device, name, capability_cache.cached_property(
+                prop, name, get_volatility(name)))
+
+
+_cache_device_properties()
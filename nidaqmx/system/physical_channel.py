@@ -688,6 +688,17 @@ class PhysicalChannel(object):
 
         return val.tolist()
 
+    @property
+    def teds_info(self):
+        """
+        nidaqmx.types.TEDSInfo: Indicates the Basic TEDS, the first
+            template ID and the bitstream of the sensor, parsed from a
+            single read of **teds_bit_stream**.
+        """
+        from nidaqmx.system.teds import parse_teds_bit_stream
+
+        return parse_teds_bit_stream(self.teds_bit_stream)
+
     @property
     def teds_mfg_id(self):
         """
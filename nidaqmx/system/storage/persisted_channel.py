@@ -8,6 +8,7 @@ import ctypes
 from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small, is_array_buffer_too_small)
+from nidaqmx.system._persisted_index import persisted_channel_index
 
 __all__ = ['PersistedChannel']
 
@@ -120,4 +121,5 @@ class PersistedChannel(object):
         cfunc.argtypes = [ctypes_byte_str]
 
         error_code = cfunc(self._name)
+        persisted_channel_index.invalidate()
         check_for_error(error_code)
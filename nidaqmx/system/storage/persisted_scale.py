@@ -9,6 +9,7 @@ from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
 from nidaqmx.scale import Scale
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small, is_array_buffer_too_small)
+from nidaqmx.system._persisted_index import persisted_scale_index
 
 __all__ = ['PersistedScale']
 
@@ -121,6 +122,7 @@ class PersistedScale(object):
         cfunc.argtypes = [ctypes_byte_str]
 
         error_code = cfunc(self._name)
+        persisted_scale_index.invalidate()
         check_for_error(error_code)
 
     def load(self):
@@ -8,6 +8,7 @@ import ctypes
 from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small)
+from nidaqmx.system._persisted_index import persisted_task_index
 
 __all__ = ['PersistedTask']
 
@@ -119,6 +120,7 @@ class PersistedTask(object):
         cfunc.argtypes = [ctypes_byte_str]
 
         error_code = cfunc(self._name)
+        persisted_task_index.invalidate()
         check_for_error(error_code)
 
     def load(self):
@@ -18,6 +18,8 @@ from nidaqmx.system._collections.persisted_scale_collection import (
     PersistedScaleCollection)
 from nidaqmx.system._collections.persisted_task_collection import (
     PersistedTaskCollection)
+from nidaqmx.system.system_snapshot import SystemSnapshot
+from nidaqmx.system._power_up_provisioning import provision_power_up_states
 from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 from nidaqmx.constants import (
     AOPowerUpOutputBehavior, LogicFamily, PowerUpStates, ResistorState,
@@ -151,6 +153,25 @@ class System(object):
 
         return val.value
 
+    def snapshot(self, max_workers=None):
+        """
+        Reads the devices of this DAQmx system, their chassis, physical
+        channels, supported measurement and output types, and terminals
+        into an immutable snapshot that answers queries without calling
+        the driver. Devices are read in parallel.
+
+        Args:
+            max_workers (Optional[int]): Specifies the maximum number of
+                devices read at the same time. If you do not specify a
+                value, up to 8 devices are read at the same time.
+        Returns:
+            nidaqmx.system.system_snapshot.SystemSnapshot:
+
+            Indicates the snapshot.
+        """
+        return SystemSnapshot.build(
+            self.devices.device_names, max_workers=max_workers)
+
     def connect_terms(
             self, source_terminal, destination_terminal,
             signal_modifiers=SignalModifiers.DO_NOT_INVERT_POLARITY):
@@ -297,15 +318,15 @@ class System(object):
         """
         states = []
 
-        device = Device(device_name)
+        do_lines = Device(device_name).do_lines.channel_names
         args = [device_name]
         argtypes = [ctypes_byte_str]
 
-        for do_line in device.do_lines:
+        for do_line in do_lines:
             state = ctypes.c_int()
             states.append(state)
             
-            args.append(do_line.name)
+            args.append(do_line)
             argtypes.append(ctypes_byte_str)
             
             args.append(ctypes.byref(state))
@@ -320,9 +341,9 @@ class System(object):
         check_for_error(error_code)
 
         power_up_states = []
-        for d, p in zip(device.do_lines, states):
+        for d, p in zip(do_lines, states):
             power_up_states.append(
-                DOPowerUpState(physical_channel=d.name,
+                DOPowerUpState(physical_channel=d,
                                power_up_state=PowerUpStates(p.value)))
 
         return power_up_states
@@ -389,15 +410,15 @@ class System(object):
         """
         states = []
 
-        device = Device(device_name)
+        do_lines = Device(device_name).do_lines.channel_names
         args = [device_name]
         argtypes = [ctypes_byte_str]
 
-        for do_line in device.do_lines:
+        for do_line in do_lines:
             state = ctypes.c_int()
             states.append(state)
             
-            args.append(do_line.name)
+            args.append(do_line)
             argtypes.append(ctypes_byte_str)
             
             args.append(ctypes.byref(state))
@@ -412,10 +433,10 @@ class System(object):
         check_for_error(error_code)
 
         power_up_states = []
-        for d, p in zip(device.do_lines, states):
+        for d, p in zip(do_lines, states):
             power_up_states.append(
                 DOResistorPowerUpState(
-                    physical_channel=d.name,
+                    physical_channel=d,
                     power_up_state=ResistorState(p.value)))
 
         return power_up_states
@@ -493,7 +514,8 @@ class System(object):
         cfunc.argtypes = [
             ctypes_byte_str,
             wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
-            wrapped_ndpointer(dtype=numpy.int32, flags=('C','W'))]
+            wrapped_ndpointer(dtype=numpy.int32, flags=('C','W')),
+            ctypes.c_uint]
 
         error_code = cfunc(
             physical_channel, state, channel_type, len(power_up_states))
@@ -525,18 +547,18 @@ class System(object):
         states = []
         channel_types = []
 
-        device = Device(device_name)
+        ao_physical_chans = Device(device_name).ao_physical_chans.channel_names
         args = [device_name]
         argtypes = [ctypes_byte_str]
 
-        for ao_physical_chan in device.ao_physical_chans:
+        for ao_physical_chan in ao_physical_chans:
             state = ctypes.c_double()
             states.append(state)
 
             channel_type = ctypes.c_int()
             channel_types.append(channel_type)
 
-            args.append(ao_physical_chan.name)
+            args.append(ao_physical_chan)
             argtypes.append(ctypes_byte_str)
             
             args.append(ctypes.byref(state))
@@ -554,10 +576,10 @@ class System(object):
         check_for_error(error_code)
 
         power_up_states = []
-        for a, p, c in zip(device.ao_physical_chans, states, channel_types):
+        for a, p, c in zip(ao_physical_chans, states, channel_types):
             power_up_states.append(
                 AOPowerUpState(
-                    physical_channel=a.name,
+                    physical_channel=a,
                     power_up_state=p.value,
                     channel_type=AOPowerUpOutputBehavior(c.value)))
 
@@ -590,15 +612,19 @@ class System(object):
         states = numpy.zeros(size, dtype=numpy.float64)
         channel_types = numpy.zeros(size, dtype=numpy.int32)
 
+        # The array size is passed by reference.
+        array_size = ctypes.c_uint(size)
+
         cfunc = lib_importer.cdll.DAQmxGetAnalogPowerUpStatesWithOutputType
         cfunc.argtypes = [
-            'ctypes_byte_str',
+            ctypes_byte_str,
             wrapped_ndpointer(dtype=numpy.float64, flags=('C','W')),
-            wrapped_ndpointer(dtype=numpy.int32, flags=('C','W'))]
+            wrapped_ndpointer(dtype=numpy.int32, flags=('C','W')),
+            ctypes.POINTER(ctypes.c_uint)]
 
         error_code = cfunc(
             flatten_channel_string(physical_channels), states, channel_types,
-            size)
+            ctypes.byref(array_size))
 
         check_for_error(error_code)
 
@@ -608,7 +634,7 @@ class System(object):
                 AOPowerUpState(
                     physical_channel=p,
                     power_up_state=float(s),
-                    channel_type=AOPowerUpOutputBehavior(c.value)))
+                    channel_type=AOPowerUpOutputBehavior(int(c))))
 
         return power_up_states
 
@@ -663,6 +689,60 @@ class System(object):
 
         return LogicFamily(logic_family.value)
 
+    def provision_power_up_states(
+            self, power_up_map, dry_run=False, max_workers=None):
+        """
+        Brings the power up states of several devices to the specified
+        states. This method reads the current power up states of the
+        devices in parallel, compares them with the specified states, and
+        sets only the states that differ.
+
+        Args:
+            power_up_map (dict): Specifies the power up states to set, by
+                device name. The power up states of each device are a
+                dict that can contain the following keys:
+
+                - digital (List[nidaqmx.types.DOPowerUpState]): Specifies
+                  the power up states of digital lines or ports.
+                - pull_up_pull_down
+                  (List[nidaqmx.types.DOResistorPowerUpState]): Specifies
+                  the resistor levels of digital lines or ports.
+                - analog (List[nidaqmx.types.AOPowerUpState]): Specifies
+                  the power up states and output types of analog output
+                  physical channels.
+                - logic_family (:class:`nidaqmx.constants.LogicFamily`):
+                  Specifies the digital logic family of the device.
+
+                Physical channel names can omit the device name.
+            dry_run (Optional[bool]): Specifies if this method only
+                compares the states without setting them.
+            max_workers (Optional[int]): Specifies the maximum number of
+                devices read or set at the same time. If you do not specify
+                a value, up to 8 devices are read or set at the same time.
+        Returns:
+            nidaqmx.types.PowerUpProvisioningReport:
+
+            Indicates the states that differed and how long the operation
+            took.
+
+            - changes (List[nidaqmx.types.PowerUpStateChange]): Indicates
+              the states that differed, each with the device name, the
+              state type as a key of **power_up_map**, the physical
+              channel, and the old and new states. Analog states are
+              (power_up_state, channel_type) pairs. The old state of
+              digital lines or ports whose lines had different states is
+              None.
+            - dry_run (bool): Indicates if the states were only compared.
+            - read_time (float): Indicates the time in seconds spent
+              reading the current states.
+            - apply_time (float): Indicates the time in seconds spent
+              setting the states.
+            - device_read_times (dict): Indicates the time in seconds
+              spent reading the current states of each device.
+        """
+        return provision_power_up_states(
+            self, power_up_map, dry_run=dry_run, max_workers=max_workers)
+
     # endregion
 
     # region cDAQ Sync Functions
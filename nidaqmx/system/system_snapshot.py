@@ -0,0 +1,314 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import concurrent.futures
+import six
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system.device import Device
+from nidaqmx.types import DeviceInfo
+
+__all__ = ['SystemSnapshot']
+
+# DeviceInfo fields that hold lists, named after the Device properties
+# they are read from.
+_CHANNEL_FIELDS = (
+    'ai_physical_chans', 'ao_physical_chans', 'ci_physical_chans',
+    'co_physical_chans', 'di_lines', 'di_ports', 'do_lines', 'do_ports')
+
+_USAGE_TYPE_FIELDS = (
+    'ai_meas_types', 'ao_output_types', 'ci_meas_types', 'co_output_types')
+
+
+def _read(device, name, default=None):
+    try:
+        return getattr(device, name)
+    except DaqError:
+        # The device does not support the property, such as the slot
+        # number of a device that is not in a chassis.
+        return default
+
+
+def _read_device_info(device_name):
+    device = Device(device_name)
+
+    chassis = _read(device, 'compact_daq_chassis_device')
+    fields = {
+        'name': device_name,
+        'product_type': _read(device, 'product_type'),
+        'product_category': _read(device, 'product_category'),
+        'is_simulated': _read(device, 'dev_is_simulated'),
+        'serial_num': _read(device, 'dev_serial_num'),
+        'bus_type': _read(device, 'bus_type'),
+        'compact_daq_chassis_device':
+            chassis.name if chassis is not None else None,
+        'compact_daq_slot_num': _read(device, 'compact_daq_slot_num'),
+        'pxi_chassis_num': _read(device, 'pxi_chassis_num'),
+        'pxi_slot_num': _read(device, 'pxi_slot_num'),
+        'chassis_module_devices': tuple(
+            d.name for d in _read(device, 'chassis_module_devices', [])),
+        'terminals': tuple(_read(device, 'terminals', [])),
+    }
+    for field in _CHANNEL_FIELDS:
+        collection = getattr(device, field)
+        fields[field] = tuple(_read(collection, 'channel_names', []))
+    for field in _USAGE_TYPE_FIELDS:
+        fields[field] = tuple(_read(device, field, []))
+
+    return DeviceInfo(**fields)
+
+
+class SystemSnapshot(object):
+    """
+    Represents the devices of a DAQmx system, their chassis and slots,
+    physical channels, supported measurement and output types, and
+    terminals, as read once from the driver.
+
+    The snapshot does not change after it is built and answers queries
+    from indexes, without calling the driver. Build a new snapshot with
+    :meth:`nidaqmx.system.system.System.snapshot` after the system changes.
+    """
+    __slots__ = ['_devices', '_by_category', '_by_chassis', '_by_usage_type',
+                 '_by_terminal']
+
+    def __init__(self, devices):
+        """
+        Args:
+            devices (List[nidaqmx.types.DeviceInfo]): Specifies the
+                devices in the snapshot.
+        """
+        self._devices = collections.OrderedDict(
+            (d.name, d) for d in devices)
+
+        by_category = collections.defaultdict(list)
+        by_chassis = collections.defaultdict(list)
+        by_usage_type = collections.defaultdict(list)
+        by_terminal = {}
+
+        for device in self._devices.values():
+            by_category[device.product_category].append(device)
+            for chassis in self._get_chassis(device):
+                by_chassis[chassis].append(device)
+            for field in _USAGE_TYPE_FIELDS:
+                for usage_type in getattr(device, field):
+                    by_usage_type[usage_type].append(device)
+            for terminal in device.terminals:
+                by_terminal[terminal] = device
+
+        self._by_category = dict(
+            (k, tuple(v)) for k, v in by_category.items())
+        self._by_chassis = dict(
+            (k, tuple(v)) for k, v in by_chassis.items())
+        self._by_usage_type = dict(
+            (k, tuple(v)) for k, v in by_usage_type.items())
+        self._by_terminal = by_terminal
+
+    def __contains__(self, item):
+        if isinstance(item, (Device, DeviceInfo)):
+            item = item.name
+        return item in self._devices
+
+    def __getitem__(self, name):
+        """
+        Returns the device with the specified name.
+
+        Args:
+            name (str): Specifies the name of the device.
+        Returns:
+            nidaqmx.types.DeviceInfo:
+
+            Indicates the device.
+        """
+        try:
+            return self._devices[name]
+        except KeyError:
+            raise DaqError(
+                'The specified device is not in the system snapshot.\n\n'
+                'Device: {0}'.format(name), DAQmxErrors.UNKNOWN.value)
+
+    def __iter__(self):
+        return iter(self._devices.values())
+
+    def __len__(self):
+        return len(self._devices)
+
+    def __repr__(self):
+        return 'SystemSnapshot(devices={0})'.format(len(self._devices))
+
+    @classmethod
+    def build(cls, device_names, max_workers=None):
+        """
+        Reads the devices with the specified names from the driver, one
+        device per thread, and builds a snapshot of them.
+
+        Args:
+            device_names (List[str]): Specifies the names of the devices.
+            max_workers (Optional[int]): Specifies the maximum number of
+                devices read at the same time. If you do not specify a
+                value, up to 8 devices are read at the same time.
+        Returns:
+            nidaqmx.system.system_snapshot.SystemSnapshot:
+
+            Indicates the snapshot.
+        """
+        device_names = list(device_names)
+        if not device_names:
+            return cls([])
+        if max_workers is None:
+            max_workers = min(8, len(device_names))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return cls(list(executor.map(_read_device_info, device_names)))
+
+    @property
+    def device_names(self):
+        """
+        List[str]: Indicates the names of the devices in the snapshot.
+        """
+        return list(self._devices)
+
+    @property
+    def chassis(self):
+        """
+        List: Indicates the CompactDAQ chassis names and PXI chassis
+            numbers of the chassis in the snapshot.
+        """
+        return list(self._by_chassis)
+
+    def by_category(self, product_category):
+        """
+        Returns the devices of the specified product category.
+
+        Args:
+            product_category (nidaqmx.constants.ProductCategory): Specifies
+                the product category.
+        Returns:
+            List[nidaqmx.types.DeviceInfo]:
+
+            Indicates the devices.
+        """
+        return list(self._by_category.get(product_category, ()))
+
+    def in_chassis(self, chassis):
+        """
+        Returns the devices installed in the specified chassis.
+
+        Args:
+            chassis: Specifies the name, as a str, or the
+                :class:`nidaqmx.types.DeviceInfo` of a CompactDAQ chassis,
+                or the number, as an int, of a PXI chassis.
+        Returns:
+            List[nidaqmx.types.DeviceInfo]:
+
+            Indicates the devices in the chassis, not including the
+            chassis itself.
+        """
+        if isinstance(chassis, (Device, DeviceInfo)):
+            chassis = chassis.name
+        return list(self._by_chassis.get(chassis, ()))
+
+    def supporting(self, *usage_types):
+        """
+        Returns the devices that support all of the specified measurement
+        and output types.
+
+        Args:
+            usage_types: Specifies the measurement or output types as
+                :class:`nidaqmx.constants.UsageTypeAI`,
+                :class:`nidaqmx.constants.UsageTypeAO`,
+                :class:`nidaqmx.constants.UsageTypeCI` or
+                :class:`nidaqmx.constants.UsageTypeCO` values.
+        Returns:
+            List[nidaqmx.types.DeviceInfo]:
+
+            Indicates the devices.
+        """
+        names = None
+        for usage_type in usage_types:
+            supported = set(
+                d.name for d in self._by_usage_type.get(usage_type, ()))
+            names = supported if names is None else names & supported
+        if names is None:
+            return list(self)
+        return [d for d in self if d.name in names]
+
+    def device_with_terminal(self, terminal):
+        """
+        Returns the device that owns the specified terminal.
+
+        Args:
+            terminal (str): Specifies the name of the terminal, such as
+                "/Dev1/PFI0".
+        Returns:
+            nidaqmx.types.DeviceInfo:
+
+            Indicates the device, or None if no device in the snapshot
+            owns the terminal.
+        """
+        return self._by_terminal.get(terminal)
+
+    def find(self, product_category=None, is_simulated=None, chassis=None,
+             usage_types=(), predicate=None, **minimum_channels):
+        """
+        Returns the devices that match all of the specified criteria.
+
+        Args:
+            product_category (Optional[nidaqmx.constants.ProductCategory]):
+                Specifies the product category of the devices.
+            is_simulated (Optional[bool]): Specifies if the devices are
+                simulated.
+            chassis (Optional): Specifies the chassis the devices are
+                installed in, as accepted by **in_chassis**.
+            usage_types (Optional[List]): Specifies the measurement and
+                output types the devices support.
+            predicate (Optional[function]): Specifies a function that
+                receives a :class:`nidaqmx.types.DeviceInfo` and returns
+                True if the device matches.
+            minimum_channels: Specifies the minimum number of physical
+                channels, lines or ports of the devices by field name,
+                such as ai_physical_chans=4 or do_lines=8.
+        Returns:
+            List[nidaqmx.types.DeviceInfo]:
+
+            Indicates the devices, in the order in which the driver lists
+            them.
+        """
+        for field in minimum_channels:
+            if field not in _CHANNEL_FIELDS:
+                raise DaqError(
+                    'Invalid physical channel type "{0}" specified.\n\n'
+                    'Valid types: {1}'.format(
+                        field, ', '.join(_CHANNEL_FIELDS)),
+                    DAQmxErrors.UNKNOWN.value)
+
+        if product_category is not None:
+            devices = self.by_category(product_category)
+        elif chassis is not None:
+            devices = self.in_chassis(chassis)
+        else:
+            devices = list(self)
+
+        if chassis is not None:
+            in_chassis = set(d.name for d in self.in_chassis(chassis))
+            devices = [d for d in devices if d.name in in_chassis]
+        if usage_types:
+            supporting = set(d.name for d in self.supporting(*usage_types))
+            devices = [d for d in devices if d.name in supporting]
+
+        return [
+            d for d in devices
+            if (is_simulated is None or d.is_simulated == is_simulated) and
+            all(len(getattr(d, field)) >= minimum
+                for field, minimum in six.iteritems(minimum_channels)) and
+            (predicate is None or predicate(d))]
+
+    @staticmethod
+    def _get_chassis(device):
+        if device.compact_daq_chassis_device:
+            yield device.compact_daq_chassis_device
+        if device.pxi_chassis_num is not None:
+            yield device.pxi_chassis_num
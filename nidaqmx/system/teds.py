@@ -0,0 +1,450 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import binascii
+import concurrent.futures
+import io
+import json
+import os
+import six
+import threading
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.system.physical_channel import PhysicalChannel
+from nidaqmx.types import TEDSInfo
+from nidaqmx.utils import _write_text_file
+
+__all__ = ['TEDSCache', 'parse_teds_bit_stream', 'read_teds_file',
+           'write_teds_file']
+
+# Virtual TEDS files store one bit per byte, least significant bit of
+# each field first, after a header that is stored the same way.
+_TED_FILE_HEADER = b'[v03]'
+
+_BASIC_TEDS_BITS = 64
+
+# IEEE 1451.4 selector value that precedes a standard template ID.
+_STANDARD_TEMPLATE_SELECTOR = 0
+
+
+def _unpack_bits(bit_stream):
+    bits = []
+    for byte in bytearray(bit_stream):
+        bits.extend((byte >> i) & 1 for i in range(8))
+    return bits
+
+
+def _pack_bits(bits):
+    bit_stream = []
+    for offset in range(0, len(bits), 8):
+        bit_stream.append(sum(
+            b << i for i, b in enumerate(bits[offset:offset + 8])))
+    return bit_stream
+
+
+def _read_uint(bits, offset, count):
+    return sum(b << i for i, b in enumerate(bits[offset:offset + count]))
+
+
+def _parse_bits(bits):
+    if len(bits) < _BASIC_TEDS_BITS:
+        raise DaqError(
+            'The TEDS bitstream is too short to contain Basic TEDS.\n\n'
+            'Number of bits: {0}'.format(len(bits)),
+            DAQmxErrors.UNKNOWN.value)
+
+    version_letter = _read_uint(bits, 29, 5)
+    template_ids = []
+    # The layout of the template data depends on the template, so only
+    # the first template ID is read from the bitstream.
+    if (len(bits) >= _BASIC_TEDS_BITS + 10 and
+            _read_uint(bits, _BASIC_TEDS_BITS, 2) ==
+            _STANDARD_TEMPLATE_SELECTOR):
+        template_ids.append(_read_uint(bits, _BASIC_TEDS_BITS + 2, 8))
+
+    return TEDSInfo(
+        mfg_id=_read_uint(bits, 0, 14),
+        model_num=_read_uint(bits, 14, 15),
+        version_letter=(
+            six.unichr(ord('A') + version_letter - 1)
+            if version_letter else ''),
+        version_num=_read_uint(bits, 34, 6),
+        serial_num=_read_uint(bits, 40, 24),
+        template_ids=tuple(template_ids),
+        bit_stream=tuple(_pack_bits(bits)))
+
+
+def parse_teds_bit_stream(bit_stream):
+    """
+    Parses the Basic TEDS and the first template ID of an IEEE 1451.4
+    TEDS bitstream without calling NI-DAQmx.
+
+    Args:
+        bit_stream (List[int]): Specifies the TEDS bitstream as 8-bit
+            unsigned integers, such as the value of
+            :attr:`nidaqmx.system.physical_channel.PhysicalChannel.teds_bit_stream`.
+    Returns:
+        nidaqmx.types.TEDSInfo:
+
+        Indicates the TEDS information.
+    """
+    return _parse_bits(_unpack_bits(bit_stream))
+
+
+def read_teds_file(file_path):
+    """
+    Parses a virtual TEDS file without calling NI-DAQmx.
+
+    Args:
+        file_path (str): Specifies the path of the virtual TEDS file.
+    Returns:
+        nidaqmx.types.TEDSInfo:
+
+        Indicates the TEDS information.
+    """
+    with io.open(file_path, 'rb') as f:
+        data = bytearray(f.read())
+
+    if any(b > 1 for b in data):
+        raise DaqError(
+            'The file is not a virtual TEDS file.\n\nFile: {0}'.format(
+                file_path),
+            DAQmxErrors.UNKNOWN.value)
+
+    bits = list(data)
+    header_bits = 8 * len(_TED_FILE_HEADER)
+    header = bytearray(_pack_bits(bits[:header_bits]))
+    if header[:1] == b'[' and header[-1:] == b']':
+        bits = bits[header_bits:]
+    return _parse_bits(bits)
+
+
+def write_teds_file(file_path, bit_stream):
+    """
+    Writes a TEDS bitstream to a virtual TEDS file that
+    :meth:`nidaqmx.system.physical_channel.PhysicalChannel.configure_teds`
+    accepts.
+
+    Args:
+        file_path (str): Specifies the path of the virtual TEDS file.
+        bit_stream (List[int]): Specifies the TEDS bitstream as 8-bit
+            unsigned integers.
+    """
+    bits = _unpack_bits(_TED_FILE_HEADER) + _unpack_bits(bit_stream)
+    with io.open(file_path, 'wb') as f:
+        f.write(bytes(bytearray(bits)))
+
+
+def _get_key(teds_info):
+    return '{0}-{1}-{2}-{3}{4}'.format(
+        teds_info.mfg_id, teds_info.model_num, teds_info.serial_num,
+        teds_info.version_letter, teds_info.version_num)
+
+
+def _get_channel_name(physical_channel):
+    if isinstance(physical_channel, PhysicalChannel):
+        return physical_channel.name
+    return physical_channel
+
+
+class TEDSCache(object):
+    """
+    Keeps the TEDS of known sensors in a directory, keyed by
+    manufacturer ID, model number, serial number and version, together
+    with the sensor last read on each physical channel.
+
+    Reading TEDS from the EEPROM of a sensor is slow. Once the cache knows
+    which sensor is connected to a physical channel, **configure_channel**
+    associates the cached TEDS with the channel from a virtual TEDS file
+    instead of reading the sensor again. After you move or replace a
+    sensor, call **read_channel** for the affected physical channels.
+    """
+
+    _INDEX_FILE_NAME = 'index.json'
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): Specifies the directory in which the TEDS are
+                kept across runs of the application. The directory is
+                created if it does not exist.
+        """
+        self._cache_dir = cache_dir
+        self._lock = threading.RLock()
+
+        self._sensors = {}
+        self._channels = {}
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        elif os.path.isfile(self._index_path):
+            self._load()
+
+    def __contains__(self, item):
+        return _get_key(item) in self._sensors
+
+    def __iter__(self):
+        with self._lock:
+            sensors = list(self._sensors.values())
+        return iter(sensors)
+
+    def __len__(self):
+        return len(self._sensors)
+
+    @property
+    def cache_dir(self):
+        """
+        str: Indicates the directory in which the TEDS are kept.
+        """
+        return self._cache_dir
+
+    @property
+    def _index_path(self):
+        return os.path.join(self._cache_dir, self._INDEX_FILE_NAME)
+
+    def get(self, mfg_id, model_num, serial_num, version_letter, version_num):
+        """
+        Looks up the TEDS of a sensor.
+
+        Args:
+            mfg_id (int): Specifies the manufacturer ID of the sensor.
+            model_num (int): Specifies the model number of the sensor.
+            serial_num (int): Specifies the serial number of the sensor.
+            version_letter (str): Specifies the version letter of the
+                sensor.
+            version_num (int): Specifies the version number of the sensor.
+        Returns:
+            nidaqmx.types.TEDSInfo:
+
+            Indicates the TEDS of the sensor, or None if the sensor is not
+            in the cache.
+        """
+        return self._sensors.get('{0}-{1}-{2}-{3}{4}'.format(
+            mfg_id, model_num, serial_num, version_letter, version_num))
+
+    def get_channel_sensor(self, physical_channel):
+        """
+        Looks up the TEDS of the sensor last read on a physical channel.
+
+        Args:
+            physical_channel (nidaqmx.system.physical_channel.PhysicalChannel):
+                Specifies the physical channel, as an object or a name.
+        Returns:
+            nidaqmx.types.TEDSInfo:
+
+            Indicates the TEDS of the sensor, or None if no sensor has
+            been read on the physical channel.
+        """
+        with self._lock:
+            key = self._channels.get(_get_channel_name(physical_channel))
+            return self._sensors.get(key)
+
+    def get_file_path(self, teds_info):
+        """
+        Gets the path of the virtual TEDS file of a cached sensor.
+
+        Args:
+            teds_info (nidaqmx.types.TEDSInfo): Specifies the sensor.
+        Returns:
+            str:
+
+            Indicates the path of the virtual TEDS file.
+        """
+        return os.path.join(
+            self._cache_dir, '{0}.ted'.format(_get_key(teds_info)))
+
+    def add(self, teds_info, physical_channel=None):
+        """
+        Adds the TEDS of a sensor to the cache.
+
+        Args:
+            teds_info (nidaqmx.types.TEDSInfo): Specifies the TEDS, such
+                as the value of :func:`parse_teds_bit_stream` or
+                :func:`read_teds_file`.
+            physical_channel (Optional[nidaqmx.system.physical_channel.PhysicalChannel]):
+                Specifies the physical channel, as an object or a name,
+                on which the sensor is connected.
+        """
+        with self._lock:
+            self._add(teds_info, physical_channel)
+            self._save()
+
+    def remove(self, teds_info):
+        """
+        Removes the TEDS of a sensor from the cache.
+
+        Args:
+            teds_info (nidaqmx.types.TEDSInfo): Specifies the sensor.
+        """
+        with self._lock:
+            key = _get_key(teds_info)
+            if self._sensors.pop(key, None) is None:
+                return
+            self._channels = dict(
+                (c, k) for c, k in six.iteritems(self._channels) if k != key)
+            file_path = self.get_file_path(teds_info)
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            self._save()
+
+    def forget_channel(self, physical_channel):
+        """
+        Forgets the sensor last read on a physical channel, so that the
+        next call to **configure_channel** reads the sensor again. The
+        TEDS of the sensor stay in the cache.
+
+        Args:
+            physical_channel (nidaqmx.system.physical_channel.PhysicalChannel):
+                Specifies the physical channel, as an object or a name.
+        """
+        with self._lock:
+            if self._channels.pop(
+                    _get_channel_name(physical_channel), None) is not None:
+                self._save()
+
+    def clear(self):
+        """
+        Removes every sensor and physical channel from the cache.
+        """
+        with self._lock:
+            for teds_info in self._sensors.values():
+                file_path = self.get_file_path(teds_info)
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+            self._sensors = {}
+            self._channels = {}
+            if os.path.isfile(self._index_path):
+                os.remove(self._index_path)
+
+    def read_channel(self, physical_channel):
+        """
+        Reads the TEDS of the sensor connected to a physical channel,
+        associates them with the physical channel, and adds them to the
+        cache.
+
+        Args:
+            physical_channel (nidaqmx.system.physical_channel.PhysicalChannel):
+                Specifies the physical channel, as an object or a name.
+        Returns:
+            nidaqmx.types.TEDSInfo:
+
+            Indicates the TEDS of the sensor.
+        """
+        with self._lock:
+            teds_info = self._read_channel(physical_channel)
+            self._save()
+            return teds_info
+
+    def configure_channel(self, physical_channel):
+        """
+        Associates the cached TEDS of the sensor last read on a physical
+        channel with the physical channel, without reading the sensor. If
+        no sensor has been read on the physical channel, the sensor is
+        read and added to the cache.
+
+        Args:
+            physical_channel (nidaqmx.system.physical_channel.PhysicalChannel):
+                Specifies the physical channel, as an object or a name.
+        Returns:
+            nidaqmx.types.TEDSInfo:
+
+            Indicates the TEDS associated with the physical channel.
+        """
+        return self.configure_channels([physical_channel], max_workers=1)[0]
+
+    def configure_channels(self, physical_channels, max_workers=None):
+        """
+        Associates TEDS with multiple physical channels in parallel, as
+        **configure_channel** does for one physical channel.
+
+        Args:
+            physical_channels (List[nidaqmx.system.physical_channel.PhysicalChannel]):
+                Specifies the physical channels, as objects or names.
+            max_workers (Optional[int]): Specifies the maximum number of
+                physical channels to configure at the same time. If you do
+                not specify a value, up to 8 physical channels are
+                configured at the same time.
+        Returns:
+            List[nidaqmx.types.TEDSInfo]:
+
+            Indicates the TEDS associated with each physical channel.
+        """
+        names = [_get_channel_name(p) for p in physical_channels]
+        if not names:
+            return []
+        if max_workers is None:
+            max_workers = min(8, len(names))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self._configure_channel, n)
+                       for n in names]
+            try:
+                return [f.result() for f in futures]
+            finally:
+                with self._lock:
+                    self._save()
+
+    def _configure_channel(self, name):
+        teds_info = self.get_channel_sensor(name)
+        if teds_info is None:
+            return self._read_channel(name)
+
+        file_path = self.get_file_path(teds_info)
+        if not os.path.isfile(file_path):
+            write_teds_file(file_path, teds_info.bit_stream)
+        PhysicalChannel(name).configure_teds(file_path)
+        return teds_info
+
+    def _read_channel(self, physical_channel):
+        name = _get_channel_name(physical_channel)
+        channel = PhysicalChannel(name)
+        channel.configure_teds()
+        teds_info = parse_teds_bit_stream(channel.teds_bit_stream)
+        self._add(teds_info, name)
+        return teds_info
+
+    def _add(self, teds_info, physical_channel):
+        with self._lock:
+            key = _get_key(teds_info)
+            teds_info = teds_info._replace(
+                template_ids=tuple(teds_info.template_ids),
+                bit_stream=tuple(teds_info.bit_stream))
+            if self._sensors.get(key) != teds_info:
+                write_teds_file(
+                    self.get_file_path(teds_info), teds_info.bit_stream)
+                self._sensors[key] = teds_info
+            if physical_channel is not None:
+                self._channels[_get_channel_name(physical_channel)] = key
+
+    def _load(self):
+        with io.open(self._index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for key, sensor in six.iteritems(data['sensors']):
+            self._sensors[key] = TEDSInfo(
+                mfg_id=sensor['mfg_id'], model_num=sensor['model_num'],
+                version_letter=sensor['version_letter'],
+                version_num=sensor['version_num'],
+                serial_num=sensor['serial_num'],
+                template_ids=tuple(sensor['template_ids']),
+                bit_stream=tuple(bytearray(
+                    binascii.unhexlify(sensor['bit_stream']))))
+        self._channels = dict(
+            (c, k) for c, k in six.iteritems(data['channels'])
+            if k in self._sensors)
+
+    def _save(self):
+        sensors = {}
+        for key, teds_info in six.iteritems(self._sensors):
+            sensor = teds_info._asdict()
+            sensor['template_ids'] = list(teds_info.template_ids)
+            sensor['bit_stream'] = binascii.hexlify(
+                bytearray(teds_info.bit_stream)).decode('ascii')
+            sensors[key] = sensor
+
+        data = six.text_type(json.dumps(
+            {'sensors': sensors, 'channels': self._channels},
+            indent=4, sort_keys=True))
+        _write_text_file(self._index_path, data)
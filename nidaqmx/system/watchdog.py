@@ -11,10 +11,14 @@ import warnings
 from nidaqmx._lib import lib_importer, wrapped_ndpointer, ctypes_byte_str
 from nidaqmx.errors import (
     check_for_error, is_string_buffer_too_small, is_array_buffer_too_small,
-    DaqResourceWarning)
+    DaqError, DaqResourceWarning)
+from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.system._watchdog_modules.expiration_state import ExpirationState
+from nidaqmx.system._watchdog_modules.expiration_state_map import (
+    expand_expiration_map, verify_expiration_states)
 from nidaqmx.system._watchdog_modules.expiration_states_collection import (
     ExpirationStatesCollection)
+from nidaqmx.system._watchdog_modules.watchdog_keeper import WatchdogKeeper
 from nidaqmx.utils import flatten_channel_string
 from nidaqmx.constants import (
     Edge, TriggerType, WDTTaskAction)
@@ -68,6 +72,7 @@ class WatchdogTask(object):
         # double closes.
         self._saved_name = self.name
         self._expiration_states = ExpirationStatesCollection(self._handle)
+        self._keeper = None
 
     def __del__(self):
         if self._handle is not None:
@@ -91,6 +96,17 @@ class WatchdogTask(object):
         """
         return self._expiration_states
 
+    @property
+    def keeper(self):
+        """
+        nidaqmx.system._watchdog_modules.watchdog_keeper.WatchdogKeeper:
+            Indicates the keeper that resets the timer of this task, or
+            None if no keeper is running.
+        """
+        if self._keeper is not None and self._keeper.is_running:
+            return self._keeper
+        return None
+
     @property
     def expir_trig_dig_edge_edge(self):
         """
@@ -497,6 +513,66 @@ class WatchdogTask(object):
         return [ExpirationState(self._handle, e.physical_channel)
                 for e in expiration_states]
 
+    def cfg_watchdog_expir_states_from_map(self, expiration_map, verify=True):
+        """
+        Configures the expiration states of many physical channels from a
+        map of physical channel patterns to expiration states, with one
+        configuration call per channel type.
+
+        Args:
+            expiration_map (dict): Specifies the expiration states by
+                physical channel pattern. You can also specify a list of
+                (pattern, state) pairs. A pattern is a list or range of
+                physical channels, such as "Dev1/port0/line0:31", and can
+                contain the wildcards "*", "?" and "[...]" after the
+                device name, such as "Dev1/port*/line*". If several
+                patterns match a physical channel, the last one applies.
+                The state determines the channel type:
+
+                - :class:`nidaqmx.constants.Level`: Specifies the state
+                  of digital lines or ports.
+                - :class:`nidaqmx.constants.WatchdogCOExpirState`:
+                  Specifies the state of counter output channels.
+                - (float, :class:`nidaqmx.constants.WatchdogAOExpirState`):
+                  Specifies the state and output type of analog output
+                  channels.
+            verify (Optional[bool]): Specifies if this method reads the
+                expiration states back after configuring them, with one
+                read per group of channels that share a state, and raises
+                a DaqError if any state differs.
+        Returns:
+            List[nidaqmx.types.AOExpirationState,
+            nidaqmx.types.COExpirationState,
+            nidaqmx.types.DOExpirationState]:
+
+            Indicates the configured expiration state of each physical
+            channel.
+        """
+        expanded = expand_expiration_map(expiration_map)
+        cfg_functions = [
+            (AOExpirationState, self.cfg_watchdog_ao_expir_states),
+            (COExpirationState, self.cfg_watchdog_co_expir_states),
+            (DOExpirationState, self.cfg_watchdog_do_expir_states)]
+
+        for kind, cfg_function in cfg_functions:
+            if expanded[kind]:
+                cfg_function(expanded[kind])
+
+        if verify:
+            mismatches = []
+            for kind, _ in cfg_functions:
+                if expanded[kind]:
+                    mismatches.extend(verify_expiration_states(
+                        self._handle, kind, expanded[kind]))
+            if mismatches:
+                raise DaqError(
+                    'Expiration states read back from the device differ '
+                    'from the configured states.\n\nStates read back: '
+                    '{0}'.format(mismatches), DAQmxErrors.UNKNOWN.value,
+                    task_name=self.name)
+
+        return [e for kind, _ in cfg_functions for e in expanded[kind]]
+
     def clear_expiration(self):
         """
         Unlock a device whose watchdog timer expired.
@@ -525,6 +601,8 @@ class WatchdogTask(object):
                 'already closed.'.format(self._saved_name), DaqResourceWarning)
             return
 
+        self._stop_keeper()
+
         cfunc = lib_importer.windll.DAQmxClearTask
         cfunc.argtypes = [
             lib_importer.task_handle]
@@ -561,6 +639,53 @@ class WatchdogTask(object):
         """
         self._control_watchdog_task(WDTTaskAction.RESET_TIMER)
 
+    def start_keeper(
+            self, reset_fraction=0.25, health_checks=None,
+            alert_callback=None, alert_margin=0.5, history_length=64):
+        """
+        Starts a thread that resets the timer of this task every time
+        **reset_fraction** of the timeout elapses, as long as every health
+        check passes. Start the task before you start the keeper.
+
+        Stopping or closing the task stops the keeper first. To reset the
+        timer from the application again, stop the keeper with
+        **keeper.stop()**, which resets the timer one last time.
+
+        Args:
+            reset_fraction (Optional[float]): Specifies the fraction of
+                the timeout that elapses between resets.
+            health_checks (Optional[List[function]]): Specifies the
+                functions the keeper calls before each reset, such as a
+                check that the acquisition loop made progress recently.
+                Each function takes no arguments and returns True if the
+                application is healthy. The keeper skips the reset if any
+                function returns False or raises an exception, which lets
+                the watchdog timer expire.
+            alert_callback (Optional[function]): Specifies the function
+                the keeper calls with a :class:`nidaqmx.types.WatchdogAlert`
+                when a reset is skipped, fails, or leaves less than
+                **alert_margin** of the timeout.
+            alert_margin (Optional[float]): Specifies the fraction of the
+                timeout below which the margin left by a reset raises an
+                alert.
+            history_length (Optional[int]): Specifies the number of recent
+                resets the keeper records.
+        Returns:
+            nidaqmx.system._watchdog_modules.watchdog_keeper.WatchdogKeeper:
+
+            Indicates the keeper.
+        """
+        if self.keeper is not None:
+            raise DaqError(
+                'A keeper is already resetting the timer of this watchdog '
+                'task.', DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+        self._keeper = WatchdogKeeper(
+            self, self.timeout, reset_fraction=reset_fraction,
+            health_checks=health_checks, alert_callback=alert_callback,
+            alert_margin=alert_margin, history_length=history_length)
+        return self._keeper
+
     def start(self):
         """
         Transitions the task to the running state to begin the measurement
@@ -578,8 +703,15 @@ class WatchdogTask(object):
         Stops the task and returns it to the state the task was in before the
         DAQmx Start Task method ran.
         """
+        self._stop_keeper()
+
         cfunc = lib_importer.windll.DAQmxStopTask
         cfunc.argtypes = [lib_importer.task_handle]
 
         error_code = cfunc(self._handle)
         check_for_error(error_code)
+
+    def _stop_keeper(self):
+        if self._keeper is not None:
+            self._keeper.stop(final_reset=False)
+            self._keeper = None
@@ -3,13 +3,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import concurrent.futures
 import ctypes
 import numpy
 import six
+import threading
 import warnings
 
 from nidaqmx._lib import lib_importer, ctypes_byte_str, c_bool32
+from nidaqmx._task_modules.channels import AIChannel, CIChannel, DIChannel
 from nidaqmx._task_modules.channels.channel import Channel
+from nidaqmx._task_modules.events import EventHub
 from nidaqmx._task_modules.export_signals import ExportSignals
 from nidaqmx._task_modules.in_stream import InStream
 from nidaqmx._task_modules.read_functions import (
@@ -19,6 +24,7 @@ from nidaqmx._task_modules.read_functions import (
 from nidaqmx._task_modules.timing import Timing
 from nidaqmx._task_modules.triggers import Triggers
 from nidaqmx._task_modules.out_stream import OutStream
+from nidaqmx._task_modules.property_manifest import get_property_manifest
 from nidaqmx._task_modules.ai_channel_collection import (
     AIChannelCollection)
 from nidaqmx._task_modules.ao_channel_collection import (
@@ -39,12 +45,13 @@ from nidaqmx.constants import (
     READ_ALL_AVAILABLE, UsageTypeCO, _Save)
 from nidaqmx.error_codes import DAQmxErrors
 from nidaqmx.errors import (
-    check_for_error, is_string_buffer_too_small, DaqError, DaqResourceWarning)
+    check_for_error, get_error_string, is_string_buffer_too_small, DaqError,
+    DaqResourceWarning)
 from nidaqmx.system.device import Device
-from nidaqmx.types import CtrFreq, CtrTick, CtrTime
+from nidaqmx.types import ConfigChange, CtrFreq, CtrTick, CtrTime
 from nidaqmx.utils import unflatten_channel_string, flatten_channel_string
 
-__all__ = ['Task']
+__all__ = ['Task', 'TaskDoneFuture', 'as_completed']
 
 
 class UnsetNumSamplesSentinel(object):
@@ -58,9 +65,39 @@ class UnsetAutoStartSentinel(object):
 NUM_SAMPLES_UNSET = UnsetNumSamplesSentinel()
 AUTO_START_UNSET = UnsetAutoStartSentinel()
 
+# Sections of the configuration Task.snapshot() can read, in the order
+# Task.apply_config() writes them: timing determines the valid buffer
+# sizes, for example.
+SNAPSHOT_SECTIONS = (
+    'channels', 'export_signals', 'in_stream', 'out_stream', 'timing',
+    'triggers')
+_APPLY_ORDER = (
+    'channels', 'timing', 'triggers', 'export_signals', 'in_stream',
+    'out_stream')
+_TRIGGER_NAMES = (
+    'arm_start_trigger', 'handshake_trigger', 'pause_trigger',
+    'reference_trigger', 'start_trigger')
+
+# Marks properties whose value is not in the configuration cache.
+_UNKNOWN_VALUE = object()
+
 del UnsetNumSamplesSentinel
 del UnsetAutoStartSentinel
 
+_WriteChannelLayout = collections.namedtuple(
+    '_WriteChannelLayout',
+    ['number_of_channels', 'chan_type', 'do_num_booleans_per_chan',
+     'co_output_type'])
+
+
+def _require_write_array(data, dtype):
+    """
+    Converts data to a C-contiguous, writeable NumPy array of the
+    specified dtype, as required by the DAQmx Write functions. The data is
+    copied only if it does not already meet these requirements.
+    """
+    return numpy.require(data, dtype=dtype, requirements=['C', 'W'])
+
 
 class Task(object):
     """
@@ -156,6 +193,7 @@ class Task(object):
             a channel object that represents the entire list of virtual 
             channels in this task.
         """
+        self._config_shadow.clear()
         return Channel._factory(
             self._handle, flatten_channel_string(self.channel_names))
 
@@ -259,6 +297,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.ai_channel_collection.AIChannelCollection`:
             Gets the collection of analog input channels for this task.
         """
+        self._config_shadow.clear()
         return self._ai_channels
 
     @property
@@ -267,6 +306,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.ao_channel_collection.AOChannelCollection`: 
             Gets the collection of analog output channels for this task.
         """
+        self._config_shadow.clear()
         return self._ao_channels
 
     @property
@@ -275,6 +315,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.ci_channel_collection.CIChannelCollection`: 
             Gets the collection of counter input channels for this task.
         """
+        self._config_shadow.clear()
         return self._ci_channels
 
     @property
@@ -283,6 +324,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.co_channel_collection.COChannelCollection`: 
             Gets the collection of counter output channels for this task.
         """
+        self._config_shadow.clear()
         return self._co_channels
 
     @property
@@ -291,6 +333,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.di_channel_collection.DIChannelCollection`: 
             Gets the collection of digital input channels for this task.
         """
+        self._config_shadow.clear()
         return self._di_channels
 
     @property
@@ -299,14 +342,25 @@ class Task(object):
         :class:`nidaqmx._task_modules.do_channel_collection.DOChannelCollection`: 
             Gets the collection of digital output channels for this task.
         """
+        self._config_shadow.clear()
         return self._do_channels
 
+    @property
+    def events(self):
+        """
+        :class:`nidaqmx._task_modules.events.EventHub`: Gets the event hub
+            that dispatches the events of the task to any number of
+            callbacks.
+        """
+        return self._events
+
     @property
     def export_signals(self):
         """
         :class:`nidaqmx._task_modules.export_signals.ExportSignals`: Gets the 
             exported signal configurations for the task.
         """
+        self._config_shadow.clear()
         return self._export_signals
 
     @property
@@ -315,6 +369,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.in_stream.InStream`: Gets the read 
             configurations for the task.
         """
+        self._config_shadow.clear()
         return self._in_stream
 
     @property
@@ -323,6 +378,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.out_stream.OutStream`: Gets the
             write configurations for the task.
         """
+        self._config_shadow.clear()
         return self._out_stream
 
     @property
@@ -331,6 +387,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.timing.Timing`: Gets the timing 
             configurations for the task.
         """
+        self._config_shadow.clear()
         return self._timing
 
     @property
@@ -339,6 +396,7 @@ class Task(object):
         :class:`nidaqmx._task_modules.triggers.Triggers`: Gets the trigger
             configurations for the task.
         """
+        self._config_shadow.clear()
         return self._triggers
 
     def _initialize(self, task_handle):
@@ -358,19 +416,128 @@ class Task(object):
         self._co_channels = COChannelCollection(task_handle)
         self._di_channels = DIChannelCollection(task_handle)
         self._do_channels = DOChannelCollection(task_handle)
+        self._events = EventHub(self)
         self._export_signals = ExportSignals(task_handle)
         self._in_stream = InStream(self)
         self._timing = Timing(task_handle)
         self._triggers = Triggers(task_handle)
         self._out_stream = OutStream(self)
 
-        # These lists keep C callback objects in memory as ctypes doesn't.
+        # This dict keeps the registered C callback object of each event, and
+        # of each signal type of signal events, in memory as ctypes doesn't.
         # Program will crash if callback is made after object is garbage
         # collected.
-        self._done_event_callbacks = []
-        self._every_n_transferred_event_callbacks = []
-        self._every_n_acquired_event_callbacks = []
-        self._signal_event_callbacks = []
+        self._event_callbacks = {}
+
+        # Futures returned by done_future() that are waiting for the Done
+        # event, and the event hub subscription that resolves them.
+        self._done_futures = []
+        self._done_futures_lock = threading.Lock()
+        self._done_futures_subscription = None
+
+        # Last known value of each property written by apply_config() or
+        # read by snapshot(), keyed by section, object name and property.
+        # The channels, timing, triggers, exported signals and streams can
+        # be configured through the objects the public attributes return,
+        # so getting any of them, controlling the task or adding channels
+        # clears it.
+        self._config_shadow = {}
+        self._config_channels = {}
+
+        # Channels cannot be removed from a task, so the layout of the
+        # channels to write only changes when the number of channels does.
+        self._write_channel_layout = None
+
+    def _get_write_channel_layout(self):
+        """
+        Gets the number and type of the channels in this task, as used to
+        validate data to write. The layout is cached and queried again
+        only if the number of channels in the task changed.
+        """
+        number_of_channels = self.number_of_channels
+
+        layout = self._write_channel_layout
+        if (layout is not None and
+                layout.number_of_channels == number_of_channels):
+            return layout
+
+        chan_type = None
+        do_num_booleans_per_chan = None
+        co_output_type = None
+
+        if number_of_channels > 0:
+            channels = self.channels
+            chan_type = channels.chan_type
+
+            if chan_type == ChannelType.DIGITAL_OUTPUT:
+                do_num_booleans_per_chan = (
+                    self._out_stream.do_num_booleans_per_chan)
+            elif chan_type == ChannelType.COUNTER_OUTPUT:
+                co_output_type = channels.co_output_type
+
+        layout = _WriteChannelLayout(
+            number_of_channels, chan_type, do_num_booleans_per_chan,
+            co_output_type)
+        self._write_channel_layout = layout
+        return layout
+
+    def _unpack_counter_samples(self, data, sample_type, dtype):
+        """
+        Splits counter output samples into one NumPy array per field of
+        the sample type, as required by the DAQmx Write Counter functions.
+
+        Args:
+            data: Specifies a sample type object, a list or list of lists
+                of sample type objects, or a structured NumPy array that
+                has a field for each field of the sample type.
+            sample_type: Specifies the nidaqmx.types namedtuple that
+                describes the samples.
+            dtype: Specifies the NumPy data type of the arrays to create.
+        Returns:
+            List[numpy.ndarray]:
+
+            Contains one flattened, C-contiguous array per field of the
+            sample type.
+        """
+        field_names = sample_type._fields
+
+        if isinstance(data, numpy.ndarray) and data.dtype.names is not None:
+            missing_fields = [
+                f for f in field_names if f not in data.dtype.names]
+            if missing_fields:
+                raise DaqError(
+                    'Write failed, because the structured NumPy array does '
+                    'not contain the fields required by the counter output '
+                    'type of the task.\n\n'
+                    'Required fields: {0}\n'
+                    'Fields in data: {1}'
+                    .format(', '.join(field_names),
+                            ', '.join(data.dtype.names)),
+                    DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+            return [_require_write_array(data[f], dtype).reshape(-1)
+                    for f in field_names]
+
+        element = data
+        while isinstance(element, list) and element:
+            element = element[0]
+
+        if not isinstance(element, sample_type):
+            raise DaqError(
+                'Write failed, because this write method only accepts {0} '
+                'samples or a structured NumPy array with the fields {1} '
+                'for the counter output type of the task.\n\n'
+                'Requested sample type: {2}'
+                .format(sample_type.__name__, ', '.join(field_names),
+                        type(element)),
+                DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+        # Converting the whole list at once builds a single array whose
+        # last axis holds the fields of each sample.
+        samples = numpy.asarray(data, dtype=dtype)
+
+        return [_require_write_array(samples[..., i], dtype).reshape(-1)
+                for i in range(len(field_names))]
 
     def _calculate_num_samps_per_chan(self, num_samps_per_chan):
         """
@@ -388,13 +555,13 @@ class Task(object):
         if num_samps_per_chan is NUM_SAMPLES_UNSET:
             return 1
         elif num_samps_per_chan == READ_ALL_AVAILABLE:
-            acq_type = self.timing.samp_quant_samp_mode
+            acq_type = self._timing.samp_quant_samp_mode
 
             if (acq_type == AcquisitionType.FINITE and
-                    not self.in_stream.read_all_avail_samp):
-                return self.timing.samp_quant_samp_per_chan
+                    not self._in_stream.read_all_avail_samp):
+                return self._timing.samp_quant_samp_per_chan
             else:
-                return self.in_stream.avail_samp_per_chan
+                return self._in_stream.avail_samp_per_chan
         else:
             return num_samps_per_chan
 
@@ -414,12 +581,87 @@ class Task(object):
         cfunc.argtypes = [
             lib_importer.task_handle, ctypes_byte_str]
 
+        self._config_shadow.clear()
+
         channels = flatten_channel_string([g._name for g in global_channels])
 
         error_code = cfunc(
             self._handle, channels)
         check_for_error(error_code)
 
+    def apply_config(self, config, dry_run=False, use_cache=True):
+        """
+        Sets the properties of the task, its channels, timing, triggers,
+        exported signals and streams to the values you specify, skipping
+        the properties that already have those values.
+
+        Setting a property can invalidate the verified or committed state
+        of the task, so avoiding redundant writes avoids reverifying and
+        recommitting the task. This method compares each value against
+        the value last written by this method or read by
+        :py:meth:`nidaqmx.task.Task.snapshot`, and reads properties it has
+        no value for. Getting the channels, timing, triggers, exported
+        signals or streams of the task, controlling the task or adding
+        channels to it discards these values, as the configuration may
+        have changed; set **use_cache** to False if you change the task
+        through objects you got earlier.
+
+        Properties are written section by section: channels, timing,
+        triggers, exported signals, then streams. Within each channel or
+        section, properties that select a type, mode, source or units are
+        written first and ranges last.
+
+        Args:
+            config (dict): Specifies the values to set, in the layout
+                :py:meth:`nidaqmx.task.Task.snapshot` returns. Enum-valued
+                properties accept the enum member or its name; properties
+                that take a physical channel, channel or scale accept its
+                name. Read-only properties, such as those a snapshot
+                includes, are ignored.
+            dry_run (Optional[bool]): Specifies if this method only
+                reports the properties it would set.
+            use_cache (Optional[bool]): Specifies if this method compares
+                values against the values it last wrote or read. If you
+                set this input to False, this method reads every property
+                from NI-DAQmx before deciding whether to set it.
+        Returns:
+            List[nidaqmx.types.ConfigChange]:
+
+            Indicates the properties set, or that would be set if
+            **dry_run** is True, in the order they were set.
+        """
+        changes = []
+        for section, object_name, obj, descriptor, value in (
+                self._get_config_writes(config)):
+            key = (section, object_name, descriptor.name)
+            current = _UNKNOWN_VALUE
+            if use_cache:
+                current = self._config_shadow.get(key, _UNKNOWN_VALUE)
+            if current is _UNKNOWN_VALUE:
+                try:
+                    current = descriptor.to_plain_value(
+                        getattr(obj, descriptor.name))
+                except DaqError:
+                    current = None
+
+            if current == value:
+                self._config_shadow[key] = value
+                continue
+
+            changes.append(ConfigChange(
+                section=section, object=object_name,
+                property=descriptor.name, old_value=current,
+                new_value=value))
+            if dry_run:
+                continue
+
+            self._config_shadow.pop(key, None)
+            setattr(obj, descriptor.name,
+                    descriptor.to_setter_value(value, self._handle))
+            self._config_shadow[key] = value
+
+        return changes
+
     def close(self):
         """
         Clears the task.
@@ -438,6 +680,8 @@ class Task(object):
                 'already closed.'.format(self._saved_name), DaqResourceWarning)
             return
 
+        done_status = self._get_done_status()
+
         cfunc = lib_importer.windll.DAQmxClearTask
         cfunc.argtypes = [
             lib_importer.task_handle]
@@ -448,6 +692,11 @@ class Task(object):
 
         self._handle = None
 
+        # Clearing the task unregisters its events; stop the worker thread
+        # of the event hub, if any, after it dispatches the queued events.
+        self._events.close()
+        self._settle_done_futures(done_status)
+
     def control(self, action):
         """
         Alters the state of a task according to the action you specify.
@@ -460,10 +709,43 @@ class Task(object):
         cfunc.argtypes = [
             lib_importer.task_handle, ctypes.c_int]
 
+        self._config_shadow.clear()
+
         error_code = cfunc(
             self._handle, action.value)
         check_for_error(error_code)
 
+    def done_future(self):
+        """
+        Returns a future that resolves when the Done event of the task
+        occurs, that is, when a finite acquisition or generation completes
+        or when the task stops due to an error.
+
+        Call this method before you start the task; NI-DAQmx does not
+        allow registering the Done event while the task runs. The future
+        resolves with the status of the task, which is 0 or a warning
+        code. If the task stops due to an error, the future raises the
+        corresponding DaqError instead. If you stop or clear the task
+        before it completes, the future is cancelled.
+
+        Unlike the register_done_event method, this method subscribes to
+        the event through the event hub of the task, so you can use it
+        with other callbacks subscribed through
+        :py:attr:`nidaqmx.task.Task.events`.
+
+        Returns:
+            nidaqmx.task.TaskDoneFuture:
+
+            Indicates the future that resolves when the task is done.
+        """
+        future = TaskDoneFuture(self)
+        with self._done_futures_lock:
+            if self._done_futures_subscription is None:
+                self._done_futures_subscription = (
+                    self._events.subscribe_done(self._resolve_done_futures))
+            self._done_futures.append(future)
+        return future
+
     def is_task_done(self):
         """
         Queries the status of the task and indicates if it completed
@@ -568,7 +850,7 @@ class Task(object):
             >>> type(data[0])
             <type 'float'>
         """
-        channels_to_read = self.in_stream.channels_to_read
+        channels_to_read = self._in_stream.channels_to_read
         number_of_channels = len(channels_to_read.channel_names)
         read_chan_type = channels_to_read.chan_type
 
@@ -597,7 +879,7 @@ class Task(object):
         # Digital Input or Digital Output
         elif (read_chan_type == ChannelType.DIGITAL_INPUT or
                 read_chan_type == ChannelType.DIGITAL_OUTPUT):
-            if self.in_stream.di_num_booleans_per_chan == 1:
+            if self._in_stream.di_num_booleans_per_chan == 1:
                 data = numpy.zeros(array_shape, dtype=numpy.bool)
                 samples_read = _read_digital_lines(
                     self._handle, data, number_of_samples_per_channel, timeout
@@ -619,9 +901,8 @@ class Task(object):
                     self._handle, frequencies, duty_cycles,
                     number_of_samples_per_channel, timeout)
 
-                data = []
-                for f, d in zip(frequencies, duty_cycles):
-                    data.append(CtrFreq(freq=f, duty_cycle=d))
+                data = list(map(CtrFreq._make, zip(
+                    frequencies.tolist(), duty_cycles.tolist())))
 
             elif meas_type == UsageTypeCI.PULSE_TIME:
                 high_times = numpy.zeros(array_shape, dtype=numpy.float64)
@@ -630,9 +911,8 @@ class Task(object):
                 samples_read = _read_ctr_time(
                     self._handle, high_times, low_times,
                     number_of_samples_per_channel, timeout)
-                data = []
-                for h, l in zip(high_times, low_times):
-                    data.append(CtrTime(high_time=h, low_time=l))
+                data = list(map(CtrTime._make, zip(
+                    high_times.tolist(), low_times.tolist())))
 
             elif meas_type == UsageTypeCI.PULSE_TICKS:
                 high_ticks = numpy.zeros(array_shape, dtype=numpy.uint32)
@@ -641,9 +921,8 @@ class Task(object):
                 samples_read = _read_ctr_ticks(
                     self._handle, high_ticks, low_ticks,
                     number_of_samples_per_channel, timeout)
-                data = []
-                for h, l in zip(high_ticks, low_ticks):
-                    data.append(CtrTick(high_tick=h, low_tick=l))
+                data = list(map(CtrTick._make, zip(
+                    high_ticks.tolist(), low_ticks.tolist())))
 
             elif meas_type == UsageTypeCI.COUNT_EDGES:
                 data = numpy.zeros(array_shape, dtype=numpy.uint32)
@@ -719,9 +998,8 @@ class Task(object):
 
         if callback_method is not None:
             callback_method_ptr = DAQmxDoneEventCallbackPtr(callback_method)
-            self._done_event_callbacks.append(callback_method_ptr)
         else:
-            del self._done_event_callbacks[:]
+            callback_method_ptr = None
 
         cfunc = lib_importer.windll.DAQmxRegisterDoneEvent
         cfunc.argtypes = [
@@ -732,6 +1010,8 @@ class Task(object):
             self._handle, 0, callback_method_ptr, None)
         check_for_error(error_code)
 
+        self._event_callbacks['done'] = callback_method_ptr
+
     def register_every_n_samples_acquired_into_buffer_event(
             self, sample_interval, callback_method):
         """
@@ -773,10 +1053,8 @@ class Task(object):
         if callback_method is not None:
             callback_method_ptr = DAQmxEveryNSamplesEventCallbackPtr(
                 callback_method)
-            self._every_n_acquired_event_callbacks.append(
-                callback_method_ptr)
         else:
-            del self._every_n_acquired_event_callbacks[:]
+            callback_method_ptr = None
 
         cfunc = lib_importer.windll.DAQmxRegisterEveryNSamplesEvent
         cfunc.argtypes = [
@@ -788,6 +1066,8 @@ class Task(object):
             sample_interval, 0, callback_method_ptr, None)
         check_for_error(error_code)
 
+        self._event_callbacks['every_n_acquired'] = callback_method_ptr
+
     def register_every_n_samples_transferred_from_buffer_event(
             self, sample_interval, callback_method):
         """
@@ -829,10 +1109,8 @@ class Task(object):
         if callback_method is not None:
             callback_method_ptr = DAQmxEveryNSamplesEventCallbackPtr(
                 callback_method)
-            self._every_n_transferred_event_callbacks.append(
-                callback_method_ptr)
         else:
-            del self._every_n_transferred_event_callbacks[:]
+            callback_method_ptr = None
 
         cfunc = lib_importer.windll.DAQmxRegisterEveryNSamplesEvent
         cfunc.argtypes = [
@@ -845,6 +1123,8 @@ class Task(object):
             sample_interval, 0, callback_method_ptr, None)
         check_for_error(error_code)
 
+        self._event_callbacks['every_n_transferred'] = callback_method_ptr
+
     def register_signal_event(self, signal_type, callback_method):
         """
         Registers a callback function to receive an event when the specified
@@ -880,11 +1160,10 @@ class Task(object):
 
         if callback_method is not None:
             callback_method_ptr = DAQmxSignalEventCallbackPtr(callback_method)
-            self._signal_event_callbacks.append(callback_method_ptr)
         else:
-            del self._signal_event_callbacks[:]
+            callback_method_ptr = None
 
-        cfunc = lib_importer.daqlib.DAQmxRegisterSignalEvent
+        cfunc = lib_importer.windll.DAQmxRegisterSignalEvent
         cfunc.argtypes = [
             lib_importer.task_handle, ctypes.c_int, ctypes.c_uint,
             DAQmxSignalEventCallbackPtr, ctypes.c_void_p]
@@ -893,6 +1172,10 @@ class Task(object):
             self._handle, signal_type.value, 0, callback_method_ptr, None)
         check_for_error(error_code)
 
+        # Each signal type is registered separately, so keep the callback
+        # of every signal type.
+        self._event_callbacks[('signal', signal_type)] = callback_method_ptr
+
     def save(self, save_as="", author="", overwrite_existing_task=False,
              allow_interactive_editing=True, allow_interactive_deletion=True):
         """
@@ -937,8 +1220,99 @@ class Task(object):
 
         error_code = cfunc(
             self._handle, save_as, author, options)
+        from nidaqmx.system._persisted_index import persisted_task_index
+        persisted_task_index.invalidate()
         check_for_error(error_code)
 
+    def snapshot(self, include=None, max_workers=None):
+        """
+        Reads the configuration of the task, its channels, timing,
+        triggers, exported signals and streams into a nested dictionary.
+
+        The properties to read come from a manifest built once per class.
+        Properties that apply only to other measurement or output types
+        are skipped without calling NI-DAQmx, as are properties NI-DAQmx
+        reported as not applicable to the same measurement type and
+        devices during an earlier snapshot. Properties that cannot be
+        read in the current state of the task are left out.
+
+        Args:
+            include (Optional[List[str]]): Specifies the sections to read:
+                "channels", "export_signals", "in_stream", "out_stream",
+                "timing" and "triggers". If you do not specify a value,
+                this method reads every section that applies to the task.
+            max_workers (Optional[int]): Specifies the number of threads
+                to read the properties of channels and sections on
+                concurrently. If you do not specify a value, this method
+                reads on the calling thread.
+        Returns:
+            dict:
+
+            Indicates the configuration, keyed by section. Sections
+            that do not apply to the task, such as "out_stream" for an
+            input task, are left out. The "channels" section is keyed by
+            virtual channel name and the "triggers" section by trigger
+            type. Each property is keyed by its name in this API.
+            Physical channels, channels and scales are represented by
+            name.
+        """
+        if include is None:
+            include = SNAPSHOT_SECTIONS
+        else:
+            include = list(include)
+            self._check_config_sections(include)
+
+        devices = tuple(sorted(d.product_type for d in self.devices))
+        channels = [
+            Channel._factory(self._handle, name)
+            for name in self.channel_names]
+        has_input = any(
+            isinstance(c, (AIChannel, CIChannel, DIChannel))
+            for c in channels)
+
+        # Each job reads one object into the dictionary at its path.
+        jobs = []
+        if 'channels' in include:
+            jobs.extend((('channels', c.name), c) for c in channels)
+        if 'export_signals' in include:
+            jobs.append((('export_signals',), self._export_signals))
+        if 'in_stream' in include and channels and has_input:
+            jobs.append((('in_stream',), self._in_stream))
+        if 'out_stream' in include and channels and not has_input:
+            jobs.append((('out_stream',), self._out_stream))
+        if 'timing' in include:
+            jobs.append((('timing',), self._timing))
+        if 'triggers' in include:
+            jobs.append((('triggers',), self._triggers))
+            for trigger_name in _TRIGGER_NAMES:
+                jobs.append((
+                    ('triggers', trigger_name),
+                    getattr(self._triggers, trigger_name)))
+
+        def read_job(job):
+            obj = job[1]
+            return get_property_manifest(type(obj)).read(obj, devices)
+
+        if max_workers is None:
+            results = [read_job(job) for job in jobs]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+                results = list(pool.map(read_job, jobs))
+
+        # Sections are created by their jobs, so sections that do not
+        # apply to the task are left out.
+        snapshot = {}
+        for (path, _), values in zip(jobs, results):
+            parent = snapshot
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            parent.setdefault(path[-1], {}).update(values)
+
+            object_name = path[1] if len(path) > 1 else None
+            for name, value in six.iteritems(values):
+                self._config_shadow[(path[0], object_name, name)] = value
+        return snapshot
+
     def start(self):
         """
         Transitions the task to the running state to begin the measurement
@@ -974,12 +1348,20 @@ class Task(object):
         repeatedly. Starting and stopping a task repeatedly reduces the
         performance of the application.
         """
+        done_status = self._get_done_status()
+
         cfunc = lib_importer.windll.DAQmxStopTask
         cfunc.argtypes = [lib_importer.task_handle]
 
         error_code = cfunc(self._handle)
         check_for_error(error_code)
 
+        # NI-DAQmx does not report the Done event when a task is stopped
+        # explicitly, so futures still waiting for it never resolve. Let
+        # the event hub dispatch the events already queued first.
+        self._events._drain()
+        self._settle_done_futures(done_status)
+
     def wait_until_done(self, timeout=10.0):
         """
         Waits for the measurement or generation to complete.
@@ -1002,6 +1384,147 @@ class Task(object):
         error_code = cfunc(self._handle, timeout)
         check_for_error(error_code)
 
+    def _get_done_status(self):
+        """
+        Gets the status of the task before it is stopped or cleared, if
+        futures are waiting for its Done event. Returns 0 if the task
+        completed, the error code if it stopped due to an error, and None
+        if it did not complete or no future is waiting.
+        """
+        with self._done_futures_lock:
+            if not self._done_futures:
+                return None
+
+        try:
+            return 0 if self.is_task_done() else None
+        except DaqError as e:
+            return e.error_code
+
+    def _settle_done_futures(self, done_status):
+        """
+        Resolves the futures whose Done event was not delivered with the
+        status obtained by _get_done_status(), and cancels them if the
+        task did not complete.
+        """
+        with self._done_futures_lock:
+            futures, self._done_futures = self._done_futures, []
+        if not futures:
+            return
+
+        if done_status is not None:
+            self._resolve_futures(futures, done_status)
+            return
+
+        for future in futures:
+            # Waiters, such as as_completed(), are notified of the
+            # cancellation only by set_running_or_notify_cancel().
+            if future.cancel():
+                future.set_running_or_notify_cancel()
+
+    def _resolve_done_futures(self, event):
+        with self._done_futures_lock:
+            futures, self._done_futures = self._done_futures, []
+        if futures:
+            self._resolve_futures(futures, event.status)
+
+    def _resolve_futures(self, futures, status):
+        error = None
+        if status < 0:
+            error = DaqError(
+                get_error_string(status), status,
+                task_name=self._saved_name)
+
+        for future in futures:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(status)
+
+    def _check_config_sections(self, sections):
+        unknown = [s for s in sections if s not in SNAPSHOT_SECTIONS]
+        if unknown:
+            raise DaqError(
+                'Configuration sections are not valid.\n\n'
+                'Invalid sections: {0}\n'
+                'Valid sections: {1}'.format(
+                    ', '.join(unknown), ', '.join(SNAPSHOT_SECTIONS)),
+                DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+    def _get_config_writes(self, config):
+        """
+        Resolves the properties a configuration sets, as (section, object
+        name, object, property descriptor, value) tuples in the order to
+        set them.
+        """
+        self._check_config_sections(config)
+
+        # Resolve every property before setting any, so that an invalid
+        # name does not leave the task partially configured.
+        writes = []
+        invalid_names = []
+        object_index = 0
+        for section_index, section in enumerate(_APPLY_ORDER):
+            for object_name, obj, properties in self._get_config_targets(
+                    section, config.get(section) or {}):
+                object_index += 1
+                manifest = get_property_manifest(type(obj))
+                for property_index, (name, value) in enumerate(
+                        six.iteritems(properties)):
+                    if name not in manifest:
+                        if name != manifest.context_property:
+                            invalid_names.append('.'.join(
+                                n for n in (section, object_name, name)
+                                if n))
+                        continue
+                    descriptor = manifest[name]
+                    if not descriptor.settable:
+                        continue
+                    order = (section_index, object_index,
+                             descriptor.write_rank, property_index)
+                    writes.append((
+                        order, section, object_name, obj, descriptor,
+                        descriptor.to_plain_value(value)))
+
+        if invalid_names:
+            raise DaqError(
+                'Configuration specifies properties that do not exist.\n\n'
+                'Invalid properties: {0}'.format(', '.join(invalid_names)),
+                DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+        return [w[1:] for w in sorted(writes, key=lambda w: w[0])]
+
+    def _get_config_targets(self, section, section_config):
+        """
+        Lists the objects whose properties a section of a configuration
+        sets, as (object name, object, properties) tuples.
+        """
+        if section == 'channels':
+            targets = []
+            for name, properties in six.iteritems(section_config):
+                channel = self._config_channels.get(name)
+                if channel is None:
+                    channel = Channel._factory(self._handle, name)
+                    self._config_channels[name] = channel
+                targets.append((name, channel, properties))
+            return targets
+
+        if section == 'triggers':
+            targets = []
+            properties = {}
+            for name, value in six.iteritems(section_config):
+                if name in _TRIGGER_NAMES:
+                    targets.append(
+                        (name, getattr(self._triggers, name), value))
+                else:
+                    properties[name] = value
+            if properties:
+                targets.insert(0, (None, self._triggers, properties))
+            return targets
+
+        return [(None, getattr(self, '_' + section), section_config)]
+
     def _raise_invalid_num_lines_error(
             self, num_lines_expected, num_lines_in_data):
         raise DaqError(
@@ -1055,6 +1578,12 @@ class Task(object):
         - List of CtrFreq, CtrTime, CtrTick (from nidaqmx.types):
           Multiple samples for 1 channel or 1 sample for multiple 
           channels.
+        - Structured numpy.ndarray with the same field names as
+          CtrFreq, CtrTime or CtrTick: Multiple samples for 1 channel
+          or 1 sample for multiple channels.
+
+        NumPy arrays that already have the data type the channels
+        require are written without being copied.
 
         If the task uses on-demand timing, this method returns only
         after the device generates all samples. On-demand is the default
@@ -1097,11 +1626,10 @@ class Task(object):
             Specifies the actual number of samples this method
             successfully wrote.
         """
-        channels_to_write = self.channels
-        number_of_channels = len(channels_to_write.channel_names)
-        write_chan_type = channels_to_write.chan_type
+        layout = self._get_write_channel_layout()
+        number_of_channels = layout.number_of_channels
+        write_chan_type = layout.chan_type
 
-        element = None
         if number_of_channels == 1:
             if isinstance(data, list):
                 if isinstance(data[0], list):
@@ -1109,7 +1637,6 @@ class Task(object):
                         number_of_channels, len(data))
 
                 number_of_samples_per_channel = len(data)
-                element = data[0]
 
             elif isinstance(data, numpy.ndarray):
                 if len(data.shape) == 2:
@@ -1117,11 +1644,9 @@ class Task(object):
                         number_of_channels, data.shape[0])
 
                 number_of_samples_per_channel = len(data)
-                element = data[0]
 
             else:
                 number_of_samples_per_channel = 1
-                element = data
 
         else:
             if isinstance(data, list):
@@ -1131,10 +1656,8 @@ class Task(object):
 
                 if isinstance(data[0], list):
                     number_of_samples_per_channel = len(data[0])
-                    element = data[0][0]
                 else:
                     number_of_samples_per_channel = 1
-                    element = data[0]
 
             elif isinstance(data, numpy.ndarray):
                 if data.shape[0] != number_of_channels:
@@ -1143,10 +1666,8 @@ class Task(object):
 
                 if len(data.shape) == 2:
                     number_of_samples_per_channel = data.shape[1]
-                    element = data[0][0]
                 else:
                     number_of_samples_per_channel = 1
-                    element = data[0]
 
             else:
                 self._raise_invalid_write_num_chans_error(
@@ -1160,86 +1681,78 @@ class Task(object):
 
         # Analog Input
         if write_chan_type == ChannelType.ANALOG_OUTPUT:
-            data = numpy.asarray(data, dtype=numpy.float64)
+            data = _require_write_array(data, numpy.float64)
             return _write_analog_f_64(
                 self._handle, data, number_of_samples_per_channel, auto_start,
                 timeout)
 
         # Digital Input
         elif write_chan_type == ChannelType.DIGITAL_OUTPUT:
-            if self.out_stream.do_num_booleans_per_chan == 1:
-                if (not isinstance(element, bool) and
-                        not isinstance(element, numpy.bool_)):
+            # NumPy input is validated by its dtype and only copied if it
+            # is not already laid out as the C API requires. Lists are
+            # converted once and then validated the same way.
+            data = numpy.asarray(data)
+
+            if layout.do_num_booleans_per_chan == 1:
+                if data.dtype != numpy.bool_:
                     raise DaqError(
                         'Write failed, because this write method only accepts '
                         'boolean samples when there is one digital line per '
                         'channel in a task.\n\n'
-                        'Requested sample type: {0}'.format(type(element)),
+                        'Requested sample type: {0}'.format(data.dtype),
                         DAQmxErrors.UNKNOWN.value, task_name=self.name)
 
-                data = numpy.asarray(data, dtype=numpy.bool)
+                data = _require_write_array(data, numpy.bool_)
                 return _write_digital_lines(
                     self._handle, data, number_of_samples_per_channel,
                     auto_start, timeout)
             else:
-                if (not isinstance(element, six.integer_types) and
-                        not isinstance(element, numpy.uint32)):
+                if data.dtype.kind not in 'biu':
                     raise DaqError(
                         'Write failed, because this write method only accepts '
                         'unsigned 32-bit integer samples when there are '
                         'multiple digital lines per channel in a task.\n\n'
-                        'Requested sample type: {0}'.format(type(element)),
+                        'Requested sample type: {0}'.format(data.dtype),
                         DAQmxErrors.UNKNOWN.value, task_name=self.name)
 
-                data = numpy.asarray(data, dtype=numpy.uint32)
+                if (data.dtype != numpy.uint32 and data.size and
+                        (data.min() < 0 or data.max() > 0xFFFFFFFF)):
+                    raise DaqError(
+                        'Write failed, because this write method only accepts '
+                        'unsigned 32-bit integer samples when there are '
+                        'multiple digital lines per channel in a task.\n\n'
+                        'Requested sample range: [{0}, {1}]'
+                        .format(data.min(), data.max()),
+                        DAQmxErrors.UNKNOWN.value, task_name=self.name)
+
+                data = _require_write_array(data, numpy.uint32)
                 return _write_digital_u_32(
                     self._handle, data, number_of_samples_per_channel,
                     auto_start, timeout)
 
         # Counter Input
         elif write_chan_type == ChannelType.COUNTER_OUTPUT:
-            output_type = channels_to_write.co_output_type
-
-            if number_of_samples_per_channel == 1:
-                data = [data]
+            output_type = layout.co_output_type
 
             if output_type == UsageTypeCO.PULSE_FREQUENCY:
-                frequencies = []
-                duty_cycles = []
-                for sample in data:
-                    frequencies.append(sample.duty_cycle)
-                    duty_cycles.append(sample.freq)
-
-                frequencies = numpy.asarray(frequencies, dtype=numpy.float64)
-                duty_cycles = numpy.asarray(duty_cycles, dtype=numpy.float64)
+                frequencies, duty_cycles = self._unpack_counter_samples(
+                    data, CtrFreq, numpy.float64)
 
                 return _write_ctr_freq(
                     self._handle, frequencies, duty_cycles,
                     number_of_samples_per_channel, auto_start, timeout)
 
             elif output_type == UsageTypeCO.PULSE_TIME:
-                high_times = []
-                low_times = []
-                for sample in data:
-                    high_times.append(sample.high_time)
-                    low_times.append(sample.low_time)
-
-                high_times = numpy.asarray(high_times, dtype=numpy.float64)
-                low_times = numpy.asarray(low_times, dtype=numpy.float64)
+                high_times, low_times = self._unpack_counter_samples(
+                    data, CtrTime, numpy.float64)
 
                 return _write_ctr_time(
                     self._handle, high_times, low_times,
                     number_of_samples_per_channel, auto_start, timeout)
 
             elif output_type == UsageTypeCO.PULSE_TICKS:
-                high_ticks = []
-                low_ticks = []
-                for sample in data:
-                    high_ticks.append(sample.high_tick)
-                    low_ticks.append(sample.low_tick)
-
-                high_ticks = numpy.asarray(high_ticks, dtype=numpy.uint32)
-                low_ticks = numpy.asarray(low_ticks, dtype=numpy.uint32)
+                high_ticks, low_ticks = self._unpack_counter_samples(
+                    data, CtrTick, numpy.uint32)
 
                 return _write_ctr_ticks(
                     self._handle, high_ticks, low_ticks,
@@ -1250,3 +1763,55 @@ class Task(object):
                 'task to which data can be written.',
                 DAQmxErrors.WRITE_NO_OUTPUT_CHANS_IN_TASK.value,
                 task_name=self.name)
+
+
+class TaskDoneFuture(concurrent.futures.Future):
+    """
+    Future returned by :py:meth:`nidaqmx.task.Task.done_future`.
+
+    The future resolves with the status of the task when its Done event
+    occurs, or raises a DaqError if the task stopped due to an error.
+    """
+
+    def __init__(self, task):
+        super(TaskDoneFuture, self).__init__()
+        self._task = task
+
+    @property
+    def task(self):
+        """
+        :class:`nidaqmx.task.Task`: Indicates the task whose completion
+            the future represents.
+        """
+        return self._task
+
+
+def as_completed(tasks, timeout=None):
+    """
+    Yields a future for each of the specified tasks as the task completes,
+    without polling or dedicating a thread to each task.
+
+    Call this function before you start the tasks, or pass futures
+    returned by :py:meth:`nidaqmx.task.Task.done_future` that you
+    obtained before you started the tasks. Use the "task" property of
+    each future to identify the task that completed.
+
+    Args:
+        tasks (List[nidaqmx.task.Task or nidaqmx.task.TaskDoneFuture]):
+            Specifies the tasks, or the futures of the tasks, to wait for.
+        timeout (Optional[float]): Specifies the maximum amount of time in
+            seconds to wait for all the tasks to complete. If you do not
+            specify a value, this function waits indefinitely. If the time
+            elapses, this function raises a
+            concurrent.futures.TimeoutError.
+    Returns:
+        Iterator[nidaqmx.task.TaskDoneFuture]:
+
+        Indicates the futures of the tasks in the order in which the tasks
+        complete. Calling the "result" method of a future raises a DaqError
+        if its task stopped due to an error.
+    """
+    futures = [
+        t if isinstance(t, concurrent.futures.Future) else t.done_future()
+        for t in tasks]
+    return concurrent.futures.as_completed(futures, timeout=timeout)
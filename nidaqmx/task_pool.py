@@ -0,0 +1,317 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import contextlib
+import threading
+
+from nidaqmx.constants import TaskMode
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.types import TaskPoolMetrics
+from nidaqmx.utils import _clock
+
+__all__ = ['TaskPool']
+
+
+class TaskPool(object):
+    """
+    Keeps NI-DAQmx tasks in the committed state so that repeated finite
+    measurements or generations pay the cost of creating, configuring,
+    verifying and committing a task only once.
+
+    The pool builds tasks by calling a factory with a configuration key
+    and commits each task it builds. Use the **lease** method to borrow a
+    committed task for one run. When the task is returned, the pool stops
+    it, which returns it to the committed state, and hands it out again
+    for the next run of the same configuration.
+
+    Committed tasks keep their hardware resources reserved. When the pool
+    is full, or when committing a new task fails, the pool clears the
+    idle task that was used least recently and tries again.
+
+    The pool is a context manager; leaving the context clears every task
+    in the pool.
+    """
+
+    def __init__(self, factory, max_tasks=8, health_check=None):
+        """
+        Args:
+            factory (function): Specifies the function that builds a task
+                for a configuration key. The function receives the key and
+                returns a configured :class:`nidaqmx.task.Task` that is
+                not running. The pool commits the task.
+            max_tasks (Optional[int]): Specifies the maximum number of
+                tasks, idle or leased, the pool keeps.
+            health_check (Optional[function]): Specifies the function the
+                pool calls to check an idle task before handing it out.
+                The function receives the task and returns True if the
+                task is usable. If the function returns False or raises a
+                DaqError, the pool clears the task and builds a new one.
+                If you do not specify a value, the pool commits the task
+                again, which fails if the task or its device is no longer
+                usable and otherwise does nothing.
+        """
+        if max_tasks < 1:
+            raise DaqError(
+                'Maximum number of tasks must be greater than 0.\n\n'
+                'Maximum number of tasks: {0}'.format(max_tasks),
+                DAQmxErrors.UNKNOWN.value)
+
+        self._factory = factory
+        self._max_tasks = max_tasks
+        self._health_check = health_check
+
+        self._lock = threading.Lock()
+        # Idle tasks in order of least recent use, as (key, task) pairs
+        # keyed by the identity of the task.
+        self._idle = collections.OrderedDict()
+        self._leased = {}
+        self._closed = False
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._health_check_failures = 0
+        self._tasks_built = 0
+        self._build_time = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._idle) + len(self._leased)
+
+    def __repr__(self):
+        return 'TaskPool(max_tasks={0})'.format(self._max_tasks)
+
+    @property
+    def max_tasks(self):
+        """
+        int: Indicates the maximum number of tasks the pool keeps.
+        """
+        return self._max_tasks
+
+    @property
+    def metrics(self):
+        """
+        :class:`nidaqmx.types.TaskPoolMetrics`: Indicates how effectively
+            the pool reuses committed tasks.
+
+            **hits** is the number of leases served by an idle task and
+            **misses** the number of leases that required building a
+            task. **mean_build_time** is the mean time in seconds spent
+            building and committing a task.
+        """
+        with self._lock:
+            builds = self._tasks_built
+            return TaskPoolMetrics(
+                hits=self._hits, misses=self._misses, tasks_built=builds,
+                evictions=self._evictions,
+                health_check_failures=self._health_check_failures,
+                idle_tasks=len(self._idle), leased_tasks=len(self._leased),
+                mean_build_time=self._build_time / builds if builds else 0.0)
+
+    def acquire(self, key):
+        """
+        Hands out a committed task for the specified configuration,
+        building the task if the pool has no idle task for it. Return the
+        task with the **release** method.
+
+        Args:
+            key: Specifies the configuration key passed to the factory.
+                The key must be hashable.
+        Returns:
+            nidaqmx.task.Task:
+
+            Indicates the committed task.
+        """
+        while True:
+            with self._lock:
+                self._raise_if_closed()
+                task = self._pop_idle(key)
+                if task is None:
+                    self._misses += 1
+                    break
+                self._leased[id(task)] = (key, task)
+
+            if self._check_health(task):
+                with self._lock:
+                    self._hits += 1
+                return task
+
+            with self._lock:
+                self._health_check_failures += 1
+                self._leased.pop(id(task), None)
+            self._close_task(task)
+
+        return self._build(key)
+
+    def release(self, task, discard=False):
+        """
+        Stops a task handed out by the pool, which returns the task to the
+        committed state, and makes it available to the next lease of the
+        same configuration.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task to return.
+            discard (Optional[bool]): Specifies if the pool clears the task
+                instead of keeping it, such as after an error left the task
+                in an unknown state.
+        """
+        with self._lock:
+            entry = self._leased.pop(id(task), None)
+        if entry is None:
+            raise DaqError(
+                'The specified task was not handed out by this pool.',
+                DAQmxErrors.UNKNOWN.value, task_name=task.name)
+
+        if not discard:
+            try:
+                task.stop()
+            except DaqError:
+                discard = True
+
+        with self._lock:
+            if not discard and not self._closed:
+                self._idle[id(task)] = entry
+                return
+        self._close_task(task)
+
+    @contextlib.contextmanager
+    def lease(self, key):
+        """
+        Hands out a committed task for the specified configuration for
+        the duration of a with statement. The pool clears the task instead
+        of keeping it if the body of the statement raises an exception.
+
+        Args:
+            key: Specifies the configuration key passed to the factory.
+        Returns:
+            nidaqmx.task.Task:
+
+            Indicates the committed task.
+        """
+        task = self.acquire(key)
+        try:
+            yield task
+        except BaseException:
+            self.release(task, discard=True)
+            raise
+        self.release(task)
+
+    def prepare(self, key, number_of_tasks=1):
+        """
+        Builds and commits tasks for the specified configuration ahead of
+        time so that the next leases do not pay the cost.
+
+        Args:
+            key: Specifies the configuration key passed to the factory.
+            number_of_tasks (Optional[int]): Specifies the number of idle
+                tasks the pool keeps for the configuration.
+        """
+        with self._lock:
+            idle = sum(1 for k, _ in self._idle.values() if k == key)
+        for _ in range(number_of_tasks - idle):
+            self.release(self._build(key))
+
+    def evict(self, key=None):
+        """
+        Clears the idle tasks for the specified configuration.
+
+        Args:
+            key (Optional): Specifies the configuration key of the tasks to
+                clear. If you do not specify a value, this method clears
+                every idle task.
+        """
+        with self._lock:
+            tasks = [t for k, t in self._idle.values()
+                     if key is None or k == key]
+            for task in tasks:
+                del self._idle[id(task)]
+            self._evictions += len(tasks)
+        for task in tasks:
+            self._close_task(task)
+
+    def close(self):
+        """
+        Clears every idle task. Tasks that are leased are cleared when
+        they are returned.
+        """
+        with self._lock:
+            self._closed = True
+        self.evict()
+
+    def _raise_if_closed(self):
+        if self._closed:
+            raise DaqError(
+                'The task pool has been closed.', DAQmxErrors.UNKNOWN.value)
+
+    def _pop_idle(self, key):
+        # Hand out the most recently used task so that rarely needed
+        # duplicates age towards eviction.
+        for task_id in reversed(self._idle):
+            entry_key, task = self._idle[task_id]
+            if entry_key == key:
+                del self._idle[task_id]
+                return task
+        return None
+
+    def _pop_least_recently_used(self):
+        with self._lock:
+            if not self._idle:
+                return None
+            _, (_, task) = self._idle.popitem(last=False)
+            self._evictions += 1
+            return task
+
+    def _check_health(self, task):
+        try:
+            if self._health_check is None:
+                task.control(TaskMode.TASK_COMMIT)
+                return True
+            return bool(self._health_check(task))
+        except DaqError:
+            return False
+
+    def _build(self, key):
+        while len(self) >= self._max_tasks:
+            task = self._pop_least_recently_used()
+            if task is None:
+                raise DaqError(
+                    'Every task in the pool is leased.\n\n'
+                    'Maximum number of tasks: {0}'.format(self._max_tasks),
+                    DAQmxErrors.UNKNOWN.value)
+            self._close_task(task)
+
+        start = _clock()
+        task = self._factory(key)
+        while True:
+            try:
+                task.control(TaskMode.TASK_COMMIT)
+                break
+            except DaqError:
+                # Idle tasks may hold resources the new task needs.
+                evicted = self._pop_least_recently_used()
+                if evicted is None:
+                    self._close_task(task)
+                    raise
+                self._close_task(evicted)
+
+        with self._lock:
+            self._tasks_built += 1
+            self._build_time += _clock() - start
+            self._leased[id(task)] = (key, task)
+        return task
+
+    def _close_task(self, task):
+        try:
+            task.close()
+        except DaqError:
+            pass
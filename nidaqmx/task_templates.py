@@ -0,0 +1,609 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import copy
+import enum
+import hashlib
+import json
+import six
+import threading
+
+from nidaqmx import constants
+from nidaqmx.constants import (
+    AcquisitionType, LineGrouping, SampleTimingType, TriggerType,
+    UsageTypeAI, UsageTypeAO, UsageTypeCI, UsageTypeCO)
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.task import Task
+from nidaqmx._task_modules.channels import (
+    AIChannel, AOChannel, CIChannel, COChannel, DIChannel, DOChannel)
+from nidaqmx._task_modules.channels.channel import Channel
+from nidaqmx._task_modules.property_manifest import get_property_manifest
+from nidaqmx.utils import flatten_channel_string
+
+__all__ = ['TaskTemplate']
+
+TEMPLATE_VERSION = 1
+
+# Maximum number of compiled call plans kept in memory.
+_PLAN_CACHE_SIZE = 64
+
+# The method that creates each type of channel, keyed by measurement or
+# output type, or by channel class for digital channels.
+_CHANNEL_METHODS = {
+    UsageTypeAI.ACCELERATION_4_WIRE_DC_VOLTAGE:
+        'add_ai_accel_4_wire_dc_voltage_chan',
+    UsageTypeAI.ACCELERATION_ACCELEROMETER_CURRENT_INPUT:
+        'add_ai_accel_chan',
+    UsageTypeAI.ACCELERATION_CHARGE: 'add_ai_accel_charge_chan',
+    UsageTypeAI.BRIDGE: 'add_ai_bridge_chan',
+    UsageTypeAI.CHARGE: 'add_ai_charge_chan',
+    UsageTypeAI.CURRENT: 'add_ai_current_chan',
+    UsageTypeAI.CURRENT_ACRMS: 'add_ai_current_rms_chan',
+    UsageTypeAI.FORCE_IEPE_SENSOR: 'add_ai_force_iepe_chan',
+    UsageTypeAI.FREQUENCY_VOLTAGE: 'add_ai_freq_voltage_chan',
+    UsageTypeAI.POSITION_ANGULAR_RVDT: 'add_ai_pos_rvdt_chan',
+    UsageTypeAI.POSITION_EDDY_CURRENT_PROX_PROBE:
+        'add_ai_pos_eddy_curr_prox_probe_chan',
+    UsageTypeAI.POSITION_LINEAR_LVDT: 'add_ai_pos_lvdt_chan',
+    UsageTypeAI.RESISTANCE: 'add_ai_resistance_chan',
+    UsageTypeAI.SOUND_PRESSURE_MICROPHONE: 'add_ai_microphone_chan',
+    UsageTypeAI.STRAIN_STRAIN_GAGE: 'add_ai_strain_gage_chan',
+    UsageTypeAI.TEMPERATURE_BUILT_IN_SENSOR:
+        'add_ai_temp_built_in_sensor_chan',
+    UsageTypeAI.TEMPERATURE_RTD: 'add_ai_rtd_chan',
+    UsageTypeAI.TEMPERATURE_THERMOCOUPLE: 'add_ai_thrmcpl_chan',
+    UsageTypeAI.VELOCITY_IEPE_SENSOR: 'add_ai_velocity_iepe_chan',
+    UsageTypeAI.VOLTAGE: 'add_ai_voltage_chan',
+    UsageTypeAI.VOLTAGE_ACRMS: 'add_ai_voltage_rms_chan',
+    UsageTypeAI.VOLTAGE_CUSTOM_WITH_EXCITATION:
+        'add_ai_voltage_chan_with_excit',
+    UsageTypeAO.CURRENT: 'add_ao_current_chan',
+    UsageTypeAO.FUNCTION_GENERATION: 'add_ao_func_gen_chan',
+    UsageTypeAO.VOLTAGE: 'add_ao_voltage_chan',
+    UsageTypeCI.COUNT_EDGES: 'add_ci_count_edges_chan',
+    UsageTypeCI.DUTY_CYCLE: 'add_ci_duty_cycle_chan',
+    UsageTypeCI.FREQUENCY: 'add_ci_freq_chan',
+    UsageTypeCI.PERIOD: 'add_ci_period_chan',
+    UsageTypeCI.POSITION_ANGULAR_ENCODER: 'add_ci_ang_encoder_chan',
+    UsageTypeCI.POSITION_LINEAR_ENCODER: 'add_ci_lin_encoder_chan',
+    UsageTypeCI.PULSE_FREQ: 'add_ci_pulse_chan_freq',
+    UsageTypeCI.PULSE_TICKS: 'add_ci_pulse_chan_ticks',
+    UsageTypeCI.PULSE_TIME: 'add_ci_pulse_chan_time',
+    UsageTypeCI.PULSE_WIDTH_DIGITAL: 'add_ci_pulse_width_chan',
+    UsageTypeCI.PULSE_WIDTH_DIGITAL_SEMI_PERIOD: 'add_ci_semi_period_chan',
+    UsageTypeCI.PULSE_WIDTH_DIGITAL_TWO_EDGE_SEPARATION:
+        'add_ci_two_edge_sep_chan',
+    UsageTypeCI.TIME_GPS: 'add_ci_gps_timestamp_chan',
+    UsageTypeCI.VELOCITY_ANGULAR_ENCODER: 'add_ci_ang_velocity_chan',
+    UsageTypeCI.VELOCITY_LINEAR_ENCODER: 'add_ci_lin_velocity_chan',
+    UsageTypeCO.PULSE_FREQUENCY: 'add_co_pulse_chan_freq',
+    UsageTypeCO.PULSE_TICKS: 'add_co_pulse_chan_ticks',
+    UsageTypeCO.PULSE_TIME: 'add_co_pulse_chan_time',
+    DIChannel: 'add_di_chan',
+    DOChannel: 'add_do_chan',
+}
+
+# The channel collection of the task each channel creation method belongs
+# to, keyed by the prefix of the method name.
+_CHANNEL_COLLECTIONS = collections.OrderedDict([
+    ('add_teds_ai_', 'ai_channels'),
+    ('add_ai_', 'ai_channels'),
+    ('add_ao_', 'ao_channels'),
+    ('add_ci_', 'ci_channels'),
+    ('add_co_', 'co_channels'),
+    ('add_di_', 'di_channels'),
+    ('add_do_', 'do_channels'),
+])
+
+# Arguments that name the physical channels or lines a channel creation
+# method uses. Consecutive calls that differ only in this argument are
+# merged into one call. Lines are merged only when they are grouped one
+# channel per line, since merging lines grouped into one channel would
+# create one channel instead of several.
+_BATCHED_ARGUMENTS = ('physical_channel', 'lines')
+
+_TRIGGER_NAMES = (
+    'arm_start_trigger', 'handshake_trigger', 'pause_trigger',
+    'reference_trigger', 'start_trigger')
+
+_plan_cache = collections.OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+class _TemplatePlan(object):
+    """
+    Holds the decoded, batched and validated calls that build a task from
+    a template.
+    """
+    __slots__ = ['calls', 'properties']
+
+    def __init__(self, calls, properties):
+        # (attribute path on the task, method name, keyword arguments).
+        self.calls = calls
+        self.properties = properties
+
+
+class TaskTemplate(object):
+    """
+    Describes how to build an NI-DAQmx task without the NI-DAQmx
+    configuration storage: the calls that create its channels and
+    configure its timing and triggers, and the properties that differ
+    from the values those calls leave.
+
+    Templates convert to and from dictionaries and JSON. Create a template
+    from a configured task with **from_task**, and build tasks from it with
+    **create_task**. The calls a template makes are compiled once per
+    template content and reused for every task built from it.
+
+    The template layout is::
+
+        {
+            "version": 1,
+            "channels": [
+                {"method": "add_ai_voltage_chan",
+                 "args": {"physical_channel": "Dev1/ai0"}}],
+            "timing": [
+                {"method": "cfg_samp_clk_timing", "args": {"rate": 1000.0}}],
+            "triggers": [
+                {"trigger": "start_trigger",
+                 "method": "cfg_dig_edge_start_trig",
+                 "args": {"trigger_source": "/Dev1/PFI0"}}],
+            "properties": {"timing": {"samp_clk_dig_fltr_enable": true}}
+        }
+
+    Arguments that take enums are represented as dictionaries such as
+    ``{"enum": "Edge", "member": "FALLING"}``. Properties use the layout
+    of :py:meth:`nidaqmx.task.Task.snapshot`, with enums represented by
+    the names of their members.
+    """
+
+    def __init__(self, channels=None, timing=None, triggers=None,
+                 properties=None):
+        """
+        Args:
+            channels (Optional[List[dict]]): Specifies the calls that
+                create the channels of the task.
+            timing (Optional[List[dict]]): Specifies the calls that
+                configure the timing of the task.
+            triggers (Optional[List[dict]]): Specifies the calls that
+                configure the triggers of the task.
+            properties (Optional[dict]): Specifies the properties to set
+                after making the calls.
+        """
+        self._template = {
+            'version': TEMPLATE_VERSION,
+            'channels': _encode(list(channels or [])),
+            'timing': _encode(list(timing or [])),
+            'triggers': _encode(list(triggers or [])),
+            'properties': _encode_properties(properties or {}),
+        }
+        self._hash = None
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.hash == other.hash
+        return False
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'TaskTemplate(hash={0})'.format(self.hash)
+
+    @property
+    def hash(self):
+        """
+        str: Indicates a hash of the content of the template. Templates
+            with the same content have the same hash.
+        """
+        if self._hash is None:
+            self._hash = hashlib.sha1(
+                self.to_json(sort_keys=True).encode('utf-8')).hexdigest()
+        return self._hash
+
+    @classmethod
+    def from_dict(cls, template):
+        """
+        Creates a template from a dictionary.
+
+        Args:
+            template (dict): Specifies the template, in the layout
+                **to_dict** returns.
+        Returns:
+            nidaqmx.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        version = template.get('version', TEMPLATE_VERSION)
+        if version != TEMPLATE_VERSION:
+            raise DaqError(
+                'Task template version is not supported.\n\n'
+                'Template version: {0}\n'
+                'Supported version: {1}'.format(version, TEMPLATE_VERSION),
+                DAQmxErrors.UNKNOWN.value)
+        return cls(
+            channels=template.get('channels'), timing=template.get('timing'),
+            triggers=template.get('triggers'),
+            properties=template.get('properties'))
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Creates a template from JSON text.
+
+        Args:
+            text (str): Specifies the JSON text.
+        Returns:
+            nidaqmx.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def from_task(cls, task):
+        """
+        Creates a template that reproduces the configuration of a task.
+
+        This method derives the calls that create the channels and
+        configure the timing and triggers from the properties of the task.
+        It then builds a scratch task from those calls and compares the
+        properties of both tasks to find the properties to record. The
+        devices of the task must be present.
+
+        Args:
+            task (nidaqmx.task.Task): Specifies the task.
+        Returns:
+            nidaqmx.task_templates.TaskTemplate:
+
+            Indicates the template.
+        """
+        calls = cls(
+            channels=[_get_channel_call(task, name)
+                      for name in task.channel_names],
+            timing=_get_timing_calls(task.timing),
+            triggers=_get_trigger_calls(task.triggers))
+
+        target = task.snapshot()
+        scratch_task = calls.create_task()
+        try:
+            reference = scratch_task.snapshot(include=list(target))
+        finally:
+            scratch_task.close()
+
+        properties = {}
+        for path, obj, values in _iterate_snapshot(task, target):
+            manifest = get_property_manifest(type(obj))
+            reference_values = _get_path(reference, path)
+            changed = dict(
+                (name, value) for name, value in six.iteritems(values)
+                if name in manifest and manifest[name].settable and
+                reference_values.get(name) != value)
+            if changed:
+                _set_path(properties, path, changed)
+
+        template = calls.to_dict()
+        template['properties'] = properties
+        return cls.from_dict(template)
+
+    def create_task(self, new_task_name=''):
+        """
+        Creates a task from the template.
+
+        Args:
+            new_task_name (Optional[str]): Specifies the name to assign to
+                the task. If you do not specify a value, NI-DAQmx assigns
+                a unique name to the task.
+        Returns:
+            nidaqmx.task.Task:
+
+            Indicates the task.
+        """
+        plan = self._get_plan()
+        task = Task(new_task_name)
+        try:
+            for path, method, kwargs in plan.calls:
+                target = task
+                for attribute in path:
+                    target = getattr(target, attribute)
+                getattr(target, method)(**kwargs)
+
+            # The task is new, so every property in the template differs
+            # from its current value; set them without comparing.
+            for section, object_name, obj, descriptor, value in (
+                    task._get_config_writes(plan.properties)):
+                setattr(obj, descriptor.name,
+                        descriptor.to_setter_value(value, task._handle))
+                task._config_shadow[
+                    (section, object_name, descriptor.name)] = value
+        except BaseException:
+            task.close()
+            raise
+        return task
+
+    def to_dict(self):
+        """
+        Converts the template to a dictionary that contains only values
+        JSON can represent.
+
+        Returns:
+            dict:
+
+            Indicates the template.
+        """
+        return copy.deepcopy(self._template)
+
+    def to_json(self, **kwargs):
+        """
+        Converts the template to JSON text.
+
+        Args:
+            kwargs: Specifies keyword arguments, such as **indent**, to
+                pass to json.dumps.
+        Returns:
+            str:
+
+            Indicates the JSON text.
+        """
+        return json.dumps(self._template, **kwargs)
+
+    def _get_plan(self):
+        key = self.hash
+        with _plan_cache_lock:
+            plan = _plan_cache.get(key)
+            if plan is not None:
+                _plan_cache[key] = _plan_cache.pop(key)
+                return plan
+
+        plan = self._compile()
+        with _plan_cache_lock:
+            _plan_cache[key] = plan
+            while len(_plan_cache) > _PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+        return plan
+
+    def _compile(self):
+        calls = []
+        for call in self._template['channels']:
+            method = call['method']
+            collection = None
+            for prefix, name in six.iteritems(_CHANNEL_COLLECTIONS):
+                if method.startswith(prefix):
+                    collection = name
+                    break
+            calls.append(_compile_call(
+                (collection,) if collection else None, method,
+                call.get('args', {}), 'add_'))
+        calls = _batch_channel_calls(calls)
+
+        for call in self._template['timing']:
+            calls.append(_compile_call(
+                ('timing',), call['method'], call.get('args', {}), 'cfg_'))
+
+        for call in self._template['triggers']:
+            trigger = call.get('trigger')
+            calls.append(_compile_call(
+                ('triggers', trigger) if trigger in _TRIGGER_NAMES else None,
+                call['method'], call.get('args', {}), 'cfg_'))
+
+        return _TemplatePlan(tuple(calls), self._template['properties'])
+
+
+def _compile_call(path, method, args, method_prefix):
+    # Only configuration methods may be called, so that a template cannot
+    # start, clear or otherwise act on the task.
+    if path is None or not method.startswith(method_prefix):
+        raise DaqError(
+            'Task template specifies a method that is not a channel, '
+            'timing or trigger configuration method.\n\n'
+            'Method: {0}'.format(method), DAQmxErrors.UNKNOWN.value)
+    return (path, method, _decode(args))
+
+
+def _batch_channel_calls(calls):
+    batched = []
+    for path, method, kwargs in calls:
+        if batched:
+            previous_path, previous_method, previous_kwargs = batched[-1]
+            argument = next(
+                (a for a in _BATCHED_ARGUMENTS if a in kwargs), None)
+            if argument == 'lines' and (kwargs.get('line_grouping') !=
+                                        LineGrouping.CHAN_PER_LINE):
+                argument = None
+            if (argument is not None and method == previous_method and
+                    argument in previous_kwargs and
+                    not _get_assigned_name(kwargs) and
+                    not _get_assigned_name(previous_kwargs) and
+                    _without(kwargs, argument) ==
+                    _without(previous_kwargs, argument)):
+                merged = dict(previous_kwargs)
+                merged[argument] = flatten_channel_string(
+                    [previous_kwargs[argument], kwargs[argument]])
+                batched[-1] = (path, method, merged)
+                continue
+        batched.append((path, method, kwargs))
+    return batched
+
+
+def _get_assigned_name(kwargs):
+    return (kwargs.get('name_to_assign_to_channel') or
+            kwargs.get('name_to_assign_to_lines'))
+
+
+def _without(kwargs, argument):
+    return dict((k, v) for k, v in six.iteritems(kwargs) if k != argument)
+
+
+def _get_channel_call(task, name):
+    channel = Channel._factory(task._handle, name)
+    if isinstance(channel, (DIChannel, DOChannel)):
+        physical_channel = channel.physical_channel.name
+        number_of_lines = (
+            channel.di_num_lines if isinstance(channel, DIChannel)
+            else channel.do_num_lines)
+        return {
+            'method': _CHANNEL_METHODS[type(channel)],
+            'args': {
+                'lines': physical_channel,
+                'name_to_assign_to_lines': (
+                    '' if name == physical_channel else name),
+                'line_grouping': (
+                    LineGrouping.CHAN_PER_LINE if number_of_lines == 1
+                    else LineGrouping.CHAN_FOR_ALL_LINES)}}
+
+    usage_type = {
+        AIChannel: lambda c: c.ai_meas_type,
+        AOChannel: lambda c: c.ao_output_type,
+        CIChannel: lambda c: c.ci_meas_type,
+        COChannel: lambda c: c.co_output_type,
+    }[type(channel)](channel)
+    method = _CHANNEL_METHODS.get(usage_type)
+    if method is None:
+        raise DaqError(
+            'Task template cannot reproduce a channel of this type.\n\n'
+            'Channel: {0}\n'
+            'Type: {1}'.format(name, usage_type.name),
+            DAQmxErrors.UNKNOWN.value, task_name=task.name)
+
+    physical_channel = channel.physical_channel.name
+    args = collections.OrderedDict()
+    args['counter' if method.startswith(('add_ci_', 'add_co_')) else
+         'physical_channel'] = physical_channel
+    args['name_to_assign_to_channel'] = (
+        '' if name == physical_channel else name)
+    if method == 'add_co_pulse_chan_ticks':
+        args['source_terminal'] = channel.co_ctr_timebase_src
+    return {'method': method, 'args': args}
+
+
+def _get_timing_calls(timing):
+    if timing.samp_timing_type != SampleTimingType.SAMPLE_CLOCK:
+        return []
+    sample_mode = timing.samp_quant_samp_mode
+    args = collections.OrderedDict()
+    args['rate'] = timing.samp_clk_rate
+    args['sample_mode'] = sample_mode
+    if sample_mode != AcquisitionType.HW_TIMED_SINGLE_POINT:
+        args['samps_per_chan'] = timing.samp_quant_samp_per_chan
+    return [{'method': 'cfg_samp_clk_timing', 'args': args}]
+
+
+def _get_trigger_calls(triggers):
+    calls = []
+
+    start_trigger = triggers.start_trigger
+    trig_type = start_trigger.trig_type
+    if trig_type == TriggerType.DIGITAL_EDGE:
+        calls.append({
+            'trigger': 'start_trigger',
+            'method': 'cfg_dig_edge_start_trig',
+            'args': collections.OrderedDict([
+                ('trigger_source', start_trigger.dig_edge_src),
+                ('trigger_edge', start_trigger.dig_edge_edge)])})
+    elif trig_type == TriggerType.ANALOG_EDGE:
+        calls.append({
+            'trigger': 'start_trigger',
+            'method': 'cfg_anlg_edge_start_trig',
+            'args': collections.OrderedDict([
+                ('trigger_source', start_trigger.anlg_edge_src),
+                ('trigger_slope', start_trigger.anlg_edge_slope),
+                ('trigger_level', start_trigger.anlg_edge_lvl)])})
+
+    reference_trigger = triggers.reference_trigger
+    try:
+        trig_type = reference_trigger.trig_type
+    except DaqError:
+        # Reference triggers do not apply to output tasks.
+        trig_type = TriggerType.NONE
+    if trig_type == TriggerType.DIGITAL_EDGE:
+        calls.append({
+            'trigger': 'reference_trigger',
+            'method': 'cfg_dig_edge_ref_trig',
+            'args': collections.OrderedDict([
+                ('trigger_source', reference_trigger.dig_edge_src),
+                ('pretrigger_samples', reference_trigger.pretrig_samples),
+                ('trigger_edge', reference_trigger.dig_edge_edge)])})
+    elif trig_type == TriggerType.ANALOG_EDGE:
+        calls.append({
+            'trigger': 'reference_trigger',
+            'method': 'cfg_anlg_edge_ref_trig',
+            'args': collections.OrderedDict([
+                ('trigger_source', reference_trigger.anlg_edge_src),
+                ('pretrigger_samples', reference_trigger.pretrig_samples),
+                ('trigger_slope', reference_trigger.anlg_edge_slope),
+                ('trigger_level', reference_trigger.anlg_edge_lvl)])})
+
+    return calls
+
+
+def _iterate_snapshot(task, snapshot):
+    """
+    Yields the path, a representative object and the values of each
+    object in a snapshot.
+    """
+    for name, values in six.iteritems(snapshot.get('channels', {})):
+        yield ('channels', name), Channel._factory(task._handle, name), values
+    for section in ('export_signals', 'in_stream', 'out_stream', 'timing'):
+        if section in snapshot:
+            yield (section,), getattr(task, section), snapshot[section]
+    triggers = snapshot.get('triggers', {})
+    trigger_values = dict(
+        (n, v) for n, v in six.iteritems(triggers)
+        if n not in _TRIGGER_NAMES)
+    yield ('triggers',), task.triggers, trigger_values
+    for name in _TRIGGER_NAMES:
+        if name in triggers:
+            yield (('triggers', name), getattr(task.triggers, name),
+                   triggers[name])
+
+
+def _get_path(dictionary, path):
+    for key in path:
+        dictionary = dictionary.get(key, {})
+    return dictionary
+
+
+def _set_path(dictionary, path, value):
+    for key in path[:-1]:
+        dictionary = dictionary.setdefault(key, {})
+    dictionary[path[-1]] = value
+
+
+def _encode(value):
+    if isinstance(value, enum.Enum):
+        return {'enum': type(value).__name__, 'member': value.name}
+    if isinstance(value, dict):
+        return dict((k, _encode(v)) for k, v in six.iteritems(value))
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if set(value) == {'enum', 'member'}:
+            return getattr(constants, value['enum'])[value['member']]
+        return dict((k, _decode(v)) for k, v in six.iteritems(value))
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def _encode_properties(value):
+    # Properties represent enums by member name; Task.apply_config and
+    # the property manifest convert names back to members.
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, dict):
+        return dict(
+            (k, _encode_properties(v)) for k, v in six.iteritems(value))
+    if isinstance(value, (list, tuple)):
+        return [_encode_properties(v) for v in value]
+    return value
@@ -0,0 +1,101 @@
+import os
+
+from nidaqmx.system.cdaq_sync_topology import CDAQSyncTopology
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.types import CDAQSyncConnection
+
+
+class _FakeDevices(object):
+    device_names = []
+
+
+class _FakeSystem(object):
+    """
+    Records the cDAQ Sync calls made to it, and reports the specified
+    connections as disconnected and detected.
+    """
+
+    def __init__(self):
+        self.devices = _FakeDevices()
+        self.calls = []
+        self.disconnected = []
+        self.detected = []
+
+    def are_configured_cdaq_sync_ports_disconnected(
+            self, chassis_devices_ports='', timeout=10.0):
+        self.calls.append(('verify', chassis_devices_ports))
+        return list(self.disconnected)
+
+    def auto_configure_cdaq_sync_connections(
+            self, chassis_devices_ports='', timeout=10.0):
+        self.calls.append(('auto_configure', chassis_devices_ports))
+        return list(self.detected)
+
+    def add_cdaq_sync_connection(self, ports_to_connect):
+        self.calls.append(('add', ports_to_connect))
+
+    def remove_cdaq_sync_connection(self, ports_to_disconnect):
+        self.calls.append(('remove', ports_to_disconnect))
+
+
+class TestCDAQSyncTopology(object):
+    """
+    Contains a collection of pytest tests that validate the cDAQ Sync
+    topology cache in the NI-DAQmx Python API.
+    """
+
+    def test_fingerprint_is_stable(self, x_series_device):
+        topology = CDAQSyncTopology()
+
+        assert topology.fingerprint is None
+        assert topology.compute_fingerprint() == (
+            topology.compute_fingerprint())
+
+    def test_cache_file_round_trip(self, x_series_device, tmpdir):
+        cache_path = str(tmpdir.join('cdaq_sync.json'))
+
+        topology = CDAQSyncTopology(cache_path)
+        assert topology.apply([]) == ([], [])
+        assert topology.fingerprint == topology.compute_fingerprint()
+        assert os.path.isfile(cache_path)
+
+        reloaded = CDAQSyncTopology(cache_path)
+        assert reloaded.fingerprint == topology.fingerprint
+        assert reloaded.connections == []
+
+        # The X Series device is not in a chassis, so there is nothing to
+        # verify.
+        assert reloaded.prepare([x_series_device]) == []
+
+        reloaded.clear()
+        assert reloaded.fingerprint is None
+        assert not os.path.isfile(cache_path)
+
+    def test_prepare_rescans_only_failed_chassis(self):
+        stale = CDAQSyncConnection('cDAQ1/SyncOut0', 'cDAQ2/SyncIn0')
+        unrelated = CDAQSyncConnection('cDAQ3/SyncOut0', 'cDAQ4/SyncIn0')
+        detected = CDAQSyncConnection('cDAQ1/SyncOut0', 'cDAQ2/SyncIn1')
+
+        system = _FakeSystem()
+        topology = CDAQSyncTopology(system=system)
+        topology.apply([stale, unrelated])
+        del system.calls[:]
+
+        # Nothing is detected again while the connections verify.
+        assert topology.prepare(['cDAQ1']) == [stale, unrelated]
+        assert system.calls == [
+            ('verify', 'cDAQ1/SyncOut0,cDAQ2/SyncIn0')]
+        del system.calls[:]
+
+        system.disconnected = [stale]
+        system.detected = [detected]
+        assert topology.prepare(['cDAQ1']) == [unrelated, detected]
+
+        # Only the ports of the chassis about to run are verified, only
+        # the chassis of the failed connection are detected again, and
+        # only their connections that were not detected are removed.
+        assert system.calls == [
+            ('verify', 'cDAQ1/SyncOut0,cDAQ2/SyncIn0'),
+            ('auto_configure', 'cDAQ1, cDAQ2'),
+            ('remove', stale)]
+        assert topology.connections == [unrelated, detected]
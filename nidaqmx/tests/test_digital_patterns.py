@@ -0,0 +1,107 @@
+import numpy
+import pytest
+import random
+
+from nidaqmx.digital_patterns import DigitalPattern, DigitalPatternCompiler
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+class TestDigitalPatterns(object):
+    """
+    Contains a collection of pytest tests that validate the digital pattern
+    compiler functionality in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_compile_lines(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_samples = random.randint(100, 1000)
+        port_width = random.choice([8, 16, 32])
+        lines = random.sample(range(port_width), 4)
+
+        values = [random.choice([True, False])
+                  for _ in range(number_of_samples)]
+        period = random.randint(2, 20)
+        edges = sorted(random.sample(range(number_of_samples), 10))
+
+        pattern = DigitalPattern(number_of_samples, port_width)
+        pattern.set_values(lines[0], values)
+        pattern.set_clock(lines[1], period)
+        pattern.set_edges(lines[2], edges, initial_value=True)
+        pattern.set_timeline(lines[3], [(edges[0], True), (edges[5], False)])
+
+        samples = DigitalPatternCompiler().compile(pattern)
+        assert samples.dtype == numpy.dtype('uint{0}'.format(port_width))
+        assert samples.shape == (number_of_samples,)
+
+        expected_clock = [i % period < period // 2
+                          for i in range(number_of_samples)]
+        expected_edges = [sum(1 for e in edges if e <= i) % 2 == 0
+                          for i in range(number_of_samples)]
+        expected_timeline = [edges[0] <= i < edges[5]
+                             for i in range(number_of_samples)]
+
+        for line, expected in zip(
+                lines, [values, expected_clock, expected_edges,
+                        expected_timeline]):
+            numpy.testing.assert_array_equal(
+                (samples >> line) & 1, numpy.array(expected, dtype=int))
+
+        # Lines that are not described are held low.
+        mask = sum(1 << line for line in lines)
+        assert not numpy.any(samples & ~numpy.array(mask, samples.dtype))
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_cache_and_incremental_compile(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_samples = random.randint(100, 1000)
+        pattern = DigitalPattern(number_of_samples, 8)
+        for line in range(8):
+            pattern.set_clock(line, 2 ** (line + 1))
+
+        compiler = DigitalPatternCompiler()
+        samples = compiler.compile(pattern)
+        assert compiler.lines_compiled == 8
+
+        assert compiler.compile(pattern.copy()) is samples
+        assert compiler.hits == 1
+
+        # Changing one line recompiles only that line.
+        line = random.randint(0, 7)
+        changed_pattern = pattern.copy().set_clock(line, 3)
+        changed_samples = compiler.compile(changed_pattern)
+        assert compiler.lines_compiled == 9
+
+        expected_samples = DigitalPatternCompiler().compile(changed_pattern)
+        numpy.testing.assert_array_equal(changed_samples, expected_samples)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_from_timeline(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_samples = random.randint(10, 100)
+        events = [(random.randint(0, number_of_samples - 1),
+                   random.randint(0, 7), random.choice([True, False]))
+                  for _ in range(20)]
+
+        pattern = DigitalPattern.from_timeline(
+            number_of_samples, events, port_width=8)
+        samples = DigitalPatternCompiler().compile(pattern)
+
+        expected_samples = numpy.zeros(number_of_samples, dtype=numpy.uint8)
+        state = 0
+        for i in range(number_of_samples):
+            for sample_index, line, value in events:
+                if sample_index == i:
+                    if value:
+                        state |= 1 << line
+                    else:
+                        state &= ~(1 << line)
+            expected_samples[i] = state
+
+        numpy.testing.assert_array_equal(samples, expected_samples)
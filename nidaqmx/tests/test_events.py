@@ -0,0 +1,158 @@
+import pytest
+import random
+import time
+
+import nidaqmx
+from nidaqmx.constants import AcquisitionType, EveryNSamplesEventType
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+class TestEventHub(object):
+    """
+    Contains a collection of pytest tests that validate the event hub
+    functionality in the NI-DAQmx Python API.
+    """
+
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.time() + timeout
+        while not predicate() and time.time() < deadline:
+            time.sleep(0.01)
+        return predicate()
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_done_event_subscribers(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        number_of_samples = random.randint(10, 100)
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+            task.timing.cfg_samp_clk_timing(
+                1000, samps_per_chan=number_of_samples)
+
+            calls = []
+
+            def failing_callback(event):
+                calls.append('failing')
+                raise ValueError('Subscriber failure')
+
+            task.events.subscribe_done(
+                lambda event: calls.append('low'), priority=-1)
+            task.events.subscribe_done(failing_callback, priority=1)
+            high = task.events.subscribe_done(
+                lambda event: calls.append(('high', event.status)),
+                priority=2)
+
+            task.start()
+            assert self._wait_for(lambda: len(calls) == 3)
+
+            # Subscribers run in order of priority, and an exception in one
+            # does not prevent the others from running.
+            assert calls == [('high', 0), 'failing', 'low']
+            assert len(task.events.errors) == 1
+            assert high.deliveries == 1
+
+            statistics = task.events.latency_statistics()['done']
+            assert statistics.count == 3
+            assert statistics.min >= 0
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_every_n_samples_on_worker_thread(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        sample_interval = random.randint(10, 50)
+        number_of_events = random.randint(2, 5)
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+            task.timing.cfg_samp_clk_timing(
+                1000, samps_per_chan=sample_interval * number_of_events)
+
+            task.events.dispatch_on_worker_thread = True
+
+            events = []
+            subscription = (
+                task.events.subscribe_every_n_samples_acquired_into_buffer(
+                    sample_interval, events.append))
+
+            task.start()
+            assert self._wait_for(lambda: len(events) == number_of_events)
+            task.stop()
+
+            assert all(
+                e.event_type == EveryNSamplesEventType.ACQUIRED_INTO_BUFFER
+                for e in events)
+            assert all(
+                e.number_of_samples == sample_interval for e in events)
+
+            subscription.unsubscribe()
+            assert task.events.subscriptions == []
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_done_futures_as_completed(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channels = random.sample(x_series_device.ai_physical_chans, 2)
+        rates = [1000, 4000]
+
+        with nidaqmx.Task() as slow_task, nidaqmx.Task() as fast_task:
+            tasks = [slow_task, fast_task]
+            for task, channel, rate in zip(tasks, channels, rates):
+                task.ai_channels.add_ai_voltage_chan(channel.name)
+                task.timing.cfg_samp_clk_timing(rate, samps_per_chan=1000)
+
+            futures = [task.done_future() for task in tasks]
+            for task in tasks:
+                task.start()
+
+            completed = [
+                f.task for f in nidaqmx.task.as_completed(futures, timeout=5)]
+            assert completed == [fast_task, slow_task]
+            assert all(f.result() == 0 for f in futures)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_done_future_cancelled_on_stop(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+            task.timing.cfg_samp_clk_timing(
+                1000, sample_mode=AcquisitionType.CONTINUOUS)
+
+            future = task.done_future()
+            task.start()
+            assert not future.done()
+            task.stop()
+
+            assert future.cancelled()
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_done_future_resolved_on_stop_after_completion(
+            self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        dispatch_on_worker_thread = random.choice([True, False])
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+            task.timing.cfg_samp_clk_timing(10000, samps_per_chan=100)
+            task.events.dispatch_on_worker_thread = dispatch_on_worker_thread
+
+            future = task.done_future()
+            task.start()
+            task.wait_until_done()
+            task.stop()
+
+            assert not future.cancelled()
+            assert future.result(timeout=1) == 0
@@ -0,0 +1,101 @@
+import numpy
+import pytest
+import random
+
+import nidaqmx
+from nidaqmx.polling import PollingLoop
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+from nidaqmx.tests.test_read_write import TestDAQmxIOBase
+
+
+class TestPollingLoop(TestDAQmxIOBase):
+    """
+    Contains a collection of pytest tests that validate the polling loop
+    functionality in the NI-DAQmx Python API.
+
+    These tests use only a single X Series device by utilizing the internal
+    loopback routes on the device.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_analog_loopback(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        # Select a random loopback channel pair on the device.
+        loopback_channel_pairs = self._get_analog_loopback_channels(
+            x_series_device)
+        loopback_channel_pair = random.choice(loopback_channel_pairs)
+
+        with nidaqmx.Task() as write_task, nidaqmx.Task() as read_task:
+            write_task.ao_channels.add_ao_voltage_chan(
+                loopback_channel_pair.output_channel, max_val=10, min_val=-10)
+
+            read_task.ai_channels.add_ai_voltage_chan(
+                loopback_channel_pair.input_channel, max_val=10, min_val=-10)
+
+            # Generate random values to test.
+            values_to_test = [random.uniform(-10, 10) for _ in range(10)]
+
+            loop = PollingLoop(period=0.002)
+            feedback = loop.add_analog_input(read_task)
+            drive = loop.add_analog_output(write_task)
+
+            values_read = []
+
+            def step(polling_loop):
+                # The value read in each iteration was written by the
+                # previous iteration, so skip the first iteration.
+                iteration = len(values_read)
+                if iteration > 0:
+                    values_read.append(feedback.value)
+                else:
+                    values_read.append(None)
+                if iteration < len(values_to_test):
+                    drive.value = values_to_test[iteration]
+
+            iterations = loop.run(
+                step, num_iterations=len(values_to_test) + 1)
+
+            assert iterations == len(values_to_test) + 1
+            numpy.testing.assert_allclose(
+                values_read[1:], values_to_test, rtol=0.05, atol=0.005)
+
+            statistics = loop.statistics
+            assert statistics.iterations == iterations
+            assert statistics.min_jitter >= 0
+            assert len(loop.jitter_history) == iterations
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_stop_and_duration(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        loopback_channel_pairs = self._get_analog_loopback_channels(
+            x_series_device)
+        loopback_channel_pair = random.choice(loopback_channel_pairs)
+
+        with nidaqmx.Task() as read_task:
+            read_task.ai_channels.add_ai_voltage_chan(
+                loopback_channel_pair.input_channel, max_val=10, min_val=-10)
+
+            loop = PollingLoop(period=0.001, history_length=0)
+            loop.add_analog_input(read_task)
+
+            number_of_iterations = random.randint(5, 20)
+
+            def step(polling_loop):
+                if polling_loop.statistics.iterations + 1 >= (
+                        number_of_iterations):
+                    polling_loop.stop()
+
+            assert loop.run(step) == number_of_iterations
+            assert len(loop.jitter_history) == 0
+
+            loop.reset_statistics()
+            assert loop.statistics.iterations == 0
+
+            iterations = loop.run(duration=0.05)
+            assert iterations >= 1
+            assert loop.statistics.iterations == iterations
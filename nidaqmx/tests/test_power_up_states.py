@@ -4,10 +4,11 @@ import random
 
 import nidaqmx
 import nidaqmx.system
-from nidaqmx.constants import PowerUpStates
-from nidaqmx.system.system import DOPowerUpState
+from nidaqmx.constants import AOPowerUpOutputBehavior, PowerUpStates
+from nidaqmx.system.system import AOPowerUpState, DOPowerUpState
 from nidaqmx.tests.fixtures import x_series_device
 from nidaqmx.tests.helpers import generate_random_seed
+from nidaqmx.utils import flatten_channel_string
 
 
 class TestPowerUpStates(object):
@@ -53,3 +54,77 @@ class TestPowerUpStates(object):
 
         for state in port_states:
             assert state.power_up_state == PowerUpStates.TRISTATE
+
+    def test_provision_power_up_states(self, x_series_device):
+        do_port = x_series_device.do_ports[0].name
+        system = nidaqmx.system.System.local()
+
+        system.set_digital_power_up_states(
+            x_series_device.name,
+            [DOPowerUpState(physical_channel=do_port,
+                            power_up_state=PowerUpStates.TRISTATE)])
+
+        power_up_map = {x_series_device.name: {'digital': [
+            DOPowerUpState(physical_channel=do_port,
+                           power_up_state=PowerUpStates.LOW)]}}
+
+        # A dry run reports the change without making it.
+        report = system.provision_power_up_states(power_up_map, dry_run=True)
+        assert report.dry_run
+        assert len(report.changes) == 1
+        assert report.changes[0].old_state == PowerUpStates.TRISTATE
+        assert report.changes[0].new_state == PowerUpStates.LOW
+        assert x_series_device.name in report.device_read_times
+
+        report = system.provision_power_up_states(power_up_map)
+        assert len(report.changes) == 1
+        port_states = [
+            p for p in system.get_digital_power_up_states(
+                x_series_device.name) if do_port in p.physical_channel]
+        for state in port_states:
+            assert state.power_up_state == PowerUpStates.LOW
+
+        # States that already match are not set again.
+        report = system.provision_power_up_states(power_up_map)
+        assert report.changes == []
+
+        system.set_digital_power_up_states(
+            x_series_device.name,
+            [DOPowerUpState(physical_channel=do_port,
+                            power_up_state=PowerUpStates.TRISTATE)])
+
+    def test_provision_analog_power_up_state_range(self, x_series_device):
+        ao_channels = [
+            c.name for c in x_series_device.ao_physical_chans[:2]]
+        system = nidaqmx.system.System.local()
+
+        system.set_analog_power_up_states_with_output_type([
+            AOPowerUpState(physical_channel=c, power_up_state=0.0,
+                           channel_type=AOPowerUpOutputBehavior.VOLTAGE)
+            for c in ao_channels])
+
+        # A range of channels is compared and set channel by channel.
+        power_up_map = {x_series_device.name: {'analog': [
+            AOPowerUpState(physical_channel=flatten_channel_string(
+                ao_channels), power_up_state=1.0,
+                channel_type=AOPowerUpOutputBehavior.VOLTAGE)]}}
+
+        report = system.provision_power_up_states(power_up_map, dry_run=True)
+        assert [c.physical_channel for c in report.changes] == ao_channels
+        for change in report.changes:
+            assert change.old_state == (
+                0.0, AOPowerUpOutputBehavior.VOLTAGE)
+
+        report = system.provision_power_up_states(power_up_map)
+        assert len(report.changes) == 2
+        for state in system.get_analog_power_up_states_with_output_type(
+                ao_channels):
+            assert state.power_up_state == 1.0
+
+        report = system.provision_power_up_states(power_up_map)
+        assert report.changes == []
+
+        system.set_analog_power_up_states_with_output_type([
+            AOPowerUpState(physical_channel=c, power_up_state=0.0,
+                           channel_type=AOPowerUpOutputBehavior.VOLTAGE)
+            for c in ao_channels])
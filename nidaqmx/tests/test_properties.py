@@ -6,6 +6,14 @@ import nidaqmx
 import nidaqmx.system
 from nidaqmx import DaqError
 from nidaqmx.constants import AcquisitionType, UsageTypeAI
+from nidaqmx._task_modules.channels import (
+    AIChannel, AOChannel, CIChannel, COChannel, DIChannel, DOChannel)
+from nidaqmx._task_modules.export_signals import ExportSignals
+from nidaqmx._task_modules.in_stream import InStream
+from nidaqmx._task_modules.out_stream import OutStream
+from nidaqmx._task_modules.property_manifest import get_property_manifest
+from nidaqmx._task_modules.timing import Timing
+from nidaqmx._task_modules.triggering.start_trigger import StartTrigger
 from nidaqmx.tests.fixtures import x_series_device, bridge_device
 from nidaqmx.tests.helpers import generate_random_seed
 
@@ -196,3 +204,129 @@ class TestPropertyListDataTypes(object):
             del ai_channel.ai_bridge_poly_forward_coeff
             assert isinstance(ai_channel.ai_bridge_poly_forward_coeff, list)
             assert len(ai_channel.ai_bridge_poly_forward_coeff) == 0
+
+
+class TestPropertySnapshot(object):
+    """
+    Contains a collection of pytest tests that validate reading the
+    configuration of a task into a snapshot.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_task_snapshot(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channels = random.sample(x_series_device.ai_physical_chans, 2)
+        rate = random.choice([1000, 2000, 4000, 5000, 10000])
+
+        with nidaqmx.Task() as task:
+            for channel in channels:
+                task.ai_channels.add_ai_voltage_chan(channel.name)
+            task.timing.cfg_samp_clk_timing(rate)
+
+            snapshot = task.snapshot()
+
+            assert sorted(snapshot['channels']) == sorted(task.channel_names)
+            ai_channel = snapshot['channels'][task.channel_names[0]]
+            assert ai_channel['ai_meas_type'] == UsageTypeAI.VOLTAGE
+            assert ai_channel['physical_channel'] == channels[0].name
+            assert 'ai_thrmcpl_type' not in ai_channel
+            assert snapshot['timing']['samp_clk_rate'] == rate
+            assert 'start_trigger' in snapshot['triggers']
+            assert 'out_stream' not in snapshot
+
+            # Reading on a thread pool gives the same configuration.
+            threaded_snapshot = task.snapshot(
+                include=['channels', 'timing'], max_workers=4)
+            assert threaded_snapshot['channels'] == snapshot['channels']
+            assert threaded_snapshot['timing'] == snapshot['timing']
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_apply_config_skips_unchanged_properties(
+            self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        rate, new_rate = random.sample([1000, 2000, 4000, 5000, 10000], 2)
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+            # Start in continuous mode so that applying the configuration
+            # changes the sample mode.
+            task.timing.cfg_samp_clk_timing(
+                1000, sample_mode=AcquisitionType.CONTINUOUS)
+
+            config = {
+                'channels': {task.channel_names[0]: {
+                    'ai_max': 5.0, 'ai_min': -5.0}},
+                'timing': {
+                    'samp_clk_rate': rate,
+                    'samp_quant_samp_mode': 'FINITE'},
+            }
+            changes = task.apply_config(config)
+            assert task.timing.samp_quant_samp_mode == AcquisitionType.FINITE
+            assert task.ai_channels[0].ai_max == 5.0
+
+            # Type and mode properties are set before other properties.
+            timing_changes = [
+                c.property for c in changes if c.section == 'timing']
+            assert timing_changes[0] == 'samp_quant_samp_mode'
+
+            # Applying the same configuration again sets nothing.
+            assert task.apply_config(config) == []
+
+            config['timing']['samp_clk_rate'] = new_rate
+            changes = task.apply_config(config)
+            assert [c.property for c in changes] == ['samp_clk_rate']
+            assert changes[0].old_value == rate
+            assert task.timing.samp_clk_rate == new_rate
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_apply_config_after_timing_changes(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        rate, other_rate = random.sample([1000, 2000, 4000, 5000, 10000], 2)
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(channel.name)
+
+            config = {'timing': {'samp_clk_rate': rate}}
+            task.apply_config(config)
+
+            # Changing the timing without apply_config() must not leave a
+            # stale value that makes the configuration look applied.
+            task.timing.cfg_samp_clk_timing(other_rate)
+
+            changes = task.apply_config(config)
+            assert [c.property for c in changes] == ['samp_clk_rate']
+            assert changes[0].old_value == other_rate
+            assert task.timing.samp_clk_rate == rate
+
+    def test_apply_config_invalid_property(self, x_series_device):
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(
+                x_series_device.ai_physical_chans[0].name)
+
+            with pytest.raises(DaqError):
+                task.apply_config({'timing': {'samp_clk_rates': 1000}})
+
+    @pytest.mark.parametrize('cls', [
+        AIChannel, AOChannel, CIChannel, COChannel, DIChannel, DOChannel,
+        ExportSignals, InStream, OutStream, Timing, StartTrigger])
+    def test_manifest_excludes_private_properties(self, cls):
+        manifest = get_property_manifest(cls)
+
+        assert len(manifest) > 0
+        assert not [d.name for d in manifest if d.name.startswith('_')]
+
+    def test_invalid_snapshot_section(self, x_series_device):
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(
+                x_series_device.ai_physical_chans[0].name)
+
+            with pytest.raises(DaqError):
+                task.snapshot(include=['channels', 'calibration'])
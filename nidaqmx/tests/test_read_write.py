@@ -331,6 +331,34 @@ class TestDigitalReadWrite(TestDAQmxIOBase):
             assert isinstance(value_read, list)
             assert isinstance(value_read[0], list)
 
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_bool_numpy_n_chan_1_samp(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_channels = random.randint(2, len(x_series_device.do_lines))
+        do_lines = random.sample(x_series_device.do_lines, number_of_channels)
+
+        with nidaqmx.Task() as task:
+            task.do_channels.add_do_chan(
+                flatten_channel_string([d.name for d in do_lines]),
+                line_grouping=LineGrouping.CHAN_PER_LINE)
+
+            # Generate random values to test.
+            values_to_test = numpy.array(
+                [bool(random.getrandbits(1)) for _ in
+                 range(number_of_channels)], dtype=numpy.bool_)
+
+            task.write(values_to_test)
+            time.sleep(0.001)
+            values_read = task.read()
+
+            assert values_read == values_to_test.tolist()
+
+            # Verify that non-boolean data is rejected.
+            with pytest.raises(nidaqmx.DaqError):
+                task.write(values_to_test.astype(numpy.uint8))
+
     @pytest.mark.parametrize('seed', [generate_random_seed()])
     def test_uint_1_chan_1_samp(self, x_series_device, seed):
         # Reset the pseudorandom number generator with seed.
@@ -598,3 +626,42 @@ class TestCounterReadWrite(TestDAQmxIOBase):
 
             assert value_read.high_tick == high_ticks
             assert value_read.low_tick == low_ticks
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_pulse_freq_write_structured_array(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        frequency = random.uniform(100, 1000)
+        duty_cycle = random.uniform(0.2, 0.8)
+
+        # Select random counters from the device.
+        counters = random.sample(self._get_device_counters(x_series_device), 2)
+
+        with nidaqmx.Task() as write_task, nidaqmx.Task() as read_task:
+            write_task.co_channels.add_co_pulse_chan_freq(
+                counters[0], freq=500, duty_cycle=0.5)
+            write_task.timing.cfg_implicit_timing(
+                sample_mode=AcquisitionType.CONTINUOUS)
+
+            read_task.ci_channels.add_ci_pulse_chan_freq(
+                counters[1], min_val=100, max_val=1000)
+            read_task.ci_channels.all.ci_pulse_freq_term = (
+                '/{0}InternalOutput'.format(counters[0]))
+
+            samples = numpy.zeros(
+                1, dtype=[('freq', numpy.float64),
+                          ('duty_cycle', numpy.float64)])
+            samples['freq'] = frequency
+            samples['duty_cycle'] = duty_cycle
+
+            write_task.write(samples, auto_start=True)
+            read_task.start()
+
+            # Skip the first measurement, which may span the update.
+            read_task.read(timeout=2)
+            value_read = read_task.read(timeout=2)
+            write_task.stop()
+
+            assert numpy.isclose(value_read.freq, frequency, rtol=0.01)
+            assert numpy.isclose(value_read.duty_cycle, duty_cycle, rtol=0.01)
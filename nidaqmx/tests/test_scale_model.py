@@ -0,0 +1,136 @@
+import numpy
+import pickle
+import pytest
+import random
+
+from nidaqmx.errors import DaqError
+from nidaqmx.scale import Scale
+from nidaqmx.scale_model import ScaleModel, fit_reverse_poly_coeff
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+class TestScaleModel(object):
+    """
+    Contains a collection of pytest tests that validate the offline scale
+    evaluation functionality in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_linear_scale_model(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        slope = random.uniform(0.5, 10)
+        y_intercept = random.uniform(-5, 5)
+        model = ScaleModel.linear(slope, y_intercept)
+
+        values = numpy.random.uniform(-10, 10, (4, 25))
+        scaled = model.forward(values)
+        assert scaled.shape == values.shape
+        numpy.testing.assert_allclose(scaled, values * slope + y_intercept)
+        numpy.testing.assert_allclose(model.reverse(scaled), values)
+
+    def test_map_ranges_scale_model_coerces(self):
+        model = ScaleModel.map_ranges(0.0, 10.0, 0.0, 100.0)
+
+        assert model.forward(5.0) == 50.0
+        numpy.testing.assert_allclose(
+            model.forward([-1.0, 11.0]), [0.0, 100.0])
+        with pytest.raises(DaqError):
+            model.reverse([150.0])
+
+    def test_polynomial_scale_model(self):
+        model = ScaleModel.polynomial([1.0, 2.0, 3.0], [0.0, 0.5])
+
+        numpy.testing.assert_allclose(
+            model.forward([0.0, 1.0, 2.0]), [1.0, 6.0, 17.0])
+        assert model.reverse(4.0) == 2.0
+
+    def test_table_scale_model(self):
+        model = ScaleModel.table([0.0, 1.0, 2.0], [0.0, 10.0, 40.0])
+
+        numpy.testing.assert_allclose(
+            model.forward([0.5, 1.5, 3.0]), [5.0, 25.0, 40.0])
+        numpy.testing.assert_allclose(model.reverse([25.0]), [1.5])
+
+    def test_scale_model_pickles(self):
+        model = ScaleModel.table([0.0, 1.0, 2.0], [0.0, 10.0, 40.0])
+        unpickled = pickle.loads(pickle.dumps(model))
+
+        assert unpickled == model
+        assert hash(unpickled) == hash(model)
+        assert unpickled.forward(1.5) == model.forward(1.5)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_scale_to_model(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        scale_name = 'TestScaleModel{0}'.format(random.randint(0, 100000))
+        slope = random.uniform(0.5, 10)
+        scale = Scale.create_lin_scale(scale_name, slope, y_intercept=1.0)
+
+        model = scale.to_model()
+        assert model == ScaleModel.linear(slope, 1.0)
+        assert model.forward(2.0) == pytest.approx(2.0 * slope + 1.0)
+
+
+class TestReversePolyFit(object):
+    """
+    Contains a collection of pytest tests that validate the reverse
+    polynomial fitting functionality in the NI-DAQmx Python API.
+    """
+
+    def test_fit_matches_least_squares(self):
+        forward_coeffs = [0.5, 2.0, 0.1, 0.01]
+        fit = fit_reverse_poly_coeff(forward_coeffs)
+
+        x = numpy.linspace(-5.0, 5.0, 1000)
+        y = numpy.polynomial.polynomial.polyval(x, forward_coeffs)
+        expected = numpy.polynomial.polynomial.polyfit(y, x, 3)
+
+        numpy.testing.assert_allclose(fit.reverse_coeffs, expected,
+                                      rtol=1e-6, atol=1e-12)
+        errors = numpy.polynomial.polynomial.polyval(y, expected) - x
+        assert fit.max_error == pytest.approx(numpy.abs(errors).max())
+
+    def test_fit_inverts_linear_polynomial(self):
+        fit = fit_reverse_poly_coeff([1.0, 4.0], reverse_poly_order=1)
+
+        numpy.testing.assert_allclose(fit.reverse_coeffs, [-0.25, 0.25])
+        assert fit.max_error < 1e-12
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_batch_fit_matches_single_fits(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        forward_coeffs = [[random.uniform(-1, 1), random.uniform(1, 2),
+                           random.uniform(0, 0.01)] for _ in range(20)]
+        max_val_x = [random.uniform(2, 10) for _ in range(20)]
+
+        batch = fit_reverse_poly_coeff(
+            forward_coeffs, min_val_x=0.0, max_val_x=max_val_x)
+        assert batch.reverse_coeffs.shape == (20, 3)
+
+        for i in range(20):
+            single = fit_reverse_poly_coeff(
+                forward_coeffs[i], min_val_x=0.0, max_val_x=max_val_x[i])
+            numpy.testing.assert_allclose(
+                batch.reverse_coeffs[i], single.reverse_coeffs)
+            assert batch.rms_error[i] == pytest.approx(single.rms_error)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_fit_matches_driver(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        forward_coeffs = [random.uniform(-1, 1), random.uniform(1, 2),
+                          random.uniform(0, 0.05)]
+
+        expected = Scale.calculate_reverse_poly_coeff(forward_coeffs)
+        fit = fit_reverse_poly_coeff(forward_coeffs)
+
+        numpy.testing.assert_allclose(
+            fit.reverse_coeffs, expected, rtol=1e-4, atol=1e-6)
@@ -0,0 +1,148 @@
+import numpy
+import pytest
+import random
+import threading
+
+import nidaqmx
+from nidaqmx._lib import DaqLibImporter
+from nidaqmx.constants import AcquisitionType, LineGrouping, TriggerType
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+from nidaqmx.simulation import (
+    SimulatedBackend, SimulatedDevice, constant, use_backend)
+from nidaqmx.system import System
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+@pytest.fixture()
+def simulated_backend():
+    backend = SimulatedBackend([SimulatedDevice('SimDev1')])
+    with use_backend(backend):
+        yield backend
+
+
+class TestSimulation(object):
+    """
+    Contains a collection of pytest tests that validate the simulated
+    backend functionality in the NI-DAQmx Python API. These tests do not
+    require NI-DAQmx or DAQ hardware.
+    """
+
+    def test_system_enumeration(self, simulated_backend):
+        system = System.local()
+
+        assert system.devices.device_names == ['SimDev1']
+        device = system.devices['SimDev1']
+        assert device.product_type == 'PCIe-6363'
+        assert len(device.ai_physical_chans) == 32
+        assert device.ai_physical_chans[3].name == 'SimDev1/ai3'
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_finite_analog_read(self, simulated_backend, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        value = random.uniform(-5, 5)
+        number_of_samples = random.randint(10, 100)
+        device = simulated_backend.get_device('SimDev1')
+        device.set_ai_generator('SimDev1/ai1', constant(value))
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan('SimDev1/ai0:1')
+            task.timing.cfg_samp_clk_timing(
+                10000, samps_per_chan=number_of_samples)
+
+            data = task.read(number_of_samples_per_channel=number_of_samples)
+
+            assert numpy.shape(data) == (2, number_of_samples)
+            numpy.testing.assert_allclose(data[1], value)
+            assert task.is_task_done()
+
+    def test_read_timeout(self, simulated_backend):
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan('SimDev1/ai0')
+            task.timing.cfg_samp_clk_timing(
+                100, sample_mode=AcquisitionType.CONTINUOUS)
+            task.start()
+
+            with pytest.raises(DaqError) as e:
+                task.read(number_of_samples_per_channel=1000, timeout=0.01)
+            assert (e.value.error_code ==
+                    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE.value)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_digital_loopback(self, simulated_backend, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        values = [bool(random.getrandbits(1)) for _ in range(8)]
+
+        with nidaqmx.Task() as write_task, nidaqmx.Task() as read_task:
+            write_task.do_channels.add_do_chan(
+                'SimDev1/port0/line0:7',
+                line_grouping=LineGrouping.CHAN_PER_LINE)
+            read_task.di_channels.add_di_chan(
+                'SimDev1/port0/line0:7',
+                line_grouping=LineGrouping.CHAN_PER_LINE)
+
+            write_task.write(values)
+            assert read_task.read() == values
+
+    def test_every_n_samples_event(self, simulated_backend):
+        samples_read = []
+        event = threading.Event()
+
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan('SimDev1/ai0')
+            task.timing.cfg_samp_clk_timing(10000, samps_per_chan=100)
+
+            def callback(task_handle, event_type, number_of_samples,
+                         callback_data):
+                samples_read.append(len(task.read(number_of_samples)))
+                if len(samples_read) == 4:
+                    event.set()
+                return 0
+
+            task.register_every_n_samples_acquired_into_buffer_event(
+                25, callback)
+            task.start()
+
+            assert event.wait(5.0)
+            assert samples_read == [25, 25, 25, 25]
+
+    def test_unsupported_function(self, simulated_backend):
+        with nidaqmx.Task() as task:
+            with pytest.raises(nidaqmx._lib.DaqFunctionNotSupportedError):
+                task.ai_channels.add_ai_bridge_chan('SimDev1/ai0')
+
+    def test_task_snapshot(self, simulated_backend):
+        with nidaqmx.Task() as task:
+            task.ai_channels.add_ai_voltage_chan(
+                'SimDev1/ai0:1', min_val=-5.0, max_val=5.0)
+            task.timing.cfg_samp_clk_timing(1000)
+
+            snapshot = task.snapshot()
+
+        assert sorted(snapshot['channels']) == ['SimDev1/ai0', 'SimDev1/ai1']
+        assert snapshot['channels']['SimDev1/ai0']['ai_max'] == 5.0
+        assert snapshot['timing']['samp_clk_rate'] == 1000.0
+        assert (snapshot['triggers']['start_trigger']['trig_type'] ==
+                TriggerType.NONE)
+        assert 'out_stream' not in snapshot
+
+    def test_system_snapshot(self, simulated_backend):
+        snapshot = System.local().snapshot()
+
+        assert snapshot.device_names == ['SimDev1']
+        device = snapshot['SimDev1']
+        assert device.product_type == 'PCIe-6363'
+        assert device.compact_daq_chassis_device is None
+        assert len(device.ai_physical_chans) == 32
+
+    def test_set_backend_overrides_environment(self, monkeypatch):
+        monkeypatch.setenv('NIDAQMX_BACKEND', 'simulated')
+        importer = DaqLibImporter()
+        assert isinstance(importer.backend, SimulatedBackend)
+
+        importer.set_backend(None)
+        assert importer.backend is None
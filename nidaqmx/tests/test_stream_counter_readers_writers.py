@@ -10,6 +10,7 @@ from nidaqmx.stream_writers import CounterWriter
 from nidaqmx.tests.fixtures import x_series_device
 from nidaqmx.tests.helpers import generate_random_seed
 from nidaqmx.tests.test_read_write import TestDAQmxIOBase
+from nidaqmx.types import CTR_FREQ_DTYPE
 
 
 class TestCounterReaderWriter(TestDAQmxIOBase):
@@ -272,6 +273,62 @@ class TestCounterReaderWriter(TestDAQmxIOBase):
             numpy.testing.assert_allclose(
                 duty_cycles_read, duty_cycles_to_test[1:], rtol=0.05)
 
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_many_sample_pulse_freq_structured(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_samples = random.randint(2, 50)
+
+        # Select random counters from the device.
+        counters = random.sample(
+            self._get_device_counters(x_series_device), 2)
+
+        with nidaqmx.Task() as write_task, nidaqmx.Task() as read_task:
+            write_task.co_channels.add_co_pulse_chan_freq(
+                counters[0], idle_state=Level.HIGH)
+            write_task.timing.cfg_implicit_timing(
+                samps_per_chan=number_of_samples + 1)
+            write_task.control(TaskMode.TASK_COMMIT)
+
+            read_task.ci_channels.add_ci_pulse_chan_freq(
+                counters[1], min_val=1000, max_val=10000)
+            read_task.ci_channels.all.ci_pulse_freq_term = (
+                '/{0}InternalOutput'.format(counters[0]))
+            read_task.timing.cfg_implicit_timing(
+                samps_per_chan=number_of_samples)
+
+            samples_to_test = numpy.zeros(
+                number_of_samples + 1, dtype=CTR_FREQ_DTYPE)
+            samples_to_test['freq'] = [
+                random.uniform(1000, 10000) for _ in
+                range(number_of_samples + 1)]
+            samples_to_test['duty_cycle'] = [
+                random.uniform(0.2, 0.8) for _ in
+                range(number_of_samples + 1)]
+
+            writer = CounterWriter(write_task.out_stream)
+            reader = CounterReader(read_task.in_stream)
+
+            assert (writer.write_many_sample_pulse(samples_to_test) ==
+                    number_of_samples + 1)
+
+            read_task.start()
+            write_task.start()
+
+            samples_read = numpy.zeros(
+                number_of_samples, dtype=CTR_FREQ_DTYPE)
+
+            assert reader.read_many_sample_pulse(
+                samples_read, number_of_samples_per_channel=number_of_samples,
+                timeout=2) == number_of_samples
+
+            numpy.testing.assert_allclose(
+                samples_read['freq'], samples_to_test['freq'][1:], rtol=0.05)
+            numpy.testing.assert_allclose(
+                samples_read['duty_cycle'],
+                samples_to_test['duty_cycle'][1:], rtol=0.05)
+
     @pytest.mark.parametrize('seed', [generate_random_seed()])
     def test_one_sample_pulse_time(self, x_series_device, seed):
         # Reset the pseudorandom number generator with seed.
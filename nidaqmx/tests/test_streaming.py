@@ -0,0 +1,93 @@
+import numpy
+import pytest
+import random
+
+import nidaqmx
+from nidaqmx.constants import AcquisitionType, RegenerationMode
+from nidaqmx.streaming import OutStreamEngine
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+from nidaqmx.tests.test_read_write import TestDAQmxIOBase
+
+
+class TestOutStreamEngine(TestDAQmxIOBase):
+    """
+    Contains a collection of pytest tests that validate the output stream
+    engine functionality in the NI-DAQmx Python API.
+
+    These tests use only a single X Series device by utilizing the internal
+    loopback routes on the device.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_stream_blocks(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_channels = random.randint(
+            1, len(x_series_device.ao_physical_chans))
+        channels_to_test = random.sample(
+            x_series_device.ao_physical_chans, number_of_channels)
+
+        block_size = random.randint(500, 1000)
+        number_of_blocks = random.randint(10, 20)
+
+        def blocks():
+            for _ in range(number_of_blocks):
+                block = numpy.random.uniform(
+                    -10, 10, (number_of_channels, block_size))
+                yield block[0] if number_of_channels == 1 else block
+
+        with nidaqmx.Task() as task:
+            task.ao_channels.add_ao_voltage_chan(
+                ','.join([c.name for c in channels_to_test]),
+                max_val=10, min_val=-10)
+            task.timing.cfg_samp_clk_timing(
+                10000, sample_mode=AcquisitionType.CONTINUOUS,
+                samps_per_chan=4 * block_size)
+
+            with OutStreamEngine(task, blocks()) as engine:
+                engine.start()
+                assert (task.out_stream.regen_mode ==
+                        RegenerationMode.DONT_ALLOW_REGENERATION)
+                assert engine.wait_until_done(timeout=10)
+
+                metrics = engine.metrics
+                assert metrics.blocks_written == number_of_blocks
+                assert (metrics.samples_written ==
+                        number_of_blocks * block_size)
+                assert metrics.samples_generated >= metrics.samples_written
+                assert metrics.min_headroom > 0
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_source_smaller_than_buffer(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ao_physical_chans)
+        block_size = random.randint(100, 200)
+        number_of_blocks = random.randint(1, 3)
+
+        blocks = [numpy.random.uniform(-10, 10, block_size)
+                  for _ in range(number_of_blocks)]
+
+        with nidaqmx.Task() as task:
+            task.ao_channels.add_ao_voltage_chan(
+                channel.name, max_val=10, min_val=-10)
+            task.timing.cfg_samp_clk_timing(
+                10000, sample_mode=AcquisitionType.CONTINUOUS,
+                samps_per_chan=4 * number_of_blocks * block_size)
+
+            with OutStreamEngine(task, iter(blocks)) as engine:
+                engine.start()
+
+                # The whole source is written while priming the buffer.
+                assert (engine.metrics.samples_written <
+                        task.out_stream.output_buf_size)
+                assert engine.wait_until_done()
+                assert not engine.is_running
+
+                metrics = engine.metrics
+                assert metrics.blocks_written == number_of_blocks
+                assert (metrics.samples_written ==
+                        number_of_blocks * block_size)
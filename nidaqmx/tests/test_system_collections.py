@@ -1,9 +1,13 @@
 import collections
 import pytest
+import random
 import six
 
 import nidaqmx
 import nidaqmx.system
+from nidaqmx.constants import ProductCategory, UsageTypeAI
+from nidaqmx.scale import Scale
+from nidaqmx.system._capability_cache import capability_cache
 from nidaqmx.system._collections.device_collection import DeviceCollection
 from nidaqmx.system._collections.persisted_channel_collection import (
     PersistedChannelCollection)
@@ -13,7 +17,10 @@ from nidaqmx.system._collections.persisted_scale_collection import (
     PersistedScaleCollection)
 from nidaqmx.system._collections.physical_channel_collection import (
     PhysicalChannelCollection)
+from nidaqmx.system.storage import PersistedScale
 from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+from nidaqmx.utils import flatten_channel_string, unflatten_channel_string
 
 
 class TestSystemCollections(object):
@@ -82,3 +89,141 @@ class TestSystemCollections(object):
 
         # Test specific property on object.
         assert isinstance(phys_chans[0].ai_meas_types, list)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_physical_channel_collection_ranges(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        phys_chans = x_series_device.ai_physical_chans
+        channel_names = phys_chans.channel_names
+
+        index = random.randrange(len(channel_names))
+        assert len(phys_chans) == len(channel_names)
+        assert phys_chans[index].name == channel_names[index]
+        assert phys_chans[-1].name == channel_names[-1]
+        assert [c.name for c in reversed(phys_chans)] == channel_names[::-1]
+
+        # Slices are flattened to ranges of physical channels.
+        assert phys_chans[:4].name == flatten_channel_string(
+            channel_names[:4])
+        assert phys_chans[3::-1].name == flatten_channel_string(
+            channel_names[3::-1])
+        assert phys_chans[:4] in phys_chans
+        assert channel_names[index].upper() in phys_chans
+        assert '{0}/ai999'.format(x_series_device.name) not in phys_chans
+
+        indices = random.sample(range(len(channel_names)), 4)
+        assert unflatten_channel_string(phys_chans.names_for(indices)) == [
+            channel_names[i] for i in indices]
+
+
+class TestPersistedCollectionIndex(object):
+    """
+    Contains a collection of pytest tests that validate the cached name
+    index of the persisted collections in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_saved_scale_lookups(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        scales = nidaqmx.system.System.local().scales
+        scale_name = 'IndexScale{0}'.format(random.randint(0, 1000000))
+        Scale.create_lin_scale(scale_name, 2.0).save(author='tester')
+        saved_scale = PersistedScale(scale_name)
+
+        try:
+            # Saving a scale invalidates the cached names.
+            assert scale_name.upper() in scales
+            assert scales.find(scale_name.lower()) == saved_scale
+            assert saved_scale in scales.starting_with('indexscale')
+
+            info = [i for i in scales.get_info() if i.name == scale_name]
+            assert info[0].author == 'tester'
+        finally:
+            saved_scale.delete()
+
+        assert scale_name not in scales
+        assert scales.find(scale_name) is None
+
+
+class TestDeviceCapabilityCache(object):
+    """
+    Contains a collection of pytest tests that validate the device
+    capability cache in the NI-DAQmx Python API.
+    """
+
+    def test_static_properties_are_cached(self, x_series_device):
+        cache = capability_cache
+        x_series_device.clear_capability_cache()
+
+        product_type = x_series_device.product_type
+        channel_names = x_series_device.ai_physical_chans.channel_names
+        misses = cache.misses
+
+        device = nidaqmx.system.Device(x_series_device.name)
+        assert device.product_type == product_type
+        assert device.ai_physical_chans.channel_names == channel_names
+        assert len(device.ai_physical_chans) == len(channel_names)
+        assert cache.misses == misses
+
+        # Lists handed out by the cache are copies.
+        list(reversed(device.ai_physical_chans))
+        assert device.ai_physical_chans.channel_names == channel_names
+
+    def test_cache_cleared_by_device_operations(self, x_series_device):
+        cache = capability_cache
+
+        x_series_device.product_type
+        misses = cache.misses
+        x_series_device.reset_device()
+        x_series_device.product_type
+        assert cache.misses == misses + 1
+
+        x_series_device.self_test_device()
+        x_series_device.product_type
+        assert cache.misses == misses + 2
+
+        nidaqmx.system.Device.clear_all_capability_caches()
+        x_series_device.product_type
+        assert cache.misses == misses + 3
+
+
+class TestSystemSnapshot(object):
+    """
+    Contains a collection of pytest tests that validate the system
+    snapshot functionality in the NI-DAQmx Python API.
+    """
+
+    def test_snapshot_matches_devices(self, x_series_device):
+        system = nidaqmx.system.System.local()
+        snapshot = system.snapshot()
+
+        assert snapshot.device_names == system.devices.device_names
+        assert x_series_device in snapshot
+
+        info = snapshot[x_series_device.name]
+        assert info.product_type == x_series_device.product_type
+        assert (list(info.ai_physical_chans) ==
+                x_series_device.ai_physical_chans.channel_names)
+        assert (snapshot.device_with_terminal(info.terminals[0]) ==
+                info)
+
+    def test_snapshot_queries(self, x_series_device):
+        snapshot = nidaqmx.system.System.local().snapshot(max_workers=2)
+
+        devices = snapshot.find(
+            product_category=ProductCategory.X_SERIES_DAQ,
+            is_simulated=False, usage_types=[UsageTypeAI.VOLTAGE],
+            ai_physical_chans=4, ao_physical_chans=2, do_lines=8,
+            ci_physical_chans=4,
+            predicate=lambda d: len(d.di_lines) == len(d.do_lines))
+        assert x_series_device.name in [d.name for d in devices]
+
+        assert all(d.product_category == ProductCategory.X_SERIES_DAQ
+                   for d in snapshot.by_category(
+                       ProductCategory.X_SERIES_DAQ))
+        assert all(UsageTypeAI.VOLTAGE in d.ai_meas_types
+                   for d in snapshot.supporting(UsageTypeAI.VOLTAGE))
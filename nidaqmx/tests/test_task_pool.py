@@ -0,0 +1,69 @@
+import pytest
+import random
+
+import nidaqmx
+from nidaqmx.task_pool import TaskPool
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+class TestTaskPool(object):
+    """
+    Contains a collection of pytest tests that validate the task pool
+    functionality in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_lease_reuses_committed_task(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channel = random.choice(x_series_device.ai_physical_chans)
+        number_of_samples = random.randint(10, 100)
+
+        def factory(key):
+            task = nidaqmx.Task()
+            task.ai_channels.add_ai_voltage_chan(key)
+            task.timing.cfg_samp_clk_timing(
+                1000, samps_per_chan=number_of_samples)
+            return task
+
+        with TaskPool(factory) as pool:
+            leased_tasks = []
+            for _ in range(3):
+                with pool.lease(channel.name) as task:
+                    leased_tasks.append(task)
+                    task.start()
+                    data = task.read(
+                        number_of_samples_per_channel=number_of_samples)
+                    assert len(data) == number_of_samples
+
+            assert all(t is leased_tasks[0] for t in leased_tasks)
+
+            metrics = pool.metrics
+            assert metrics.tasks_built == 1
+            assert metrics.hits == 2
+            assert metrics.misses == 1
+            assert metrics.idle_tasks == 1
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_least_recently_used_task_evicted(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channels = random.sample(x_series_device.ai_physical_chans, 2)
+
+        def factory(key):
+            task = nidaqmx.Task()
+            task.ai_channels.add_ai_voltage_chan(key)
+            return task
+
+        with TaskPool(factory, max_tasks=1) as pool:
+            with pool.lease(channels[0].name) as first_task:
+                pass
+            with pool.lease(channels[1].name):
+                pass
+
+            assert pool.metrics.evictions == 1
+            with pytest.raises(nidaqmx.DaqError):
+                first_task.name
@@ -0,0 +1,107 @@
+import pytest
+import random
+
+import nidaqmx
+from nidaqmx.constants import Edge, LineGrouping, TerminalConfiguration
+from nidaqmx.task_templates import TaskTemplate
+from nidaqmx.tests.fixtures import x_series_device
+from nidaqmx.tests.helpers import generate_random_seed
+from nidaqmx.utils import flatten_channel_string
+
+
+class TestTaskTemplate(object):
+    """
+    Contains a collection of pytest tests that validate the task template
+    functionality in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_round_trip_from_task(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        channels = random.sample(x_series_device.ai_physical_chans, 2)
+        rate = random.choice([1000, 2000, 4000, 5000, 10000])
+        number_of_samples = random.randint(100, 1000)
+
+        with nidaqmx.Task() as task:
+            for channel in channels:
+                task.ai_channels.add_ai_voltage_chan(
+                    channel.name, terminal_config=TerminalConfiguration.RSE,
+                    min_val=-5.0, max_val=5.0)
+            task.timing.cfg_samp_clk_timing(
+                rate, samps_per_chan=number_of_samples)
+            task.triggers.start_trigger.cfg_dig_edge_start_trig(
+                '/{0}/PFI0'.format(x_series_device.name),
+                trigger_edge=Edge.FALLING)
+            task.timing.samp_clk_dig_fltr_enable = True
+
+            template = TaskTemplate.from_task(task)
+            expected = task.snapshot()
+
+        template = TaskTemplate.from_json(template.to_json())
+        assert (template.to_dict()['properties']['timing']
+                ['samp_clk_dig_fltr_enable'])
+
+        with template.create_task() as task:
+            actual = task.snapshot()
+
+        assert actual['channels'] == expected['channels']
+        assert actual['timing'] == expected['timing']
+        assert (actual['triggers']['start_trigger'] ==
+                expected['triggers']['start_trigger'])
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_channel_calls_batched(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_channels = random.randint(2, 4)
+        channels = list(
+            x_series_device.ai_physical_chans)[:number_of_channels]
+
+        template = TaskTemplate(channels=[
+            {'method': 'add_ai_voltage_chan',
+             'args': {'physical_channel': c.name}} for c in channels])
+
+        # The channels are created with a single call.
+        assert len(template._get_plan().calls) == 1
+
+        with template.create_task() as task:
+            assert task.channel_names == [c.name for c in channels]
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_round_trip_digital_channels(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        lines = [d.name for d in x_series_device.do_lines][:6]
+        use_input = random.choice([True, False])
+
+        with nidaqmx.Task() as task:
+            collection = task.di_channels if use_input else task.do_channels
+            add_channel = (collection.add_di_chan if use_input else
+                           collection.add_do_chan)
+            for line in lines[:2]:
+                add_channel(line, line_grouping=LineGrouping.CHAN_PER_LINE)
+            for i, group in enumerate((lines[2:4], lines[4:6])):
+                add_channel(flatten_channel_string(group),
+                            name_to_assign_to_lines='Group{0}'.format(i),
+                            line_grouping=LineGrouping.CHAN_FOR_ALL_LINES)
+
+            template = TaskTemplate.from_task(task)
+            expected = task.channel_names
+
+        # The single-line channels are merged into one call; the channels
+        # of several lines are not.
+        assert len(template._get_plan().calls) == 3
+
+        with template.create_task() as task:
+            assert task.channel_names == expected
+            assert task.number_of_channels == 4
+
+    def test_invalid_method(self):
+        template = TaskTemplate(timing=[{'method': 'start'}])
+
+        with pytest.raises(nidaqmx.DaqError):
+            template.create_task()
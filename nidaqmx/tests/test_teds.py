@@ -4,10 +4,16 @@ import random
 
 import nidaqmx
 from nidaqmx.constants import TerminalConfiguration, TEDSUnits
+from nidaqmx.system.teds import (
+    TEDSCache, parse_teds_bit_stream, read_teds_file, write_teds_file)
 from nidaqmx.tests.fixtures import x_series_device
 from nidaqmx.tests.helpers import generate_random_seed
 
 
+TEDS_FILE_PATH = os.path.join(
+    os.path.dirname(__file__), 'teds', 'Voltage.ted')
+
+
 class TestTEDS(object):
     """
     Contains a collection of pytest tests that validate the TEDS
@@ -44,3 +50,52 @@ class TestTEDS(object):
             assert ai_channel.ai_teds_units == 'Kelvin'
             assert ai_channel.ai_min == -300.0
             assert ai_channel.ai_max == 100.0
+
+    def test_read_teds_file(self):
+        teds_info = read_teds_file(TEDS_FILE_PATH)
+
+        assert teds_info.mfg_id == 17
+        assert teds_info.model_num == 1
+        assert teds_info.version_letter == 'A'
+        assert teds_info.version_num == 1
+        assert teds_info.serial_num == 12345
+        assert teds_info.template_ids == (30,)
+        assert parse_teds_bit_stream(teds_info.bit_stream) == teds_info
+
+    def test_teds_file_round_trip(self, tmpdir):
+        teds_info = read_teds_file(TEDS_FILE_PATH)
+        file_path = str(tmpdir.join('Copy.ted'))
+
+        write_teds_file(file_path, teds_info.bit_stream)
+        assert read_teds_file(file_path) == teds_info
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_teds_cache(self, x_series_device, tmpdir, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        ai_phys_chan = random.choice(x_series_device.ai_physical_chans)
+        ai_phys_chan.configure_teds(TEDS_FILE_PATH)
+        teds_info = ai_phys_chan.teds_info
+        assert teds_info == read_teds_file(TEDS_FILE_PATH)._replace(
+            bit_stream=teds_info.bit_stream)
+
+        cache_dir = str(tmpdir.join('teds'))
+        cache = TEDSCache(cache_dir)
+        cache.add(teds_info, ai_phys_chan)
+        assert teds_info in cache
+        assert cache.get(17, 1, 12345, 'A', 1) == teds_info
+
+        # A new cache loads the sensors and physical channels from disk and
+        # configures the physical channel from the cached virtual TEDS file.
+        ai_phys_chan.clear_teds()
+        reloaded = TEDSCache(cache_dir)
+        assert len(reloaded) == 1
+        assert reloaded.get_channel_sensor(ai_phys_chan.name) == teds_info
+        assert reloaded.configure_channels([ai_phys_chan]) == [teds_info]
+        assert ai_phys_chan.teds_mfg_id == 17
+        assert ai_phys_chan.teds_template_ids == [30]
+
+        reloaded.clear()
+        assert len(reloaded) == 0
+        assert reloaded.get_channel_sensor(ai_phys_chan) is None
@@ -5,6 +5,8 @@ import time
 import nidaqmx
 import nidaqmx.system
 from nidaqmx.system.watchdog import DOExpirationState
+from nidaqmx.system._watchdog_modules.expiration_state_map import (
+    expand_expiration_map)
 from nidaqmx.constants import Level
 from nidaqmx.tests.fixtures import x_series_device
 from nidaqmx.tests.helpers import generate_random_seed
@@ -71,3 +73,80 @@ class TestWatchdog(object):
 
             expir_state_obj.expir_states_do_state = Level.LOW
             assert expir_state_obj.expir_states_do_state == Level.LOW
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_watchdog_keeper(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        do_line = random.choice(x_series_device.do_lines)
+
+        with nidaqmx.system.WatchdogTask(
+                x_series_device.name, timeout=0.5) as task:
+            expir_states = [DOExpirationState(
+                physical_channel=do_line.name,
+                expiration_state=Level.TRISTATE)]
+
+            task.cfg_watchdog_do_expir_states(expir_states)
+            task.start()
+
+            healthy = [True]
+            alerts = []
+            keeper = task.start_keeper(
+                health_checks=[lambda: healthy[0]],
+                alert_callback=alerts.append)
+            assert task.keeper is keeper
+
+            # The keeper resets the timer while the application is healthy.
+            time.sleep(1)
+            assert not task.expired
+            assert keeper.history
+            assert keeper.minimum_margin > 0
+
+            # The watchdog timer expires once a health check fails.
+            healthy[0] = False
+            time.sleep(1)
+            assert task.expired
+            assert 'unhealthy' in [a.reason for a in alerts]
+
+            task.stop()
+            assert task.keeper is None
+            assert not keeper.is_running
+
+            task.clear_expiration()
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_watchdog_expir_states_from_map(self, x_series_device, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        do_port = random.choice(x_series_device.do_ports).name
+        do_line = random.choice(
+            [d for d in x_series_device.do_lines if do_port in d.name]).name
+
+        with nidaqmx.system.WatchdogTask(
+                x_series_device.name, timeout=0.1) as task:
+            expir_states = task.cfg_watchdog_expir_states_from_map([
+                ('{0}/line*'.format(do_port), Level.TRISTATE),
+                (do_line, Level.LOW)])
+
+            port_lines = [d.name for d in x_series_device.do_lines
+                          if do_port in d.name]
+            assert (sorted(e.physical_channel for e in expir_states) ==
+                    sorted(port_lines))
+
+            for e in expir_states:
+                expected = (Level.LOW if e.physical_channel == do_line
+                            else Level.TRISTATE)
+                assert e.expiration_state == expected
+                assert (task.expiration_states[e.physical_channel]
+                        .expir_states_do_state == expected)
+
+    def test_watchdog_port_pattern_excludes_lines(self, x_series_device):
+        expanded = expand_expiration_map(
+            {'{0}/port*'.format(x_series_device.name): Level.HIGH})
+
+        assert ([e.physical_channel for e in expanded[DOExpirationState]] ==
+                [d.name for d in x_series_device.do_ports])
+        assert all(e.expiration_state == Level.HIGH
+                   for e in expanded[DOExpirationState])
@@ -0,0 +1,94 @@
+import numpy
+import pytest
+import random
+
+from nidaqmx.waveforms import (
+    SineWave, SquareWave, ChirpWave, ArbitraryWave, WaveformSequence,
+    WaveformCache)
+from nidaqmx.tests.helpers import generate_random_seed
+
+
+class TestWaveforms(object):
+    """
+    Contains a collection of pytest tests that validate the waveform
+    synthesis and caching functionality in the NI-DAQmx Python API.
+    """
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_phase_continuity(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        sample_rate = random.uniform(1000, 100000)
+        waveform = SineWave(
+            random.uniform(1, sample_rate / 4), random.uniform(0.1, 10))
+        number_of_samples = random.randint(100, 1000)
+
+        first_block, phase = waveform.synthesize(
+            number_of_samples, sample_rate)
+        second_block, _ = waveform.synthesize(
+            number_of_samples, sample_rate, phase)
+        whole_block, _ = waveform.synthesize(
+            2 * number_of_samples, sample_rate)
+
+        numpy.testing.assert_allclose(
+            numpy.concatenate([first_block, second_block]), whole_block,
+            atol=1e-9)
+
+        # A sequence that changes frequency must not jump between segments.
+        amplitude = random.uniform(0.1, 10)
+        sequence = WaveformSequence(
+            [(SineWave(100, amplitude), 1000),
+             (ChirpWave(100, 1000, amplitude), 5000),
+             (SineWave(1000, amplitude), 1000)], 100000)
+        samples, _ = sequence.synthesize()
+        assert len(samples) == 7000
+        max_step = 2 * numpy.pi * 1000 / 100000 * amplitude
+        assert numpy.abs(numpy.diff(samples)).max() <= max_step * 1.01
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_arbitrary_wave(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        period = [random.uniform(-10, 10) for _ in range(random.randint(2, 20))]
+        waveform = ArbitraryWave(period)
+
+        samples, phase = waveform.synthesize(3 * len(period), 1000)
+        numpy.testing.assert_allclose(samples, period * 3)
+        assert phase == 0
+
+        assert ArbitraryWave(period) == waveform
+        assert hash(ArbitraryWave(period)) == hash(waveform)
+
+    @pytest.mark.parametrize('seed', [generate_random_seed()])
+    def test_cache(self, seed):
+        # Reset the pseudorandom number generator with seed.
+        random.seed(seed)
+
+        number_of_samples = random.randint(1000, 10000)
+        waveforms = [SineWave(random.uniform(1, 100)),
+                     SquareWave(random.uniform(1, 100))]
+
+        cache = WaveformCache(max_bytes=3 * number_of_samples * 8)
+        samples = cache.get_multi(waveforms, number_of_samples, 1000)
+        assert samples.shape == (2, number_of_samples)
+        assert samples.dtype == numpy.float64
+        assert samples.flags.c_contiguous and samples.flags.writeable
+        assert cache.misses == 1
+
+        assert cache.get_multi(waveforms, number_of_samples, 1000) is samples
+        assert cache.hits == 1
+
+        # Raw codes are quantized and clipped to the integer data type.
+        codes = cache.get(
+            SineWave(10, 10), number_of_samples, 1000, dtype=numpy.int16,
+            gain=4000.0)
+        assert codes.dtype == numpy.int16
+        assert codes.max() == numpy.iinfo(numpy.int16).max
+        assert codes.min() == numpy.iinfo(numpy.int16).min
+
+        # Adding a third waveform evicts the least recently used one.
+        cache.get(waveforms[0], 2 * number_of_samples, 1000)
+        assert cache.nbytes <= cache.max_bytes
+        assert len(cache) == 2
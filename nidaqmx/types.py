@@ -4,6 +4,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import collections
+import numpy
 
 # region Task Counter IO namedtuples
 
@@ -18,6 +19,35 @@ CtrTime = collections.namedtuple(
 
 # endregion
 
+# region Task Counter IO structured dtypes
+
+CTR_FREQ_DTYPE = numpy.dtype(
+    [(f, numpy.float64) for f in CtrFreq._fields])
+
+CTR_TICK_DTYPE = numpy.dtype(
+    [(f, numpy.uint32) for f in CtrTick._fields])
+
+CTR_TIME_DTYPE = numpy.dtype(
+    [(f, numpy.float64) for f in CtrTime._fields])
+
+# endregion
+
+# region Task Event namedtuples
+
+DoneEvent = collections.namedtuple(
+    'DoneEvent', ['status', 'timestamp'])
+
+EveryNSamplesEvent = collections.namedtuple(
+    'EveryNSamplesEvent', ['event_type', 'number_of_samples', 'timestamp'])
+
+SignalEvent = collections.namedtuple(
+    'SignalEvent', ['signal_type', 'timestamp'])
+
+EventLatencyStatistics = collections.namedtuple(
+    'EventLatencyStatistics', ['count', 'mean', 'std', 'min', 'max'])
+
+# endregion
+
 # region Watchdog namedtuples
 
 AOExpirationState = collections.namedtuple(
@@ -30,6 +60,47 @@ COExpirationState = collections.namedtuple(
 DOExpirationState = collections.namedtuple(
     'DOExpirationState', ['physical_channel', 'expiration_state'])
 
+WatchdogAlert = collections.namedtuple(
+    'WatchdogAlert', ['reason', 'margin', 'timestamp'])
+
+WatchdogReset = collections.namedtuple(
+    'WatchdogReset', ['timestamp', 'latency', 'margin'])
+
+# endregion
+
+# region Polling Loop namedtuples
+
+PollingLoopStatistics = collections.namedtuple(
+    'PollingLoopStatistics',
+    ['iterations', 'overruns', 'missed_periods', 'mean_jitter',
+     'std_jitter', 'min_jitter', 'max_jitter', 'max_execution_time'])
+
+# endregion
+
+# region Output Stream Engine namedtuples
+
+OutStreamEngineMetrics = collections.namedtuple(
+    'OutStreamEngineMetrics',
+    ['samples_written', 'samples_generated', 'blocks_written',
+     'buffer_size', 'buffer_fill', 'min_headroom', 'low_water_events'])
+
+# endregion
+
+# region Task Configuration namedtuples
+
+ConfigChange = collections.namedtuple(
+    'ConfigChange',
+    ['section', 'object', 'property', 'old_value', 'new_value'])
+
+# endregion
+
+# region Task Pool namedtuples
+
+TaskPoolMetrics = collections.namedtuple(
+    'TaskPoolMetrics',
+    ['hits', 'misses', 'tasks_built', 'evictions', 'health_check_failures',
+     'idle_tasks', 'leased_tasks', 'mean_build_time'])
+
 # endregion
 
 # region Power Up States namedtuples
@@ -43,6 +114,31 @@ DOPowerUpState = collections.namedtuple(
 DOResistorPowerUpState = collections.namedtuple(
     'DOResistorPowerUpState', ['physical_channel', 'power_up_state'])
 
+PowerUpStateChange = collections.namedtuple(
+    'PowerUpStateChange',
+    ['device_name', 'state_type', 'physical_channel', 'old_state',
+     'new_state'])
+
+PowerUpProvisioningReport = collections.namedtuple(
+    'PowerUpProvisioningReport',
+    ['changes', 'dry_run', 'read_time', 'apply_time', 'device_read_times'])
+
+# endregion
+
+# region Scale namedtuples
+
+ReversePolyFit = collections.namedtuple(
+    'ReversePolyFit', ['reverse_coeffs', 'max_error', 'rms_error'])
+
+# endregion
+
+# region Storage namedtuples
+
+PersistedInfo = collections.namedtuple(
+    'PersistedInfo',
+    ['name', 'author', 'allow_interactive_editing',
+     'allow_interactive_deletion'])
+
 # endregion
 
 # region System namedtuples
@@ -50,5 +146,21 @@ DOResistorPowerUpState = collections.namedtuple(
 CDAQSyncConnection = collections.namedtuple(
     'CDAQSyncConnection', ['output_port', 'input_port'])
 
+DeviceInfo = collections.namedtuple(
+    'DeviceInfo',
+    ['name', 'product_type', 'product_category', 'is_simulated',
+     'serial_num', 'bus_type', 'compact_daq_chassis_device',
+     'compact_daq_slot_num', 'pxi_chassis_num', 'pxi_slot_num',
+     'chassis_module_devices', 'ai_physical_chans', 'ao_physical_chans',
+     'ci_physical_chans', 'co_physical_chans', 'di_lines', 'di_ports',
+     'do_lines', 'do_ports', 'ai_meas_types', 'ao_output_types',
+     'ci_meas_types', 'co_output_types', 'terminals'])
+
+
+TEDSInfo = collections.namedtuple(
+    'TEDSInfo',
+    ['mfg_id', 'model_num', 'version_letter', 'version_num', 'serial_num',
+     'template_ids', 'bit_stream'])
+
 # endregion
 
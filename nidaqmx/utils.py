@@ -3,10 +3,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
+import os
 import re
+import tempfile
+import time
 
 from nidaqmx.errors import DaqError
 
+# Measures elapsed time with the highest resolution clock available.
+_clock = getattr(time, 'perf_counter', time.time)
+
 # Method logic adapted from
 # //Measurements/Infrastructure/dmxf/trunk/2.5/source/nimuck/parseUtilities.cpp
 
@@ -173,3 +180,32 @@ def unflatten_channel_string(channel_names):
             channel_list_to_return.extend(colon_expanded_channel)
 
     return channel_list_to_return
+
+
+def _replace_file(source, destination):
+    try:
+        replace = os.replace
+    except AttributeError:
+        # Python 2 cannot rename over an existing file on Windows.
+        if os.path.isfile(destination):
+            os.remove(destination)
+        replace = os.rename
+    replace(source, destination)
+
+
+def _write_text_file(path, data):
+    """
+    Writes text to a UTF-8 file through a temporary file that then
+    replaces it, so that an interrupted write does not leave a truncated
+    file behind.
+    """
+    handle, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with io.open(handle, 'w', encoding='utf-8') as f:
+            f.write(data)
+        _replace_file(temp_path, path)
+    except BaseException:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        raise
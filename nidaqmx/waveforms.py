@@ -0,0 +1,650 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import collections
+import hashlib
+import numpy
+import threading
+
+from nidaqmx.errors import DaqError
+from nidaqmx.error_codes import DAQmxErrors
+
+__all__ = ['Waveform', 'SineWave', 'SquareWave', 'TriangleWave',
+           'SawtoothWave', 'ChirpWave', 'ArbitraryWave', 'WaveformSequence',
+           'WaveformCache']
+
+
+class Waveform(object):
+    """
+    Base class for waveforms that can be synthesized into blocks of
+    samples.
+
+    The phase of a waveform is expressed in cycles, so a phase of 0.5
+    starts a periodic waveform half way through its period. Synthesizing a
+    block returns the phase at which the next block must start for the two
+    blocks to join without a discontinuity.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self.key == other.key
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return '{0}({1})'.format(
+            self.__class__.__name__, ', '.join(repr(p) for p in self.key[1:]))
+
+    @property
+    def key(self):
+        """
+        tuple: Indicates a hashable value that uniquely identifies the
+            waveform and its parameters.
+        """
+        raise NotImplementedError()
+
+    def synthesize(self, number_of_samples, sample_rate, phase=0.0):
+        """
+        Synthesizes a block of samples of the waveform.
+
+        Args:
+            number_of_samples (int): Specifies the number of samples to
+                synthesize.
+            sample_rate (float): Specifies the rate in samples per second
+                at which the samples are generated.
+            phase (Optional[float]): Specifies the phase, in cycles, of
+                the first sample.
+        Returns:
+            tuple:
+
+            A tuple of the samples, as a 1D NumPy array of float64 values,
+            and the phase, in cycles, at which the next block must start
+            to continue the waveform.
+        """
+        cycles, end_phase = self._cycles(
+            number_of_samples, sample_rate, phase)
+        return self._shape(cycles), end_phase
+
+    def _cycles(self, number_of_samples, sample_rate, phase):
+        cycles_per_sample = self.frequency / sample_rate
+        cycles = numpy.arange(number_of_samples, dtype=numpy.float64)
+        cycles *= cycles_per_sample
+        cycles += phase
+        end_phase = (phase + number_of_samples * cycles_per_sample) % 1.0
+        return cycles, end_phase
+
+    def _shape(self, cycles):
+        raise NotImplementedError()
+
+
+class SineWave(Waveform):
+    """
+    Represents a sine wave.
+    """
+    __slots__ = ['frequency', 'amplitude', 'offset']
+
+    def __init__(self, frequency, amplitude=1.0, offset=0.0):
+        """
+        Args:
+            frequency (float): Specifies the frequency of the wave in hertz.
+            amplitude (Optional[float]): Specifies the peak amplitude of
+                the wave.
+            offset (Optional[float]): Specifies the DC offset of the wave.
+        """
+        self.frequency = float(frequency)
+        self.amplitude = float(amplitude)
+        self.offset = float(offset)
+
+    @property
+    def key(self):
+        return ('sine', self.frequency, self.amplitude, self.offset)
+
+    def _shape(self, cycles):
+        cycles *= 2 * numpy.pi
+        samples = numpy.sin(cycles, out=cycles)
+        samples *= self.amplitude
+        samples += self.offset
+        return samples
+
+
+class SquareWave(Waveform):
+    """
+    Represents a square wave.
+    """
+    __slots__ = ['frequency', 'amplitude', 'offset', 'duty_cycle']
+
+    def __init__(self, frequency, amplitude=1.0, offset=0.0, duty_cycle=0.5):
+        """
+        Args:
+            frequency (float): Specifies the frequency of the wave in hertz.
+            amplitude (Optional[float]): Specifies the peak amplitude of
+                the wave.
+            offset (Optional[float]): Specifies the DC offset of the wave.
+            duty_cycle (Optional[float]): Specifies the fraction of each
+                period, between 0 and 1, that the wave is high.
+        """
+        self.frequency = float(frequency)
+        self.amplitude = float(amplitude)
+        self.offset = float(offset)
+        self.duty_cycle = float(duty_cycle)
+
+    @property
+    def key(self):
+        return ('square', self.frequency, self.amplitude, self.offset,
+                self.duty_cycle)
+
+    def _shape(self, cycles):
+        numpy.mod(cycles, 1.0, out=cycles)
+        return numpy.where(
+            cycles < self.duty_cycle, self.offset + self.amplitude,
+            self.offset - self.amplitude)
+
+
+class TriangleWave(Waveform):
+    """
+    Represents a triangle wave that starts at its minimum.
+    """
+    __slots__ = ['frequency', 'amplitude', 'offset']
+
+    def __init__(self, frequency, amplitude=1.0, offset=0.0):
+        """
+        Args:
+            frequency (float): Specifies the frequency of the wave in hertz.
+            amplitude (Optional[float]): Specifies the peak amplitude of
+                the wave.
+            offset (Optional[float]): Specifies the DC offset of the wave.
+        """
+        self.frequency = float(frequency)
+        self.amplitude = float(amplitude)
+        self.offset = float(offset)
+
+    @property
+    def key(self):
+        return ('triangle', self.frequency, self.amplitude, self.offset)
+
+    def _shape(self, cycles):
+        numpy.mod(cycles, 1.0, out=cycles)
+        cycles -= 0.5
+        samples = numpy.abs(cycles, out=cycles)
+        samples *= -4 * self.amplitude
+        samples += self.offset + self.amplitude
+        return samples
+
+
+class SawtoothWave(Waveform):
+    """
+    Represents a rising sawtooth wave that starts at its minimum.
+    """
+    __slots__ = ['frequency', 'amplitude', 'offset']
+
+    def __init__(self, frequency, amplitude=1.0, offset=0.0):
+        """
+        Args:
+            frequency (float): Specifies the frequency of the wave in hertz.
+            amplitude (Optional[float]): Specifies the peak amplitude of
+                the wave.
+            offset (Optional[float]): Specifies the DC offset of the wave.
+        """
+        self.frequency = float(frequency)
+        self.amplitude = float(amplitude)
+        self.offset = float(offset)
+
+    @property
+    def key(self):
+        return ('sawtooth', self.frequency, self.amplitude, self.offset)
+
+    def _shape(self, cycles):
+        samples = numpy.mod(cycles, 1.0, out=cycles)
+        samples *= 2 * self.amplitude
+        samples += self.offset - self.amplitude
+        return samples
+
+
+class ChirpWave(Waveform):
+    """
+    Represents a sine wave whose frequency sweeps from a start frequency to
+    a stop frequency over the length of the block it is synthesized into.
+    """
+    __slots__ = ['start_frequency', 'stop_frequency', 'amplitude', 'offset',
+                 'exponential']
+
+    def __init__(self, start_frequency, stop_frequency, amplitude=1.0,
+                 offset=0.0, exponential=False):
+        """
+        Args:
+            start_frequency (float): Specifies the frequency in hertz at
+                the start of the sweep.
+            stop_frequency (float): Specifies the frequency in hertz at
+                the end of the sweep.
+            amplitude (Optional[float]): Specifies the peak amplitude of
+                the wave.
+            offset (Optional[float]): Specifies the DC offset of the wave.
+            exponential (Optional[bool]): Specifies if the frequency
+                sweeps exponentially instead of linearly. Both frequencies
+                must be greater than 0 for an exponential sweep.
+        """
+        if exponential and (start_frequency <= 0 or stop_frequency <= 0):
+            raise DaqError(
+                'Start and stop frequencies of an exponential chirp must be '
+                'greater than 0.\n\n'
+                'Start frequency: {0}\nStop frequency: {1}'.format(
+                    start_frequency, stop_frequency),
+                DAQmxErrors.UNKNOWN.value)
+
+        self.start_frequency = float(start_frequency)
+        self.stop_frequency = float(stop_frequency)
+        self.amplitude = float(amplitude)
+        self.offset = float(offset)
+        self.exponential = bool(exponential)
+
+    @property
+    def key(self):
+        return ('chirp', self.start_frequency, self.stop_frequency,
+                self.amplitude, self.offset, self.exponential)
+
+    def _cycles(self, number_of_samples, sample_rate, phase):
+        duration = number_of_samples / sample_rate
+        t = numpy.arange(number_of_samples + 1, dtype=numpy.float64)
+        t /= sample_rate
+
+        f0, f1 = self.start_frequency, self.stop_frequency
+        if not duration:
+            cycles = t
+        elif self.exponential and f0 != f1:
+            ratio = f1 / f0
+            rate = numpy.log(ratio) / duration
+            cycles = numpy.expm1(rate * t, out=t)
+            cycles *= f0 / rate
+        else:
+            cycles = t * (f0 + (f1 - f0) * t / (2 * duration))
+        cycles += phase
+        return cycles[:-1], cycles[-1] % 1.0
+
+    def _shape(self, cycles):
+        cycles *= 2 * numpy.pi
+        samples = numpy.sin(cycles, out=cycles)
+        samples *= self.amplitude
+        samples += self.offset
+        return samples
+
+
+class ArbitraryWave(Waveform):
+    """
+    Represents an arbitrary waveform defined by one period of samples.
+
+    If you do not specify a frequency, the samples are generated one per
+    sample clock and the period of the waveform is the number of samples
+    that define it. Otherwise, the period is resampled with linear
+    interpolation to the specified frequency.
+    """
+    __slots__ = ['samples', 'frequency', '_digest']
+
+    def __init__(self, samples, frequency=None):
+        """
+        Args:
+            samples (numpy.ndarray): Specifies one period of the waveform
+                as a 1D array.
+            frequency (Optional[float]): Specifies the frequency, in
+                hertz, at which the period repeats.
+        """
+        samples = numpy.array(samples, dtype=numpy.float64)
+        if samples.ndim != 1 or not samples.size:
+            raise DaqError(
+                'Samples of an arbitrary waveform must be a non-empty 1D '
+                'array.\n\n'
+                'Shape of samples: {0}'.format(samples.shape),
+                DAQmxErrors.UNKNOWN.value)
+        samples.flags.writeable = False
+
+        self.samples = samples
+        self.frequency = None if frequency is None else float(frequency)
+        self._digest = hashlib.sha1(samples.tobytes()).hexdigest()
+
+    @property
+    def key(self):
+        return ('arbitrary', self._digest, self.frequency)
+
+    def _cycles(self, number_of_samples, sample_rate, phase):
+        if self.frequency is None:
+            cycles_per_sample = 1.0 / self.samples.size
+        else:
+            cycles_per_sample = self.frequency / sample_rate
+        cycles = numpy.arange(number_of_samples, dtype=numpy.float64)
+        cycles *= cycles_per_sample
+        cycles += phase
+        end_phase = (phase + number_of_samples * cycles_per_sample) % 1.0
+        return cycles, end_phase
+
+    def _shape(self, cycles):
+        size = self.samples.size
+        positions = numpy.mod(cycles, 1.0, out=cycles)
+        positions *= size
+        if self.frequency is None:
+            indices = numpy.rint(positions).astype(numpy.intp)
+            indices %= size
+            return self.samples[indices]
+
+        # Interpolate between the sample before and after each position,
+        # wrapping around to the start of the period.
+        xp = numpy.arange(size + 1, dtype=numpy.float64)
+        fp = numpy.append(self.samples, self.samples[0])
+        return numpy.interp(positions, xp, fp)
+
+
+class WaveformSequence(object):
+    """
+    Represents a sequence of waveform segments that are concatenated
+    without phase discontinuities.
+
+    Each segment starts at the phase at which the previous segment ended,
+    so consecutive segments of the same frequency join seamlessly.
+    """
+
+    def __init__(self, segments, sample_rate, phase=0.0):
+        """
+        Args:
+            segments (List[Tuple[nidaqmx.waveforms.Waveform, int]]):
+                Specifies the waveform and number of samples of each
+                segment, in order.
+            sample_rate (float): Specifies the rate in samples per second
+                at which the samples are generated.
+            phase (Optional[float]): Specifies the phase, in cycles, of
+                the first sample of the sequence.
+        """
+        self._segments = tuple(
+            (waveform, int(number_of_samples))
+            for waveform, number_of_samples in segments)
+        self._sample_rate = float(sample_rate)
+        self._phase = float(phase)
+
+    def __len__(self):
+        return sum(n for _, n in self._segments)
+
+    @property
+    def key(self):
+        """
+        tuple: Indicates a hashable value that uniquely identifies the
+            sequence.
+        """
+        return ('sequence', tuple((w.key, n) for w, n in self._segments),
+                self._sample_rate, self._phase)
+
+    @property
+    def sample_rate(self):
+        """
+        float: Indicates the rate in samples per second at which the
+            samples are generated.
+        """
+        return self._sample_rate
+
+    @property
+    def segments(self):
+        """
+        tuple: Indicates the waveform and number of samples of each
+            segment.
+        """
+        return self._segments
+
+    def synthesize(self):
+        """
+        Synthesizes the complete sequence.
+
+        Returns:
+            tuple:
+
+            A tuple of the samples, as a 1D NumPy array of float64 values,
+            and the phase, in cycles, at which the waveform following the
+            sequence must start.
+        """
+        samples = numpy.empty(len(self), dtype=numpy.float64)
+        phase = self._phase
+        start = 0
+        for waveform, number_of_samples in self._segments:
+            block, phase = waveform.synthesize(
+                number_of_samples, self._sample_rate, phase)
+            samples[start:start + number_of_samples] = block
+            start += number_of_samples
+        return samples, phase
+
+
+def _quantize(samples, dtype, gain, offset):
+    # Scales the samples to raw codes and clips them to the range of the
+    # integer type in one pass over a float64 working array.
+    info = numpy.iinfo(dtype)
+    codes = numpy.multiply(samples, gain)
+    codes += offset
+    numpy.rint(codes, out=codes)
+    numpy.clip(codes, info.min, info.max, out=codes)
+    return codes.astype(dtype)
+
+
+class WaveformCache(object):
+    """
+    Caches synthesized waveforms in the data type and layout of the stream
+    writer they are written with.
+
+    The cache evicts the least recently used waveforms once the total size
+    of the cached arrays exceeds **max_bytes**. Arrays returned by the cache
+    are shared between callers and must not be modified.
+
+    Request float64 arrays for
+    :class:`nidaqmx.stream_writers.AnalogSingleChannelWriter`,
+    :class:`nidaqmx.stream_writers.AnalogMultiChannelWriter` and the
+    frequencies, duty cycles, ticks and times written by
+    :class:`nidaqmx.stream_writers.CounterWriter`. Request an integer data
+    type, along with the gain and offset that convert scaled values to raw
+    codes, for :class:`nidaqmx.stream_writers.AnalogUnscaledWriter`.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (Optional[int]): Specifies the maximum total size in
+                bytes of the cached arrays.
+        """
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hits(self):
+        """
+        int: Indicates the number of requests served from the cache.
+        """
+        return self._hits
+
+    @property
+    def max_bytes(self):
+        """
+        int: Specifies the maximum total size in bytes of the cached
+            arrays.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, val):
+        with self._lock:
+            self._max_bytes = val
+            self._evict()
+
+    @property
+    def misses(self):
+        """
+        int: Indicates the number of requests that synthesized a waveform.
+        """
+        return self._misses
+
+    @property
+    def nbytes(self):
+        """
+        int: Indicates the total size in bytes of the cached arrays.
+        """
+        return self._nbytes
+
+    def clear(self):
+        """
+        Removes all waveforms from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def get(self, waveform, number_of_samples=None, sample_rate=None,
+            phase=0.0, dtype=numpy.float64, gain=None, offset=0.0):
+        """
+        Returns the samples of a waveform or waveform sequence as a 1D
+        array, synthesizing them only if they are not already cached.
+
+        Args:
+            waveform (nidaqmx.waveforms.Waveform or
+                nidaqmx.waveforms.WaveformSequence): Specifies the waveform
+                to synthesize.
+            number_of_samples (Optional[int]): Specifies the number of
+                samples to synthesize. Do not specify a value for a
+                waveform sequence.
+            sample_rate (Optional[float]): Specifies the rate in samples
+                per second at which the samples are generated. Do not
+                specify a value for a waveform sequence.
+            phase (Optional[float]): Specifies the phase, in cycles, of
+                the first sample. Do not specify a value for a waveform
+                sequence.
+            dtype (Optional[numpy.dtype]): Specifies the data type of the
+                samples to return.
+            gain (Optional[float]): Specifies the factor that converts
+                scaled values to raw codes. You must specify a value if
+                **dtype** is an integer type.
+            offset (Optional[float]): Specifies the raw code that
+                corresponds to a scaled value of 0.
+        Returns:
+            numpy.ndarray:
+
+            The samples of the waveform.
+        """
+        return self.get_multi(
+            [waveform], number_of_samples, sample_rate, [phase], dtype,
+            None if gain is None else [gain], [offset])[0]
+
+    def get_multi(self, waveforms, number_of_samples=None, sample_rate=None,
+                  phases=None, dtype=numpy.float64, gains=None, offsets=None):
+        """
+        Returns the samples of one waveform or waveform sequence per
+        channel as a 2D array laid out as (channels, samples), synthesizing
+        them only if they are not already cached.
+
+        Args:
+            waveforms (List[nidaqmx.waveforms.Waveform]): Specifies the
+                waveform to synthesize for each channel.
+            number_of_samples (Optional[int]): Specifies the number of
+                samples per channel to synthesize. Do not specify a value
+                for waveform sequences.
+            sample_rate (Optional[float]): Specifies the rate in samples
+                per second at which the samples are generated. Do not
+                specify a value for waveform sequences.
+            phases (Optional[List[float]]): Specifies the phase, in
+                cycles, of the first sample of each channel.
+            dtype (Optional[numpy.dtype]): Specifies the data type of the
+                samples to return.
+            gains (Optional[List[float]]): Specifies the factor for each
+                channel that converts scaled values to raw codes. You
+                must specify a value if **dtype** is an integer type.
+            offsets (Optional[List[float]]): Specifies the raw code for
+                each channel that corresponds to a scaled value of 0.
+        Returns:
+            numpy.ndarray:
+
+            The samples of the waveforms.
+        """
+        dtype = numpy.dtype(dtype)
+        number_of_channels = len(waveforms)
+        if phases is None:
+            phases = [0.0] * number_of_channels
+        if offsets is None:
+            offsets = [0.0] * number_of_channels
+
+        if dtype.kind in 'iu':
+            if gains is None:
+                raise DaqError(
+                    'Gains that convert scaled values to raw codes must be '
+                    'specified to synthesize waveforms of an integer data '
+                    'type.\n\n'
+                    'Data type: {0}'.format(dtype),
+                    DAQmxErrors.UNKNOWN.value)
+            scaling = (tuple(float(g) for g in gains),
+                       tuple(float(o) for o in offsets))
+        else:
+            scaling = None
+
+        key = (tuple(w.key for w in waveforms), number_of_samples,
+               sample_rate, tuple(float(p) for p in phases), dtype.str,
+               scaling)
+
+        with self._lock:
+            samples = self._entries.get(key)
+            if samples is not None:
+                self._entries[key] = self._entries.pop(key)
+                self._hits += 1
+                return samples
+            self._misses += 1
+
+        samples = self._synthesize(
+            waveforms, number_of_samples, sample_rate, phases, dtype,
+            scaling)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = samples
+                self._nbytes += samples.nbytes
+                self._evict()
+        return samples
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._entries:
+            _, samples = self._entries.popitem(last=False)
+            self._nbytes -= samples.nbytes
+
+    def _synthesize(self, waveforms, number_of_samples, sample_rate, phases,
+                    dtype, scaling):
+        blocks = []
+        for waveform, phase in zip(waveforms, phases):
+            if isinstance(waveform, WaveformSequence):
+                block, _ = waveform.synthesize()
+            else:
+                block, _ = waveform.synthesize(
+                    number_of_samples, sample_rate, phase)
+            blocks.append(block)
+
+        lengths = set(block.size for block in blocks)
+        if len(lengths) > 1:
+            raise DaqError(
+                'Waveforms of every channel must have the same number of '
+                'samples.\n\n'
+                'Number of samples per channel: {0}'.format(
+                    [block.size for block in blocks]),
+                DAQmxErrors.UNKNOWN.value)
+
+        samples = numpy.vstack(blocks) if blocks else numpy.empty((0, 0))
+        if scaling is not None:
+            gains, offsets = scaling
+            samples = _quantize(
+                samples, dtype, numpy.array(gains)[:, numpy.newaxis],
+                numpy.array(offsets)[:, numpy.newaxis])
+        elif samples.dtype != dtype:
+            samples = samples.astype(dtype)
+        return samples
@@ -48,6 +48,7 @@ setup(
     packages=['nidaqmx'],
     install_requires=[
         'enum34;python_version<"3.4"',
+        'futures;python_version<"3.2"',
         'numpy',
         'six'
     ],